@@ -335,6 +335,49 @@ async def _get(self, key: str, default: Any = None) -> Any:
         result, _ = await self._get_with_fallback(key, default)
         return result
     
+    async def _get_many(self, defaults: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Batched multi-tier read for several keys with per-key defaults
+
+        Resolves L1 locally and fetches the rest with one Memcached multi-get
+        and one Redis MGET, instead of one round trip per key.
+        """
+        start_time = time.perf_counter()
+        self._operation_count += len(defaults)
+
+        try:
+            results = await self.multi_tier_cache.get_many(list(defaults))
+        except Exception as e:
+            elapsed = time.perf_counter() - start_time
+            for key in defaults:
+                self._update_metrics(key, CacheStatus.ERROR, elapsed)
+            self._record_failure()
+            logger.error(f"Multi-tier cache batch error for {len(defaults)} keys: {e}")
+            return dict(defaults)
+
+        elapsed = time.perf_counter() - start_time
+        values = {}
+        for key, default in defaults.items():
+            value, layer = results.get(key, (None, CacheLayer.MISS))
+            if layer == CacheLayer.MISS:
+                status = CacheStatus.MISS
+                value = default
+            elif layer == CacheLayer.L3_REDIS:
+                status = CacheStatus.FALLBACK
+            else:
+                status = CacheStatus.HIT
+            self._update_metrics(key, status, elapsed)
+            values[key] = value
+
+        if any(results.get(key, (None, CacheLayer.MISS))[1] != CacheLayer.MISS for key in defaults):
+            self._record_success()
+        logger.debug(f"Batched cache read for {len(defaults)} keys ({elapsed*1000:.1f}ms)")
+        return values
+
+    async def get_many(self, keys: List[str], default: Any = None) -> Dict[str, Any]:
+        """Public batched get; every missing key maps to ``default``"""
+        return await self._get_many({key: default for key in keys})
+
     async def get(self, key: str, default: Any = None) -> Any:
         """Public get method for cache access"""
         return await self._get(key, default)
@@ -345,10 +388,16 @@ async def set(self, key: str, value: Any, ttl: int = 300) -> bool:
     
     async def get_market_overview(self) -> Dict[str, Any]:
         """Get market overview with correct field names"""
-        overview = await self._get('market:overview', {})
-        tickers = await self._get('market:tickers', {})
-        regime = await self._get('analysis:market_regime', 'unknown')
-        breadth = await self._get('market:breadth', {})
+        cached = await self._get_many({
+            'market:overview': {},
+            'market:tickers': {},
+            'analysis:market_regime': 'unknown',
+            'market:breadth': {}
+        })
+        overview = cached['market:overview']
+        tickers = cached['market:tickers']
+        regime = cached['analysis:market_regime']
+        breadth = cached['market:breadth']
         
         # Calculate totals
         total_symbols = overview.get('total_symbols', len(tickers))
@@ -392,10 +441,16 @@ async def get_market_overview(self) -> Dict[str, Any]:
     
     async def get_dashboard_overview(self) -> Dict[str, Any]:
         """Get complete dashboard overview with self-populating on cache miss"""
-        overview = await self._get('market:overview', {})
-        signals = await self._get('analysis:signals', {})
-        regime = await self._get('analysis:market_regime', 'unknown')
-        movers = await self._get('market:movers', {})
+        cached = await self._get_many({
+            'market:overview': {},
+            'analysis:signals': {},
+            'analysis:market_regime': 'unknown',
+            'market:movers': {}
+        })
+        overview = cached['market:overview']
+        signals = cached['analysis:signals']
+        regime = cached['analysis:market_regime']
+        movers = cached['market:movers']
 
         # TYPE SAFETY: Ensure all cached values are dicts (not error strings)
         if not isinstance(overview, dict):
@@ -518,8 +573,12 @@ async def get_dashboard_overview(self) -> Dict[str, Any]:
             
             # Try alternative cache keys as fallback
             if not overview and not signals:
-                alt_overview = await self._get('virtuoso:market_overview', {})
-                alt_signals = await self._get('virtuoso:signals', {})
+                cached = await self._get_many({
+                    'virtuoso:market_overview': {},
+                    'virtuoso:signals': {}
+                })
+                alt_overview = cached['virtuoso:market_overview']
+                alt_signals = cached['virtuoso:signals']
                 if alt_overview or alt_signals:
                     logger.info(f"FOUND ALTERNATIVE KEYS: alt_overview={bool(alt_overview)}, alt_signals={bool(alt_signals)}")
                     overview = alt_overview or overview
@@ -535,11 +594,16 @@ async def get_dashboard_overview(self) -> Dict[str, Any]:
 
         # Enhance signals with detailed confluence breakdowns
         enhanced_signal_list = []
+        # Fetch the breakdowns for the top 10 signals in one batched cache read
+        breakdowns = await self.get_many([
+            f'confluence:breakdown:{signal.get("symbol")}'
+            for signal in signal_list[:10] if signal.get('symbol')
+        ])
         for signal in signal_list[:10]:  # Top 10 signals
             symbol = signal.get('symbol', '')
             if symbol:
-                # Fetch detailed breakdown for this symbol
-                breakdown_data = await self._get(f'confluence:breakdown:{symbol}', None)
+                # Detailed breakdown for this symbol
+                breakdown_data = breakdowns.get(f'confluence:breakdown:{symbol}')
 
                 if breakdown_data and isinstance(breakdown_data, dict):
                     # Merge breakdown into signal
@@ -623,8 +687,12 @@ async def get_signals(self) -> Dict[str, Any]:
     async def get_dashboard_symbols(self) -> Dict[str, Any]:
         """Get symbol data from cache"""
         # Standardize cache key usage via prefixes
-        tickers = await self._get('market:tickers', {})
-        signals = await self._get('analysis:signals', {})
+        cached = await self._get_many({
+            'market:tickers': {},
+            'analysis:signals': {}
+        })
+        tickers = cached['market:tickers']
+        signals = cached['analysis:signals']
         
         # Create symbol list with signals
         symbols = []
@@ -685,9 +753,14 @@ async def get_market_movers(self) -> Dict[str, Any]:
     
     async def get_market_analysis(self) -> Dict[str, Any]:
         """Get market analysis from cache"""
-        overview = await self._get('market:overview', {})
-        movers = await self._get('market:movers', {})
-        regime = await self._get('analysis:market_regime', 'unknown')
+        cached = await self._get_many({
+            'market:overview': {},
+            'market:movers': {},
+            'analysis:market_regime': 'unknown'
+        })
+        overview = cached['market:overview']
+        movers = cached['market:movers']
+        regime = cached['analysis:market_regime']
         
         # Calculate momentum
         gainers = len([m for m in movers.get('gainers', []) if m.get('change_24h', 0) > 0])
@@ -724,8 +797,12 @@ async def get_alerts(self) -> Dict[str, Any]:
         
         # Generate some alerts if none exist
         if not alerts:
-            overview = await self._get('market:overview', {})
-            movers = await self._get('market:movers', {})
+            cached = await self._get_many({
+                'market:overview': {},
+                'market:movers': {}
+            })
+            overview = cached['market:overview']
+            movers = cached['market:movers']
             
             alerts = []
             
@@ -763,11 +840,18 @@ async def get_alerts(self) -> Dict[str, Any]:
     
     async def get_mobile_data(self) -> Dict[str, Any]:
         """Get mobile dashboard data with confluence scores"""
-        overview = await self._get('market:overview', {})
-        signals = await self._get('analysis:signals', {})
-        movers = await self._get('market:movers', {})
-        regime = await self._get('analysis:market_regime', 'unknown')
-        btc_dom = await self._get('market:btc_dominance', '57.0')  # Fallback, real value from CoinGecko
+        cached = await self._get_many({
+            'market:overview': {},
+            'analysis:signals': {},
+            'market:movers': {},
+            'analysis:market_regime': 'unknown',
+            'market:btc_dominance': '57.0'  # Fallback, real value from CoinGecko
+        })
+        overview = cached['market:overview']
+        signals = cached['analysis:signals']
+        movers = cached['market:movers']
+        regime = cached['analysis:market_regime']
+        btc_dom = cached['market:btc_dominance']
 
         # Ensure movers is a dict
         if not isinstance(movers, dict):
@@ -925,17 +1009,23 @@ async def get_mobile_data(self) -> Dict[str, Any]:
         confluence_scores = []
         signal_list = signals.get('signals', [])
         max_symbols = 20  # Matches config/config.yaml market.symbols.max_symbols
+        # Fetch every breakdown plus the tickers in one batched cache read
+        breakdown_keys = {
+            f'confluence:breakdown:{signal.get("symbol")}': None
+            for signal in signal_list[:max_symbols] if signal.get('symbol')
+        }
+        cached = await self._get_many({'market:tickers': {}, **breakdown_keys})
+        tickers_data = cached['market:tickers']
         for signal in signal_list[:max_symbols]:
             # Check if we have detailed breakdown
             symbol = signal.get('symbol', '')
             breakdown_data = None
             if symbol:
-                breakdown_data = await self._get(f'confluence:breakdown:{symbol}', None)
+                breakdown_data = cached.get(f'confluence:breakdown:{symbol}')
             
             if breakdown_data and isinstance(breakdown_data, dict):
                 # Use real detailed breakdown
                 # Get ticker data for this symbol to add high/low
-                tickers_data = await self._get('market:tickers', {})
                 ticker = tickers_data.get(symbol, {})
                 
                 # Calculate range if we have high/low
@@ -968,7 +1058,6 @@ async def get_mobile_data(self) -> Dict[str, Any]:
             else:
                 # Fallback to signal data
                 # Get ticker data for this symbol to add high/low/reliability
-                tickers_data = await self._get('market:tickers', {})
                 ticker = tickers_data.get(symbol, {})
                 
                 # Calculate range if we have high/low
@@ -1427,10 +1516,13 @@ async def get_orderbook_snapshot(self, symbol: str, limit: int = 20) -> Dict[str
                 
                 # Also cache derived metrics with different TTLs
                 await self._set(f'orderbook:{symbol}:spread', snapshot['spread'], ttl=5)
-                await self._set(f'orderbook:{symbol}:imbalance', snapshot['imbalance'], ttl=10)
-                await self._set(f'orderbook:{symbol}:depth:{limit}', 
-                              {'bid_volume': snapshot['bid_volume'], 'ask_volume': snapshot['ask_volume']}, 
-                              ttl=10)
+                await self._set_many({
+                    f'orderbook:{symbol}:imbalance': snapshot['imbalance'],
+                    f'orderbook:{symbol}:depth:{limit}': {
+                        'bid_volume': snapshot['bid_volume'],
+                        'ask_volume': snapshot['ask_volume']
+                    }
+                }, ttl=10)
                 
                 logger.info(f"Cached orderbook snapshot for {symbol} with 5s TTL")
                 
@@ -1458,6 +1550,17 @@ async def _set(self, key: str, value: Any, ttl: int = 300) -> bool:
             logger.error(f"Multi-tier cache write error for {key}: {e}")
             return False
     
+    async def _set_many(self, items: Dict[str, Any], ttl: int = 300) -> bool:
+        """Batched multi-tier write (one Redis pipeline, concurrent Memcached sets)"""
+        try:
+            await self.multi_tier_cache.set_many(items, ttl_override=ttl)
+            logger.debug(f"Multi-tier cache SET_MANY for {len(items)} keys with TTL={ttl}s")
+            return True
+
+        except Exception as e:
+            logger.error(f"Multi-tier cache batch write error for {list(items)}: {e}")
+            return False
+    
     async def _exists(self, key: str) -> bool:
         """Check if key exists in cache (try both backends)"""
         # Try Memcached first
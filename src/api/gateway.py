@@ -23,7 +23,7 @@
 import json
 import hashlib
 from datetime import datetime, timedelta, timezone
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
 import threading
 from functools import wraps
 from urllib.parse import urlencode
@@ -347,7 +347,9 @@ class APIGateway:
     def __init__(self, 
                  cache: MultiTierCache = None,
                  rate_limit_rps: int = 100,
-                 enable_circuit_breaker: bool = True):
+                 enable_circuit_breaker: bool = True,
+                 max_stale_seconds: int = 30,
+                 max_stale_entries: int = 1000):
         """
         Initialize API Gateway
         
@@ -355,12 +357,33 @@ def __init__(self,
             cache: Multi-tier cache instance
             rate_limit_rps: Requests per second limit
             enable_circuit_breaker: Enable circuit breaker protection
+            max_stale_seconds: How long past its cache_ttl a response may be
+                served while a background refresh runs (0 disables
+                stale-while-revalidate; routes can override with 'max_stale')
+            max_stale_entries: Number of last-known-good responses kept for
+                stale serving
         """
         self.cache = cache or get_multi_tier_cache()
         self.rate_limiter = RateLimiter(requests_per_second=rate_limit_rps)
         self.request_logger = RequestLogger()
         self.circuit_breaker = CircuitBreaker() if enable_circuit_breaker else None
         
+        # Single-flight: one backend fetch per cache key, shared by concurrent misses
+        self._inflight: Dict[str, asyncio.Task] = {}
+        
+        # Stale-while-revalidate: last good response per key with its expiry time
+        self.max_stale_seconds = max_stale_seconds
+        self.max_stale_entries = max_stale_entries
+        self._stale_responses: OrderedDict = OrderedDict()
+        
+        self.coalescing_stats = {
+            'backend_fetches': 0,
+            'coalesced_requests': 0,
+            'stale_served': 0,
+            'background_refreshes': 0,
+            'refresh_failures': 0
+        }
+        
         # Backend service endpoints
         self.backends = {
             'primary': 'http://localhost:8003',
@@ -423,6 +446,82 @@ async def _fetch_from_backend(self,
         except Exception as e:
             raise HTTPException(status_code=502, detail=f"Backend error: {str(e)}")
     
+    def _start_backend_fetch(self,
+                             cache_key: str,
+                             route_info: Dict[str, Any],
+                             backend_url: str,
+                             path: str,
+                             params: Dict[str, Any]) -> asyncio.Task:
+        """Start the single backend fetch for a cache key and register it as in flight"""
+        self.coalescing_stats['backend_fetches'] += 1
+        task = create_tracked_task(
+            self._refresh_from_backend(cache_key, route_info, backend_url, path, params),
+            name=f"gateway_fetch:{path}"
+        )
+        self._inflight[cache_key] = task
+        
+        def _on_done(done: asyncio.Task):
+            if self._inflight.get(cache_key) is done:
+                del self._inflight[cache_key]
+            if not done.cancelled() and done.exception() is not None:
+                self.coalescing_stats['refresh_failures'] += 1
+        
+        task.add_done_callback(_on_done)
+        return task
+    
+    async def _refresh_from_backend(self,
+                                    cache_key: str,
+                                    route_info: Dict[str, Any],
+                                    backend_url: str,
+                                    path: str,
+                                    params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch from backend and store the result in the cache and the stale store"""
+        # Apply circuit breaker if enabled
+        fetch_func = self._fetch_from_backend
+        if self.circuit_breaker:
+            fetch_func = self.circuit_breaker.call(fetch_func)
+        
+        data = await fetch_func(backend_url, path, params, timeout=10)
+        
+        # Cache the response for the route's TTL (0 leaves it to the stale store)
+        if route_info['cache_ttl'] > 0:
+            await self.cache.set(cache_key, data, ttl_override=route_info['cache_ttl'])
+        self._remember_response(cache_key, data, route_info)
+        return data
+    
+    def _remember_response(self, cache_key: str, data: Dict[str, Any], route_info: Dict[str, Any]):
+        """Keep the latest good response so it can be served stale after expiry"""
+        if self._max_stale_for(route_info) <= 0:
+            return
+        self._stale_responses[cache_key] = (data, time.time() + route_info['cache_ttl'])
+        self._stale_responses.move_to_end(cache_key)
+        while len(self._stale_responses) > self.max_stale_entries:
+            self._stale_responses.popitem(last=False)
+    
+    def _get_stale_response(self, cache_key: str, route_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the last good response if it expired less than max_stale seconds ago"""
+        entry = self._stale_responses.get(cache_key)
+        if entry is None:
+            return None
+        data, expires_at = entry
+        if time.time() - expires_at > self._max_stale_for(route_info):
+            del self._stale_responses[cache_key]
+            return None
+        return data
+    
+    def _max_stale_for(self, route_info: Dict[str, Any]) -> float:
+        return route_info.get('max_stale', self.max_stale_seconds)
+    
+    def _get_coalescing_metrics(self) -> Dict[str, Any]:
+        """Single-flight and stale-while-revalidate counters"""
+        stats = dict(self.coalescing_stats)
+        backend_demand = stats['backend_fetches'] + stats['coalesced_requests']
+        stats['coalescing_ratio'] = round(stats['coalesced_requests'] / max(backend_demand, 1), 4)
+        stats['in_flight'] = len(self._inflight)
+        stats['stale_entries'] = len(self._stale_responses)
+        stats['max_stale_seconds'] = self.max_stale_seconds
+        return stats
+    
     async def route_request(self, request: Request) -> JSONResponse:
         """
         Main request routing with caching, rate limiting, and error handling
@@ -456,7 +555,7 @@ async def route_request(self, request: Request) -> JSONResponse:
             
             # Check cache first
             cache_key = self._get_cache_key(request)
-            cached_response = await self.cache.get(cache_key, 'gateway')
+            cached_response, _ = await self.cache.get(cache_key)
             
             if cached_response is not None:
                 cache_hit = True
@@ -477,32 +576,42 @@ async def route_request(self, request: Request) -> JSONResponse:
             })
             
             backend_url = self.backends.get(route_info['backend'], self.backends['primary'])
+            params = dict(request.query_params)
             
-            # Apply circuit breaker if enabled
-            fetch_func = self._fetch_from_backend
-            if self.circuit_breaker:
-                fetch_func = self.circuit_breaker.call(fetch_func)
+            # Serve the expired response while one background refresh runs
+            stale = self._get_stale_response(cache_key, route_info)
+            if stale is not None:
+                self.coalescing_stats['stale_served'] += 1
+                if cache_key not in self._inflight:
+                    self.coalescing_stats['background_refreshes'] += 1
+                    self._start_backend_fetch(cache_key, route_info, backend_url, path, params)
+                
+                response = JSONResponse(content=stale)
+                response.headers['X-Cache'] = 'STALE'
+                response.headers['X-Response-Time'] = str(round((time.time() - start_time) * 1000, 2))
+                
+                self.request_logger.log_request(
+                    request.method, path, client_ip, start_time, time.time(), 200, cache_hit=True
+                )
+                return response
             
-            # Fetch from backend
-            data = await fetch_func(
-                backend_url, 
-                path, 
-                dict(request.query_params),
-                timeout=10
-            )
+            # Fetch from backend, joining an in-flight fetch for the same key
+            coalesced = cache_key in self._inflight
+            if coalesced:
+                self.coalescing_stats['coalesced_requests'] += 1
+                task = self._inflight[cache_key]
+            else:
+                task = self._start_backend_fetch(cache_key, route_info, backend_url, path, params)
             
-            # Cache the response
-            await self.cache.set(
-                cache_key, 
-                data, 
-                route_info['data_type'],
-                force_l1=True  # Gateway responses should go to L1
-            )
+            # Shield so a disconnecting client does not cancel the shared fetch
+            data = await asyncio.shield(task)
             
             response = JSONResponse(content=data)
             response.headers['X-Cache'] = 'MISS'
             response.headers['X-Backend'] = route_info['backend']
             response.headers['X-Response-Time'] = str(round((time.time() - start_time) * 1000, 2))
+            if coalesced:
+                response.headers['X-Coalesced'] = 'true'
             
             self.request_logger.log_request(
                 request.method, path, client_ip, start_time, time.time(), 200, cache_hit=False
@@ -551,6 +660,7 @@ async def get_gateway_metrics(self) -> Dict[str, Any]:
             'rate_limiting': rate_limit_stats,
             'requests': request_metrics,
             'circuit_breaker': circuit_breaker_status,
+            'coalescing': self._get_coalescing_metrics(),
             'backends': {
                 backend: {'url': url, 'status': 'unknown'} 
                 for backend, url in self.backends.items()
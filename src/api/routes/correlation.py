@@ -1,7 +1,7 @@
 """Signal Correlation Matrix API routes for the Virtuoso Trading System."""
 
 from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import asyncio
 import numpy as np
 import pandas as pd
@@ -423,6 +423,40 @@ def _compute_asset_correlations_old(self, signal_data: List[Dict[str, Any]]) ->
 # Initialize calculator
 correlation_calculator = SignalCorrelationCalculator()
 
+
+async def _price_correlations(
+    symbols_list: List[str], days: int = 30
+) -> Tuple[Optional[Dict[str, Dict[str, Optional[float]]]], List[str]]:
+    """
+    Asset correlations of daily returns from the shared correlation engine.
+
+    Symbols without a price series keep their row and column with None
+    entries (1.0 on the diagonal) and are listed as missing. The matrix is
+    None only when no symbol has data or the engine is unavailable.
+    """
+    try:
+        from src.core.services.simple_correlation_service import get_simple_correlation_service
+        result = await get_simple_correlation_service().engine.correlation_matrix(symbols_list, days)
+    except Exception as e:
+        logger.warning(f"Price correlations unavailable: {e}")
+        return None, []
+
+    unavailable = set(result['missing'])
+    missing = [symbol for symbol in symbols_list if symbol in unavailable]
+    if len(missing) == len(symbols_list):
+        return None, missing
+    if missing:
+        logger.info(f"No price data for {len(missing)} symbols: {', '.join(missing)}")
+
+    matrix = result['matrix']
+    return {
+        symbol1: {
+            symbol2: (None if np.isnan(matrix[i, j]) else round(float(matrix[i, j]), 2))
+            for j, symbol2 in enumerate(symbols_list)
+        }
+        for i, symbol1 in enumerate(symbols_list)
+    }, missing
+
 async def _get_matrix_data_internal(symbols_list: List[str], timeframe: str, include_correlations: bool) -> Dict[str, Any]:
     """Internal function to generate matrix data without Query objects."""
     try:
@@ -431,6 +465,7 @@ async def _get_matrix_data_internal(symbols_list: List[str], timeframe: str, inc
         # Get dashboard integration service
         integration = get_dashboard_integration()
         matrix_data = {}
+        missing_symbols: List[str] = []
         
         if integration:
             # Get real signal data from dashboard integration
@@ -518,31 +553,34 @@ async def _get_matrix_data_internal(symbols_list: List[str], timeframe: str, inc
             # Try to calculate real signal correlations from database
             logger.info("Dashboard integration not available - attempting database signal correlations")
 
-            # Generate realistic mock correlation matrix
+            # Real price correlations from the shared price panel when available
             import random
             random.seed(42)  # Consistent mock data
 
-            correlation_matrix = {}
-            for symbol1 in symbols_list:
-                correlation_matrix[symbol1] = {}
-                for symbol2 in symbols_list:
-                    if symbol1 == symbol2:
-                        correlation_matrix[symbol1][symbol2] = 1.0
-                    else:
-                        # Generate realistic correlations (0.6-0.9 for crypto pairs)
-                        # BTC-ETH typically higher, altcoins more varied
-                        if "BTC" in symbol1 and "ETH" in symbol2 or "ETH" in symbol1 and "BTC" in symbol2:
-                            corr = round(random.uniform(0.82, 0.92), 2)
-                        elif "BTC" in symbol1 or "BTC" in symbol2:
-                            corr = round(random.uniform(0.70, 0.85), 2)
+            correlation_matrix, missing_symbols = await _price_correlations(symbols_list)
+            if correlation_matrix is None:
+                # Generate realistic mock correlation matrix
+                correlation_matrix = {}
+                for symbol1 in symbols_list:
+                    correlation_matrix[symbol1] = {}
+                    for symbol2 in symbols_list:
+                        if symbol1 == symbol2:
+                            correlation_matrix[symbol1][symbol2] = 1.0
                         else:
-                            corr = round(random.uniform(0.60, 0.80), 2)
+                            # Generate realistic correlations (0.6-0.9 for crypto pairs)
+                            # BTC-ETH typically higher, altcoins more varied
+                            if "BTC" in symbol1 and "ETH" in symbol2 or "ETH" in symbol1 and "BTC" in symbol2:
+                                corr = round(random.uniform(0.82, 0.92), 2)
+                            elif "BTC" in symbol1 or "BTC" in symbol2:
+                                corr = round(random.uniform(0.70, 0.85), 2)
+                            else:
+                                corr = round(random.uniform(0.60, 0.80), 2)
 
-                        # Ensure symmetry
-                        if symbol2 in correlation_matrix and symbol1 in correlation_matrix[symbol2]:
-                            correlation_matrix[symbol1][symbol2] = correlation_matrix[symbol2][symbol1]
-                        else:
-                            correlation_matrix[symbol1][symbol2] = corr
+                            # Ensure symmetry
+                            if symbol2 in correlation_matrix and symbol1 in correlation_matrix[symbol2]:
+                                correlation_matrix[symbol1][symbol2] = correlation_matrix[symbol2][symbol1]
+                            else:
+                                correlation_matrix[symbol1][symbol2] = corr
 
             correlations = correlation_matrix
 
@@ -576,7 +614,8 @@ async def _get_matrix_data_internal(symbols_list: List[str], timeframe: str, inc
                 "timeframe": timeframe,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
                 "total_symbols": len(symbols_list),
-                "total_signals": len(SIGNAL_TYPES)
+                "total_signals": len(SIGNAL_TYPES),
+                "missing_symbols": missing_symbols
             }
         }
         
@@ -608,6 +647,7 @@ async def get_signal_confluence_matrix(
         # Get dashboard integration service
         integration = get_dashboard_integration()
         matrix_data = {}
+        missing_symbols: List[str] = []
         
         if integration:
             # Get real signal data from dashboard integration
@@ -695,31 +735,34 @@ async def get_signal_confluence_matrix(
             # Try to calculate real signal correlations from database
             logger.info("Dashboard integration not available - attempting database signal correlations")
 
-            # Generate realistic mock correlation matrix
+            # Real price correlations from the shared price panel when available
             import random
             random.seed(42)  # Consistent mock data
 
-            correlation_matrix = {}
-            for symbol1 in symbols_list:
-                correlation_matrix[symbol1] = {}
-                for symbol2 in symbols_list:
-                    if symbol1 == symbol2:
-                        correlation_matrix[symbol1][symbol2] = 1.0
-                    else:
-                        # Generate realistic correlations (0.6-0.9 for crypto pairs)
-                        # BTC-ETH typically higher, altcoins more varied
-                        if "BTC" in symbol1 and "ETH" in symbol2 or "ETH" in symbol1 and "BTC" in symbol2:
-                            corr = round(random.uniform(0.82, 0.92), 2)
-                        elif "BTC" in symbol1 or "BTC" in symbol2:
-                            corr = round(random.uniform(0.70, 0.85), 2)
+            correlation_matrix, missing_symbols = await _price_correlations(symbols_list)
+            if correlation_matrix is None:
+                # Generate realistic mock correlation matrix
+                correlation_matrix = {}
+                for symbol1 in symbols_list:
+                    correlation_matrix[symbol1] = {}
+                    for symbol2 in symbols_list:
+                        if symbol1 == symbol2:
+                            correlation_matrix[symbol1][symbol2] = 1.0
                         else:
-                            corr = round(random.uniform(0.60, 0.80), 2)
+                            # Generate realistic correlations (0.6-0.9 for crypto pairs)
+                            # BTC-ETH typically higher, altcoins more varied
+                            if "BTC" in symbol1 and "ETH" in symbol2 or "ETH" in symbol1 and "BTC" in symbol2:
+                                corr = round(random.uniform(0.82, 0.92), 2)
+                            elif "BTC" in symbol1 or "BTC" in symbol2:
+                                corr = round(random.uniform(0.70, 0.85), 2)
+                            else:
+                                corr = round(random.uniform(0.60, 0.80), 2)
 
-                        # Ensure symmetry
-                        if symbol2 in correlation_matrix and symbol1 in correlation_matrix[symbol2]:
-                            correlation_matrix[symbol1][symbol2] = correlation_matrix[symbol2][symbol1]
-                        else:
-                            correlation_matrix[symbol1][symbol2] = corr
+                            # Ensure symmetry
+                            if symbol2 in correlation_matrix and symbol1 in correlation_matrix[symbol2]:
+                                correlation_matrix[symbol1][symbol2] = correlation_matrix[symbol2][symbol1]
+                            else:
+                                correlation_matrix[symbol1][symbol2] = corr
 
             correlations = correlation_matrix
 
@@ -753,7 +796,8 @@ async def get_signal_confluence_matrix(
                 "timeframe": timeframe,
                 "timestamp": datetime.now(timezone.utc).isoformat(),
                 "total_symbols": len(symbols_list),
-                "total_signals": len(SIGNAL_TYPES)
+                "total_signals": len(SIGNAL_TYPES),
+                "missing_symbols": missing_symbols
             }
         }
         
@@ -3213,6 +3213,18 @@ async def get_performance_chart() -> Dict[str, Any]:
             {"symbol": "ALGOUSDT", "beta": 1.43, "performance": -0.5, "market_cap": 20}
         ]
         
+        # Replace static betas with real ones from the shared price panel
+        if CORRELATION_SERVICE_AVAILABLE:
+            try:
+                betas = await get_simple_correlation_service().calculate_betas(
+                    [d['symbol'] for d in scatter_data], days=30
+                )
+                for item in scatter_data:
+                    if item['symbol'] in betas:
+                        item['beta'] = betas[item['symbol']]
+            except Exception as e:
+                logger.error(f"Error calculating real betas: {e}")
+        
         # Update with real performance data if available
         local_integration = get_dashboard_integration()
         if local_integration and hasattr(local_integration, '_dashboard_data'):
@@ -3257,6 +3269,30 @@ async def get_risk_distribution() -> Dict[str, Any]:
             {"category": "Medium Risk (0.8 ≤ β < 1.2)", "count": 5, "percentage": 33.3, "color": "#f59e0b"},
             {"category": "High Risk (β ≥ 1.2)", "count": 8, "percentage": 53.4, "color": "#ef4444"}
         ]
+        total_assets = 15
+        avg_portfolio_beta = 1.28
+
+        # Bucket real betas when the correlation service can provide them
+        if CORRELATION_SERVICE_AVAILABLE:
+            try:
+                betas = list((await get_simple_correlation_service().calculate_betas(
+                    ["BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT", "ADAUSDT", "DOTUSDT", "AVAXUSDT",
+                     "NEARUSDT", "ATOMUSDT", "LINKUSDT", "UNIUSDT", "LTCUSDT", "APTUSDT", "ARBUSDT", "OPUSDT"],
+                    days=30
+                )).values())
+                if betas:
+                    counts = [
+                        sum(1 for b in betas if b < 0.8),
+                        sum(1 for b in betas if 0.8 <= b < 1.2),
+                        sum(1 for b in betas if b >= 1.2)
+                    ]
+                    for category, count in zip(risk_categories, counts):
+                        category["count"] = count
+                        category["percentage"] = round(count / len(betas) * 100, 1)
+                    total_assets = len(betas)
+                    avg_portfolio_beta = round(sum(betas) / len(betas), 2)
+            except Exception as e:
+                logger.error(f"Error calculating real beta distribution: {e}")
         
         # Sector allocation
         sector_allocation = [
@@ -3270,8 +3306,8 @@ async def get_risk_distribution() -> Dict[str, Any]:
         return {
             "risk_distribution": risk_categories,
             "sector_allocation": sector_allocation,
-            "total_assets": 15,
-            "avg_portfolio_beta": 1.28,
+            "total_assets": total_assets,
+            "avg_portfolio_beta": avg_portfolio_beta,
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "status": "success"
         }
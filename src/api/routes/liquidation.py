@@ -16,6 +16,7 @@
 )
 from src.core.market.market_data_manager import DataUnavailableError
 from src.core.analysis.liquidation_detector import LiquidationDetectionEngine
+from src.core.analysis.liquidation_window import get_liquidation_aggregator
 from src.core.exchanges.manager import ExchangeManager
 
 router = APIRouter()
@@ -912,6 +913,38 @@ async def get_liquidation_zones(
         )
 
 
+@router.get("/aggregates")
+async def get_liquidation_aggregates(
+    symbol: Optional[str] = Query(None, description="Trading symbol; all symbols when omitted"),
+    window: int = Query(300, description="Window length in seconds (60, 300 or 900)"),
+    request: Request = None
+):
+    """
+    Get live liquidation totals over a sliding window.
+
+    Returns the same running totals the aggregate cascade alerts use:
+    count, total/long/short USD, value-weighted average price and the
+    largest liquidation, for one symbol or globally with a per-symbol
+    breakdown.
+    """
+    alert_manager = getattr(request.app.state, "alert_manager", None) if request else None
+    aggregator = getattr(alert_manager, "liquidation_aggregator", None) or get_liquidation_aggregator()
+    if aggregator is None:
+        raise HTTPException(status_code=503, detail="Liquidation aggregator not available")
+
+    if window not in aggregator.windows:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported window {window}s; choose one of {list(aggregator.windows)}"
+        )
+
+    if symbol:
+        result = aggregator.window_stats(symbol.upper(), window)
+    else:
+        result = aggregator.summary(window)
+    return {**result, "timestamp": datetime.now().isoformat()}
+
+
 @router.get("/summary")
 async def get_liquidation_summary(
     symbol: str = Query("BTCUSDT", description="Trading symbol"),
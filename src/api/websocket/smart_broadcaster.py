@@ -10,7 +10,7 @@
 import time
 from typing import Dict, List, Any, Optional, Set, Callable
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import defaultdict, deque
 from fastapi import WebSocket
 from enum import Enum
 import weakref
@@ -45,6 +45,11 @@ class ClientConnection:
     message_count: int = 0
     is_mobile: bool = False
     bandwidth_limit: Optional[int] = None  # Messages per second
+    # Pre-encoded payloads awaiting send; drop-oldest when full
+    send_queue: deque = field(default_factory=deque)
+    send_ready: asyncio.Event = field(default_factory=asyncio.Event)
+    sender_task: Optional[asyncio.Task] = None
+    dropped_messages: int = 0
 
 @dataclass
 class QueuedMessage:
@@ -59,7 +64,13 @@ class QueuedMessage:
 class SmartWebSocketBroadcaster:
     """Optimized WebSocket message delivery with intelligent routing"""
     
-    def __init__(self):
+    def __init__(self, send_queue_size: int = 100):
+        """
+        Args:
+            send_queue_size: Pending messages kept per client; when a slow
+                client falls further behind, its oldest messages are dropped
+        """
+        self.send_queue_size = send_queue_size
         self.clients: Dict[str, ClientConnection] = {}
         self.subscriptions: Dict[str, Set[str]] = defaultdict(set)  # topic -> client_ids
         self.message_queue: asyncio.Queue = asyncio.Queue()
@@ -71,7 +82,9 @@ def __init__(self):
             'clients_connected': 0,
             'clients_disconnected': 0,
             'avg_delivery_time': 0,
-            'queue_size': 0
+            'queue_size': 0,
+            'messages_dropped': 0,
+            'payloads_encoded': 0
         }
         self._running = False
     
@@ -91,6 +104,9 @@ async def stop(self):
                 await self.processing_task
             except asyncio.CancelledError:
                 pass
+        for client in self.clients.values():
+            if client.sender_task:
+                client.sender_task.cancel()
         logger.info("Smart WebSocket broadcaster stopped")
     
     async def connect_client(self, websocket: WebSocket, client_id: Optional[str] = None) -> str:
@@ -107,11 +123,15 @@ async def connect_client(self, websocket: WebSocket, client_id: Optional[str] =
             websocket=websocket,
             client_id=client_id,
             is_mobile=is_mobile,
-            bandwidth_limit=10 if is_mobile else 50  # Messages per second limit
+            bandwidth_limit=10 if is_mobile else 50,  # Messages per second limit
+            send_queue=deque(maxlen=self.send_queue_size)
         )
         
         self.clients[client_id] = client
         self._stats['clients_connected'] += 1
+        client.sender_task = create_tracked_task(
+            self._client_sender(client), name=f"ws_sender_{client_id}"
+        )
         
         logger.info(f"Client {client_id} connected (mobile: {is_mobile})")
         
@@ -144,7 +164,9 @@ async def disconnect_client(self, client_id: str):
                 if subscribers
             }
             
-            del self.clients[client_id]
+            client = self.clients.pop(client_id)
+            if client.sender_task and client.sender_task is not asyncio.current_task():
+                client.sender_task.cancel()
             self._stats['clients_disconnected'] += 1
             
             logger.info(f"Client {client_id} disconnected")
@@ -283,33 +305,33 @@ async def _process_message_queue(self):
                 logger.error(f"Error processing message queue: {e}")
     
     async def _deliver_message(self, message: QueuedMessage):
-        """Deliver message to target clients"""
+        """Deliver message to target clients.
+        
+        The message is serialized once per variant (desktop/mobile) and the
+        same payload is queued on every target client's send queue, so one
+        slow socket never holds up delivery to the others.
+        """
         start_time = time.time()
         delivered_count = 0
         failed_count = 0
+        payloads: Dict[bool, str] = {}
         
-        # Create delivery tasks
-        delivery_tasks = []
         for client_id in message.target_clients:
-            if client_id in self.clients:
-                task = self._send_to_client(client_id, message.content)
-                delivery_tasks.append((client_id, task))
-        
-        if delivery_tasks:
-            # Execute deliveries in parallel with timeout
-            results = await asyncio.gather(
-                *[task for _, task in delivery_tasks],
-                return_exceptions=True
-            )
+            client = self.clients.get(client_id)
+            if client is None:
+                continue
+            
+            # Check bandwidth limits for mobile clients
+            if client.is_mobile and not await self._check_bandwidth_limit(client):
+                failed_count += 1
+                continue
             
-            # Count successes and failures
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    failed_count += 1
-                    client_id = delivery_tasks[i][0]
-                    logger.warning(f"Failed to deliver message to {client_id}: {result}")
-                else:
-                    delivered_count += 1
+            payload = payloads.get(client.is_mobile)
+            if payload is None:
+                payload = payloads[client.is_mobile] = self._encode_message(message.content, client.is_mobile)
+            
+            self._enqueue_payload(client, payload)
+            delivered_count += 1
         
         # Update statistics
         self._stats['total_messages'] += 1
@@ -321,7 +343,38 @@ async def _deliver_message(self, message: QueuedMessage):
         total_messages = self._stats['total_messages']
         self._stats['avg_delivery_time'] = ((current_avg * (total_messages - 1)) + delivery_time) / total_messages
         
-        logger.debug(f"Message delivered to {delivered_count}/{len(message.target_clients)} clients in {delivery_time:.2f}ms")
+        logger.debug(f"Message queued for {delivered_count}/{len(message.target_clients)} clients in {delivery_time:.2f}ms")
+    
+    def _encode_message(self, message: Dict[str, Any], is_mobile: bool) -> str:
+        """Serialize a message for one client variant"""
+        if is_mobile:
+            message = self._optimize_message_for_mobile(message)
+        self._stats['payloads_encoded'] += 1
+        return json.dumps(message)
+    
+    def _enqueue_payload(self, client: ClientConnection, payload: str):
+        """Queue an encoded payload, dropping the oldest one if the client is behind"""
+        if len(client.send_queue) == client.send_queue.maxlen:
+            client.dropped_messages += 1
+            self._stats['messages_dropped'] += 1
+        client.send_queue.append(payload)
+        client.send_ready.set()
+    
+    async def _client_sender(self, client: ClientConnection):
+        """Drain one client's send queue; runs for the lifetime of the connection"""
+        try:
+            while True:
+                await client.send_ready.wait()
+                client.send_ready.clear()
+                while client.send_queue:
+                    await client.websocket.send_text(client.send_queue.popleft())
+                    client.message_count += 1
+                    client.last_heartbeat = time.time()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Error sending to client {client.client_id}: {e}")
+            await self.disconnect_client(client.client_id)
     
     async def _send_to_client(self, client_id: str, message: Dict[str, Any]) -> bool:
         """Send message to a specific client"""
@@ -335,12 +388,8 @@ async def _send_to_client(self, client_id: str, message: Dict[str, Any]) -> bool
             if client.is_mobile and not await self._check_bandwidth_limit(client):
                 return False
             
-            # Optimize message for mobile clients
-            if client.is_mobile:
-                message = self._optimize_message_for_mobile(message)
-            
             # Send message
-            await client.websocket.send_text(json.dumps(message))
+            await client.websocket.send_text(self._encode_message(message, client.is_mobile))
             client.message_count += 1
             client.last_heartbeat = time.time()
             
@@ -349,7 +398,7 @@ async def _send_to_client(self, client_id: str, message: Dict[str, Any]) -> bool
         except Exception as e:
             logger.error(f"Error sending to client {client_id}: {e}")
             # Schedule client for disconnection
-            create_tracked_task(self.disconnect_client, name="disconnect_client_task")
+            create_tracked_task(self.disconnect_client(client_id), name="disconnect_client_task")
             return False
     
     async def _filter_clients_for_message(self, client_ids: List[str], topic: str, data: Dict[str, Any]) -> List[str]:
@@ -408,18 +457,19 @@ def _optimize_message_for_mobile(self, message: Dict[str, Any]) -> Dict[str, Any
         # Remove unnecessary fields for mobile
         mobile_message = message.copy()
         
-        # Reduce precision for mobile
+        # Reduce precision for mobile; copies so the desktop payload keeps full precision
         if 'data' in mobile_message and isinstance(mobile_message['data'], dict):
-            data = mobile_message['data']
+            data = mobile_message['data'] = dict(mobile_message['data'])
             
             # Round numerical values
             for key, value in data.items():
                 if isinstance(value, float):
                     data[key] = round(value, 2)
                 elif isinstance(value, dict):
-                    for sub_key, sub_value in value.items():
-                        if isinstance(sub_value, float):
-                            value[sub_key] = round(sub_value, 2)
+                    data[key] = {
+                        sub_key: round(sub_value, 2) if isinstance(sub_value, float) else sub_value
+                        for sub_key, sub_value in value.items()
+                    }
         
         return mobile_message
     
@@ -478,7 +528,9 @@ def get_client_info(self) -> List[Dict[str, Any]]:
                 "message_count": client.message_count,
                 "connection_time": client.connection_time,
                 "last_heartbeat": client.last_heartbeat,
-                "bandwidth_limit": client.bandwidth_limit
+                "bandwidth_limit": client.bandwidth_limit,
+                "pending_messages": len(client.send_queue),
+                "dropped_messages": client.dropped_messages
             }
             for client in self.clients.values()
         ]
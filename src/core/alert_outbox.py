@@ -0,0 +1,504 @@
+"""
+Durable outbox for Discord webhook deliveries.
+
+``AlertManager`` used to post webhooks inline: build the message, call the
+blocking ``DiscordWebhook.execute()`` and ``asyncio.sleep`` between retries,
+all inside the ``send_*`` coroutine awaited by ``_process_symbol``. A Discord
+429 or a slow chart upload therefore stalled symbol analysis.
+
+``AlertOutbox`` splits enqueueing from delivery:
+
+- ``enqueue`` writes the message to the ``alert_outbox`` table (through the
+  shared ``SQLiteAccess`` writer) and returns once the row is committed.
+- Each webhook URL gets one worker task that sends its messages in order
+  (a message waiting for its retry holds back the ones behind it).
+  Workers follow Discord's per-route rate limit headers
+  (``X-RateLimit-Remaining`` / ``X-RateLimit-Reset-After``) and the
+  ``retry_after`` of a 429, and retry 5xx / network errors with exponential
+  backoff, all off the caller's path.
+- Embed-only messages queued together for the same webhook are coalesced
+  into one multi-embed message (up to Discord's 10 embeds / 6000 characters).
+- Delivered rows are deleted; rows still pending at shutdown are picked up
+  again by the next ``start()``.
+
+``get_stats`` reports queue depth per webhook and delivery latency
+(enqueue to accepted by Discord).
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import aiohttp
+
+from src.database.sqlite_access import get_db_access
+from src.utils.task_tracker import create_tracked_task
+
+# Discord message limits
+MAX_EMBEDS = 10
+MAX_EMBED_CHARS = 6000
+MAX_CONTENT_CHARS = 2000
+
+RETRYABLE_STATUS = {500, 502, 503, 504}
+
+# (status, headers with lower-case names, body text)
+PostResult = Tuple[int, Mapping[str, str], str]
+Sender = Callable[[str, Dict[str, Any], List[Tuple[str, bytes]]], Awaitable[PostResult]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS alert_outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    webhook_url TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    files TEXT,
+    alert_type TEXT,
+    coalescable INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT
+)
+"""
+
+
+@dataclass
+class OutboxEntry:
+    """One queued webhook message."""
+    entry_id: int
+    webhook_url: str
+    payload: Dict[str, Any]
+    files: List[str] = field(default_factory=list)
+    alert_type: Optional[str] = None
+    coalesce: bool = False
+    attempts: int = 0
+    created_at: float = field(default_factory=time.time)
+    next_attempt_at: float = 0.0
+
+
+def _embed_chars(embed: Dict[str, Any]) -> int:
+    """Characters Discord counts against the 6000 per-message embed limit."""
+    total = len(embed.get('title') or '') + len(embed.get('description') or '')
+    for item in ('footer', 'author'):
+        part = embed.get(item)
+        if isinstance(part, dict):
+            total += len(part.get('text') or part.get('name') or '')
+    for field_data in embed.get('fields') or []:
+        total += len(str(field_data.get('name', ''))) + len(str(field_data.get('value', '')))
+    return total
+
+
+def _is_coalescable(payload: Dict[str, Any], files: Sequence[str]) -> bool:
+    embeds = payload.get('embeds') or []
+    return not files and 0 < len(embeds) <= MAX_EMBEDS
+
+
+def _read_files(paths: Sequence[str]) -> Tuple[List[Tuple[str, bytes]], List[str]]:
+    attachments, missing = [], []
+    for path in paths:
+        try:
+            with open(path, 'rb') as f:
+                content = f.read()
+        except OSError:
+            missing.append(path)
+            continue
+        if content:
+            attachments.append((os.path.basename(path), content))
+        else:
+            missing.append(path)
+    return attachments, missing
+
+
+class _Route:
+    """Queue, worker and rate limit state of one webhook URL."""
+
+    __slots__ = ('url', 'queue', 'wakeup', 'task', 'blocked_until', 'sent', 'label')
+
+    def __init__(self, url: str):
+        self.url = url
+        self.queue: Deque[OutboxEntry] = deque()
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        # monotonic time before which the route must not post
+        self.blocked_until = 0.0
+        self.sent = 0
+        # Webhook id only; the token part of the URL stays out of stats and logs
+        parts = url.rstrip('/').split('/')
+        self.label = parts[-2] if len(parts) >= 2 else url[:20]
+
+
+class AlertOutbox:
+    """SQLite-backed webhook outbox with one rate-limited worker per webhook."""
+
+    def __init__(
+        self,
+        db_path: str = 'data/virtuoso.db',
+        sender: Optional[Sender] = None,
+        max_attempts: int = 5,
+        initial_retry_delay: float = 2.0,
+        max_retry_delay: float = 60.0,
+        coalesce_window: float = 0.5,
+        request_timeout: float = 30.0,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Args:
+            db_path: SQLite database holding the ``alert_outbox`` table
+            sender: Coroutine posting one message; defaults to an aiohttp post
+            max_attempts: Attempts before a message is marked failed (429
+                responses do not count)
+            initial_retry_delay: Backoff after the first failed attempt
+            max_retry_delay: Upper bound of the backoff
+            coalesce_window: Seconds a fresh embed-only message waits for
+                others to share its post
+            request_timeout: Timeout of the default sender
+            logger: Logger to use
+        """
+        self.db_path = db_path
+        self.max_attempts = max_attempts
+        self.initial_retry_delay = initial_retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.coalesce_window = coalesce_window
+        self.request_timeout = request_timeout
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._db = get_db_access(db_path)
+        self._db.execute(_SCHEMA)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_outbox_status ON alert_outbox (status, id)")
+
+        self._sender = sender or self._post
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._routes: Dict[str, _Route] = {}
+        self._global_blocked_until = 0.0
+        self._started = False
+        self._start_lock: Optional[asyncio.Lock] = None
+
+        self._latencies: Deque[float] = deque(maxlen=1000)
+        self.stats = {
+            'enqueued': 0,
+            'delivered': 0,
+            'posts': 0,
+            'coalesced': 0,
+            'retries': 0,
+            'rate_limited': 0,
+            'failed': 0,
+            'recovered': 0,
+            'attachment_failures': 0
+        }
+
+    # -- Enqueueing --------------------------------------------------------
+
+    async def enqueue(
+        self,
+        webhook_url: str,
+        payload: Dict[str, Any],
+        files: Optional[Sequence[str]] = None,
+        alert_type: Optional[str] = None,
+        coalesce: bool = True
+    ) -> int:
+        """Durably queue a webhook message and return its outbox id.
+
+        Args:
+            webhook_url: Discord webhook URL
+            payload: JSON body (content, username, embeds, ...)
+            files: Paths attached when the message is sent
+            alert_type: Alert type, kept for inspection of the table
+            coalesce: Allow merging with neighbouring embed-only messages
+        """
+        await self.start()
+        files = list(files or [])
+        coalesce = coalesce and _is_coalescable(payload, files)
+        now = time.time()
+        entry_id = await self._write(
+            "INSERT INTO alert_outbox (webhook_url, payload, files, alert_type, coalescable, created_at, next_attempt_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (webhook_url, json.dumps(payload, default=str), json.dumps(files), alert_type, int(coalesce), now, now)
+        )
+        self.stats['enqueued'] += 1
+        self._push(OutboxEntry(entry_id, webhook_url, payload, files, alert_type, coalesce,
+                               created_at=now, next_attempt_at=now))
+        return entry_id
+
+    async def _write(self, sql: str, params: Sequence[Any] = ()) -> Any:
+        # Waited-on writes commit as soon as the writer is free, off the event loop
+        return await self._db.run_async(self._db.execute, sql, params)
+
+    def _push(self, entry: OutboxEntry) -> None:
+        route = self._routes.get(entry.webhook_url)
+        if route is None:
+            route = self._routes[entry.webhook_url] = _Route(entry.webhook_url)
+        route.queue.append(entry)
+        route.wakeup.set()
+        if route.task is None or route.task.done():
+            route.task = create_tracked_task(self._run_route(route), name=f"alert_outbox_{route.label}")
+
+    # -- Lifecycle ---------------------------------------------------------
+
+    async def start(self) -> None:
+        """Load messages left pending by a previous run and start their workers."""
+        if self._started:
+            return
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._started:
+                return
+            rows = await self._db.read_async(lambda conn: conn.execute(
+                "SELECT id, webhook_url, payload, files, alert_type, coalescable, attempts, created_at, next_attempt_at "
+                "FROM alert_outbox WHERE status = 'pending' ORDER BY id"
+            ).fetchall())
+            self._started = True
+            for row in rows:
+                self._push(OutboxEntry(
+                    row['id'], row['webhook_url'], json.loads(row['payload']), json.loads(row['files'] or '[]'),
+                    row['alert_type'], bool(row['coalescable']), row['attempts'], row['created_at'], row['next_attempt_at']
+                ))
+            if rows:
+                self.stats['recovered'] += len(rows)
+                self.logger.info(f"Alert outbox recovered {len(rows)} pending messages")
+
+    async def stop(self, drain_timeout: float = 5.0) -> None:
+        """Give the workers ``drain_timeout`` seconds to empty their queues, then stop them.
+
+        Undelivered messages stay in the table for the next ``start()``.
+        """
+        deadline = time.monotonic() + drain_timeout
+        while self.queue_depth and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        tasks = [route.task for route in self._routes.values() if route.task and not route.task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._routes.clear()
+        self._started = False
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    # -- Delivery ----------------------------------------------------------
+
+    async def _run_route(self, route: _Route) -> None:
+        while True:
+            if not route.queue:
+                route.wakeup.clear()
+                await route.wakeup.wait()
+                continue
+
+            head = route.queue[0]
+            delay = max(
+                head.next_attempt_at - time.time(),
+                max(route.blocked_until, self._global_blocked_until) - time.monotonic()
+            )
+            if head.coalesce and head.attempts == 0:
+                # Let a burst build up behind a fresh message
+                delay = max(delay, head.created_at + self.coalesce_window - time.time())
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            try:
+                await self._deliver(route, self._take_batch(route))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Keep the worker alive; the head is retried with backoff
+                self.logger.error(f"Alert outbox worker {route.label} error: {e}", exc_info=True)
+                if route.queue:
+                    await self._retry(route, [route.queue[0]], str(e))
+
+    def _take_batch(self, route: _Route) -> List[OutboxEntry]:
+        head = route.queue[0]
+        batch = [head]
+        if not head.coalesce:
+            return batch
+        embeds = len(head.payload['embeds'])
+        chars = sum(_embed_chars(e) for e in head.payload['embeds'])
+        content = len(head.payload.get('content') or '')
+        now = time.time()
+        for entry in list(route.queue)[1:]:
+            if not entry.coalesce or entry.next_attempt_at > now:
+                break
+            if (entry.payload.get('username'), entry.payload.get('avatar_url')) != \
+                    (head.payload.get('username'), head.payload.get('avatar_url')):
+                break
+            entry_embeds = entry.payload['embeds']
+            entry_chars = sum(_embed_chars(e) for e in entry_embeds)
+            entry_content = len(entry.payload.get('content') or '')
+            if (embeds + len(entry_embeds) > MAX_EMBEDS or chars + entry_chars > MAX_EMBED_CHARS
+                    or content + entry_content + 1 > MAX_CONTENT_CHARS):
+                break
+            batch.append(entry)
+            embeds += len(entry_embeds)
+            chars += entry_chars
+            content += entry_content + 1
+        return batch
+
+    @staticmethod
+    def _merge(batch: List[OutboxEntry]) -> Dict[str, Any]:
+        if len(batch) == 1:
+            return batch[0].payload
+        payload = dict(batch[0].payload)
+        payload['embeds'] = [embed for entry in batch for embed in entry.payload['embeds']]
+        contents = [entry.payload.get('content') for entry in batch if entry.payload.get('content')]
+        if contents:
+            payload['content'] = '\n'.join(contents)
+        return payload
+
+    async def _deliver(self, route: _Route, batch: List[OutboxEntry]) -> None:
+        files: List[Tuple[str, bytes]] = []
+        if batch[0].files:
+            files, missing = await asyncio.to_thread(_read_files, batch[0].files)
+            if missing:
+                self.stats['attachment_failures'] += len(missing)
+                self.logger.warning(f"Alert outbox {route.label}: attachments not readable, sending without: {missing}")
+
+        try:
+            status, headers, body = await self._sender(route.url, self._merge(batch), files)
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+            self.stats['posts'] += 1
+            await self._retry(route, batch, f"{type(e).__name__}: {e}")
+            return
+        self.stats['posts'] += 1
+        self._apply_rate_limit(route, status, headers, body)
+
+        if 200 <= status < 300:
+            await self._complete(route, batch)
+        elif status == 429:
+            self.stats['rate_limited'] += 1
+            self.logger.warning(f"Alert outbox {route.label} rate limited, "
+                                f"waiting {max(0.0, route.blocked_until - time.monotonic()):.1f}s")
+        elif status in RETRYABLE_STATUS:
+            await self._retry(route, batch, f"HTTP {status}: {body[:200]}")
+        elif len(batch) > 1:
+            # A merged message was rejected; send its parts on their own
+            for entry in batch:
+                entry.coalesce = False
+            self.logger.warning(f"Alert outbox {route.label} rejected a coalesced message (HTTP {status}), splitting")
+        else:
+            await self._fail(route, batch, f"HTTP {status}: {body[:200]}")
+
+    def _apply_rate_limit(self, route: _Route, status: int, headers: Mapping[str, str], body: str) -> None:
+        now = time.monotonic()
+        if status == 429:
+            retry_after = None
+            try:
+                retry_after = float(json.loads(body).get('retry_after'))
+            except (ValueError, TypeError, AttributeError):
+                pass
+            if retry_after is None:
+                try:
+                    retry_after = float(headers.get('retry-after', 1.0))
+                except (TypeError, ValueError):
+                    retry_after = 1.0
+            until = now + retry_after
+            if str(headers.get('x-ratelimit-global', '')).lower() == 'true':
+                self._global_blocked_until = max(self._global_blocked_until, until)
+            route.blocked_until = max(route.blocked_until, until)
+            return
+        remaining = headers.get('x-ratelimit-remaining')
+        reset_after = headers.get('x-ratelimit-reset-after')
+        if remaining is not None and reset_after is not None:
+            try:
+                if int(float(remaining)) <= 0:
+                    route.blocked_until = max(route.blocked_until, now + float(reset_after))
+            except (TypeError, ValueError):
+                pass
+
+    async def _complete(self, route: _Route, batch: List[OutboxEntry]) -> None:
+        for _ in batch:
+            route.queue.popleft()
+        now = time.time()
+        for entry in batch:
+            self._latencies.append(now - entry.created_at)
+        route.sent += len(batch)
+        self.stats['delivered'] += len(batch)
+        self.stats['coalesced'] += len(batch) - 1
+        ids = [entry.entry_id for entry in batch]
+        await self._write(f"DELETE FROM alert_outbox WHERE id IN ({','.join('?' * len(ids))})", ids)
+
+    async def _retry(self, route: _Route, batch: List[OutboxEntry], error: str) -> None:
+        failed = []
+        for entry in batch:
+            entry.attempts += 1
+            if entry.attempts >= self.max_attempts:
+                failed.append(entry)
+                continue
+            delay = min(self.max_retry_delay, self.initial_retry_delay * 2 ** (entry.attempts - 1))
+            entry.next_attempt_at = time.time() + delay
+            self.stats['retries'] += 1
+            await self._write(
+                "UPDATE alert_outbox SET attempts = ?, next_attempt_at = ?, last_error = ? WHERE id = ?",
+                (entry.attempts, entry.next_attempt_at, error[:500], entry.entry_id)
+            )
+        if failed:
+            await self._fail(route, failed, error)
+        else:
+            self.logger.warning(f"Alert outbox {route.label}: {error}; retry {batch[0].attempts}/{self.max_attempts - 1}")
+
+    async def _fail(self, route: _Route, entries: List[OutboxEntry], error: str) -> None:
+        for entry in entries:
+            route.queue.remove(entry)
+        self.stats['failed'] += len(entries)
+        self.logger.error(f"Alert outbox {route.label}: giving up on {len(entries)} message(s): {error}")
+        for entry in entries:
+            await self._write(
+                "UPDATE alert_outbox SET status = 'failed', attempts = ?, last_error = ? WHERE id = ?",
+                (entry.attempts, error[:500], entry.entry_id)
+            )
+
+    async def _post(self, url: str, payload: Dict[str, Any], files: List[Tuple[str, bytes]]) -> PostResult:
+        """Default sender: one aiohttp POST, multipart when files are attached."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.request_timeout))
+        if files:
+            data = aiohttp.FormData()
+            data.add_field('payload_json', json.dumps(payload, default=str), content_type='application/json')
+            for i, (filename, content) in enumerate(files):
+                data.add_field(f'files[{i}]', content, filename=filename)
+            request = self._session.post(url, data=data)
+        else:
+            request = self._session.post(url, json=payload)
+        async with request as response:
+            headers = {name.lower(): value for name, value in response.headers.items()}
+            return response.status, headers, await response.text()
+
+    # -- Metrics -----------------------------------------------------------
+
+    @property
+    def queue_depth(self) -> int:
+        """Messages waiting for delivery across all webhooks."""
+        return sum(len(route.queue) for route in self._routes.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth per webhook, delivery latency percentiles and counters."""
+        latencies = sorted(self._latencies)
+
+        def percentile(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))]
+
+        now, mono = time.time(), time.monotonic()
+        oldest = min((route.queue[0].created_at for route in self._routes.values() if route.queue), default=None)
+        return {
+            **self.stats,
+            'queue_depth': self.queue_depth,
+            'oldest_pending_age': now - oldest if oldest is not None else 0.0,
+            'latency_p50': percentile(0.5),
+            'latency_p95': percentile(0.95),
+            'latency_max': latencies[-1] if latencies else None,
+            'routes': {
+                route.label: {
+                    'queue_depth': len(route.queue),
+                    'sent': route.sent,
+                    'rate_limited_for': max(0.0, max(route.blocked_until, self._global_blocked_until) - mono)
+                }
+                for route in self._routes.values()
+            }
+        }
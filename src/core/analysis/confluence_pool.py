@@ -0,0 +1,503 @@
+"""
+Process-pool execution mode for confluence analysis.
+
+``MarketMonitor._process_symbol`` used to await ``ConfluenceAnalyzer.analyze``
+on the event loop. The analysis is pure pandas/NumPy work across six indicator
+families and blocks WebSocket handling, API routes and alert delivery for its
+whole duration, while only one core is used.
+
+``ConfluenceProcessPool`` runs the analysis in worker processes instead:
+
+- Each worker builds its own analyzer once, in the process initializer,
+  through the same DI registrations as the main process (so it gets the
+  injected interpretation service), and keeps it across tasks.
+- Market data is shipped through one ``SharedMemory`` block per task. OHLCV
+  frames, orderbook levels and the trade tape are written as raw column
+  arrays; only the small remaining fields (ticker, OI, LSR, ...) and the array
+  layout are pickled.
+- Every task has its own timeout. A timed-out task leaves its worker busy, so
+  new tasks go to a fresh pool. The old pool finishes the tasks it already
+  holds, then its processes (including the stuck one) are terminated.
+- Workers are recycled after ``max_tasks_per_worker`` tasks on average to
+  bound memory growth in long-running indicator caches.
+
+Results resolve per task as soon as their worker finishes, so the per-symbol
+scheduler picks each one up independently. ``confluence.process_pool.enabled:
+false`` keeps analysis on the event loop.
+"""
+
+import asyncio
+import importlib
+import inspect
+import logging
+import multiprocessing as mp
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.core.market.trade_tape import TradeTape
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ANALYZER_FACTORY = 'src.core.analysis.confluence_pool:create_worker_analyzer'
+
+# Array offsets inside the shared block are aligned for any NumPy dtype
+_ALIGNMENT = 64
+
+
+class SharedMarketDataWriter:
+    """Collects column arrays and lays them out in one shared memory block."""
+
+    def __init__(self):
+        self._arrays: List[Tuple[str, np.ndarray]] = []
+
+    def add(self, key: str, array: np.ndarray) -> str:
+        self._arrays.append((key, np.ascontiguousarray(array)))
+        return key
+
+    def write(self) -> Tuple[Optional[shared_memory.SharedMemory], Dict[str, Tuple[str, Tuple[int, ...], int]]]:
+        """Copy the collected arrays into a new block.
+
+        Returns:
+            Tuple of (block or None when there is nothing to share,
+            ``{key: (dtype, shape, offset)}`` layout)
+        """
+        layout = {}
+        offset = 0
+        for key, array in self._arrays:
+            layout[key] = (array.dtype.str, array.shape, offset)
+            offset += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+        if offset == 0:
+            return None, layout
+
+        block = shared_memory.SharedMemory(create=True, size=offset)
+        for key, array in self._arrays:
+            dtype, shape, start = layout[key]
+            target = np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=start)
+            target[...] = array
+            del target
+        return block, layout
+
+
+def _frame_spec(writer: SharedMarketDataWriter, key: str, df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+    """Describe a numeric DataFrame as shared columns, or None if it must be pickled."""
+    if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes):
+        return None
+    if df.columns.duplicated().any():
+        return None
+
+    spec: Dict[str, Any] = {'columns': []}
+    for position, column in enumerate(df.columns):
+        array_key = writer.add(f"{key}/c{position}", df.iloc[:, position].to_numpy())
+        spec['columns'].append((column, array_key))
+
+    index = df.index
+    if isinstance(index, pd.RangeIndex):
+        spec['index'] = ('range', (index.start, index.stop, index.step), index.name)
+    elif isinstance(index, pd.DatetimeIndex):
+        tz = str(index.tz) if index.tz is not None else None
+        values = index.tz_convert(None) if tz else index
+        spec['index'] = ('datetime', writer.add(f"{key}/index", values.to_numpy()), index.name, tz)
+    elif pd.api.types.is_numeric_dtype(index.dtype) and not isinstance(index, pd.MultiIndex):
+        spec['index'] = ('values', writer.add(f"{key}/index", index.to_numpy()), index.name)
+    else:
+        return None
+    return spec
+
+
+def _levels_array(levels: Any) -> Optional[np.ndarray]:
+    """Orderbook levels as a float64 (n, 2) array, or None if not rectangular."""
+    if not isinstance(levels, list):
+        return None
+    try:
+        array = np.asarray(levels, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    if array.ndim != 2 or (len(array) and array.shape[1] != 2):
+        return None
+    return array.reshape(len(array), 2)
+
+
+def pack_market_data(market_data: Dict[str, Any]) -> Tuple[Optional[shared_memory.SharedMemory], Dict[str, Any]]:
+    """Split market data into a shared column block and a small picklable spec.
+
+    OHLCV DataFrames, orderbook bid/ask levels and the trade tape go into
+    shared memory; everything else is kept in the spec as is. Fields in an
+    unexpected layout fall back to pickling, so unpacking always returns the
+    same structure that was packed.
+
+    The caller owns the returned block and must ``close()`` and ``unlink()``
+    it once the task has finished.
+
+    Args:
+        market_data: Market data dict as produced by the data collector
+
+    Returns:
+        Tuple of (shared block or None, spec for ``unpack_market_data``)
+    """
+    writer = SharedMarketDataWriter()
+    fields = dict(market_data)
+    spec: Dict[str, Any] = {'fields': fields, 'frames': {}}
+
+    ohlcv = fields.get('ohlcv')
+    if isinstance(ohlcv, dict):
+        remaining = {}
+        for timeframe, df in ohlcv.items():
+            frame_spec = _frame_spec(writer, f"ohlcv/{timeframe}", df) if isinstance(df, pd.DataFrame) else None
+            if frame_spec is None:
+                remaining[timeframe] = df
+            else:
+                spec['frames'][timeframe] = frame_spec
+        fields['ohlcv'] = remaining
+
+    orderbook = fields.get('orderbook')
+    if isinstance(orderbook, dict):
+        levels = {}
+        for side in ('bids', 'asks'):
+            array = _levels_array(orderbook.get(side))
+            if array is not None:
+                levels[side] = writer.add(f"orderbook/{side}", array)
+        if levels:
+            fields['orderbook'] = {k: v for k, v in orderbook.items() if k not in levels}
+            spec['orderbook_levels'] = levels
+
+    tape = fields.pop('trade_tape', None)
+    if isinstance(tape, TradeTape):
+        cols = tape.columns()
+        spec['trade_tape'] = {
+            'symbol': tape.symbol,
+            'capacity': tape.capacity,
+            'appended': tape.stats['appended'],
+            'ids': tape.ids,
+            'columns': {name: writer.add(f"trade_tape/{name}", column) for name, column in cols.items()}
+        }
+        # The legacy trades list is the tape's newest-first materialization
+        trades = fields.get('trades')
+        if trades is not None and trades is tape.to_records():
+            fields.pop('trades')
+            spec['trades_from_tape'] = True
+    elif tape is not None:
+        fields['trade_tape'] = tape
+
+    block, spec['layout'] = writer.write()
+    spec['block'] = block.name if block is not None else None
+    return block, spec
+
+
+def _rebuild_frame(frame_spec: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> pd.DataFrame:
+    index_spec = frame_spec['index']
+    if index_spec[0] == 'range':
+        index = pd.RangeIndex(*index_spec[1], name=index_spec[2])
+    elif index_spec[0] == 'datetime':
+        index = pd.DatetimeIndex(arrays[index_spec[1]], name=index_spec[2])
+        if index_spec[3]:
+            index = index.tz_localize('UTC').tz_convert(index_spec[3])
+    else:
+        index = pd.Index(arrays[index_spec[1]], name=index_spec[2])
+    columns = {column: arrays[key] for column, key in frame_spec['columns']}
+    return pd.DataFrame(columns, index=index, columns=[column for column, _ in frame_spec['columns']])
+
+
+def unpack_market_data(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild the market data dict from a spec produced by ``pack_market_data``.
+
+    Arrays are copied out of the shared block, so the block can be released
+    as soon as this returns regardless of what the analyzer keeps around.
+    """
+    arrays: Dict[str, np.ndarray] = {}
+    if spec['block'] is not None:
+        block = shared_memory.SharedMemory(name=spec['block'])
+        try:
+            for key, (dtype, shape, offset) in spec['layout'].items():
+                arrays[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=offset).copy()
+        finally:
+            block.close()
+
+    market_data = dict(spec['fields'])
+
+    if spec['frames']:
+        ohlcv = dict(market_data.get('ohlcv') or {})
+        for timeframe, frame_spec in spec['frames'].items():
+            ohlcv[timeframe] = _rebuild_frame(frame_spec, arrays)
+        market_data['ohlcv'] = ohlcv
+
+    if spec.get('orderbook_levels'):
+        orderbook = dict(market_data.get('orderbook') or {})
+        for side, key in spec['orderbook_levels'].items():
+            orderbook[side] = arrays[key].tolist()
+        market_data['orderbook'] = orderbook
+
+    tape_spec = spec.get('trade_tape')
+    if tape_spec is not None:
+        cols = {name: arrays[key] for name, key in tape_spec['columns'].items()}
+        tape = TradeTape.from_columns(
+            tape_spec['symbol'], cols['price'], cols['size'], cols['side'], cols['timestamp'],
+            trade_ids=tape_spec['ids'], capacity=tape_spec['capacity'], appended=tape_spec['appended']
+        )
+        market_data['trade_tape'] = tape
+        if spec.get('trades_from_tape'):
+            market_data['trades'] = tape.to_records()
+
+    return market_data
+
+
+# Per-process analyzer and event loop, created by _init_worker
+_worker_analyzer = None
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _load_factory(path: str):
+    module_name, _, attr = path.partition(':')
+    return getattr(importlib.import_module(module_name), attr)
+
+
+async def create_worker_analyzer(config: Dict[str, Any]):
+    """Resolve a ConfluenceAnalyzer through the DI registrations used by the main process."""
+    from src.core.analysis.confluence import ConfluenceAnalyzer
+    from src.core.di.container import ServiceContainer
+    from src.core.di.registration import register_analysis_services, register_core_services
+
+    container = ServiceContainer()
+    register_core_services(container, config)
+    register_analysis_services(container)
+    return await container.get_service(ConfluenceAnalyzer)
+
+
+def _init_worker(factory_path: str, config: Dict[str, Any]) -> None:
+    """Build the worker's analyzer once, at process start."""
+    global _worker_analyzer, _worker_loop
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+    analyzer = _load_factory(factory_path)(config)
+    if inspect.isawaitable(analyzer):
+        analyzer = _worker_loop.run_until_complete(analyzer)
+    _worker_analyzer = analyzer
+    logger.info(f"Confluence worker {os.getpid()} ready")
+
+
+def _run_analysis(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Worker entry point: unpack the shared market data and run the analyzer."""
+    started = time.perf_counter()
+    market_data = unpack_market_data(spec)
+    unpacked = time.perf_counter()
+    result = _worker_loop.run_until_complete(_worker_analyzer.analyze(market_data))
+    return {
+        'result': result,
+        'pid': os.getpid(),
+        'unpack_ms': (unpacked - started) * 1000,
+        'analysis_ms': (time.perf_counter() - unpacked) * 1000
+    }
+
+
+class ConfluenceProcessPool:
+    """
+    Runs confluence analysis in a pool of worker processes.
+
+    Settings are read from ``confluence.process_pool``:
+
+    - ``enabled``: run analysis in workers (false keeps it on the event loop)
+    - ``workers``: pool size (default: CPU count minus 2, at least 1)
+    - ``task_timeout_seconds``: per-task timeout
+    - ``max_tasks_per_worker``: recycle the pool after this many tasks per worker
+    - ``start_method``: multiprocessing start method ('spawn' by default, so
+      workers never inherit the event loop's threads or sockets)
+    - ``fallback_to_loop_on_error``: tells callers to rerun a failed task in-loop
+
+    Args:
+        config: Application config, also passed to each worker's analyzer factory
+        analyzer_factory: ``module:attr`` path of a callable (sync or async)
+            taking the config and returning an object with
+            ``async analyze(market_data)``
+    """
+
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        analyzer_factory: str = DEFAULT_ANALYZER_FACTORY,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.config = config or {}
+        self.analyzer_factory = analyzer_factory
+        self.logger = logger or logging.getLogger(__name__)
+
+        pool_config = self.config.get('confluence', {}).get('process_pool', {})
+        self.enabled = pool_config.get('enabled', False)
+        self.workers = max(1, int(pool_config.get('workers') or (os.cpu_count() or 2) - 2))
+        self.task_timeout = float(pool_config.get('task_timeout_seconds', 30))
+        self.max_tasks_per_worker = max(1, int(pool_config.get('max_tasks_per_worker', 500)))
+        self.start_method = pool_config.get('start_method', 'spawn')
+        self.fallback_to_loop_on_error = pool_config.get('fallback_to_loop_on_error', True)
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._generation = 0
+        self._generation_tasks = 0
+        self._in_flight = 0
+        # Tasks running per pool generation, and retired pools waiting for theirs to finish
+        self._generation_in_flight: Dict[int, int] = {}
+        self._draining: Dict[int, List[Any]] = {}
+        self.stats = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'timeouts': 0,
+            'recycles': 0,
+            'restarts': 0,
+            'shared_bytes': 0,
+            'last_unpack_ms': 0.0,
+            'last_analysis_ms': 0.0,
+            'last_roundtrip_ms': 0.0
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._executor is not None
+
+    def start(self) -> None:
+        """Create the worker pool (workers are spawned on first use)."""
+        if self._executor is not None:
+            return
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=mp.get_context(self.start_method),
+            initializer=_init_worker,
+            initargs=(self.analyzer_factory, self.config)
+        )
+        self._generation += 1
+        self._generation_tasks = 0
+        self.logger.info(
+            f"Confluence process pool started: {self.workers} workers "
+            f"({self.start_method}), timeout={self.task_timeout}s"
+        )
+
+    def _retire(self, terminate: bool) -> List[Any]:
+        """Detach the current pool and return its processes.
+
+        With ``terminate`` queued tasks are cancelled and the processes killed
+        at once; otherwise the old pool finishes the tasks it holds.
+        """
+        executor, self._executor = self._executor, None
+        if executor is None:
+            return []
+        processes = list((getattr(executor, '_processes', None) or {}).values())
+        executor.shutdown(wait=False, cancel_futures=terminate)
+        if terminate:
+            self._terminate(processes)
+        return processes
+
+    @staticmethod
+    def _terminate(processes: List[Any]) -> None:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    def _recycle_if_due(self) -> None:
+        if self._generation_tasks >= self.workers * self.max_tasks_per_worker:
+            # In-flight tasks finish on the old workers, which then exit
+            self._retire(terminate=False)
+            self.stats['recycles'] += 1
+            self.start()
+
+    async def analyze(self, market_data: Dict[str, Any]) -> Any:
+        """Run ``analyze(market_data)`` in a worker process.
+
+        Raises:
+            asyncio.TimeoutError: the task exceeded ``task_timeout_seconds``
+                (the pool is restarted)
+            BrokenProcessPool: a worker died (the pool is restarted)
+        """
+        if self._executor is None:
+            self.start()
+        self._recycle_if_due()
+
+        started = time.perf_counter()
+        block, spec = pack_market_data(market_data)
+        if block is not None:
+            self.stats['shared_bytes'] += block.size
+        generation = self._generation
+        self._generation_tasks += 1
+        self._generation_in_flight[generation] = self._generation_in_flight.get(generation, 0) + 1
+        self._in_flight += 1
+        self.stats['submitted'] += 1
+        try:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, _run_analysis, spec)
+            try:
+                payload = await asyncio.wait_for(future, timeout=self.task_timeout)
+            except asyncio.TimeoutError:
+                self.stats['timeouts'] += 1
+                self._restart(generation, 'task timeout', drain=True)
+                raise asyncio.TimeoutError(
+                    f"Confluence analysis for {market_data.get('symbol')} exceeded {self.task_timeout}s"
+                )
+            except BrokenProcessPool:
+                self.stats['failed'] += 1
+                self._restart(generation, 'broken pool')
+                raise
+            except Exception:
+                self.stats['failed'] += 1
+                raise
+        finally:
+            self._in_flight -= 1
+            self._task_done(generation)
+            if block is not None:
+                block.close()
+                block.unlink()
+
+        self.stats['completed'] += 1
+        self.stats['last_unpack_ms'] = round(payload['unpack_ms'], 3)
+        self.stats['last_analysis_ms'] = round(payload['analysis_ms'], 3)
+        self.stats['last_roundtrip_ms'] = round((time.perf_counter() - started) * 1000, 3)
+        return payload['result']
+
+    def _restart(self, generation: int, reason: str, drain: bool = False) -> None:
+        """Replace the pool, unless another task already did for this generation.
+
+        With ``drain`` the old pool's other tasks still complete; its processes
+        are terminated once the last of them is done (see ``_task_done``).
+        """
+        if generation != self._generation or self._executor is None:
+            return
+        self.logger.warning(f"Restarting confluence process pool ({reason})")
+        processes = self._retire(terminate=not drain)
+        if drain:
+            self._draining[generation] = processes
+        self.stats['restarts'] += 1
+        self.start()
+
+    def _task_done(self, generation: int) -> None:
+        remaining = self._generation_in_flight.get(generation, 1) - 1
+        if remaining > 0:
+            self._generation_in_flight[generation] = remaining
+            return
+        self._generation_in_flight.pop(generation, None)
+        processes = self._draining.pop(generation, None)
+        if processes is not None:
+            self._terminate(processes)
+            self.logger.info(f"Retired confluence pool generation {generation} after its last task")
+
+    async def stop(self) -> None:
+        """Shut the pool down without waiting for running tasks."""
+        for processes in self._draining.values():
+            self._terminate(processes)
+        self._draining.clear()
+        if self._executor is None:
+            return
+        self._retire(terminate=True)
+        self.logger.info("Confluence process pool stopped")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'enabled': self.enabled,
+            'running': self.running,
+            'workers': self.workers,
+            'in_flight': self._in_flight,
+            'generation': self._generation,
+            'draining_pools': len(self._draining),
+            **self.stats
+        }
@@ -13,6 +13,8 @@
 import hashlib
 import json
 
+from .correlation_engine import CorrelationEngine, matrix_to_rows
+
 logger = logging.getLogger(__name__)
 
 
@@ -78,6 +80,19 @@ def __init__(self, exchange_manager, cache_manager=None):
         # Active calculation cache (in-memory)
         self._correlation_cache = {}
         self._beta_cache = {}
+
+        # Shared price panel for matrix and rolling beta calculations
+        self.engine = CorrelationEngine(
+            self._load_closes,
+            benchmark=self.benchmark_symbol,
+            cache_ttl=self.cache_ttl,
+            min_observations=self.min_observations
+        )
+
+    async def _load_closes(self, symbol: str, days: int, timeframe: str) -> Optional[pd.Series]:
+        """Close prices for the correlation engine."""
+        df = await self.get_historical_prices(symbol, days, timeframe)
+        return None if df.empty else df['close']
         
     async def get_historical_prices(
         self, 
@@ -328,63 +343,33 @@ async def calculate_beta(
     async def calculate_correlation_matrix(
         self, 
         symbols: List[str],
-        days: int = None
+        days: int = None,
+        method: str = "pearson"
     ) -> Dict[str, Any]:
         """
         Calculate correlation matrix for multiple symbols.
+
+        Each symbol is fetched once into a shared price panel and the full
+        matrix is computed in one pass.
         
         Args:
             symbols: List of trading pair symbols
             days: Number of days for analysis
+            method: Correlation method ('pearson', 'spearman')
             
         Returns:
             Dictionary containing correlation matrix and metadata
         """
         if days is None:
             days = self.default_lookback
-            
-        correlation_matrix = []
-        correlation_data = {}
-        
-        # Calculate all pairwise correlations
-        tasks = []
-        for i, symbol1 in enumerate(symbols):
-            for j, symbol2 in enumerate(symbols):
-                if i == j:
-                    # Self-correlation is always 1.0
-                    correlation_data[(symbol1, symbol2)] = 1.0
-                elif (symbol2, symbol1) in correlation_data:
-                    # Use symmetric property
-                    correlation_data[(symbol1, symbol2)] = correlation_data[(symbol2, symbol1)]
-                else:
-                    # Calculate correlation
-                    task = self.calculate_correlation(symbol1, symbol2, days)
-                    tasks.append((symbol1, symbol2, task))
-        
-        # Execute correlation calculations concurrently
-        if tasks:
-            results = await asyncio.gather(*[task[2] for task in tasks], return_exceptions=True)
-            
-            for (symbol1, symbol2, _), result in zip(tasks, results):
-                if isinstance(result, Exception):
-                    self.logger.error(f"Error calculating correlation {symbol1}-{symbol2}: {result}")
-                    correlation_data[(symbol1, symbol2)] = None
-                elif result is not None:
-                    correlation_data[(symbol1, symbol2)] = result.correlation
-                else:
-                    correlation_data[(symbol1, symbol2)] = None
-        
-        # Build matrix
-        for symbol1 in symbols:
-            row = []
-            for symbol2 in symbols:
-                corr_value = correlation_data.get((symbol1, symbol2))
-                row.append(corr_value)
-            correlation_matrix.append(row)
+
+        result = await self.engine.correlation_matrix(symbols, days, method=method)
+        if result['missing']:
+            self.logger.warning(f"No price history for {result['missing']}, correlations left empty")
         
         return {
             "symbols": symbols,
-            "correlation_matrix": correlation_matrix,
+            "correlation_matrix": matrix_to_rows(result['matrix']),
             "timeframe": f"{days}d",
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "status": "success",
@@ -399,6 +384,9 @@ async def calculate_beta_time_series(
     ) -> Dict[str, Any]:
         """
         Calculate rolling beta coefficients over time.
+
+        Windows end on consecutive candles and are computed incrementally
+        from one price panel.
         
         Args:
             symbols: List of trading pair symbols
@@ -408,33 +396,22 @@ async def calculate_beta_time_series(
         Returns:
             Dictionary containing time series beta data
         """
+        rolled = await self.engine.rolling_betas(
+            symbols, window=days_per_window, num_windows=num_windows
+        )
+
         series_data = {}
-        
         for symbol in symbols:
-            data_points = []
-            
-            # Calculate beta for each time window
-            for i in range(num_windows):
-                end_date = datetime.now(timezone.utc) - timedelta(days=i * 1)  # Daily windows
-                
-                # Calculate beta for this window
-                beta_result = await self.calculate_beta(
-                    symbol=symbol,
-                    days=days_per_window
-                )
-                
-                data_point = {
-                    "date": end_date.strftime("%Y-%m-%d"),
-                    "timestamp": int(end_date.timestamp() * 1000),
-                    "beta": beta_result.beta if beta_result else None,
-                    "alpha": beta_result.alpha if beta_result else None,
-                    "r_squared": beta_result.r_squared if beta_result else None
+            series_data[symbol] = [
+                {
+                    "date": point["timestamp"].strftime("%Y-%m-%d"),
+                    "timestamp": int(point["timestamp"].timestamp() * 1000),
+                    "beta": point["beta"],
+                    "alpha": point["alpha"],
+                    "r_squared": point["r_squared"]
                 }
-                data_points.append(data_point)
-            
-            # Reverse to get chronological order
-            data_points.reverse()
-            series_data[symbol] = data_points
+                for point in rolled.get(symbol, [])
+            ]
         
         return {
             "series_data": series_data,
@@ -458,6 +435,7 @@ def clear_cache(self):
         """Clear all cached correlation and beta calculations."""
         self._correlation_cache.clear()
         self._beta_cache.clear()
+        self.engine.clear_cache()
         self.logger.info("Cleared correlation calculation cache")
     
     def get_cache_stats(self) -> Dict[str, Any]:
@@ -466,5 +444,6 @@ def get_cache_stats(self) -> Dict[str, Any]:
             "correlation_cache_size": len(self._correlation_cache),
             "beta_cache_size": len(self._beta_cache),
             "cache_ttl": self.cache_ttl,
-            "min_observations": self.min_observations
+            "min_observations": self.min_observations,
+            "engine": self.engine.get_stats()
         }
\ No newline at end of file
@@ -0,0 +1,410 @@
+"""
+Panel-based correlation and beta engine.
+
+``CorrelationCalculator.calculate_correlation_matrix`` used to schedule one
+``calculate_correlation`` per symbol pair, and every pair fetched the price
+history of both symbols again (~870 OHLCV fetches for a 30 symbol heatmap).
+The engine works on a shared price panel instead:
+
+- Each symbol's close series is fetched once per timeframe (concurrent
+  requests for the same symbol share one fetch) and kept for ``cache_ttl``.
+- The closes are aligned into a ``(T, N)`` returns matrix with NaN where a
+  symbol has no candle.
+- The full Pearson or Spearman matrix and the betas of every symbol come out
+  of a handful of masked matrix products, using pairwise-complete
+  observations like ``DataFrame.corr``.
+- Rolling betas use prefix sums along the time axis, so every window costs
+  O(1) per symbol instead of a fresh regression.
+- Results are cached by (universe, window, timeframe).
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# async (symbol, days, timeframe) -> close prices indexed by candle time
+CloseLoader = Callable[[str, int, str], Awaitable[Optional[pd.Series]]]
+
+
+@dataclass
+class PricePanel:
+    """Aligned simple returns for a universe of symbols."""
+    symbols: List[str]
+    index: pd.DatetimeIndex
+    returns: np.ndarray  # (T, N), NaN where a symbol has no observation
+    missing: List[str]
+    timeframe: str
+
+    def column(self, symbol: str) -> Optional[int]:
+        try:
+            return self.symbols.index(symbol)
+        except ValueError:
+            return None
+
+
+def _pairwise_sums(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Sums over rows where both columns are observed, for every column pair.
+
+    Returns ``(n, sx, sy, sxx, syy, sxy)``, each ``(Nx, Ny)``.
+    """
+    mx, my = ~np.isnan(x), ~np.isnan(y)
+    x0, y0 = np.where(mx, x, 0.0), np.where(my, y, 0.0)
+    fx, fy = mx.astype(np.float64), my.astype(np.float64)
+    return (
+        fx.T @ fy,
+        x0.T @ fy,
+        fx.T @ y0,
+        (x0 * x0).T @ fy,
+        fx.T @ (y0 * y0),
+        x0.T @ y0,
+    )
+
+
+def _moments(n, sx, sy, sxx, syy, sxy):
+    """Pairwise covariance and variances (population normalisation)."""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_x, mean_y = sx / n, sy / n
+        cov = sxy / n - mean_x * mean_y
+        var_x = sxx / n - mean_x ** 2
+        var_y = syy / n - mean_y ** 2
+    return mean_x, mean_y, cov, np.maximum(var_x, 0.0), np.maximum(var_y, 0.0)
+
+
+def correlation_matrix(
+    returns: np.ndarray,
+    method: str = 'pearson',
+    min_observations: int = 2
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Pairwise-complete correlation matrix of the columns of ``returns``.
+
+    Args:
+        returns: ``(T, N)`` matrix, NaN for missing observations
+        method: 'pearson' or 'spearman' (Pearson of per-column ranks)
+        min_observations: Pairs with fewer common rows are NaN
+
+    Returns:
+        ``(correlations, observations)``, both ``(N, N)``
+    """
+    if method == 'spearman':
+        returns = pd.DataFrame(returns).rank().to_numpy()
+    elif method != 'pearson':
+        raise ValueError(f"Unsupported correlation method: {method}")
+
+    n, sx, sy, sxx, syy, sxy = _pairwise_sums(returns, returns)
+    _, _, cov, var_x, var_y = _moments(n, sx, sy, sxx, syy, sxy)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        corr = np.clip(cov / np.sqrt(var_x * var_y), -1.0, 1.0)
+    corr[n < min_observations] = np.nan
+    np.fill_diagonal(corr, 1.0)
+    return corr, n.astype(np.int64)
+
+
+def beta_vector(returns: np.ndarray, benchmark_col: int, min_observations: int = 2) -> Dict[str, np.ndarray]:
+    """OLS beta/alpha/R² of every column against one benchmark column."""
+    bench = returns[:, [benchmark_col]]
+    n, sx, sy, sxx, syy, sxy = (a[:, 0] for a in _pairwise_sums(returns, bench))
+    mean_x, mean_y, cov, var_x, var_y = _moments(n, sx, sy, sxx, syy, sxy)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        beta = np.where(var_y > 0, cov / var_y, np.nan)
+        r_squared = np.where(var_x * var_y > 0, cov ** 2 / (var_x * var_y), np.nan)
+    alpha = mean_x - beta * mean_y
+    invalid = n < min_observations
+    for values in (beta, alpha, r_squared):
+        values[invalid] = np.nan
+    return {
+        'beta': beta,
+        'alpha': alpha,
+        'r_squared': r_squared,
+        'volatility': np.sqrt(var_x),
+        'benchmark_volatility': np.sqrt(var_y),
+        'n_observations': n.astype(np.int64)
+    }
+
+
+def rolling_betas(
+    returns: np.ndarray,
+    benchmark_col: int,
+    window: int,
+    num_windows: int,
+    min_observations: int = 2
+) -> Dict[str, np.ndarray]:
+    """Betas over the last ``num_windows`` windows of ``window`` rows.
+
+    Prefix sums make every window a difference of two rows. Arrays are
+    ``(num_windows, N)`` in chronological order; ``end`` holds the row index
+    each window ends on (inclusive).
+    """
+    t = len(returns)
+    bench = returns[:, [benchmark_col]]
+    mask = ~np.isnan(returns) & ~np.isnan(bench)
+    x = np.where(mask, returns, 0.0)
+    y = np.where(mask, np.broadcast_to(bench, returns.shape), 0.0)
+
+    def prefix(values):
+        out = np.zeros((t + 1, values.shape[1]))
+        np.cumsum(values, axis=0, out=out[1:])
+        return out
+
+    sums = [prefix(v) for v in (mask.astype(np.float64), x, y, x * x, y * y, x * y)]
+    end = np.arange(t - num_windows + 1, t + 1)
+    end = end[end > 0]
+    start = np.maximum(end - window, 0)
+    n, sx, sy, sxx, syy, sxy = (c[end] - c[start] for c in sums)
+
+    mean_x, mean_y, cov, var_x, var_y = _moments(n, sx, sy, sxx, syy, sxy)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        beta = np.where(var_y > 0, cov / var_y, np.nan)
+        r_squared = np.where(var_x * var_y > 0, cov ** 2 / (var_x * var_y), np.nan)
+    alpha = mean_x - beta * mean_y
+    invalid = n < min_observations
+    for values in (beta, alpha, r_squared):
+        values[invalid] = np.nan
+    return {'beta': beta, 'alpha': alpha, 'r_squared': r_squared, 'end': end - 1}
+
+
+class CorrelationEngine:
+    """Shared price panel plus vectorized correlation/beta calculations."""
+
+    def __init__(
+        self,
+        loader: CloseLoader,
+        benchmark: str = 'BTCUSDT',
+        cache_ttl: float = 3600,
+        min_fetch_days: int = 60,
+        min_observations: int = 10
+    ):
+        """
+        Args:
+            loader: ``async (symbol, days, timeframe) -> close Series``
+            benchmark: Default beta benchmark
+            cache_ttl: Seconds price series and results stay cached
+            min_fetch_days: Lookback always fetched, so nearby windows
+                (e.g. 30d matrix and 37d beta series) share one fetch
+            min_observations: Minimum common observations per pair
+        """
+        self.loader = loader
+        self.benchmark = benchmark
+        self.cache_ttl = cache_ttl
+        self.min_fetch_days = min_fetch_days
+        self.min_observations = min_observations
+        self._closes: Dict[Tuple[str, str], Tuple[float, int, Optional[pd.Series]]] = {}
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._results: Dict[Tuple, Tuple[float, Any]] = {}
+        self.stats = {'fetches': 0, 'close_hits': 0, 'result_hits': 0, 'panels_built': 0}
+
+    # ------------------------------------------------------------------
+    # Price panel
+    # ------------------------------------------------------------------
+
+    async def _closes_for(self, symbol: str, days: int, timeframe: str) -> Optional[pd.Series]:
+        key = (symbol, timeframe)
+        cached = self._closes.get(key)
+        if cached and time.time() - cached[0] < self.cache_ttl and cached[1] >= days:
+            self.stats['close_hits'] += 1
+            return cached[2]
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        fetch_days = max(days, self.min_fetch_days)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            self.stats['fetches'] += 1
+            try:
+                series = await self.loader(symbol, fetch_days, timeframe)
+            except Exception as e:
+                logger.warning(f"Price history for {symbol} ({timeframe}) unavailable: {e}")
+                series = None
+            if series is not None:
+                series = series[~series.index.duplicated(keep='last')].sort_index().astype(np.float64)
+                if series.empty:
+                    series = None
+            if series is not None:
+                self._closes[key] = (time.time(), fetch_days, series)
+            future.set_result(series)
+            return series
+        finally:
+            if not future.done():
+                future.set_result(None)
+            self._inflight.pop(key, None)
+
+    async def get_panel(self, symbols: Sequence[str], days: int, timeframe: str = '1d') -> PricePanel:
+        """Aligned returns for ``symbols`` over the last ``days`` days."""
+        symbols = list(dict.fromkeys(symbols))
+        series = await asyncio.gather(*[self._closes_for(s, days, timeframe) for s in symbols])
+
+        available = {s: c for s, c in zip(symbols, series) if c is not None and len(c) > 1}
+        missing = [s for s in symbols if s not in available]
+        if not available:
+            return PricePanel([], pd.DatetimeIndex([]), np.empty((0, 0)), missing, timeframe)
+
+        closes = pd.concat(available, axis=1, join='outer').sort_index()
+        cutoff = closes.index[-1] - pd.Timedelta(days=days)
+        returns = closes.pct_change(fill_method=None).iloc[1:]
+        returns = returns[returns.index >= cutoff]
+        self.stats['panels_built'] += 1
+        return PricePanel(list(available), returns.index, returns.to_numpy(dtype=np.float64), missing, timeframe)
+
+    # ------------------------------------------------------------------
+    # Cached calculations
+    # ------------------------------------------------------------------
+
+    def _cached(self, key: Tuple) -> Optional[Any]:
+        entry = self._results.get(key)
+        if entry and time.time() - entry[0] < self.cache_ttl:
+            self.stats['result_hits'] += 1
+            return entry[1]
+        return None
+
+    def _store(self, key: Tuple, value: Any) -> Any:
+        self._results[key] = (time.time(), value)
+        return value
+
+    async def correlation_matrix(
+        self,
+        symbols: Sequence[str],
+        days: int = 30,
+        timeframe: str = '1d',
+        method: str = 'pearson',
+        min_observations: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Correlation matrix over ``symbols`` in the requested order.
+
+        Returns a dict with ``symbols``, ``matrix`` and ``observations``
+        (``(N, N)`` arrays, NaN / 0 for symbols without data) and ``missing``.
+        """
+        symbols = list(symbols)
+        min_obs = min_observations or self.min_observations
+        key = ('corr', tuple(symbols), days, timeframe, method, min_obs)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
+        panel = await self.get_panel(symbols, days, timeframe)
+        size = len(symbols)
+        matrix = np.full((size, size), np.nan)
+        observations = np.zeros((size, size), dtype=np.int64)
+        if panel.symbols:
+            corr, n = correlation_matrix(panel.returns, method, min_obs)
+            positions = np.array([symbols.index(s) for s in panel.symbols])
+            matrix[np.ix_(positions, positions)] = corr
+            observations[np.ix_(positions, positions)] = n
+        np.fill_diagonal(matrix, 1.0)
+
+        return self._store(key, {
+            'symbols': list(symbols),
+            'matrix': matrix,
+            'observations': observations,
+            'missing': panel.missing,
+            'start': panel.index[0] if len(panel.index) else None,
+            'end': panel.index[-1] if len(panel.index) else None
+        })
+
+    async def betas(
+        self,
+        symbols: Sequence[str],
+        days: int = 30,
+        timeframe: str = '1d',
+        benchmark: Optional[str] = None,
+        min_observations: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Beta statistics of every symbol against the benchmark.
+
+        Returns ``{symbol: {'beta', 'alpha', 'r_squared', 'volatility',
+        'benchmark_volatility', 'n_observations'}}`` for symbols with data.
+        """
+        benchmark = benchmark or self.benchmark
+        min_obs = min_observations or self.min_observations
+        key = ('beta', tuple(symbols), days, timeframe, benchmark, min_obs)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
+        panel = await self.get_panel(list(symbols) + [benchmark], days, timeframe)
+        bench_col = panel.column(benchmark)
+        results: Dict[str, Dict[str, Any]] = {}
+        if bench_col is not None:
+            stats = beta_vector(panel.returns, bench_col, min_obs)
+            for symbol in symbols:
+                col = panel.column(symbol)
+                if col is None or np.isnan(stats['beta'][col]):
+                    continue
+                results[symbol] = {name: values[col].item() for name, values in stats.items()}
+        return self._store(key, results)
+
+    async def rolling_betas(
+        self,
+        symbols: Sequence[str],
+        window: int = 30,
+        num_windows: int = 7,
+        timeframe: str = '1d',
+        benchmark: Optional[str] = None,
+        min_observations: Optional[int] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Betas over the last ``num_windows`` windows of ``window`` candles.
+
+        Returns ``{symbol: [{'timestamp', 'beta', 'alpha', 'r_squared'}, ...]}``
+        in chronological order; values are None where a window is too thin.
+        """
+        benchmark = benchmark or self.benchmark
+        min_obs = min_observations or self.min_observations
+        key = ('rolling_beta', tuple(symbols), window, num_windows, timeframe, benchmark, min_obs)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
+        candle = pd.Timedelta(_timeframe_seconds(timeframe), unit='s')
+        days = int(np.ceil((window + num_windows + 1) * candle / pd.Timedelta(days=1)))
+        panel = await self.get_panel(list(symbols) + [benchmark], days, timeframe)
+        bench_col = panel.column(benchmark)
+        series: Dict[str, List[Dict[str, Any]]] = {}
+        if bench_col is not None and len(panel.index):
+            rolled = rolling_betas(panel.returns, bench_col, window, num_windows, min_obs)
+            ends = panel.index[rolled['end']]
+            for symbol in symbols:
+                col = panel.column(symbol)
+                if col is None or symbol == benchmark:
+                    continue
+                series[symbol] = [
+                    {
+                        'timestamp': ends[i],
+                        **{
+                            name: (None if np.isnan(rolled[name][i, col]) else float(rolled[name][i, col]))
+                            for name in ('beta', 'alpha', 'r_squared')
+                        }
+                    }
+                    for i in range(len(ends))
+                ]
+        return self._store(key, series)
+
+    def clear_cache(self) -> None:
+        self._closes.clear()
+        self._results.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            'cached_series': len(self._closes),
+            'cached_results': len(self._results),
+            'cache_ttl': self.cache_ttl
+        }
+
+
+def _timeframe_seconds(timeframe: str) -> int:
+    units = {'m': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+    return int(timeframe[:-1] or 1) * units[timeframe[-1]]
+
+
+def matrix_to_rows(matrix: np.ndarray, decimals: Optional[int] = None) -> List[List[Optional[float]]]:
+    """JSON-friendly nested lists with None for NaN."""
+    values = np.round(matrix, decimals) if decimals is not None else matrix
+    return [[None if np.isnan(v) else float(v) for v in row] for row in values]
@@ -0,0 +1,286 @@
+"""
+Sliding-window liquidation aggregates.
+
+``AlertManager`` used to keep every liquidation of the aggregation window in
+per-symbol and global lists, rebuilt with a list comprehension on each event
+and summed again for every aggregate check. During a cascade (hundreds of
+events per second) that is quadratic work on the event loop.
+
+``LiquidationWindowAggregator`` groups events into fixed time buckets (one
+second by default). Each scope (a symbol, or the global view) keeps a deque
+of buckets per window with running totals, so an insert updates a handful of
+counters and expiry pops whole buckets off the left: O(1) amortized per
+event. The largest liquidation of each window comes from a monotonic deque.
+Several windows (1m/5m/15m by default) are served from the same buckets.
+
+Bucketing makes the window edge coarse: an event is counted until its whole
+bucket has left the window, i.e. for at most ``bucket_seconds`` extra.
+"""
+
+import math
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Optional, Tuple
+
+DEFAULT_WINDOWS = (60, 300, 900)
+
+# Side reported by the exchange for a liquidated long position
+LONG_SIDE = 'BUY'
+
+
+class _Bucket:
+    """Totals of the events that fell into one time bucket."""
+
+    __slots__ = ('start', 'count', 'total', 'long', 'short', 'weighted_price', 'first_ts', 'by_symbol')
+
+    def __init__(self, start: float, first_ts: float):
+        self.start = start
+        self.first_ts = first_ts
+        self.count = 0
+        self.total = 0.0
+        self.long = 0.0
+        self.short = 0.0
+        self.weighted_price = 0.0
+        # symbol -> [count, usd]; only filled for the global scope
+        self.by_symbol: Dict[str, list] = {}
+
+
+class _Window:
+    """Running totals of one scope over one window length."""
+
+    __slots__ = ('seconds', 'buckets', 'count', 'total', 'long', 'short', 'weighted_price', 'by_symbol', 'maxima')
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.buckets: Deque[_Bucket] = deque()
+        self.by_symbol: Dict[str, list] = {}
+        # (bucket start, usd, event) with decreasing usd
+        self.maxima: Deque[Tuple[float, float, Dict[str, Any]]] = deque()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.long = 0.0
+        self.short = 0.0
+        self.weighted_price = 0.0
+
+    def expire(self, cutoff: float, bucket_seconds: float) -> None:
+        buckets = self.buckets
+        while buckets and buckets[0].start + bucket_seconds <= cutoff:
+            bucket = buckets.popleft()
+            self.count -= bucket.count
+            self.total -= bucket.total
+            self.long -= bucket.long
+            self.short -= bucket.short
+            self.weighted_price -= bucket.weighted_price
+            for symbol, (count, usd) in bucket.by_symbol.items():
+                entry = self.by_symbol[symbol]
+                entry[0] -= count
+                entry[1] -= usd
+                if entry[0] <= 0:
+                    del self.by_symbol[symbol]
+        if not buckets:
+            # Drop accumulated float error once the window is empty
+            self._reset()
+        maxima = self.maxima
+        while maxima and maxima[0][0] + bucket_seconds <= cutoff:
+            maxima.popleft()
+
+
+class _Scope:
+    __slots__ = ('current', 'windows')
+
+    def __init__(self, windows: Iterable[float]):
+        self.current: Optional[_Bucket] = None
+        self.windows = {seconds: _Window(seconds) for seconds in windows}
+
+
+class LiquidationWindowAggregator:
+    """Per-symbol and global liquidation totals over sliding windows."""
+
+    def __init__(self, windows: Iterable[float] = DEFAULT_WINDOWS, bucket_seconds: float = 1.0):
+        """
+        Args:
+            windows: Window lengths in seconds served by the aggregator
+            bucket_seconds: Width of the time buckets events are grouped into
+        """
+        self.windows = tuple(sorted(set(windows)))
+        if not self.windows or self.windows[0] < bucket_seconds:
+            raise ValueError("windows must be at least one bucket long")
+        self.bucket_seconds = bucket_seconds
+        self._scopes: Dict[Optional[str], _Scope] = {}
+        self.stats = {'events': 0, 'buckets': 0}
+
+    def _scope(self, symbol: Optional[str]) -> _Scope:
+        scope = self._scopes.get(symbol)
+        if scope is None:
+            scope = self._scopes[symbol] = _Scope(self.windows)
+        return scope
+
+    def _expire(self, scope: _Scope, now: float) -> None:
+        for window in scope.windows.values():
+            window.expire(now - window.seconds, self.bucket_seconds)
+
+    def add(
+        self,
+        symbol: str,
+        usd_value: float,
+        side: str,
+        price: float = 0.0,
+        size: float = 0.0,
+        timestamp: Optional[float] = None
+    ) -> None:
+        """Record one liquidation in the symbol's scope and the global scope.
+
+        Args:
+            symbol: Trading pair symbol
+            usd_value: USD value of the liquidation
+            side: 'Buy' (long liquidated) or 'Sell' (short liquidated)
+            price: Liquidation price
+            size: Position size
+            timestamp: Event time; defaults to now
+        """
+        ts = timestamp if timestamp is not None else time.time()
+        side = side.upper()
+        event = {'symbol': symbol, 'usd_value': usd_value, 'side': side,
+                 'price': price, 'size': size, 'timestamp': ts}
+        self.stats['events'] += 1
+        self._insert(self._scope(symbol), event, track_symbols=False)
+        self._insert(self._scope(None), event, track_symbols=True)
+
+    def _insert(self, scope: _Scope, event: Dict[str, Any], track_symbols: bool) -> None:
+        ts, usd = event['timestamp'], event['usd_value']
+        self._expire(scope, ts)
+
+        bucket = scope.current
+        shortest = scope.windows[self.windows[0]].buckets
+        # The current bucket may already have expired when timestamps arrive late
+        if (bucket is None or ts >= bucket.start + self.bucket_seconds
+                or not shortest or shortest[-1] is not bucket):
+            start = math.floor(ts / self.bucket_seconds) * self.bucket_seconds
+            if bucket is not None:
+                # Keep buckets ordered; late events count towards the newest one
+                start = max(start, bucket.start + self.bucket_seconds)
+            bucket = scope.current = _Bucket(start, ts)
+            self.stats['buckets'] += 1
+            for window in scope.windows.values():
+                window.buckets.append(bucket)
+
+        is_long = event['side'] == LONG_SIDE
+        weighted = usd * event['price']
+        bucket.count += 1
+        bucket.total += usd
+        bucket.weighted_price += weighted
+        if is_long:
+            bucket.long += usd
+        else:
+            bucket.short += usd
+        if track_symbols:
+            entry = bucket.by_symbol.setdefault(event['symbol'], [0, 0.0])
+            entry[0] += 1
+            entry[1] += usd
+
+        for window in scope.windows.values():
+            window.count += 1
+            window.total += usd
+            window.weighted_price += weighted
+            if is_long:
+                window.long += usd
+            else:
+                window.short += usd
+            if track_symbols:
+                entry = window.by_symbol.setdefault(event['symbol'], [0, 0.0])
+                entry[0] += 1
+                entry[1] += usd
+            maxima = window.maxima
+            while maxima and maxima[-1][1] <= usd:
+                maxima.pop()
+            maxima.append((bucket.start, usd, event))
+
+    def window_stats(self, symbol: Optional[str] = None, window: float = 300,
+                     now: Optional[float] = None) -> Dict[str, Any]:
+        """Aggregates of a scope over one window.
+
+        Args:
+            symbol: Symbol scope, or None for all symbols
+            window: Window length in seconds; must be one of ``windows``
+            now: Reference time; defaults to now
+
+        Returns:
+            Dict with count, total/long/short USD, value-weighted average
+            price, the largest event, the first event time and (global
+            scope only) USD per symbol, largest first
+        """
+        if window not in self.windows:
+            raise ValueError(f"Window {window}s not tracked (tracked: {self.windows})")
+        scope = self._scopes.get(symbol)
+        result = {
+            'symbol': symbol,
+            'window': window,
+            'count': 0,
+            'total_usd': 0.0,
+            'long_usd': 0.0,
+            'short_usd': 0.0,
+            'avg_price': 0.0,
+            'largest': None,
+            'first_timestamp': None,
+        }
+        if symbol is None:
+            result['symbols'] = {}
+        if scope is None:
+            return result
+
+        state = scope.windows[window]
+        state.expire((now if now is not None else time.time()) - window, self.bucket_seconds)
+        if not state.buckets:
+            return result
+
+        result.update({
+            'count': state.count,
+            'total_usd': state.total,
+            'long_usd': state.long,
+            'short_usd': state.short,
+            'avg_price': state.weighted_price / state.total if state.total > 0 else 0.0,
+            'largest': dict(state.maxima[0][2]) if state.maxima else None,
+            'first_timestamp': state.buckets[0].first_ts,
+        })
+        if symbol is None:
+            ranked = sorted(state.by_symbol.items(), key=lambda item: item[1][1], reverse=True)
+            result['symbols'] = {sym: usd for sym, (_, usd) in ranked}
+        return result
+
+    def summary(self, window: float = 300, now: Optional[float] = None) -> Dict[str, Any]:
+        """Global and per-symbol aggregates over one window, for APIs and caches."""
+        now = now if now is not None else time.time()
+        symbols = {}
+        for symbol in [s for s in self._scopes if s is not None]:
+            stats = self.window_stats(symbol, window, now)
+            if stats['count']:
+                symbols[symbol] = stats
+            elif all(not w.buckets for w in self._scopes[symbol].windows.values()):
+                # Every window of this symbol has expired
+                del self._scopes[symbol]
+        return {'window': window, 'global': self.window_stats(None, window, now), 'symbols': symbols}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Insert counters and tracked scopes."""
+        return {**self.stats, 'windows': list(self.windows), 'symbols': len(self._scopes) - (None in self._scopes)}
+
+
+_shared: Optional[LiquidationWindowAggregator] = None
+
+
+def register_liquidation_aggregator(aggregator: LiquidationWindowAggregator) -> None:
+    """Make ``aggregator`` the one returned by ``get_liquidation_aggregator``.
+
+    ``AlertManager`` registers the aggregator it feeds so caches and API
+    routes query the same live windows.
+    """
+    global _shared
+    _shared = aggregator
+
+
+def get_liquidation_aggregator() -> Optional[LiquidationWindowAggregator]:
+    """The registered aggregator, or None before an AlertManager exists."""
+    return _shared
@@ -623,44 +623,39 @@ def init_shadow_oi_divergence_table():
     """
     try:
         from src.database.shadow_storage import get_db_path
-        import sqlite3
-        import os
-
-        db_path = get_db_path()
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
-
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS shadow_oi_divergence (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp INTEGER NOT NULL,
-                symbol TEXT NOT NULL,
-                legacy_type TEXT,
-                legacy_strength REAL,
-                new_type TEXT,
-                new_strength REAL,
-                new_correlation REAL,
-                new_confidence REAL,
-                new_method TEXT,
-                sample_count INTEGER,
-                difference REAL,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_shadow_oi_div_timestamp
-            ON shadow_oi_divergence(timestamp)
-        ''')
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_shadow_oi_div_symbol
-            ON shadow_oi_divergence(symbol)
-        ''')
-
-        conn.commit()
-        conn.close()
+        from src.database.sqlite_access import get_db_access
+
+        def _create_table(conn):
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS shadow_oi_divergence (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp INTEGER NOT NULL,
+                    symbol TEXT NOT NULL,
+                    legacy_type TEXT,
+                    legacy_strength REAL,
+                    new_type TEXT,
+                    new_strength REAL,
+                    new_correlation REAL,
+                    new_confidence REAL,
+                    new_method TEXT,
+                    sample_count INTEGER,
+                    difference REAL,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_shadow_oi_div_timestamp
+                ON shadow_oi_divergence(timestamp)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_shadow_oi_div_symbol
+                ON shadow_oi_divergence(symbol)
+            ''')
+
+        get_db_access(get_db_path()).write(_create_table)
 
         logger.info("Shadow OI divergence table initialized")
         return True
@@ -685,17 +680,14 @@ def log_shadow_comparison(
     """
     try:
         from src.database.shadow_storage import get_db_path
-        import sqlite3
-
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+        from src.database.sqlite_access import get_db_access
 
         legacy_strength = legacy_result.get('strength', 0.0)
         new_strength = new_result.get('strength', 0.0)
         difference = abs(new_strength - legacy_strength)
 
-        cursor.execute('''
+        # Fire-and-forget: batched by the shared writer, never waits on a commit
+        get_db_access(get_db_path()).execute('''
             INSERT INTO shadow_oi_divergence (
                 timestamp, symbol, legacy_type, legacy_strength,
                 new_type, new_strength, new_correlation, new_confidence,
@@ -713,10 +705,7 @@ def log_shadow_comparison(
             new_result.get('method', 'unknown'),
             new_result.get('sample_size', 0),
             difference
-        ))
-
-        conn.commit()
-        conn.close()
+        ), wait=False)
 
     except Exception as e:
         logger.debug(f"Shadow logging failed (non-critical): {e}")
@@ -17,6 +17,7 @@
     CacheLayer,
     CacheStats
 )
+from .cache_codec import CacheCodec, CacheCodecError
 
 # Intelligent warmer module removed - functionality integrated elsewhere
 # from .intelligent_warmer import (
@@ -47,6 +48,8 @@
     'DirectCacheAdapter',
     'CacheLayer',
     'CacheStats',
+    'CacheCodec',
+    'CacheCodecError',
 
     # Intelligent warming - REMOVED (functionality integrated elsewhere)
     # 'IntelligentCacheWarmer',
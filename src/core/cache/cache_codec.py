@@ -0,0 +1,252 @@
+"""
+Pluggable value codec for the Memcached (L2) and Redis (L3) cache tiers.
+
+``MultiTierCacheAdapter`` used to write ``json.dumps(value).encode()`` and
+read with ``json.loads`` plus a double-decode heuristic. That is slow for
+large payloads (confluence breakdowns, OHLCV lists, market overview) and
+fails outright on NumPy integers.
+
+Encoded payloads carry a two-byte header:
+
+    byte 0: 0xF0 | FORMAT_VERSION   (0xF1 for this version)
+    byte 1: serializer id << 4 | compression id
+
+Legacy payloads are bare JSON text, which can never start with a byte in the
+0xF0-0xFF range, so readers tell the two apart from the first byte. Readers
+decode every format they know regardless of what they write. A process
+that meets a newer format version treats it as a miss instead of failing,
+so mixed-version processes can coexist during a rollout.
+
+The default writer stays ``json`` (headerless, byte-identical to the old
+format) because several modules still read cache keys directly with
+``json.loads``. Select another codec with ``CACHE_CODEC`` (json, orjson,
+msgpack, auto), ``CACHE_COMPRESSION`` (none, zlib, zstd, lz4) and
+``CACHE_COMPRESSION_THRESHOLD`` (bytes). Missing optional libraries fall
+back to json / no compression.
+"""
+
+import json
+import logging
+import os
+import zlib
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+_MARKER_BASE = 0xF0
+HEADER_MARKER = _MARKER_BASE | FORMAT_VERSION
+
+SERIALIZER_IDS = {'json': 1, 'orjson': 2, 'msgpack': 3}
+COMPRESSION_IDS = {'none': 0, 'zlib': 1, 'zstd': 2, 'lz4': 3}
+_SERIALIZER_NAMES = {v: k for k, v in SERIALIZER_IDS.items()}
+_COMPRESSION_NAMES = {v: k for k, v in COMPRESSION_IDS.items()}
+
+DEFAULT_COMPRESSION_THRESHOLD = 4096
+
+
+class CacheCodecError(ValueError):
+    """Raised when a cached payload cannot be decoded by this process."""
+
+
+def _to_builtin(value: Any) -> Any:
+    """Fallback for types the serializers do not handle (NumPy, pandas, sets)."""
+    if hasattr(value, 'tolist'):
+        # NumPy scalars and arrays
+        return value.tolist()
+    if hasattr(value, 'isoformat'):
+        # datetime / pandas Timestamp
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not cache serializable")
+
+
+def _available_serializers() -> Dict[str, Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]]:
+    serializers = {
+        'json': (
+            lambda value: json.dumps(value, default=_to_builtin).encode(),
+            lambda data: json.loads(data.decode())
+        )
+    }
+    if orjson is not None:
+        serializers['orjson'] = (
+            lambda value: orjson.dumps(
+                value, default=_to_builtin,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ),
+            orjson.loads
+        )
+    if msgpack is not None:
+        serializers['msgpack'] = (
+            lambda value: msgpack.packb(value, default=_to_builtin, use_bin_type=True),
+            lambda data: msgpack.unpackb(data, raw=False, strict_map_key=False)
+        )
+    return serializers
+
+
+def _available_compressors() -> Dict[str, Tuple[Callable[[bytes, Optional[int]], bytes], Callable[[bytes], bytes]]]:
+    compressors = {
+        'zlib': (
+            lambda data, level: zlib.compress(data, 6 if level is None else level),
+            zlib.decompress
+        )
+    }
+    if zstandard is not None:
+        compressors['zstd'] = (
+            lambda data, level: zstandard.ZstdCompressor(level=3 if level is None else level).compress(data),
+            lambda data: zstandard.ZstdDecompressor().decompress(data)
+        )
+    if lz4_frame is not None:
+        compressors['lz4'] = (
+            lambda data, level: lz4_frame.compress(data, compression_level=0 if level is None else level),
+            lz4_frame.decompress
+        )
+    return compressors
+
+
+_SERIALIZERS = _available_serializers()
+_COMPRESSORS = _available_compressors()
+
+
+def _decode_legacy(data: bytes) -> Any:
+    """Decode a headerless JSON payload written before the codec existed."""
+    try:
+        result = json.loads(data.decode())
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise CacheCodecError(f"invalid legacy JSON payload: {e}") from e
+    # DOUBLE-DECODE FIX: Handle double-JSON-encoded data
+    if isinstance(result, str) and (result.startswith('{') or result.startswith('[')):
+        try:
+            result = json.loads(result)
+        except (json.JSONDecodeError, ValueError):
+            pass  # Not JSON, return as-is
+    return result
+
+
+class CacheCodec:
+    """
+    Encodes cache values for L2/L3 and decodes any supported format.
+
+    Args:
+        serializer: 'json' (legacy headerless JSON), 'orjson', 'msgpack' or
+            'auto' (msgpack, then orjson, then json, whichever is installed)
+        compression: 'none', 'zlib', 'zstd' or 'lz4'; only applied to
+            headered formats
+        compress_threshold: Minimum serialized size in bytes to compress
+        compression_level: Compressor-specific level (library default if None)
+    """
+
+    def __init__(
+        self,
+        serializer: str = 'json',
+        compression: Optional[str] = None,
+        compress_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        compression_level: Optional[int] = None
+    ):
+        if serializer == 'auto':
+            serializer = next(name for name in ('msgpack', 'orjson', 'json') if name in _SERIALIZERS)
+        if serializer not in SERIALIZER_IDS:
+            raise ValueError(f"Unknown cache serializer: {serializer}")
+        if serializer not in _SERIALIZERS:
+            logger.warning(f"Cache serializer '{serializer}' not installed - falling back to json")
+            serializer = 'json'
+
+        compression = compression or 'none'
+        if compression not in COMPRESSION_IDS:
+            raise ValueError(f"Unknown cache compression: {compression}")
+        if compression != 'none' and compression not in _COMPRESSORS:
+            logger.warning(f"Cache compression '{compression}' not installed - writing uncompressed")
+            compression = 'none'
+
+        self.serializer = serializer
+        self.compression = compression
+        self.compress_threshold = compress_threshold
+        self.compression_level = compression_level
+        self._dumps = _SERIALIZERS[serializer][0]
+
+    @classmethod
+    def from_env(cls) -> 'CacheCodec':
+        """Build the codec from CACHE_CODEC / CACHE_COMPRESSION / CACHE_COMPRESSION_THRESHOLD."""
+        return cls(
+            serializer=os.getenv('CACHE_CODEC', 'json').lower(),
+            compression=os.getenv('CACHE_COMPRESSION', 'none').lower(),
+            compress_threshold=int(os.getenv('CACHE_COMPRESSION_THRESHOLD', DEFAULT_COMPRESSION_THRESHOLD))
+        )
+
+    @property
+    def legacy(self) -> bool:
+        """True when writing headerless JSON readable by pre-codec processes."""
+        return self.serializer == 'json' and self.compression == 'none'
+
+    def encode(self, value: Any) -> bytes:
+        payload = self._dumps(value)
+        if self.legacy:
+            return payload
+
+        compression = 'none'
+        if self.compression != 'none' and len(payload) >= self.compress_threshold:
+            compressed = _COMPRESSORS[self.compression][0](payload, self.compression_level)
+            if len(compressed) < len(payload):
+                payload, compression = compressed, self.compression
+
+        flags = SERIALIZER_IDS[self.serializer] << 4 | COMPRESSION_IDS[compression]
+        return bytes((HEADER_MARKER, flags)) + payload
+
+    def decode(self, data: bytes) -> Any:
+        """Decode a payload in any supported format.
+
+        Raises:
+            CacheCodecError: unknown format version or a codec that is not
+                installed in this process
+        """
+        if not data or data[0] < _MARKER_BASE:
+            return _decode_legacy(data)
+
+        version = data[0] & 0x0F
+        if version != FORMAT_VERSION:
+            raise CacheCodecError(f"unsupported cache format version {version}")
+        if len(data) < 2:
+            raise CacheCodecError("truncated cache payload header")
+
+        serializer = _SERIALIZER_NAMES.get(data[1] >> 4)
+        compression = _COMPRESSION_NAMES.get(data[1] & 0x0F)
+        if serializer not in _SERIALIZERS:
+            raise CacheCodecError(f"cache serializer {serializer or data[1] >> 4} not available")
+        if compression is None or (compression != 'none' and compression not in _COMPRESSORS):
+            raise CacheCodecError(f"cache compression {compression or data[1] & 0x0F} not available")
+
+        payload = memoryview(data)[2:]
+        try:
+            if compression != 'none':
+                payload = _COMPRESSORS[compression][1](payload)
+            return _SERIALIZERS[serializer][1](bytes(payload))
+        except CacheCodecError:
+            raise
+        except Exception as e:
+            raise CacheCodecError(f"failed to decode {serializer}/{compression} payload: {e}") from e
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            'serializer': self.serializer,
+            'compression': self.compression,
+            'compress_threshold': self.compress_threshold,
+            'format_version': FORMAT_VERSION if not self.legacy else 0
+        }
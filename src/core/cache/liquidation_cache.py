@@ -23,6 +23,7 @@
     MEMCACHE_AVAILABLE = False
 
 from src.core.models.liquidation import LiquidationEvent, MarketStressIndicator, CascadeAlert
+from src.core.analysis.liquidation_window import get_liquidation_aggregator
 
 class LiquidationCacheManager:
     """Manages caching for liquidation data using Redis or Memcached."""
@@ -217,6 +218,25 @@ def set_market_stress(self, symbols: List[str], exchanges: List[str],
         except Exception as e:
             self.logger.error(f"Error caching market stress: {e}")
     
+    def get_window_aggregates(self, symbol: Optional[str] = None, window: int = 300) -> Optional[Dict]:
+        """Get live liquidation totals over a sliding window.
+
+        Served from the aggregator the alert manager feeds rather than the
+        cache backend; None when no aggregator is running.
+
+        Args:
+            symbol: Symbol to report, or None for all symbols
+            window: Window length in seconds (60, 300 or 900 by default)
+        """
+        aggregator = get_liquidation_aggregator()
+        if aggregator is None:
+            return None
+        try:
+            return aggregator.window_stats(symbol, window)
+        except ValueError as e:
+            self.logger.warning(f"Liquidation window query failed: {e}")
+            return None
+
     def invalidate_pattern(self, pattern: str):
         """Invalidate all cache entries matching pattern."""
         try:
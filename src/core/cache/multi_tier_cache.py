@@ -11,7 +11,6 @@
 """
 
 import asyncio
-import json
 import time
 import logging
 from typing import Dict, Any, Optional, Tuple, Union, List
@@ -30,6 +29,8 @@
 except ImportError:
     aioredis = None
 
+from .cache_codec import CacheCodec, CacheCodecError
+
 logger = logging.getLogger(__name__)
 
 class CacheLayer(Enum):
@@ -96,7 +97,8 @@ def __init__(self,
                  l1_max_size: int = 1000,
                  l1_default_ttl: int = 30,
                  cross_process_mode: bool = True,
-                 cross_process_l1_ttl: int = 2):
+                 cross_process_l1_ttl: int = 2,
+                 codec: Optional[CacheCodec] = None):
 
         # Configuration
         self.memcached_host = memcached_host
@@ -106,6 +108,9 @@ def __init__(self,
         self.l1_max_size = l1_max_size
         self.l1_default_ttl = l1_default_ttl
 
+        # L2/L3 value codec (legacy headerless JSON unless CACHE_CODEC says otherwise)
+        self.codec = codec or CacheCodec.from_env()
+
         # Cross-process cache sharing configuration
         self.cross_process_mode = cross_process_mode
         self.cross_process_l1_ttl = cross_process_l1_ttl  # Very short TTL for cross-process keys
@@ -326,6 +331,14 @@ async def _set_l1(self, key: str, value: Any, ttl: int = None):
             )
             logger.debug(f"L1 SET: {key} (TTL: {ttl}s)")
     
+    def _deserialize(self, data: bytes, key: str, layer: str) -> Optional[Any]:
+        """Decode a payload read from L2/L3 (any codec format, or legacy JSON)"""
+        try:
+            return self.codec.decode(data)
+        except CacheCodecError as e:
+            logger.warning(f"{layer} deserialization failed for {key}: {e}")
+            return None
+
     async def _get_l2(self, key: str) -> Optional[Any]:
         """Get from Layer 2 (Memcached) cache"""
         try:
@@ -334,21 +347,7 @@ async def _get_l2(self, key: str) -> Optional[Any]:
             if data:
                 self.stats.l2_hits += 1
                 logger.debug(f"L2 HIT: {key}")
-                
-                # Deserialize data
-                try:
-                    result = json.loads(data.decode())
-                    # DOUBLE-DECODE FIX: Handle double-JSON-encoded data
-                    if isinstance(result, str) and (result.startswith('{') or result.startswith('[')):
-                        try:
-                            result = json.loads(result)
-                            logger.debug(f"Double-decoded L2 {key}")
-                        except (json.JSONDecodeError, ValueError):
-                            pass  # Not JSON, return as-is
-                    return result
-                except (json.JSONDecodeError, UnicodeDecodeError) as e:
-                    logger.warning(f"L2 deserialization failed for {key}: {e}")
-                    return None
+                return self._deserialize(data, key, 'L2')
         except Exception as e:
             logger.warning(f"L2 get failed for {key}: {e}")
         return None
@@ -360,7 +359,7 @@ async def _set_l2(self, key: str, value: Any, ttl: int = None):
         
         try:
             client = await self._get_memcached_client()
-            data = json.dumps(value).encode()
+            data = self.codec.encode(value)
             await client.set(key.encode(), data, ttl)
             logger.debug(f"L2 SET: {key} (TTL: {ttl}s)")
         except Exception as e:
@@ -375,21 +374,7 @@ async def _get_l3(self, key: str) -> Optional[Any]:
                 if data:
                     self.stats.l3_hits += 1
                     logger.debug(f"L3 HIT: {key}")
-                    
-                    # Deserialize data
-                    try:
-                        result = json.loads(data.decode())
-                        # DOUBLE-DECODE FIX: Handle double-JSON-encoded data
-                        if isinstance(result, str) and (result.startswith('{') or result.startswith('[')):
-                            try:
-                                result = json.loads(result)
-                                logger.debug(f"Double-decoded L3 {key}")
-                            except (json.JSONDecodeError, ValueError):
-                                pass  # Not JSON, return as-is
-                        return result
-                    except (json.JSONDecodeError, UnicodeDecodeError) as e:
-                        logger.warning(f"L3 deserialization failed for {key}: {e}")
-                        return None
+                    return self._deserialize(data, key, 'L3')
         except Exception as e:
             logger.warning(f"L3 get failed for {key}: {e}")
         return None
@@ -402,12 +387,94 @@ async def _set_l3(self, key: str, value: Any, ttl: int = None):
         try:
             client = await self._get_redis_client()
             if client:
-                data = json.dumps(value).encode()
+                data = self.codec.encode(value)
                 await client.setex(key, ttl, data)
                 logger.debug(f"L3 SET: {key} (TTL: {ttl}s)")
         except Exception as e:
             logger.warning(f"L3 set failed for {key}: {e}")
     
+    async def _get_l2_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several keys from Layer 2 (Memcached) with a single multi-get"""
+        found = {}
+        if not keys:
+            return found
+        try:
+            client = await self._get_memcached_client()
+            values = await client.multi_get(*(key.encode() for key in keys))
+        except Exception as e:
+            logger.warning(f"L2 multi-get failed for {len(keys)} keys: {e}")
+            return found
+
+        for key, data in zip(keys, values):
+            if data:
+                value = self._deserialize(data, key, 'L2')
+                if value is not None:
+                    self.stats.l2_hits += 1
+                    found[key] = value
+        logger.debug(f"L2 MULTI-GET: {len(found)}/{len(keys)} hits")
+        return found
+
+    async def _set_l2_many(self, items: Dict[str, Any], ttl: int = None):
+        """Set several keys in Layer 2 (Memcached) concurrently over the client pool"""
+        if not items:
+            return
+        try:
+            client = await self._get_memcached_client()
+        except Exception as e:
+            logger.warning(f"L2 multi-set failed for {len(items)} keys: {e}")
+            return
+
+        async def _set_one(key: str, value: Any):
+            key_ttl = ttl if ttl is not None else self._get_ttl_for_layer(key, CacheLayer.L2_MEMCACHED)
+            await client.set(key.encode(), self.codec.encode(value), key_ttl)
+
+        results = await asyncio.gather(
+            *(_set_one(key, value) for key, value in items.items()),
+            return_exceptions=True
+        )
+        for key, result in zip(items, results):
+            if isinstance(result, Exception):
+                logger.warning(f"L2 set failed for {key}: {result}")
+
+    async def _get_l3_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several keys from Layer 3 (Redis) with a single MGET"""
+        found = {}
+        if not keys:
+            return found
+        try:
+            client = await self._get_redis_client()
+            if not client:
+                return found
+            values = await client.mget(keys)
+        except Exception as e:
+            logger.warning(f"L3 MGET failed for {len(keys)} keys: {e}")
+            return found
+
+        for key, data in zip(keys, values):
+            if data:
+                value = self._deserialize(data, key, 'L3')
+                if value is not None:
+                    self.stats.l3_hits += 1
+                    found[key] = value
+        logger.debug(f"L3 MGET: {len(found)}/{len(keys)} hits")
+        return found
+
+    async def _set_l3_many(self, items: Dict[str, Any], ttl: int = None):
+        """Set several keys in Layer 3 (Redis) in one pipelined round trip"""
+        if not items:
+            return
+        try:
+            client = await self._get_redis_client()
+            if client:
+                pipe = client.pipeline(transaction=False)
+                for key, value in items.items():
+                    key_ttl = ttl if ttl is not None else self._get_ttl_for_layer(key, CacheLayer.L3_REDIS)
+                    pipe.setex(key, key_ttl, self.codec.encode(value))
+                await pipe.execute()
+                logger.debug(f"L3 PIPELINE SET: {len(items)} keys")
+        except Exception as e:
+            logger.warning(f"L3 pipeline set failed for {len(items)} keys: {e}")
+
     async def get(self, key: str, default: Any = None) -> Tuple[Any, CacheLayer]:
         """
         Get value from multi-tier cache with automatic promotion
@@ -477,6 +544,73 @@ async def set(self, key: str, value: Any, ttl_override: int = None):
         else:
             logger.debug(f"MULTI-TIER SET: {key}")
     
+    async def get_many(self, keys: List[str], default: Any = None) -> Dict[str, Tuple[Any, CacheLayer]]:
+        """
+        Get several keys at once with bulk promotion
+
+        L1 is resolved locally; the remaining keys go to Memcached in one
+        multi-get, and whatever is still missing to Redis in one MGET, so a
+        batch costs at most two network round trips instead of two per key.
+
+        Returns:
+            Dict mapping each requested key to (value, cache_layer_hit)
+        """
+        keys = list(dict.fromkeys(keys))
+        results: Dict[str, Tuple[Any, CacheLayer]] = {}
+
+        misses = []
+        for key in keys:
+            value = None
+            if not self._is_cross_process_key(key) or self.cross_process_l1_ttl > 0:
+                value = await self._get_l1(key)
+            if value is not None:
+                results[key] = (value, CacheLayer.L1_MEMORY)
+            else:
+                misses.append(key)
+
+        l2_found = await self._get_l2_many(misses)
+        for key, value in l2_found.items():
+            await self._set_l1(key, value)
+            results[key] = (value, CacheLayer.L2_MEMCACHED)
+        self.stats.promotions += len(l2_found)
+
+        misses = [key for key in misses if key not in l2_found]
+        l3_found = await self._get_l3_many(misses)
+        if l3_found:
+            await self._set_l2_many(l3_found)
+            for key, value in l3_found.items():
+                await self._set_l1(key, value)
+                results[key] = (value, CacheLayer.L3_REDIS)
+            self.stats.promotions += 2 * len(l3_found)
+
+        for key in misses:
+            if key not in l3_found:
+                self.stats.total_misses += 1
+                results[key] = (default, CacheLayer.MISS)
+
+        logger.debug(f"MULTI-TIER GET_MANY: {len(keys)} keys, {len(misses) - len(l3_found)} misses")
+        return results
+
+    async def set_many(self, items: Dict[str, Any], ttl_override: int = None):
+        """
+        Set several keys in all cache tiers
+
+        L1 follows the same cross-process TTL rules as ``set``; L2 writes are
+        issued concurrently and L3 writes go through one Redis pipeline.
+        """
+        for key, value in items.items():
+            l1_ttl = ttl_override
+            if self._is_cross_process_key(key) and ttl_override is None:
+                l1_ttl = self.cross_process_l1_ttl
+            await self._set_l1(key, value, l1_ttl)
+
+        await asyncio.gather(
+            self._set_l2_many(items, ttl_override),
+            self._set_l3_many(items, ttl_override),
+            return_exceptions=True
+        )
+        logger.debug(f"MULTI-TIER SET_MANY: {len(items)} keys")
+
     async def delete(self, key: str):
         """Delete from all cache tiers"""
         # Remove from L1
@@ -571,8 +705,8 @@ async def warm_from_redis(self, keys: List[str] = None) -> Dict[str, bool]:
                     if data:
                         # Deserialize
                         try:
-                            value = json.loads(data)
-                        except (json.JSONDecodeError, TypeError):
+                            value = self.codec.decode(data)
+                        except CacheCodecError:
                             value = data
 
                         # Promote to L1 and L2 with shorter TTLs (fresh data will replace)
@@ -615,6 +749,7 @@ def get_performance_metrics(self) -> Dict[str, Any]:
                 'evictions': self.stats.evictions
             },
             'l1_memory': self._get_l1_metrics(),
+            'codec': self.codec.describe(),
             'performance': {
                 'runtime_seconds': round(runtime, 1),
                 'operations_per_second': round((self.stats.total_hits + self.stats.total_misses) / runtime if runtime > 0 else 0, 1)
@@ -646,6 +781,15 @@ async def set(self, key: str, value: Any, ttl: int = None):
         """Set value in cache (backwards compatible)"""
         await self.multi_tier_cache.set(key, value, ttl)
     
+    async def get_many(self, keys: List[str], default: Any = None) -> Dict[str, Any]:
+        """Get several values from cache in one batch (backwards compatible)"""
+        results = await self.multi_tier_cache.get_many(keys, default)
+        return {key: value for key, (value, layer) in results.items()}
+
+    async def set_many(self, items: Dict[str, Any], ttl: int = None):
+        """Set several values in cache in one batch (backwards compatible)"""
+        await self.multi_tier_cache.set_many(items, ttl)
+
     async def delete(self, key: str):
         """Delete from cache (backwards compatible)"""
         await self.multi_tier_cache.delete(key)
@@ -691,4 +835,19 @@ async def warm_from_redis(self, keys: List[str] = None) -> Dict[str, bool]:
 
 
 # Export for use in other modules
-__all__ = ['MultiTierCacheAdapter', 'DirectCacheAdapter', 'CacheLayer', 'CacheStats']
\ No newline at end of file
+# Name used by the API gateway and startup checks
+MultiTierCache = MultiTierCacheAdapter
+
+_multi_tier_cache: Optional[MultiTierCacheAdapter] = None
+
+
+def get_multi_tier_cache() -> MultiTierCacheAdapter:
+    """Get the process-wide multi-tier cache, creating it on first use."""
+    global _multi_tier_cache
+    if _multi_tier_cache is None:
+        _multi_tier_cache = MultiTierCacheAdapter()
+    return _multi_tier_cache
+
+
+__all__ = ['MultiTierCacheAdapter', 'MultiTierCache', 'DirectCacheAdapter', 'CacheLayer', 'CacheStats',
+           'get_multi_tier_cache']
\ No newline at end of file
@@ -6,6 +6,13 @@
     BETA_CHART_CACHE_TTL,
     TIMEFRAME_CONFIG,
 )
+from .render_service import (
+    ChartRenderService,
+    RendererSpec,
+    chart_cache_key,
+    get_chart_render_service,
+    shutdown_chart_render_service,
+)
 
 __all__ = [
     'BetaChartService',
@@ -13,4 +20,9 @@
     'generate_beta_chart_data',
     'BETA_CHART_CACHE_TTL',
     'TIMEFRAME_CONFIG',
+    'ChartRenderService',
+    'RendererSpec',
+    'chart_cache_key',
+    'get_chart_render_service',
+    'shutdown_chart_render_service',
 ]
@@ -0,0 +1,387 @@
+"""
+Chart Render Service
+Renders matplotlib charts off the event loop, with a content-addressed cache.
+
+``AlertManager._generate_chart_from_signal_data``, ``ReportGenerator`` and
+``BitcoinBetaReport`` used to call their matplotlib chart methods directly
+from async code; a high-resolution candlestick render blocks the loop for
+hundreds of milliseconds.
+
+``ChartRenderService`` runs those same methods in a process pool instead.
+Workers are spawned once with matplotlib (Agg), its font cache and the
+renderer modules already imported, and keep one renderer instance per
+``RendererSpec`` (factory import path plus constructor arguments), so a
+render job only ships the method name and its arguments. Each renderer's
+matplotlib style is captured at construction and applied per job, so
+renderers sharing a worker do not restyle each other's charts.
+
+Jobs go through a bounded request queue (at most ``max_workers`` in the pool,
+``max_pending`` waiting). Results are cached by the digest of a caller key,
+normally ``chart_cache_key(symbol, ohlcv, timeframe, **overlays)``
+(symbol, timeframe, last candle and overlays): a repeated render of the same
+chart returns the existing file, and concurrent requests for one key share a
+single render.
+
+With ``mode='thread'`` jobs run on the caller's renderer object in one
+background thread instead (pyplot is not thread-safe, so never more).
+"""
+
+import asyncio
+import hashlib
+import importlib
+import inspect
+import json
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Hashable, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PRELOAD = ('src.core.reporting.pdf_generator',)
+
+
+@dataclass(frozen=True)
+class RendererSpec:
+    """How a worker process builds a renderer: ``factory(*args)``.
+
+    ``factory`` is ``"package.module:Class"``; ``args`` must be picklable.
+    """
+    factory: str
+    args: Tuple[Any, ...] = ()
+    key: str = field(default='', compare=False)
+
+    def __post_init__(self):
+        digest = hashlib.sha1(self.factory.encode() + pickle.dumps(self.args)).hexdigest()[:16]
+        object.__setattr__(self, 'key', digest)
+
+
+def chart_cache_key(symbol: str, ohlcv: Any = None, timeframe: Optional[str] = None, **overlays) -> Tuple:
+    """Cache key of a chart: symbol, timeframe, last candle and overlays.
+
+    The last candle is identified by its timestamp, close and the number of
+    candles, so an update of the still-open candle is a different chart.
+    """
+    candle = None
+    if hasattr(ohlcv, 'iloc') and len(ohlcv):
+        last = ohlcv.iloc[-1]
+        ts = last['timestamp'] if 'timestamp' in ohlcv.columns else ohlcv.index[-1]
+        candle = (str(ts), float(last['close']) if 'close' in last else None, len(ohlcv))
+    elif ohlcv:
+        # Raw candle lists: [timestamp, open, high, low, close, volume]
+        candle = (repr(ohlcv[-1]), len(ohlcv))
+    return (symbol, timeframe, candle, tuple(sorted((k, repr(v)) for k, v in overlays.items())))
+
+
+# -- Worker process side ---------------------------------------------------
+
+_worker_renderers: Dict[str, Tuple[Any, Dict[str, Any]]] = {}
+
+
+def _init_worker(preload: Sequence[str]) -> None:
+    """Pool initializer: load matplotlib, fonts and renderer modules once."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot  # noqa: F401
+    from matplotlib import font_manager
+    font_manager.findfont(font_manager.FontProperties(family=matplotlib.rcParams['font.family']))
+    for module in preload:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            logger.warning(f"Chart worker could not preload {module}: {e}")
+
+
+def _worker_renderer(spec: RendererSpec) -> Tuple[Any, Dict[str, Any]]:
+    entry = _worker_renderers.get(spec.key)
+    if entry is None:
+        import matplotlib
+        module_name, _, attr = spec.factory.partition(':')
+        factory = getattr(importlib.import_module(module_name), attr)
+        # Keep whatever style the renderer sets up out of the worker's global state
+        with matplotlib.rc_context():
+            renderer = factory(*spec.args)
+            style = matplotlib.rcParams.copy()
+        entry = _worker_renderers[spec.key] = (renderer, style)
+    return entry
+
+
+def _call(renderer: Any, method: str, kwargs: Dict[str, Any]) -> Any:
+    result = getattr(renderer, method)(**kwargs)
+    if inspect.iscoroutine(result):
+        # Async chart methods only await nothing-blocking helpers; run them to completion here
+        result = asyncio.run(result)
+    return result
+
+
+def _render_job(spec: RendererSpec, method: str, kwargs: Dict[str, Any]) -> Tuple[Any, float]:
+    import matplotlib
+    import matplotlib.pyplot as plt
+    renderer, style = _worker_renderer(spec)
+    start = time.perf_counter()
+    try:
+        with matplotlib.rc_context(style):
+            result = _call(renderer, method, kwargs)
+    finally:
+        plt.close('all')
+    return result, time.perf_counter() - start
+
+
+def _warm_job() -> int:
+    return os.getpid()
+
+
+# -- Service ---------------------------------------------------------------
+
+class ChartRenderService:
+    """Process-pool chart rendering with a request queue and a render cache."""
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_pending: int = 32,
+        cache_entries: int = 256,
+        mode: str = 'process',
+        preload: Sequence[str] = DEFAULT_PRELOAD,
+        start_method: str = 'spawn'
+    ):
+        """
+        Args:
+            max_workers: Worker processes (renders running at once)
+            max_pending: Requests allowed to wait for a worker before new
+                ones are rejected
+            cache_entries: Rendered charts remembered by cache key
+            mode: 'process' (default) or 'thread'
+            preload: Modules imported by every worker at start
+            start_method: multiprocessing start method of the pool
+        """
+        if mode not in ('process', 'thread'):
+            raise ValueError(f"Unknown chart render mode: {mode}")
+        self.mode = mode
+        self.max_workers = max_workers if mode == 'process' else 1
+        self.max_pending = max_pending
+        self.cache_entries = cache_entries
+        self.preload = tuple(preload)
+        self.start_method = start_method
+
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop = None
+        self._waiting = 0
+        self._cache: 'OrderedDict[str, str]' = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._render_times: Deque[float] = deque(maxlen=500)
+
+        self.stats = {
+            'requests': 0,
+            'renders': 0,
+            'cache_hits': 0,
+            'coalesced': 0,
+            'rejected': 0,
+            'errors': 0,
+            'pool_restarts': 0
+        }
+
+    # -- Pool ----------------------------------------------------------------
+
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                if self.mode == 'process':
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context(self.start_method),
+                        initializer=_init_worker,
+                        initargs=(self.preload,)
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chart_render")
+            return self._executor
+
+    def _reset_executor(self, executor) -> None:
+        with self._executor_lock:
+            if self._executor is executor:
+                self._executor = None
+                self.stats['pool_restarts'] += 1
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def warmup(self) -> None:
+        """Start the worker processes now rather than on the first render."""
+        if self.mode != 'process':
+            return
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        await asyncio.gather(*[loop.run_in_executor(executor, _warm_job) for _ in range(self.max_workers)])
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_workers)
+            self._slots_loop = loop
+        return self._slots
+
+    # -- Rendering -----------------------------------------------------------
+
+    @staticmethod
+    def _digest(spec: RendererSpec, method: str, cache_key: Hashable) -> str:
+        raw = json.dumps([spec.factory, method, cache_key], default=str)
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    async def render(
+        self,
+        spec: RendererSpec,
+        method: str,
+        kwargs: Optional[Dict[str, Any]] = None,
+        cache_key: Optional[Hashable] = None,
+        local: Any = None
+    ) -> Optional[str]:
+        """Run ``renderer.method(**kwargs)`` off the event loop.
+
+        Args:
+            spec: How worker processes build the renderer
+            method: Chart method returning the path of the written image
+            kwargs: Arguments of the chart method (picklable)
+            cache_key: Identifies the chart; None disables caching
+            local: The caller's renderer, used in thread mode
+
+        Returns:
+            Path of the chart, or None when rendering failed or was rejected
+        """
+        self.stats['requests'] += 1
+        kwargs = kwargs or {}
+        if cache_key is None:
+            return await self._submit(spec, method, kwargs, local)
+
+        digest = self._digest(spec, method, cache_key)
+        path = self._cache.get(digest)
+        if path is not None:
+            if os.path.exists(path):
+                self._cache.move_to_end(digest)
+                self.stats['cache_hits'] += 1
+                return path
+            del self._cache[digest]
+
+        future = self._inflight.get(digest)
+        if future is not None:
+            self.stats['coalesced'] += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[digest] = future
+        try:
+            path = await self._submit(spec, method, kwargs, local)
+        except BaseException as e:
+            self._inflight.pop(digest, None)
+            if isinstance(e, Exception):
+                future.set_exception(e)
+            else:
+                future.cancel()
+            raise
+        self._inflight.pop(digest, None)
+        if path:
+            self._cache[digest] = path
+            while len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+        future.set_result(path)
+        return path
+
+    async def _submit(self, spec: RendererSpec, method: str, kwargs: Dict[str, Any], local: Any) -> Optional[str]:
+        if self._waiting >= self.max_pending:
+            self.stats['rejected'] += 1
+            logger.warning(f"Chart render queue full ({self._waiting} waiting), skipping {method}")
+            return None
+
+        self._waiting += 1
+        try:
+            await self._get_slots().acquire()
+        finally:
+            self._waiting -= 1
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        try:
+            if self.mode == 'process':
+                result, elapsed = await loop.run_in_executor(executor, _render_job, spec, method, kwargs)
+            else:
+                if local is None:
+                    raise ValueError("Thread mode renders need the caller's renderer object")
+                start = time.perf_counter()
+                result = await loop.run_in_executor(executor, _call, local, method, kwargs)
+                elapsed = time.perf_counter() - start
+        except BrokenProcessPool as e:
+            self.stats['errors'] += 1
+            logger.error(f"Chart render pool broke during {method}, restarting it: {e}")
+            self._reset_executor(executor)
+            return None
+        except Exception as e:
+            self.stats['errors'] += 1
+            logger.error(f"Chart render {method} failed: {type(e).__name__}: {e}")
+            return None
+        finally:
+            self._get_slots().release()
+
+        self.stats['renders'] += 1
+        self._render_times.append(elapsed)
+        return str(result) if result else None
+
+    # -- Lifecycle and metrics -----------------------------------------------
+
+    def shutdown(self) -> None:
+        """Stop the pool; the next render starts a new one."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Render, cache and queue counters."""
+        times = sorted(self._render_times)
+        return {
+            **self.stats,
+            'mode': self.mode,
+            'workers': self.max_workers,
+            'waiting': self._waiting,
+            'in_flight': len(self._inflight),
+            'cached': len(self._cache),
+            'render_time_p50': times[len(times) // 2] if times else None,
+            'render_time_max': times[-1] if times else None
+        }
+
+
+_service: Optional[ChartRenderService] = None
+_service_lock = threading.Lock()
+
+
+def get_chart_render_service(config: Optional[Dict[str, Any]] = None) -> ChartRenderService:
+    """Shared render service; ``config`` (``chart_rendering`` section) applies on first call."""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                settings = dict((config or {}).get('chart_rendering', {}))
+                _service = ChartRenderService(
+                    max_workers=settings.get('max_workers', 2),
+                    max_pending=settings.get('max_pending', 32),
+                    cache_entries=settings.get('cache_entries', 256),
+                    mode=settings.get('mode', 'process'),
+                    preload=tuple(settings.get('preload', DEFAULT_PRELOAD))
+                )
+    return _service
+
+
+def shutdown_chart_render_service() -> None:
+    """Stop the shared service's worker processes."""
+    global _service
+    with _service_lock:
+        service, _service = _service, None
+    if service is not None:
+        service.shutdown()
@@ -46,7 +46,6 @@
 import json
 import time
 import sqlite3
-import gzip
 import os
 from typing import Dict, List, Any, Optional, Iterator, Union, Callable, Awaitable
 from dataclasses import dataclass, field, asdict
@@ -64,6 +63,8 @@
 import traceback
 
 from .event_bus import Event, EventPriority
+from .hot_event_index import HotEventIndex
+from .warm_archive import WarmArchive
 from .event_types import MarketDataUpdatedEvent, AnalysisCompletedEvent, TradingSignalEvent
 from ..interfaces.services import IAsyncDisposable
 
@@ -75,6 +76,12 @@ class StorageTier(Enum):
     COLD = "cold"        # Archived storage (>30 days)
 
 
+class DurabilityMode(Enum):
+    """When append_event returns relative to the SQLite commit."""
+    ACK_ON_ENQUEUE = "enqueue"  # Return once queued for the group-commit writer
+    ACK_ON_COMMIT = "commit"    # Return once the batch holding the event is committed
+
+
 class QueryType(Enum):
     """Event query types."""
     BY_ID = "by_id"
@@ -204,9 +211,26 @@ def __init__(
         hot_retention_hours: int = 24,
         warm_retention_days: int = 30,
         max_memory_events: int = 100000,
-        compression_enabled: bool = True
+        compression_enabled: bool = True,
+        durability: Union[DurabilityMode, str] = DurabilityMode.ACK_ON_ENQUEUE,
+        write_queue_size: int = 50000,
+        write_batch_size: int = 1000,
+        write_batch_interval_ms: float = 50.0,
+        sqlite_synchronous: str = "NORMAL",
+        warm_block_size: int = 5000
     ):
-        """Initialize event store."""
+        """Initialize event store.
+
+        Database writes go through a bounded queue drained by a single
+        group-commit writer: rows are inserted with ``executemany`` and
+        committed once per ``write_batch_size`` events or
+        ``write_batch_interval_ms``, whichever comes first. When the queue
+        is full, ``append_event`` waits (backpressure).
+
+        Warm storage is a ``WarmArchive`` partitioned by date and event type
+        with per-block time statistics; legacy ``events_*.jsonl.gz`` files
+        are migrated into it on ``initialize``.
+        """
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
         
@@ -216,14 +240,34 @@ def __init__(
         self.max_memory_events = max_memory_events
         self.compression_enabled = compression_enabled
         
-        # Hot storage (in-memory + SQLite)
-        self.hot_events: deque = deque(maxlen=max_memory_events)
-        self.hot_index: Dict[str, EventRecord] = {}  # event_id -> record
+        # Hot storage (in-memory + SQLite): time-ordered records with
+        # secondary indexes by type/source/symbol/exchange
+        self.hot_events = HotEventIndex(max_events=max_memory_events)
+        self.hot_index: Dict[str, EventRecord] = self.hot_events.by_id  # event_id -> record
         self.db_path = self.storage_path / "hot_events.db"
         self._db_connection: Optional[aiosqlite.Connection] = None
         
+        # Group-commit writer
+        self.durability = DurabilityMode(durability)
+        self.write_queue_size = write_queue_size
+        self.write_batch_size = write_batch_size
+        self.write_batch_interval = write_batch_interval_ms / 1000
+        self.sqlite_synchronous = sqlite_synchronous.upper()
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._append_latencies_ms: deque = deque(maxlen=10000)
+        self._commit_batch_sizes: deque = deque(maxlen=1000)
+        self.write_stats = {
+            'commits': 0,
+            'rows_written': 0,
+            'write_errors': 0,
+            'backpressure_waits': 0,
+            'total_commit_time_ms': 0.0
+        }
+        
         # Warm storage tracking
-        self.warm_files: Dict[str, Path] = {}  # date -> file_path
+        self.warm_archive = WarmArchive(self.storage_path / "warm", block_size=warm_block_size)
+        self.warm_files: Dict[str, Path] = {}  # date -> partition directory
         
         # Snapshots
         self.snapshots: Dict[str, EventSnapshot] = {}  # date -> snapshot
@@ -244,13 +288,24 @@ def __init__(
     
     async def initialize(self):
         """Initialize event store database and structures."""
-        # Initialize SQLite database
+        # Initialize SQLite database (WAL lets readers run alongside the writer)
         self._db_connection = await aiosqlite.connect(str(self.db_path))
+        await self._db_connection.execute("PRAGMA journal_mode=WAL")
+        await self._db_connection.execute(f"PRAGMA synchronous={self.sqlite_synchronous}")
         await self._initialize_database()
         
+        # Start the group-commit writer
+        self._write_queue = asyncio.Queue(maxsize=self.write_queue_size)
+        self._writer_task = create_tracked_task(self._writer_loop(), name="event_store_writer")
+        
         # Load existing snapshots
         await self._load_snapshots()
         
+        # Warm archive: migrate legacy jsonl.gz files, then register dates
+        await self._run_in_pool(self.warm_archive.migrate_legacy, self.storage_path, self._warm_record)
+        for date in self.warm_archive.dates():
+            self.warm_files[date] = self.warm_archive.date_path(date)
+        
         # Schedule cleanup tasks
         create_tracked_task(self._periodic_cleanup(), name="auto_tracked_task")
         
@@ -286,23 +341,37 @@ async def _initialize_database(self):
             await self._db_connection.commit()
     
     async def append_event(self, event: Event) -> str:
-        """Append event to store with high performance."""
+        """Append event to store with high performance.
+
+        The event is added to hot memory immediately and queued for the
+        database writer. With ``ACK_ON_COMMIT`` this returns only after the
+        writer has committed the batch containing the event.
+        """
         start_time = time.perf_counter()
         
         try:
             # Create event record
             record = EventRecord.from_event(event)
             
-            # Add to hot storage (memory)
+            # Add to hot storage (memory); the oldest records are evicted at capacity
             self.hot_events.append(record)
-            self.hot_index[record.event_id] = record
             
-            # Async database insert (don't wait)
-            create_tracked_task(self._insert_to_database, name="_insert_to_database_task")
+            # Queue for the group-commit writer
+            if self._write_queue is not None:
+                committed = None
+                if self.durability is DurabilityMode.ACK_ON_COMMIT:
+                    committed = asyncio.get_running_loop().create_future()
+                if self._write_queue.full():
+                    self.write_stats['backpressure_waits'] += 1
+                await self._write_queue.put((record, committed))
+                if committed is not None:
+                    await committed
             
             # Update metrics
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
             self.append_count += 1
-            self.total_append_time += (time.perf_counter() - start_time) * 1000
+            self.total_append_time += elapsed_ms
+            self._append_latencies_ms.append(elapsed_ms)
             
             return record.event_id
             
@@ -310,29 +379,84 @@ async def append_event(self, event: Event) -> str:
             self.logger.error(f"Failed to append event {event.event_id}: {e}")
             raise
     
-    async def _insert_to_database(self, record: EventRecord):
-        """Insert record to SQLite database asynchronously."""
+    @staticmethod
+    def _record_to_row(record: EventRecord) -> tuple:
+        return (
+            record.event_id,
+            record.event_type,
+            record.timestamp.timestamp(),
+            record.source,
+            record.priority,
+            json.dumps(record.data),
+            json.dumps(record.metadata),
+            record.storage_timestamp,
+            record.checksum
+        )
+    
+    async def _writer_loop(self):
+        """Drain the write queue in batches, one transaction per batch."""
+        while True:
+            batch = [await self._write_queue.get()]
+            deadline = time.monotonic() + self.write_batch_interval
+            
+            # Collect until the batch is full or the window closes
+            while len(batch) < self.write_batch_size:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._write_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                await self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+    
+    async def _write_batch(self, batch: List[tuple]):
+        """Insert a batch of queued records and commit once."""
+        start_time = time.perf_counter()
         try:
-            async with self._db_connection.cursor() as cursor:
-                await cursor.execute("""
-                    INSERT OR REPLACE INTO events 
-                    (event_id, event_type, timestamp, source, priority, data, metadata, storage_timestamp, checksum)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    record.event_id,
-                    record.event_type,
-                    record.timestamp.timestamp(),
-                    record.source,
-                    record.priority,
-                    json.dumps(record.data),
-                    json.dumps(record.metadata),
-                    record.storage_timestamp,
-                    record.checksum
-                ))
-                await self._db_connection.commit()
-                
+            await self._db_connection.executemany("""
+                INSERT OR REPLACE INTO events 
+                (event_id, event_type, timestamp, source, priority, data, metadata, storage_timestamp, checksum)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [self._record_to_row(record) for record, _ in batch])
+            await self._db_connection.commit()
+            error = None
         except Exception as e:
-            self.logger.error(f"Database insert failed for {record.event_id}: {e}")
+            error = e
+            self.write_stats['write_errors'] += 1
+            self.logger.error(f"Database batch insert of {len(batch)} events failed: {e}")
+            try:
+                await self._db_connection.rollback()
+            except Exception:
+                pass
+        
+        if error is None:
+            self.write_stats['commits'] += 1
+            self.write_stats['rows_written'] += len(batch)
+            self.write_stats['total_commit_time_ms'] += (time.perf_counter() - start_time) * 1000
+            self._commit_batch_sizes.append(len(batch))
+        
+        for _, committed in batch:
+            if committed is not None and not committed.done():
+                if error is None:
+                    committed.set_result(None)
+                else:
+                    committed.set_exception(error)
+    
+    async def flush(self):
+        """Wait until every queued event has been written."""
+        if self._write_queue is not None:
+            await self._write_queue.join()
     
     async def get_event(self, event_id: str) -> Optional[EventRecord]:
         """Get single event by ID."""
@@ -365,30 +489,34 @@ async def query_events(
         query_type: QueryType,
         **kwargs
     ) -> List[EventRecord]:
-        """Query events by various criteria."""
+        """Query events by various criteria.
+
+        Key queries (type, source, symbol, exchange) are served from the hot
+        tier indexes and accept optional ``start_time``/``end_time`` bounds,
+        ``limit`` (default 100 newest matches) and ``offset`` (newest
+        matches to skip). Time-range queries accept ``event_types`` and
+        also read matching warm archive blocks. Results are oldest first.
+        """
         start_time = time.perf_counter()
         
         try:
             if query_type == QueryType.BY_TIME_RANGE:
                 start_time_param = kwargs.get('start_time')
                 end_time_param = kwargs.get('end_time')
-                results = await self._query_by_time_range(start_time_param, end_time_param)
-            
-            elif query_type == QueryType.BY_TYPE:
-                event_type = kwargs.get('event_type')
-                results = await self._query_by_type(event_type)
-            
-            elif query_type == QueryType.BY_SOURCE:
-                source = kwargs.get('source')
-                results = await self._query_by_source(source)
-            
-            elif query_type == QueryType.BY_SYMBOL:
-                symbol = kwargs.get('symbol')
-                results = await self._query_by_symbol(symbol)
+                results = await self._query_by_time_range(
+                    start_time_param, end_time_param, kwargs.get('event_types')
+                )
             
-            elif query_type == QueryType.BY_EXCHANGE:
-                exchange = kwargs.get('exchange')
-                results = await self._query_by_exchange(exchange)
+            elif query_type in self._KEY_QUERIES:
+                field = self._KEY_QUERIES[query_type]
+                results = self.hot_events.query(
+                    field,
+                    kwargs.get(field),
+                    start_time=kwargs.get('start_time'),
+                    end_time=kwargs.get('end_time'),
+                    limit=kwargs.get('limit', 100),
+                    offset=kwargs.get('offset', 0)
+                )
             
             else:
                 results = []
@@ -400,29 +528,42 @@ async def query_events(
             self.logger.error(f"Query failed {query_type}: {e}")
             return []
     
+    _KEY_QUERIES = {
+        QueryType.BY_TYPE: 'event_type',
+        QueryType.BY_SOURCE: 'source',
+        QueryType.BY_SYMBOL: 'symbol',
+        QueryType.BY_EXCHANGE: 'exchange'
+    }
+    
     async def _query_by_time_range(
         self, 
         start_time: datetime, 
-        end_time: datetime
+        end_time: datetime,
+        event_types: Optional[List[str]] = None
     ) -> List[EventRecord]:
         """Query events by time range."""
-        results = []
+        types = set(event_types) if event_types else None
         
         # Query hot storage (memory)
-        for record in self.hot_events:
-            if start_time <= record.timestamp <= end_time:
-                results.append(record)
+        results = self.hot_events.query(start_time=start_time, end_time=end_time, limit=None)
         
         # Query database if needed (for events not in memory)
         if len(results) < 1000:  # Don't overwhelm with too many DB queries
             db_results = await self._query_database_by_time_range(start_time, end_time)
-            # Merge results, avoiding duplicates
-            existing_ids = {r.event_id for r in results}
-            for record in db_results:
-                if record.event_id not in existing_ids:
-                    results.append(record)
+            results.extend(db_results)
+        
+        # Archived events: only blocks overlapping the range/types are read
+        if self.warm_files:
+            results.extend(await self._run_in_pool(
+                self.warm_archive.scan, self._warm_record, start_time, end_time, types
+            ))
         
-        return sorted(results, key=lambda x: x.timestamp)
+        # Merge results, avoiding duplicates (hot copies win)
+        merged = {}
+        for record in results:
+            if types is None or record.event_type in types:
+                merged.setdefault(record.event_id, record)
+        return sorted(merged.values(), key=lambda x: x.timestamp.timestamp())
     
     async def _query_database_by_id(self, event_id: str) -> Optional[EventRecord]:
         """Query database for specific event."""
@@ -467,50 +608,6 @@ async def _query_database_by_time_range(
             self.logger.error(f"Database time range query failed: {e}")
             return []
     
-    async def _query_by_type(self, event_type: str) -> List[EventRecord]:
-        """Query events by type."""
-        results = []
-        
-        # Search hot storage
-        for record in self.hot_events:
-            if record.event_type == event_type:
-                results.append(record)
-        
-        return results[-100:]  # Return last 100 events
-    
-    async def _query_by_source(self, source: str) -> List[EventRecord]:
-        """Query events by source."""
-        results = []
-        
-        # Search hot storage
-        for record in self.hot_events:
-            if record.source == source:
-                results.append(record)
-        
-        return results[-100:]  # Return last 100 events
-    
-    async def _query_by_symbol(self, symbol: str) -> List[EventRecord]:
-        """Query events by symbol."""
-        results = []
-        
-        # Search hot storage
-        for record in self.hot_events:
-            if record.data.get('symbol') == symbol:
-                results.append(record)
-        
-        return results[-100:]  # Return last 100 events
-    
-    async def _query_by_exchange(self, exchange: str) -> List[EventRecord]:
-        """Query events by exchange."""
-        results = []
-        
-        # Search hot storage
-        for record in self.hot_events:
-            if record.data.get('exchange') == exchange:
-                results.append(record)
-        
-        return results[-100:]  # Return last 100 events
-    
     def _row_to_record(self, row) -> EventRecord:
         """Convert database row to EventRecord."""
         return EventRecord(
@@ -528,8 +625,18 @@ def _row_to_record(self, row) -> EventRecord:
     
     async def _query_warm_storage_by_id(self, event_id: str) -> Optional[EventRecord]:
         """Query warm storage files for event."""
-        # This would search compressed files - simplified for now
-        return None
+        if not self.warm_files:
+            return None
+        return await self._run_in_pool(self.warm_archive.get, event_id, self._warm_record)
+    
+    @staticmethod
+    def _warm_record(**columns) -> EventRecord:
+        return EventRecord(**columns, storage_tier=StorageTier.WARM)
+    
+    async def _run_in_pool(self, fn: Callable, *args):
+        """Run blocking warm-archive I/O in the store's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.thread_pool, fn, *args)
     
     def _update_query_metrics(self, start_time: float):
         """Update query performance metrics."""
@@ -638,11 +745,8 @@ async def _archive_hot_events(self):
         """Archive old hot events to warm storage."""
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=self.hot_retention_hours)
         
-        # Identify events to archive
-        events_to_archive = []
-        for record in list(self.hot_events):
-            if record.timestamp < cutoff_time:
-                events_to_archive.append(record)
+        # Pop expired events from the time-ordered head of hot storage
+        events_to_archive = self.hot_events.pop_older_than(cutoff_time)
         
         if events_to_archive:
             # Group by date for efficient storage
@@ -655,33 +759,13 @@ async def _archive_hot_events(self):
             for date_key, date_events in events_by_date.items():
                 await self._archive_events_to_warm(date_key, date_events)
             
-            # Remove from hot storage
-            for record in events_to_archive:
-                self.hot_index.pop(record.event_id, None)
-            
             self.logger.info(f"Archived {len(events_to_archive)} events to warm storage")
     
     async def _archive_events_to_warm(self, date: str, events: List[EventRecord]):
-        """Archive events to warm storage file."""
+        """Archive events to the warm archive partitions for ``date``."""
         try:
-            warm_file = self.storage_path / f"events_{date}.jsonl.gz"
-            
-            with gzip.open(warm_file, 'at') as f:
-                for record in events:
-                    event_data = {
-                        'event_id': record.event_id,
-                        'event_type': record.event_type,
-                        'timestamp': record.timestamp.isoformat(),
-                        'source': record.source,
-                        'priority': record.priority,
-                        'data': record.data,
-                        'metadata': record.metadata,
-                        'storage_timestamp': record.storage_timestamp,
-                        'checksum': record.checksum
-                    }
-                    f.write(json.dumps(event_data) + '\n')
-            
-            self.warm_files[date] = warm_file
+            await self._run_in_pool(self.warm_archive.append, date, events)
+            self.warm_files[date] = self.warm_archive.date_path(date)
             
         except Exception as e:
             self.logger.error(f"Failed to archive events for {date}: {e}")
@@ -702,8 +786,7 @@ async def _cleanup_warm_storage(self):
             try:
                 # For now, just delete old files
                 # In production, you might move to cold storage (S3, etc.)
-                if file_path.exists():
-                    file_path.unlink()
+                await self._run_in_pool(self.warm_archive.drop_date, date)
                 del self.warm_files[date]
                 
             except Exception as e:
@@ -712,13 +795,41 @@ async def _cleanup_warm_storage(self):
         if old_files:
             self.logger.info(f"Cleaned up {len(old_files)} old warm storage files")
     
+    def _write_statistics(self) -> Dict[str, Any]:
+        latencies = sorted(self._append_latencies_ms)
+        batch_sizes = self._commit_batch_sizes
+        commits = self.write_stats['commits']
+        
+        def percentile(p: float) -> float:
+            return latencies[min(len(latencies) - 1, int(len(latencies) * p))] if latencies else 0.0
+        
+        return {
+            'durability': self.durability.value,
+            'queue_depth': self._write_queue.qsize() if self._write_queue is not None else 0,
+            'queue_capacity': self.write_queue_size,
+            'append_latency_ms': {
+                'p50': percentile(0.50),
+                'p99': percentile(0.99),
+                'max': latencies[-1] if latencies else 0.0
+            },
+            'commit_batch_size': {
+                'avg': sum(batch_sizes) / len(batch_sizes) if batch_sizes else 0.0,
+                'max': max(batch_sizes) if batch_sizes else 0,
+                'last': batch_sizes[-1] if batch_sizes else 0
+            },
+            'avg_commit_time_ms': self.write_stats['total_commit_time_ms'] / max(commits, 1),
+            **{k: v for k, v in self.write_stats.items() if k != 'total_commit_time_ms'}
+        }
+    
     def get_statistics(self) -> Dict[str, Any]:
         """Get event store statistics."""
         return {
             'storage': {
                 'hot_events_count': len(self.hot_events),
                 'hot_index_size': len(self.hot_index),
+                'hot_index_keys': self.hot_events.get_stats()['index_keys'],
                 'warm_files_count': len(self.warm_files),
+                'warm_archive': self.warm_archive.stats,
                 'snapshots_count': len(self.snapshots),
                 'storage_path': str(self.storage_path)
             },
@@ -729,6 +840,7 @@ def get_statistics(self) -> Dict[str, Any]:
                 'avg_query_time_ms': self.total_query_time / max(self.query_count, 1),
                 'throughput_appends_per_sec': self.append_count / max(time.time() - getattr(self, '_start_time', time.time()), 1)
             },
+            'writer': self._write_statistics(),
             'retention': {
                 'hot_retention_hours': self.hot_retention_hours,
                 'warm_retention_days': self.warm_retention_days,
@@ -738,6 +850,17 @@ def get_statistics(self) -> Dict[str, Any]:
     
     async def close(self):
         """Close event store and cleanup resources."""
+        if self._writer_task is not None:
+            # Write out everything still queued before closing the connection
+            await self.flush()
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+            self._write_queue = None
+        
         if self._db_connection:
             await self._db_connection.close()
         
@@ -758,9 +881,19 @@ def __init__(
         self,
         storage_path: str = "data/event_sourcing",
         enable_real_time_streaming: bool = True,
-        retention_policy: Dict[str, Any] = None
+        retention_policy: Dict[str, Any] = None,
+        write_options: Dict[str, Any] = None
     ):
-        """Initialize event sourcing manager."""
+        """Initialize event sourcing manager.
+
+        Args:
+            storage_path: Directory for the event store
+            enable_real_time_streaming: Stream sourced events to subscribers
+            retention_policy: Hot/warm/cold retention settings
+            write_options: Group-commit writer settings passed to EventStore
+                (durability, write_queue_size, write_batch_size,
+                write_batch_interval_ms, sqlite_synchronous)
+        """
         # Default retention policy
         if retention_policy is None:
             retention_policy = {
@@ -775,7 +908,8 @@ def __init__(
             storage_path=storage_path,
             hot_retention_hours=retention_policy['hot_hours'],
             warm_retention_days=retention_policy['warm_days'],
-            max_memory_events=retention_policy['max_memory_events']
+            max_memory_events=retention_policy['max_memory_events'],
+            **(write_options or {})
         )
         
         # Real-time streaming
@@ -826,16 +960,15 @@ async def replay_events(
         """Replay events from audit trail."""
         try:
             # Query events from store
+            # Event type filtering happens in the store so warm blocks of
+            # other types are never decompressed
             records = await self.event_store.query_events(
                 QueryType.BY_TIME_RANGE,
                 start_time=start_time,
-                end_time=end_time
+                end_time=end_time,
+                event_types=event_types
             )
             
-            # Filter by event types if specified
-            if event_types:
-                records = [r for r in records if r.event_type in event_types]
-            
             # Convert to events
             events = [record.to_event() for record in records]
             
@@ -0,0 +1,215 @@
+"""
+Time-ordered hot-tier event index with secondary indexes.
+
+``EventStore`` used to keep hot events in a plain ``deque`` and answer
+by-type/source/symbol/exchange queries by scanning all of it (up to
+``max_memory_events`` records), and archiving copied the whole deque to find
+old events.
+
+``HotEventIndex`` keeps every record in a list ordered by event time, plus
+one time-ordered list per indexed key (``event_type``, ``source``,
+``symbol``, ``exchange``). All lists share the same ordering, so the oldest
+record overall is also the oldest record of each of its keys: evicting it
+(capacity) or archiving it (retention) pops the head of every list it
+belongs to in O(1). Queries bisect on time and slice, so a time-range + key
+query with limit/offset is O(log n + limit).
+
+Lists use a moving head offset instead of ``deque`` so they can be bisected;
+the consumed prefix is compacted once it reaches half of the list.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+INDEXED_FIELDS = ('event_type', 'source', 'symbol', 'exchange')
+
+
+def _epoch(value: datetime) -> float:
+    """Seconds since the epoch; naive datetimes are treated as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class _TimeOrderedList:
+    """Records sorted by time with O(1) removal of the oldest record."""
+
+    __slots__ = ('times', 'records', 'head')
+
+    def __init__(self):
+        self.times: List[float] = []
+        self.records: List[Any] = []
+        self.head = 0
+
+    def __len__(self) -> int:
+        return len(self.records) - self.head
+
+    def add(self, ts: float, record: Any) -> None:
+        if not self.times or ts >= self.times[-1]:
+            self.times.append(ts)
+            self.records.append(record)
+        else:
+            # Late event: keep time order (after records with the same time)
+            pos = bisect_right(self.times, ts, self.head)
+            self.times.insert(pos, ts)
+            self.records.insert(pos, record)
+
+    def first(self) -> Tuple[float, Any]:
+        return self.times[self.head], self.records[self.head]
+
+    def popleft(self) -> Any:
+        record = self.records[self.head]
+        self.records[self.head] = None
+        self.head += 1
+        if self.head >= 1024 and self.head * 2 >= len(self.records):
+            del self.times[:self.head]
+            del self.records[:self.head]
+            self.head = 0
+        return record
+
+    def window(self, start: Optional[float], end: Optional[float]) -> Tuple[int, int]:
+        lo = self.head if start is None else bisect_left(self.times, start, self.head)
+        hi = len(self.records) if end is None else bisect_right(self.times, end, self.head)
+        return lo, max(lo, hi)
+
+
+class HotEventIndex:
+    """In-memory hot-tier store of ``EventRecord`` objects.
+
+    Iteration yields records oldest first. ``by_id`` maps event IDs to
+    records and is kept in sync with eviction and archiving.
+    """
+
+    def __init__(self, max_events: int = 100000):
+        self.max_events = max_events
+        self.by_id: Dict[str, Any] = {}
+        self._all = _TimeOrderedList()
+        self._indexes: Dict[str, Dict[Any, _TimeOrderedList]] = {name: {} for name in INDEXED_FIELDS}
+
+    @staticmethod
+    def _keys(record) -> Iterator[Tuple[str, Any]]:
+        yield 'event_type', record.event_type
+        yield 'source', record.source
+        for name in ('symbol', 'exchange'):
+            value = record.data.get(name)
+            if value:
+                yield name, value
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def __iter__(self) -> Iterator[Any]:
+        records = self._all.records
+        for i in range(self._all.head, len(records)):
+            yield records[i]
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self.by_id
+
+    def get(self, event_id: str) -> Optional[Any]:
+        return self.by_id.get(event_id)
+
+    def append(self, record) -> List[Any]:
+        """Add a record; returns records evicted to stay within ``max_events``."""
+        previous = self.by_id.get(record.event_id)
+        if previous is not None:
+            # Same event stored again (INSERT OR REPLACE semantics): keep one copy
+            self.remove(previous)
+
+        ts = _epoch(record.timestamp)
+        self.by_id[record.event_id] = record
+        self._all.add(ts, record)
+        for name, value in self._keys(record):
+            index = self._indexes[name].get(value)
+            if index is None:
+                index = self._indexes[name][value] = _TimeOrderedList()
+            index.add(ts, record)
+
+        evicted = []
+        while len(self._all) > self.max_events:
+            evicted.append(self.popleft())
+        return evicted
+
+    def popleft(self):
+        """Remove and return the oldest record."""
+        record = self._all.popleft()
+        self.by_id.pop(record.event_id, None)
+        for name, value in self._keys(record):
+            index = self._indexes[name][value]
+            index.popleft()
+            if not index:
+                del self._indexes[name][value]
+        return record
+
+    def pop_older_than(self, cutoff: datetime) -> List[Any]:
+        """Remove and return records older than ``cutoff``, oldest first."""
+        cutoff_ts = _epoch(cutoff)
+        popped = []
+        while self._all and self._all.first()[0] < cutoff_ts:
+            popped.append(self.popleft())
+        return popped
+
+    def remove(self, record) -> None:
+        """Remove a specific record (O(n); only used for re-stored events)."""
+        for lst in [self._all] + [self._indexes[name].get(value) for name, value in self._keys(record)]:
+            if lst is None:
+                continue
+            for i in range(lst.head, len(lst.records)):
+                if lst.records[i] is record:
+                    del lst.times[i]
+                    del lst.records[i]
+                    break
+        for name, value in self._keys(record):
+            if value in self._indexes[name] and not self._indexes[name][value]:
+                del self._indexes[name][value]
+        self.by_id.pop(record.event_id, None)
+
+    def query(
+        self,
+        field: Optional[str] = None,
+        value: Any = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = 100,
+        offset: int = 0
+    ) -> List[Any]:
+        """Records matching a key and/or time range, oldest first.
+
+        Args:
+            field: Indexed field ('event_type', 'source', 'symbol',
+                'exchange'), or None for all records
+            value: Key value for ``field``
+            start_time: Inclusive lower time bound
+            end_time: Inclusive upper time bound
+            limit: Maximum number of records (the newest matches), or None
+            offset: Number of newest matches to skip (for paging backwards)
+        """
+        if field is None:
+            lst = self._all
+        else:
+            if field not in self._indexes:
+                raise ValueError(f"Unknown index field: {field}")
+            lst = self._indexes[field].get(value)
+            if lst is None:
+                return []
+
+        lo, hi = lst.window(
+            _epoch(start_time) if start_time is not None else None,
+            _epoch(end_time) if end_time is not None else None
+        )
+        hi = max(lo, hi - offset)
+        if limit is not None:
+            lo = max(lo, hi - limit)
+        return lst.records[lo:hi]
+
+    def count(self, field: str, value: Any) -> int:
+        """Number of hot records with the given key."""
+        lst = self._indexes[field].get(value)
+        return len(lst) if lst is not None else 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'records': len(self),
+            'index_keys': {name: len(index) for name, index in self._indexes.items()}
+        }
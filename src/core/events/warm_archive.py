@@ -0,0 +1,299 @@
+"""
+Seekable, columnar warm-tier archive for the EventStore.
+
+The previous warm tier appended JSON lines to ``events_YYYY-MM-DD.jsonl.gz``:
+a single gzip stream that had to be decompressed and parsed in full to find
+one event or replay part of a day.
+
+Layout::
+
+    warm/
+      2026-01-01/
+        index.json                     # blocks + event_id -> block index
+        market_data_updated.blk        # compressed column blocks
+        trading_signal.blk
+
+Events are partitioned by date and ``event_type``. Each archive batch is
+split into blocks of at most ``block_size`` rows ("row groups"); a block is
+a zlib-compressed JSON object of columns (``event_id``, ``timestamp``, ...)
+appended to the partition's ``.blk`` file. ``index.json`` records each
+block's file, offset, length, row count and min/max timestamp, plus a
+sparse ``event_id -> block`` map. Time-range and type-filtered reads only
+decompress blocks whose statistics overlap the query, and blocks are sliced
+from a memory map of the partition file.
+
+All methods are blocking; ``EventStore`` runs them in its thread pool.
+"""
+
+import gzip
+import json
+import logging
+import mmap
+import os
+import re
+import shutil
+import threading
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+COLUMNS = (
+    'event_id', 'event_type', 'timestamp', 'source', 'priority',
+    'data', 'metadata', 'storage_timestamp', 'checksum'
+)
+
+LEGACY_FILE_PATTERN = re.compile(r'^events_(\d{4}-\d{2}-\d{2})\.jsonl\.gz$')
+_SAFE_NAME = re.compile(r'[^A-Za-z0-9_.-]')
+
+
+def _epoch(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class WarmArchive:
+    """Date/event_type partitioned block archive with per-block statistics."""
+
+    def __init__(self, root: Path, block_size: int = 5000, index_cache_size: int = 8):
+        """
+        Args:
+            root: Directory holding one sub-directory per date
+            block_size: Maximum rows per compressed block
+            index_cache_size: Number of per-date indexes kept in memory
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.block_size = block_size
+        self.index_cache_size = index_cache_size
+        self._indexes: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.RLock()
+        self.stats = {
+            'blocks_written': 0,
+            'rows_written': 0,
+            'blocks_read': 0,
+            'blocks_skipped': 0,
+            'legacy_files_migrated': 0
+        }
+        self.logger = logging.getLogger(__name__)
+
+    # -- Layout ------------------------------------------------------------
+
+    def dates(self) -> List[str]:
+        """Archived dates (YYYY-MM-DD), oldest first."""
+        return sorted(p.name for p in self.root.iterdir() if p.is_dir() and (p / 'index.json').exists())
+
+    def date_path(self, date: str) -> Path:
+        return self.root / date
+
+    @staticmethod
+    def _partition_file(event_type: str) -> str:
+        return f"{_SAFE_NAME.sub('_', event_type) or '_'}.blk"
+
+    def _load_index(self, date: str) -> Dict[str, Any]:
+        with self._lock:
+            index = self._indexes.get(date)
+            if index is not None:
+                self._indexes.move_to_end(date)
+                return index
+
+            index_file = self.date_path(date) / 'index.json'
+            if index_file.exists():
+                with open(index_file, 'r') as f:
+                    index = json.load(f)
+            else:
+                index = {'version': 1, 'date': date, 'blocks': [], 'ids': {}}
+
+            self._indexes[date] = index
+            while len(self._indexes) > self.index_cache_size:
+                self._indexes.popitem(last=False)
+            return index
+
+    def _save_index(self, date: str, index: Dict[str, Any]) -> None:
+        index_file = self.date_path(date) / 'index.json'
+        tmp_file = index_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(index, f, separators=(',', ':'))
+        os.replace(tmp_file, index_file)
+
+    # -- Writes ------------------------------------------------------------
+
+    def append(self, date: str, records: Iterable[Any]) -> int:
+        """Append ``EventRecord`` objects for one date; returns rows written."""
+        by_type: Dict[str, List[Any]] = {}
+        for record in records:
+            by_type.setdefault(record.event_type, []).append(record)
+        if not by_type:
+            return 0
+
+        with self._lock:
+            date_dir = self.date_path(date)
+            date_dir.mkdir(parents=True, exist_ok=True)
+            index = self._load_index(date)
+            written = 0
+
+            for event_type, type_records in by_type.items():
+                type_records.sort(key=lambda r: _epoch(r.timestamp))
+                file_name = self._partition_file(event_type)
+                with open(date_dir / file_name, 'ab') as f:
+                    for start in range(0, len(type_records), self.block_size):
+                        chunk = type_records[start:start + self.block_size]
+                        payload = zlib.compress(json.dumps(self._to_columns(chunk), default=str).encode('utf-8'))
+                        offset = f.tell()
+                        f.write(payload)
+
+                        block_no = len(index['blocks'])
+                        index['blocks'].append({
+                            'event_type': event_type,
+                            'file': file_name,
+                            'offset': offset,
+                            'length': len(payload),
+                            'rows': len(chunk),
+                            'min_ts': _epoch(chunk[0].timestamp),
+                            'max_ts': _epoch(chunk[-1].timestamp)
+                        })
+                        for record in chunk:
+                            index['ids'][record.event_id] = block_no
+                        written += len(chunk)
+                        self.stats['blocks_written'] += 1
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            self._save_index(date, index)
+            self.stats['rows_written'] += written
+            return written
+
+    @staticmethod
+    def _to_columns(records: List[Any]) -> Dict[str, list]:
+        return {
+            'event_id': [r.event_id for r in records],
+            'event_type': [r.event_type for r in records],
+            'timestamp': [_epoch(r.timestamp) for r in records],
+            'source': [r.source for r in records],
+            'priority': [r.priority for r in records],
+            'data': [r.data for r in records],
+            'metadata': [r.metadata for r in records],
+            'storage_timestamp': [r.storage_timestamp for r in records],
+            'checksum': [r.checksum for r in records]
+        }
+
+    # -- Reads -------------------------------------------------------------
+
+    def _read_block(self, date: str, block: Dict[str, Any], maps: Dict[str, mmap.mmap]) -> Dict[str, list]:
+        buf = maps.get(block['file'])
+        if buf is None:
+            with open(self.date_path(date) / block['file'], 'rb') as f:
+                buf = maps[block['file']] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        payload = buf[block['offset']:block['offset'] + block['length']]
+        self.stats['blocks_read'] += 1
+        return json.loads(zlib.decompress(payload))
+
+    @staticmethod
+    def _rows(columns: Dict[str, list], make_record: Callable[..., Any], keep: Callable[[int], bool]) -> List[Any]:
+        rows = []
+        for i in range(len(columns['event_id'])):
+            if keep(i):
+                rows.append(make_record(
+                    **{name: columns[name][i] for name in COLUMNS if name != 'timestamp'},
+                    timestamp=datetime.fromtimestamp(columns['timestamp'][i], tz=timezone.utc)
+                ))
+        return rows
+
+    def scan(
+        self,
+        make_record: Callable[..., Any],
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        event_types: Optional[Iterable[str]] = None
+    ) -> List[Any]:
+        """Records in ``[start_time, end_time]``, oldest first.
+
+        Only blocks whose event type and min/max timestamps overlap the
+        query are read. ``make_record`` builds a record from the column
+        values (keyword arguments named after ``COLUMNS``).
+        """
+        start_ts = _epoch(start_time) if start_time is not None else float('-inf')
+        end_ts = _epoch(end_time) if end_time is not None else float('inf')
+        start_date = datetime.fromtimestamp(start_ts, tz=timezone.utc).strftime('%Y-%m-%d') if start_time else ''
+        end_date = datetime.fromtimestamp(end_ts, tz=timezone.utc).strftime('%Y-%m-%d') if end_time else '9999'
+        types = set(event_types) if event_types else None
+
+        results = []
+        for date in self.dates():
+            if not start_date <= date <= end_date:
+                continue
+            index = self._load_index(date)
+            maps: Dict[str, mmap.mmap] = {}
+            try:
+                for block in index['blocks']:
+                    if (types is not None and block['event_type'] not in types) or \
+                            block['max_ts'] < start_ts or block['min_ts'] > end_ts:
+                        self.stats['blocks_skipped'] += 1
+                        continue
+                    columns = self._read_block(date, block, maps)
+                    times = columns['timestamp']
+                    results.extend(self._rows(columns, make_record, lambda i: start_ts <= times[i] <= end_ts))
+            finally:
+                for buf in maps.values():
+                    buf.close()
+
+        results.sort(key=lambda r: _epoch(r.timestamp))
+        return results
+
+    def get(self, event_id: str, make_record: Callable[..., Any]) -> Optional[Any]:
+        """Look up one event through the per-date ``event_id -> block`` maps."""
+        for date in reversed(self.dates()):
+            index = self._load_index(date)
+            block_no = index['ids'].get(event_id)
+            if block_no is None:
+                continue
+            maps: Dict[str, mmap.mmap] = {}
+            try:
+                columns = self._read_block(date, index['blocks'][block_no], maps)
+            finally:
+                for buf in maps.values():
+                    buf.close()
+            rows = self._rows(columns, make_record, lambda i: columns['event_id'][i] == event_id)
+            return rows[0] if rows else None
+        return None
+
+    # -- Maintenance -------------------------------------------------------
+
+    def drop_date(self, date: str) -> None:
+        """Delete all archived events for a date."""
+        with self._lock:
+            self._indexes.pop(date, None)
+            shutil.rmtree(self.date_path(date), ignore_errors=True)
+
+    def migrate_legacy(self, directory: Path, make_record: Callable[..., Any]) -> int:
+        """Convert ``events_YYYY-MM-DD.jsonl.gz`` files into archive blocks.
+
+        Each converted file is renamed to ``*.migrated`` so a crash midway
+        never loses events and a rerun skips finished files. Returns the
+        number of events migrated.
+        """
+        migrated = 0
+        for legacy_file in sorted(Path(directory).glob('events_*.jsonl.gz')):
+            match = LEGACY_FILE_PATTERN.match(legacy_file.name)
+            if not match:
+                continue
+            records = []
+            with gzip.open(legacy_file, 'rt') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    row = json.loads(line)
+                    timestamp = datetime.fromisoformat(row.pop('timestamp'))
+                    records.append(make_record(**{k: row.get(k) for k in COLUMNS if k != 'timestamp'},
+                                               timestamp=timestamp))
+            migrated += self.append(match.group(1), records)
+            legacy_file.rename(legacy_file.with_name(legacy_file.name + '.migrated'))
+            self.stats['legacy_files_migrated'] += 1
+            self.logger.info(f"Migrated {len(records)} warm events from {legacy_file.name}")
+        return migrated
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, 'dates': len(self.dates())}
@@ -13,7 +13,7 @@
 from datetime import datetime
 import aiohttp
 import websockets
-from urllib.parse import urlencode
+from urllib.parse import urlencode, urlparse
 from pybit.unified_trading import HTTP 
 from contextlib import contextmanager
 from dataclasses import dataclass, field
@@ -28,6 +28,7 @@
 
 # Load environment variables from .env file
 from src.core.market.market_data_manager import DataUnavailableError
+from src.core.market.ohlcv_store import frame_to_arrays, get_ohlcv_store
 load_dotenv()
 
 from .base import (
@@ -41,7 +42,7 @@
     RateLimitError  # Added import
 )
 
-from .rate_limiter import BybitRateLimiter
+from .rate_limiter import get_bybit_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -165,6 +166,23 @@ async def get_instance(cls, config: Dict[str, Any], error_handler: Optional[Any]
         }
     }
     
+    # Map Bybit interval to minutes for kline time calculations
+    KLINE_INTERVAL_MINUTES = {
+        '1': 1,
+        '3': 3,
+        '5': 5,
+        '15': 15,
+        '30': 30,
+        '60': 60,
+        '120': 120,
+        '240': 240,
+        '360': 360,
+        '720': 720,
+        'D': 1440,
+        'W': 10080,
+        'M': 43200
+    }
+    
     def __init__(self, config: Dict[str, Any], error_handler: Optional[Any] = None):
         """Initialize Bybit exchange."""
         # Call parent init with both arguments
@@ -244,14 +262,35 @@ def __init__(self, config: Dict[str, Any], error_handler: Optional[Any] = None):
         self.logger.info(f"Bybit exchange initialized with endpoint: {self.rest_endpoint}")
         self.logger.info(f"WebSocket endpoint: {self.ws_endpoint}")
         
-        # Initialize rate limiter
-        self.rate_limiter = BybitRateLimiter()
+        # Shared rate limiter: one budget for every REST path in this process
+        self.rate_limiter = get_bybit_rate_limiter({
+            'endpoints': self.RATE_LIMITS['endpoints'],
+            **self.exchange_config.get('rate_limiter', {})
+        })
 
         # Initialize trades cache - CRITICAL for orderflow/volume indicators
         # Without this, calculate_taker_buy_sell_ratio() returns 50.0 (neutral)
         self._trades_cache: Dict[str, Dict[str, Any]] = {}  # {symbol: {'data': [...], 'timestamp': float}}
         self._trades_cache_ttl = 300  # 5 minutes - matches market_data_manager.py trades interval
 
+        # Shared bulk ticker response: {category: (fetched_at, response)}
+        self._bulk_tickers_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._bulk_tickers_inflight: Dict[str, asyncio.Future] = {}
+        self._bulk_tickers_ttl = self.exchange_config.get('bulk_tickers_ttl', 2.0)
+
+        # Delta ("since last candle") kline refreshes merge into the candle store shared
+        # with MarketDataManager; each buffer's last timestamp is the high-water mark
+        delta_config = self.exchange_config.get('ohlcv_delta_fetch', {})
+        self.ohlcv_delta_fetch = delta_config.get('enabled', True)
+        self.ohlcv_delta_max_bars = delta_config.get('max_delta_bars', 100)
+        self._kline_store = get_ohlcv_store(config)
+        self._kline_fetch_stats = {
+            'full_fetches': 0,
+            'delta_fetches': 0,
+            'gap_backfills': 0,
+            'candles_downloaded': 0
+        }
+
         # Initialize circuit breakers
         self._init_circuit_breakers()
         
@@ -273,12 +312,6 @@ def __init__(self, config: Dict[str, Any], error_handler: Optional[Any] = None):
         
         self.logger.info("Bybit exchange initialized successfully")
         
-        # Initialize rate limit tracking
-        self._rate_limit_buckets = {
-            endpoint: [] for endpoint in self.RATE_LIMITS['endpoints'].keys()
-        }
-        self._rate_limit_lock = asyncio.Lock()
-        
         # Initialize connection pooling components
         self.session = None
         self.connector = None
@@ -854,7 +887,9 @@ def get_rate_limiter_stats(self) -> Dict[str, Any]:
         return {
             'api_calls': self.rate_limiter.get_api_call_stats(),
             'rate_limit_status': self.rate_limit_status.copy(),
-            'circuit_breakers': {k: v.copy() for k, v in self.circuit_breakers.items()}
+            'circuit_breakers': {k: v.copy() for k, v in self.circuit_breakers.items()},
+            'kline_fetch': self.get_kline_fetch_stats(),
+            'limiter': self.rate_limiter.get_stats()
         }
 
     async def _make_request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -1138,7 +1173,7 @@ async def _process_response(self, response, url):
         # Extract rate limit headers from response and update rate limiter
         try:
             # Update rate limiter with response headers
-            endpoint = url.split('/')[-1] if '/' in url else url
+            endpoint = urlparse(str(url)).path.lstrip('/')
             self.rate_limiter.update_from_headers(endpoint, dict(response.headers))
             
             # Also update legacy rate_limit_status for backward compatibility
@@ -2622,84 +2657,14 @@ async def _handle_liquidation_update(self, message: Dict[str, Any]) -> None:
             self.logger.debug(f"Raw message: {message}")
 
     async def _check_rate_limit(self, endpoint: str, category: str = 'linear') -> None:
-        """Check rate limit using sliding window approach matching Bybit's limits.
-
-        IMPORTANT: This method uses a while loop instead of recursion to avoid
-        deadlock. asyncio.Lock is non-reentrant, so recursive calls while holding
-        the lock would cause the task to wait forever on itself.
+        """Wait for a slot under a logical endpoint name ('kline', 'market_data').
 
-        Fix applied: 2026-01-11 - Replaced recursive calls with loop pattern.
+        The slot is taken from the shared ``BybitRateLimiter`` token buckets
+        (global 600/5s plus the ``RATE_LIMITS['endpoints']`` budget) and is
+        reserved for the next ``_make_request`` in this task, so the request
+        is not counted against the global budget twice.
         """
-        max_iterations = 10  # Safety limit to prevent infinite loops
-        iteration = 0
-
-        while iteration < max_iterations:
-            iteration += 1
-            wait_time = 0
-            wait_reason = None
-
-            async with self._rate_limit_lock:
-                now = time.time()
-
-                # Use global rate limit bucket (600 requests per 5 seconds)
-                global_bucket = self._rate_limit_buckets.setdefault('global', [])
-                window_start = now - 5.0  # 5-second sliding window
-
-                # Clean expired timestamps (older than 5 seconds)
-                global_bucket[:] = [ts for ts in global_bucket if ts > window_start]
-
-                # Check if we've hit the global limit
-                if len(global_bucket) >= 600:
-                    # Calculate wait time until oldest request expires
-                    wait_time = global_bucket[0] + 5.0 - now
-                    if wait_time > 0:
-                        wait_reason = f"Global rate limit reached (600/5s), waiting {wait_time:.2f}s"
-                        # Release lock before sleeping - continue loop to re-check
-                    else:
-                        wait_time = 0  # No need to wait, timestamps expired
-
-                # If no global wait needed, check endpoint-specific limits
-                if wait_time <= 0:
-                    endpoint_bucket = self._rate_limit_buckets.setdefault(endpoint, [])
-                    endpoint_limit = self.RATE_LIMITS['endpoints'].get(endpoint, {'requests': 100, 'per_second': 1})
-
-                    # Clean expired timestamps for endpoint
-                    endpoint_window = now - endpoint_limit['per_second']
-                    endpoint_bucket[:] = [ts for ts in endpoint_bucket if ts > endpoint_window]
-
-                    # Check endpoint limit
-                    if len(endpoint_bucket) >= endpoint_limit['requests']:
-                        wait_time = endpoint_bucket[0] + endpoint_limit['per_second'] - now
-                        if wait_time > 0:
-                            wait_reason = f"Endpoint {endpoint} rate limit, waiting {wait_time:.2f}s"
-                        else:
-                            wait_time = 0
-
-                # If no rate limit wait needed, we can proceed
-                if wait_time <= 0:
-                    # Check dynamic rate limit from headers (small delay, done inside lock)
-                    if hasattr(self, 'rate_limit_status') and self.rate_limit_status.get('remaining', 100) < 50:
-                        self.logger.warning(f"Low rate limit remaining: {self.rate_limit_status['remaining']}")
-                        await asyncio.sleep(0.1)
-
-                    # Record the request timestamp and return
-                    global_bucket.append(now)
-                    endpoint_bucket = self._rate_limit_buckets.setdefault(endpoint, [])
-                    endpoint_bucket.append(now)
-                    return
-
-            # Lock released - now sleep outside the lock if needed
-            if wait_time > 0:
-                if wait_reason:
-                    if 'Global' in wait_reason:
-                        self.logger.warning(wait_reason)
-                    else:
-                        self.logger.debug(wait_reason)
-                await asyncio.sleep(wait_time)
-                # Loop continues to re-check rate limits
-
-        # Safety: if we hit max iterations, log error but allow request
-        self.logger.error(f"Rate limit check exceeded {max_iterations} iterations for {endpoint}, allowing request")
+        await self.rate_limiter.reserve(endpoint, category=category)
 
     def _ensure_sentiment_structure(self, market_data: Dict[str, Any], symbol: str) -> None:
         """Ensure sentiment structure exists in market_data to prevent KeyErrors."""
@@ -3406,13 +3371,8 @@ def get_rate_limit_status(self) -> Dict[str, Any]:
             status['percentage_used'] = ((status['limit'] - status['remaining']) / status['limit']) * 100
         
         # Add global bucket info
-        global_bucket = self._rate_limit_buckets.get('global', [])
-        now = time.time()
-        window_start = now - 5.0
-        active_requests = len([ts for ts in global_bucket if ts > window_start])
-        
-        status['active_requests_5s'] = active_requests
-        status['capacity_5s'] = 600 - active_requests
+        status['active_requests_5s'] = round(self.rate_limiter.global_used())
+        status['capacity_5s'] = self.rate_limiter.global_capacity()
         
         return status
     
@@ -3422,7 +3382,12 @@ async def _fetch_with_rate_limit(self, endpoint: str, fetch_func: Callable, *arg
         return await fetch_func(*args, **kwargs)
 
     async def _fetch_all_timeframes(self, symbol: str) -> Dict[str, pd.DataFrame]:
-        """Fetch OHLCV data for all required timeframes."""
+        """Fetch OHLCV data for all required timeframes.
+
+        The timeframes are fetched concurrently, each one going through the
+        kline rate limit. Timeframes with a cached series only download the
+        candles from their last bar onward (see ``_fetch_timeframe``).
+        """
         try:
             # Define timeframe mapping - use Bybit's format but store with standard names
             timeframes = {
@@ -3432,290 +3397,27 @@ async def _fetch_all_timeframes(self, symbol: str) -> Dict[str, pd.DataFrame]:
                 '240': 'htf'    # 4 hours (240 minutes)
             }
             
-            ohlcv_data = {}
-            
-            # Fetch each timeframe with rate limiting
-            for bybit_interval, tf_name in timeframes.items():
-                # Increase retries for LTF which seems to be more prone to failures
-                max_retries = 5 if tf_name == 'ltf' else 3
-                retry_delay = 2.0 if tf_name == 'ltf' else 1.0
-                
-                for attempt in range(max_retries):
-                    try:
-                        # Check rate limit before each OHLCV fetch
-                        await self._check_rate_limit('kline', category='linear')
-                        
-                        self.logger.debug(f"Fetching {bybit_interval} interval ({tf_name}) data for {symbol}")
-                        candles = await self._fetch_ohlcv(symbol, bybit_interval)
-                        
-                        # Special handling for LTF - if empty, try with a different limit
-                        if not candles and tf_name == 'ltf' and attempt < max_retries - 1:
-                            self.logger.warning(f"LTF fetch returned empty, retrying with different parameters")
-                            await asyncio.sleep(retry_delay)
-                            # Try fetching with explicit limit parameter
-                            candles = await self._fetch_ohlcv_with_fallback(symbol, bybit_interval)
-                        
-                        if not candles:
-                            self.logger.error(f"No candles returned for {symbol} @ {bybit_interval}")
-                            if attempt == max_retries - 1:
-                                # Create a DataFrame with minimal synthetic data for LTF to prevent complete failure
-                                if tf_name == 'ltf' and 'base' in ohlcv_data and not ohlcv_data['base'].empty:
-                                    # Use base timeframe data to create synthetic LTF data
-                                    base_df = ohlcv_data['base']
-                                    # Resample base (1m) to ltf (5m) - take every 5th candle
-                                    ltf_df = base_df.iloc[::5].copy() if len(base_df) >= 5 else base_df.copy()
-                                    ohlcv_data[tf_name] = ltf_df
-                                    self.logger.warning(f"Created synthetic LTF data from base timeframe: {len(ltf_df)} candles")
-                                else:
-                                    # Create an empty DataFrame with the correct structure
-                                    ohlcv_data[tf_name] = pd.DataFrame(
-                                        columns=['open', 'high', 'low', 'close', 'volume']
-                                    )
-                                # Ensure proper column data types even for empty DataFrame
-                                ohlcv_data[tf_name] = ohlcv_data[tf_name].astype({
-                                    'open': 'float64',
-                                    'high': 'float64',
-                                    'low': 'float64',
-                                    'close': 'float64',
-                                    'volume': 'float64'
-                                })
-                                # Create a proper datetime index
-                                ohlcv_data[tf_name].index = pd.DatetimeIndex([])
-                                ohlcv_data[tf_name].index.name = 'timestamp'
-                                self.logger.warning(f"Created empty DataFrame for {tf_name} timeframe after all retries failed")
-                                break
-                            await asyncio.sleep(retry_delay * (attempt + 1))
-                            continue
-                        
-                        # Process the candles
-                        processed_candles = []
-                        valid_candle_count = 0
-                        invalid_candle_count = 0
-                        
-                        for candle in candles:
-                            try:
-                                # Verify candle has at least 6 elements
-                                if len(candle) < 6:
-                                    self.logger.warning(f"Skipping candle with insufficient elements: {candle}")
-                                    invalid_candle_count += 1
-                                    continue
-                                
-                                # Apply explicit typecasting with validation
-                                timestamp = int(candle[0])
-                                open_price = float(candle[1])
-                                high_price = float(candle[2])
-                                low_price = float(candle[3])
-                                close_price = float(candle[4])
-                                volume = float(candle[5])
-                                
-                                # Basic sanity checks
-                                if timestamp <= 0 or pd.isna(timestamp):
-                                    self.logger.warning(f"Skipping candle with invalid timestamp: {candle}")
-                                    invalid_candle_count += 1
-                                    continue
-                                    
-                                if (pd.isna(open_price) or pd.isna(high_price) or 
-                                    pd.isna(low_price) or pd.isna(close_price) or pd.isna(volume)):
-                                    self.logger.warning(f"Skipping candle with NaN values: {candle}")
-                                    invalid_candle_count += 1
-                                    continue
-                                
-                                # Add valid candle
-                                processed_candles.append([
-                                    timestamp,
-                                    open_price,
-                                    high_price,
-                                    low_price,
-                                    close_price,
-                                    volume
-                                ])
-                                valid_candle_count += 1
-                                
-                            except (IndexError, ValueError, TypeError) as e:
-                                self.logger.warning(f"Error processing candle: {str(e)}, candle: {candle}")
-                                invalid_candle_count += 1
-                                continue
-                        
-                        # Log candle processing results
-                        self.logger.debug(f"Processed {valid_candle_count} valid candles, {invalid_candle_count} invalid for {tf_name}")
-                        
-                        if not processed_candles:
-                            self.logger.error(f"No valid candles after processing for {symbol} @ {bybit_interval}")
-                            if attempt == max_retries - 1:
-                                # Create an empty DataFrame with the correct structure
-                                ohlcv_data[tf_name] = pd.DataFrame(
-                                    columns=['open', 'high', 'low', 'close', 'volume']
-                                )
-                                # Ensure proper column data types even for empty DataFrame
-                                ohlcv_data[tf_name] = ohlcv_data[tf_name].astype({
-                                    'open': 'float64',
-                                    'high': 'float64',
-                                    'low': 'float64',
-                                    'close': 'float64',
-                                    'volume': 'float64'
-                                })
-                                # Create a proper datetime index
-                                ohlcv_data[tf_name].index = pd.DatetimeIndex([])
-                                ohlcv_data[tf_name].index.name = 'timestamp'
-                                self.logger.warning(f"Created empty DataFrame for {tf_name} timeframe after processing")
-                                break
-                            await asyncio.sleep(retry_delay * (attempt + 1))
-                            continue
-                            
-                        try:
-                            # Create DataFrame from processed candles with explicit column names
-                            df = pd.DataFrame(
-                                processed_candles,
-                                columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
-                            )
-                            
-                            # Convert timestamp to datetime - handle potential errors
-                            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-                            
-                            # Validate timestamp conversion
-                            if df['timestamp'].isna().any():
-                                self.logger.error(f"Timestamp conversion resulted in NaT values for {tf_name}")
-                                df = df[~df['timestamp'].isna()]  # Remove rows with NaT timestamps
-                                if df.empty:
-                                    raise ValueError("All timestamps were invalid after conversion")
-                                    
-                            # Set timestamp as index and sort
-                            df.set_index('timestamp', inplace=True)
-                            df = df.sort_index()
-                            
-                            # Explicit validation
-                            if df.empty:
-                                self.logger.error(f"Empty DataFrame after processing for {tf_name}")
-                                raise ValueError("Empty DataFrame")
-                                
-                            if df.isnull().values.any():
-                                # Identify which columns have null values
-                                null_counts = df.isnull().sum()
-                                self.logger.warning(f"DataFrame contains null values for {tf_name}: {null_counts}")
-                                
-                                # Fill null values or drop rows with nulls based on severity
-                                if null_counts.max() > len(df) * 0.5:  # If more than 50% of a column is null
-                                    self.logger.error(f"Too many null values in {tf_name} DataFrame")
-                                    raise ValueError("DataFrame contains too many null values")
-                                else:
-                                    # Try to fill nulls with appropriate values or drop those rows
-                                    self.logger.warning(f"Filling or dropping null values in {tf_name} DataFrame")
-                                    # Forward fill, then backward fill to handle gaps
-                                    df = df.fillna(method='ffill').fillna(method='bfill')
-                                    
-                                    if df.isnull().values.any():
-                                        # If still have nulls, drop those rows
-                                        df = df.dropna()
-                                        if df.empty:
-                                            raise ValueError("DataFrame empty after dropping null values")
-                                            
-                            # Ensure proper data types
-                            df = df.astype({
-                                'open': 'float64',
-                                'high': 'float64',
-                                'low': 'float64',
-                                'close': 'float64',
-                                'volume': 'float64'
-                            })
-                            
-                            ohlcv_data[tf_name] = df
-                            self.logger.debug(f"Successfully processed {len(df)} candles for {tf_name}")
-                            break
-                            
-                        except Exception as e:
-                            self.logger.error(f"Error creating DataFrame for {symbol} @ {bybit_interval}: {str(e)}")
-                            self.logger.debug(f"First few processed candles: {processed_candles[:2] if processed_candles else []}")
-                            if attempt == max_retries - 1:
-                                # Create a fallback empty DataFrame
-                                ohlcv_data[tf_name] = pd.DataFrame(
-                                    columns=['open', 'high', 'low', 'close', 'volume']
-                                )
-                                # Ensure proper column data types even for empty DataFrame
-                                ohlcv_data[tf_name] = ohlcv_data[tf_name].astype({
-                                    'open': 'float64',
-                                    'high': 'float64',
-                                    'low': 'float64',
-                                    'close': 'float64',
-                                    'volume': 'float64'
-                                })
-                                # Create a proper datetime index
-                                ohlcv_data[tf_name].index = pd.DatetimeIndex([])
-                                ohlcv_data[tf_name].index.name = 'timestamp'
-                                self.logger.warning(f"Created empty fallback DataFrame for {tf_name} after processing errors")
-                            else:
-                                await asyncio.sleep(retry_delay * (attempt + 1))
-                            continue
-                            
-                    except RateLimitError as e:
-                        retry_after = getattr(e, 'retry_after', retry_delay * (attempt + 1))
-                        if attempt == max_retries - 1:
-                            # Create a fallback empty DataFrame
-                            ohlcv_data[tf_name] = pd.DataFrame(
-                                columns=['open', 'high', 'low', 'close', 'volume']
-                            )
-                            # Ensure proper column data types even for empty DataFrame
-                            ohlcv_data[tf_name] = ohlcv_data[tf_name].astype({
-                                'open': 'float64',
-                                'high': 'float64',
-                                'low': 'float64',
-                                'close': 'float64',
-                                'volume': 'float64'
-                            })
-                            # Create a proper datetime index
-                            ohlcv_data[tf_name].index = pd.DatetimeIndex([])
-                            ohlcv_data[tf_name].index.name = 'timestamp'
-                            self.logger.warning(f"Created empty fallback DataFrame for {tf_name} after rate limit errors")
-                        else:
-                            self.logger.warning(f"Rate limit hit for {bybit_interval}, waiting {retry_after}s")
-                            await asyncio.sleep(retry_after)
-                        continue
-                        
-                    except Exception as e:
-                        self.logger.error(f"Error fetching {bybit_interval} interval: {str(e)}")
-                        self.logger.debug(traceback.format_exc())
-                        if attempt == max_retries - 1:
-                            # Create a fallback empty DataFrame
-                            ohlcv_data[tf_name] = pd.DataFrame(
-                                columns=['open', 'high', 'low', 'close', 'volume']
-                            )
-                            # Ensure proper column data types even for empty DataFrame
-                            ohlcv_data[tf_name] = ohlcv_data[tf_name].astype({
-                                'open': 'float64',
-                                'high': 'float64',
-                                'low': 'float64',
-                                'close': 'float64',
-                                'volume': 'float64'
-                            })
-                            # Create a proper datetime index
-                            ohlcv_data[tf_name].index = pd.DatetimeIndex([])
-                            ohlcv_data[tf_name].index.name = 'timestamp'
-                            self.logger.warning(f"Created empty fallback DataFrame for {tf_name} after general errors")
-                        else:
-                            await asyncio.sleep(retry_delay * (attempt + 1))
-                        continue
+            results = await asyncio.gather(
+                *[self._fetch_timeframe(symbol, bybit_interval, tf_name)
+                  for bybit_interval, tf_name in timeframes.items()],
+                return_exceptions=True
+            )
             
-            # Verify all timeframes were fetched
-            expected_timeframes = set(timeframes.values())
-            missing_timeframes = expected_timeframes - set(ohlcv_data.keys())
-            if missing_timeframes:
-                self.logger.error(f"Missing timeframes after fetch: {missing_timeframes}")
-                # Create empty DataFrames for missing timeframes
-                for tf in missing_timeframes:
-                    ohlcv_data[tf] = pd.DataFrame(
-                        columns=['open', 'high', 'low', 'close', 'volume']
-                    )
-                    # Ensure proper column data types even for empty DataFrame
-                    ohlcv_data[tf] = ohlcv_data[tf].astype({
-                        'open': 'float64',
-                        'high': 'float64',
-                        'low': 'float64',
-                        'close': 'float64',
-                        'volume': 'float64'
-                    })
-                    # Create a proper datetime index
-                    ohlcv_data[tf].index = pd.DatetimeIndex([])
-                    ohlcv_data[tf].index.name = 'timestamp'
-                    self.logger.warning(f"Created empty DataFrame for missing {tf} timeframe")
+            ohlcv_data = {}
+            for (bybit_interval, tf_name), result in zip(timeframes.items(), results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error fetching {bybit_interval} interval: {str(result)}")
+                    result = self._empty_ohlcv_frame()
+                    self.logger.warning(f"Created empty fallback DataFrame for {tf_name} after general errors")
+                ohlcv_data[tf_name] = result
+            
+            # Use base timeframe data to create synthetic LTF data if LTF could not be fetched
+            if ohlcv_data['ltf'].empty and not ohlcv_data['base'].empty:
+                base_df = ohlcv_data['base']
+                # Resample base (1m) to ltf (5m) - take every 5th candle
+                ltf_df = base_df.iloc[::5].copy() if len(base_df) >= 5 else base_df.copy()
+                ohlcv_data['ltf'] = ltf_df
+                self.logger.warning(f"Created synthetic LTF data from base timeframe: {len(ltf_df)} candles")
             
             # Final validation of all dataframes
             for tf, df in ohlcv_data.items():
@@ -3732,26 +3434,242 @@ async def _fetch_all_timeframes(self, symbol: str) -> Dict[str, pd.DataFrame]:
             self.logger.debug(f"Traceback: {traceback.format_exc()}")
             # Return empty DataFrames for all timeframes as a fallback
             self.logger.warning("Returning empty DataFrames for all timeframes due to critical error")
-            ohlcv_data = {}
-            for tf_name in ['base', 'ltf', 'mtf', 'htf']:
-                ohlcv_data[tf_name] = pd.DataFrame(
-                    columns=['open', 'high', 'low', 'close', 'volume']
-                )
-                # Ensure proper column data types even for empty DataFrame
-                ohlcv_data[tf_name] = ohlcv_data[tf_name].astype({
-                    'open': 'float64',
-                    'high': 'float64',
-                    'low': 'float64',
-                    'close': 'float64',
-                    'volume': 'float64'
-                })
-                # Create a proper datetime index
-                ohlcv_data[tf_name].index = pd.DatetimeIndex([])
-                ohlcv_data[tf_name].index.name = 'timestamp'
-            return ohlcv_data
+            return {tf_name: self._empty_ohlcv_frame() for tf_name in ['base', 'ltf', 'mtf', 'htf']}
+
+    async def _fetch_timeframe(self, symbol: str, bybit_interval: str, tf_name: str) -> pd.DataFrame:
+        """Fetch one timeframe with retries, using a delta fetch when a cached series exists.
+
+        A delta fetch requests candles from the cached high-water mark (the
+        last, possibly still forming, bar) onward and merges them into the
+        cached series. If the response does not line up with the high-water
+        mark or has missing bars, the series is backfilled with a full fetch.
+        """
+        # Increase retries for LTF which seems to be more prone to failures
+        max_retries = 5 if tf_name == 'ltf' else 3
+        retry_delay = 2.0 if tf_name == 'ltf' else 1.0
+        interval_ms = self.KLINE_INTERVAL_MINUTES.get(bybit_interval, 1) * 60 * 1000
+        
+        for attempt in range(max_retries):
+            try:
+                # Check rate limit before each OHLCV fetch
+                await self._check_rate_limit('kline', category='linear')
+                
+                delta_start = self._kline_delta_start(symbol, tf_name, interval_ms)
+                self.logger.debug(f"Fetching {bybit_interval} interval ({tf_name}) data for {symbol}"
+                                  f"{' since ' + str(delta_start) if delta_start is not None else ''}")
+                candles = await self._fetch_ohlcv(symbol, bybit_interval, start_time=delta_start)
+                
+                # Special handling for LTF - if empty, try with a different limit
+                if not candles and tf_name == 'ltf' and delta_start is None and attempt < max_retries - 1:
+                    self.logger.warning(f"LTF fetch returned empty, retrying with different parameters")
+                    await asyncio.sleep(retry_delay)
+                    # Try fetching with explicit limit parameter
+                    candles = await self._fetch_ohlcv_with_fallback(symbol, bybit_interval)
+                
+                df = self._klines_to_frame(candles, symbol, bybit_interval, tf_name) if candles else None
+                
+                if df is not None and delta_start is not None:
+                    self._kline_fetch_stats['delta_fetches'] += 1
+                    merged = self._merge_kline_delta(symbol, tf_name, df, delta_start, interval_ms)
+                    if merged is not None:
+                        return merged
+                    
+                    # Gap between the cached series and the delta: full backfill
+                    self._kline_fetch_stats['gap_backfills'] += 1
+                    self.logger.info(f"Gap in cached {tf_name} candles for {symbol}, running full backfill")
+                    await self._check_rate_limit('kline', category='linear')
+                    candles = await self._fetch_ohlcv(symbol, bybit_interval)
+                    df = self._klines_to_frame(candles, symbol, bybit_interval, tf_name) if candles else None
+                
+                if df is None:
+                    if attempt == max_retries - 1:
+                        self.logger.warning(f"Created empty DataFrame for {tf_name} timeframe after all retries failed")
+                        return self._empty_ohlcv_frame()
+                    await asyncio.sleep(retry_delay * (attempt + 1))
+                    continue
+                
+                if self.ohlcv_delta_fetch:
+                    self._kline_fetch_stats['full_fetches'] += 1
+                    self._kline_store.merge_frame(symbol, tf_name, df)
+                return df
+                
+            except RateLimitError as e:
+                retry_after = getattr(e, 'retry_after', retry_delay * (attempt + 1))
+                if attempt == max_retries - 1:
+                    self.logger.warning(f"Created empty fallback DataFrame for {tf_name} after rate limit errors")
+                    return self._empty_ohlcv_frame()
+                self.logger.warning(f"Rate limit hit for {bybit_interval}, waiting {retry_after}s")
+                await asyncio.sleep(retry_after)
+                
+            except Exception as e:
+                self.logger.error(f"Error fetching {bybit_interval} interval: {str(e)}")
+                self.logger.debug(traceback.format_exc())
+                if attempt == max_retries - 1:
+                    self.logger.warning(f"Created empty fallback DataFrame for {tf_name} after general errors")
+                    return self._empty_ohlcv_frame()
+                await asyncio.sleep(retry_delay * (attempt + 1))
+        
+        return self._empty_ohlcv_frame()
+
+    def _kline_delta_start(self, symbol: str, tf_name: str, interval_ms: int) -> Optional[int]:
+        """Return the open time to delta-fetch from, or None when a full fetch is needed."""
+        if not self.ohlcv_delta_fetch:
+            return None
+        buffer = self._kline_store.get_buffer(symbol, tf_name)
+        if buffer is None or not len(buffer):
+            return None
+        high_water_mark = buffer.last_timestamp
+        bars_behind = (int(time.time() * 1000) - high_water_mark) // interval_ms
+        if bars_behind >= self.ohlcv_delta_max_bars:
+            return None
+        return high_water_mark
+
+    def _merge_kline_delta(self, symbol: str, tf_name: str, df: pd.DataFrame,
+                           delta_start: int, interval_ms: int) -> Optional[pd.DataFrame]:
+        """Merge delta candles into the cached series; None if they leave a gap."""
+        timestamps, values = frame_to_arrays(df)
+        if timestamps[0] != delta_start or np.any(np.diff(timestamps) != interval_ms):
+            return None
+        buffer = self._kline_store.get_buffer(symbol, tf_name)
+        buffer.merge(timestamps, values)
+        return buffer.to_dataframe(copy=True)
+
+    def get_kline_fetch_stats(self) -> Dict[str, Any]:
+        """Full vs delta kline fetch counts and downloaded candle totals."""
+        return {
+            **self._kline_fetch_stats,
+            'delta_enabled': self.ohlcv_delta_fetch,
+            'cached_series': self._kline_store.get_stats()['buffers']
+        }
+
+    def _klines_to_frame(self, candles: List[List[Any]], symbol: str,
+                         bybit_interval: str, tf_name: str) -> Optional[pd.DataFrame]:
+        """Validate raw kline rows and build a sorted OHLCV DataFrame.
+
+        Returns:
+            DataFrame indexed by timestamp, or None if no candle was valid
 
-    async def _fetch_ohlcv(self, symbol: str, interval: str) -> List[List[Any]]:
-        """Fetch OHLCV data for a specific interval."""
+        Raises:
+            ValueError: the DataFrame could not be built from the candles
+        """
+        # Process the candles
+        processed_candles = []
+        valid_candle_count = 0
+        invalid_candle_count = 0
+        
+        for candle in candles:
+            try:
+                # Verify candle has at least 6 elements
+                if len(candle) < 6:
+                    self.logger.warning(f"Skipping candle with insufficient elements: {candle}")
+                    invalid_candle_count += 1
+                    continue
+                
+                # Apply explicit typecasting with validation
+                timestamp = int(candle[0])
+                open_price = float(candle[1])
+                high_price = float(candle[2])
+                low_price = float(candle[3])
+                close_price = float(candle[4])
+                volume = float(candle[5])
+                
+                # Basic sanity checks
+                if timestamp <= 0 or pd.isna(timestamp):
+                    self.logger.warning(f"Skipping candle with invalid timestamp: {candle}")
+                    invalid_candle_count += 1
+                    continue
+                    
+                if (pd.isna(open_price) or pd.isna(high_price) or 
+                    pd.isna(low_price) or pd.isna(close_price) or pd.isna(volume)):
+                    self.logger.warning(f"Skipping candle with NaN values: {candle}")
+                    invalid_candle_count += 1
+                    continue
+                
+                # Add valid candle
+                processed_candles.append([
+                    timestamp,
+                    open_price,
+                    high_price,
+                    low_price,
+                    close_price,
+                    volume
+                ])
+                valid_candle_count += 1
+                
+            except (IndexError, ValueError, TypeError) as e:
+                self.logger.warning(f"Error processing candle: {str(e)}, candle: {candle}")
+                invalid_candle_count += 1
+                continue
+        
+        # Log candle processing results
+        self.logger.debug(f"Processed {valid_candle_count} valid candles, {invalid_candle_count} invalid for {tf_name}")
+        self._kline_fetch_stats['candles_downloaded'] += valid_candle_count
+        
+        if not processed_candles:
+            self.logger.error(f"No valid candles after processing for {symbol} @ {bybit_interval}")
+            return None
+        
+        # Create DataFrame from processed candles with explicit column names
+        df = pd.DataFrame(
+            processed_candles,
+            columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
+        )
+        
+        # Convert timestamp to datetime - handle potential errors
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        
+        # Validate timestamp conversion
+        if df['timestamp'].isna().any():
+            self.logger.error(f"Timestamp conversion resulted in NaT values for {tf_name}")
+            df = df[~df['timestamp'].isna()]  # Remove rows with NaT timestamps
+            if df.empty:
+                raise ValueError("All timestamps were invalid after conversion")
+                
+        # Set timestamp as index and sort
+        df.set_index('timestamp', inplace=True)
+        df = df.sort_index()
+        
+        if df.isnull().values.any():
+            # Identify which columns have null values
+            null_counts = df.isnull().sum()
+            self.logger.warning(f"DataFrame contains null values for {tf_name}: {null_counts}")
+            
+            # Fill null values or drop rows with nulls based on severity
+            if null_counts.max() > len(df) * 0.5:  # If more than 50% of a column is null
+                self.logger.error(f"Too many null values in {tf_name} DataFrame")
+                raise ValueError("DataFrame contains too many null values")
+            
+            # Forward fill, then backward fill to handle gaps
+            self.logger.warning(f"Filling or dropping null values in {tf_name} DataFrame")
+            df = df.ffill().bfill().dropna()
+            if df.empty:
+                raise ValueError("DataFrame empty after dropping null values")
+        
+        # Ensure proper data types
+        return df.astype({
+            'open': 'float64',
+            'high': 'float64',
+            'low': 'float64',
+            'close': 'float64',
+            'volume': 'float64'
+        })
+
+    @staticmethod
+    def _empty_ohlcv_frame() -> pd.DataFrame:
+        """Empty OHLCV DataFrame with float columns and a timestamp DatetimeIndex."""
+        df = pd.DataFrame(columns=['open', 'high', 'low', 'close', 'volume']).astype('float64')
+        df.index = pd.DatetimeIndex([], name='timestamp')
+        return df
+
+    async def _fetch_ohlcv(self, symbol: str, interval: str, start_time: Optional[int] = None) -> List[List[Any]]:
+        """Fetch OHLCV data for a specific interval.
+
+        Args:
+            symbol: Trading pair symbol
+            interval: Bybit or standard interval
+            start_time: Only fetch candles opening at or after this time (ms);
+                defaults to the full 200-candle window
+        """
         try:
             self.logger.debug(f"Making OHLCV request for {symbol} @ {interval}")
             
@@ -3783,30 +3701,14 @@ async def _fetch_ohlcv(self, symbol: str, interval: str) -> List[List[Any]]:
             # Default limit is 200, so calculate start time accordingly
             limit = 200
             
-            # Map interval to minutes for time calculations
-            minutes_map = {
-                '1': 1,
-                '3': 3,
-                '5': 5,
-                '15': 15,
-                '30': 30,
-                '60': 60,
-                '120': 120,
-                '240': 240,
-                '360': 360,
-                '720': 720,
-                'D': 1440,
-                'W': 10080,
-                'M': 43200
-            }
-            
-            # Get minutes value for the interval (default to 1 if not found)
-            timeframe_minutes = minutes_map.get(bybit_interval, 1)
-            
-            # Calculate milliseconds to go back based on timeframe and limit
-            # Add 20% buffer to ensure we get enough data
-            minutes_back = timeframe_minutes * limit * 1.2
-            start_time = end_time - (minutes_back * 60 * 1000)
+            if start_time is None:
+                # Get minutes value for the interval (default to 1 if not found)
+                timeframe_minutes = self.KLINE_INTERVAL_MINUTES.get(bybit_interval, 1)
+                
+                # Calculate milliseconds to go back based on timeframe and limit
+                # Add 20% buffer to ensure we get enough data
+                minutes_back = timeframe_minutes * limit * 1.2
+                start_time = end_time - (minutes_back * 60 * 1000)
             
             response = await self._make_request('GET', '/v5/market/kline', {
                 'category': 'linear',  # Always use linear category for market monitor
@@ -5143,52 +5045,61 @@ async def _fetch_ticker(self, symbol: str) -> dict:
                 self.logger.warning(f"No ticker data in response for {symbol}")
                 return self._default_ticker_data(symbol)
                 
-            # Extract the first ticker
-            ticker = ticker_list[0]
-            
-            # Parse funding rate and next funding time
-            funding_rate = self.safe_float(ticker, 'fundingRate')
-            next_funding_time = int(ticker.get('nextFundingTime', 0))
-            
-            # Common fields for both spot and linear
-            result = {
-                'symbol': symbol,  # Use original symbol for consistency
-                'timestamp': int(time.time() * 1000),
-                'datetime': datetime.now().isoformat(),
-                'high': self.safe_float(ticker, 'highPrice24h'),
-                'low': self.safe_float(ticker, 'lowPrice24h'),
-                'bid': self.safe_float(ticker, 'bid1Price'),
-                'bidVolume': self.safe_float(ticker, 'bid1Size'),
-                'ask': self.safe_float(ticker, 'ask1Price'),
-                'askVolume': self.safe_float(ticker, 'ask1Size'),
-                'vwap': 0,
-                'open': 0,
-                'close': self.safe_float(ticker, 'lastPrice'),
-                'last': self.safe_float(ticker, 'lastPrice'),
-                'previousClose': 0,
-                'change': 0,
-                'percentage': self.safe_float(ticker, 'price24hPcnt') * 100,  # Convert to percentage
-                'average': 0,
-                'baseVolume': self.safe_float(ticker, 'volume24h'),
-                'quoteVolume': self.safe_float(ticker, 'turnover24h'),
-                'fundingRate': funding_rate,
-                'nextFundingTime': next_funding_time
-            }
-            
-            # Calculate change for consistency
-            prevPrice = self.safe_float(ticker, 'prevPrice24h')
-            last = self.safe_float(ticker, 'lastPrice')
-            
-            if prevPrice and last:
-                result['open'] = prevPrice
-                result['change'] = last - prevPrice
-            
-            return result
+            return self._parse_ticker(symbol, ticker_list[0])
             
         except Exception as e:
             self.logger.error(f"Error fetching ticker for {symbol}: {str(e)}")
             return self._default_ticker_data(symbol)
-            
+
+    def _parse_ticker(self, symbol: str, ticker: Dict[str, Any]) -> dict:
+        """Convert a raw /v5/market/tickers entry to the unified ticker format.
+
+        Args:
+            symbol: Symbol to report in the result
+            ticker: Raw ticker entry from the API
+
+        Returns:
+            Ticker data dictionary
+        """
+        # Parse funding rate and next funding time
+        funding_rate = self.safe_float(ticker, 'fundingRate')
+        next_funding_time = int(ticker.get('nextFundingTime', 0) or 0)
+
+        # Common fields for both spot and linear
+        result = {
+            'symbol': symbol,  # Use original symbol for consistency
+            'timestamp': int(time.time() * 1000),
+            'datetime': datetime.now().isoformat(),
+            'high': self.safe_float(ticker, 'highPrice24h'),
+            'low': self.safe_float(ticker, 'lowPrice24h'),
+            'bid': self.safe_float(ticker, 'bid1Price'),
+            'bidVolume': self.safe_float(ticker, 'bid1Size'),
+            'ask': self.safe_float(ticker, 'ask1Price'),
+            'askVolume': self.safe_float(ticker, 'ask1Size'),
+            'vwap': 0,
+            'open': 0,
+            'close': self.safe_float(ticker, 'lastPrice'),
+            'last': self.safe_float(ticker, 'lastPrice'),
+            'previousClose': 0,
+            'change': 0,
+            'percentage': self.safe_float(ticker, 'price24hPcnt') * 100,  # Convert to percentage
+            'average': 0,
+            'baseVolume': self.safe_float(ticker, 'volume24h'),
+            'quoteVolume': self.safe_float(ticker, 'turnover24h'),
+            'fundingRate': funding_rate,
+            'nextFundingTime': next_funding_time
+        }
+        
+        # Calculate change for consistency
+        prevPrice = self.safe_float(ticker, 'prevPrice24h')
+        last = self.safe_float(ticker, 'lastPrice')
+        
+        if prevPrice and last:
+            result['open'] = prevPrice
+            result['change'] = last - prevPrice
+        
+        return result
+
     def _default_ticker_data(self, symbol: str) -> dict:
         """
         Create default ticker data with empty values.
@@ -5242,10 +5153,8 @@ async def fetch_tickers(self, category: str = 'linear') -> List[Dict[str, Any]]:
         try:
             self.logger.info(f"🔍 DEBUG: BybitExchange.fetch_tickers() called with category='{category}'")
 
-            # Use the same _make_request method as fetch_ticker, but without symbol parameter
-            response = await self._make_request('GET', '/v5/market/tickers', {
-                'category': category
-            })
+            # Bulk response is shared with fetch_tickers_by_symbol and concurrent callers
+            response = await self._fetch_bulk_tickers(category)
 
             self.logger.info(f"🔍 DEBUG: fetch_tickers API response - retCode: {response.get('retCode') if response else 'None'}")
 
@@ -5334,6 +5243,60 @@ async def fetch_tickers(self, category: str = 'linear') -> List[Dict[str, Any]]:
             self.logger.debug(f"❌ DEBUG: fetch_tickers - Traceback: {traceback.format_exc()}")
             return []
 
+    async def _fetch_bulk_tickers(self, category: str = 'linear') -> Dict[str, Any]:
+        """Fetch the raw /v5/market/tickers response for a whole category.
+
+        Concurrent callers share one in-flight request, and the response is
+        reused for ``bulk_tickers_ttl`` seconds, so the monitor, top symbols
+        and dashboard aggregator refreshes cost one REST call between them.
+        """
+        cached = self._bulk_tickers_cache.get(category)
+        if cached and time.time() - cached[0] < self._bulk_tickers_ttl:
+            return cached[1]
+
+        task = self._bulk_tickers_inflight.get(category)
+        if task is None:
+            async def fetch():
+                try:
+                    response = await self._make_request('GET', '/v5/market/tickers', {'category': category})
+                    if response and response.get('retCode') == 0:
+                        self._bulk_tickers_cache[category] = (time.time(), response)
+                    return response
+                finally:
+                    self._bulk_tickers_inflight.pop(category, None)
+
+            task = asyncio.ensure_future(fetch())
+            self._bulk_tickers_inflight[category] = task
+        return await asyncio.shield(task)
+
+    async def fetch_tickers_by_symbol(self, symbols: Optional[List[str]] = None,
+                                      category: str = 'linear') -> Dict[str, Dict[str, Any]]:
+        """Fetch tickers for many symbols with a single bulk request.
+
+        Args:
+            symbols: Symbols to return, or None for every symbol in the category
+            category: Market category
+
+        Returns:
+            Dict mapping each requested symbol to ticker data in the same
+            format as ``fetch_ticker``; symbols missing from the response
+            are left out
+        """
+        response = await self._fetch_bulk_tickers(category)
+        if not response or response.get('retCode') != 0:
+            return {}
+
+        entries = {t.get('symbol'): t for t in response.get('result', {}).get('list', [])}
+        if symbols is None:
+            return {symbol: self._parse_ticker(symbol, entry) for symbol, entry in entries.items()}
+
+        tickers = {}
+        for symbol in symbols:
+            entry = entries.get(self._get_symbol_string(symbol).replace('/', ''))
+            if entry:
+                tickers[symbol] = self._parse_ticker(symbol, entry)
+        return tickers
+
     async def fetch_open_interest_history(self, symbol: str, interval: str = '5min', limit: int = 200) -> Dict[str, Any]:
         """Fetch historical open interest data for a symbol.
         
@@ -1,20 +1,221 @@
+"""
+Unified rate limiter for Bybit REST requests.
+
+Every REST path (``BybitExchange._make_request``, ``_check_rate_limit`` and
+``MarketDataManager``) draws from one ``BybitRateLimiter`` per process:
+
+- O(1) token buckets per scope: the global IP budget (600 requests / 5s),
+  optional per-category budgets and per-endpoint budgets.
+- Buckets adapt to the ``X-Bapi-Limit`` / ``X-Bapi-Limit-Status`` /
+  ``X-Bapi-Limit-Reset-Timestamp`` response headers.
+- Callers that have to wait are queued fairly: strictly by priority
+  (trading > market data > reports), FIFO within a priority.
+- Wait times are recorded in per-priority histograms.
+- The global budget can be shared between processes (web server, monitor)
+  through a Redis token bucket, so they stop competing blindly for the same
+  IP budget. If Redis is unreachable the local bucket is used.
+"""
+
 import asyncio
+import contextvars
+import heapq
+import itertools
 import logging
+import os
 import time
-from typing import Dict, List, Optional
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
 
 logger = logging.getLogger(__name__)
 
+
+class RequestPriority(IntEnum):
+    """Queueing priority for rate-limited requests (lower is served first)."""
+    TRADING = 0
+    MARKET_DATA = 1
+    REPORTS = 2
+
+
+# Priority for requests issued inside a ``rate_limit_priority`` block
+_priority_override: contextvars.ContextVar = contextvars.ContextVar('bybit_rate_limit_priority', default=None)
+# Slot reserved by ``reserve`` for the next request made in the same task
+_reservation: contextvars.ContextVar = contextvars.ContextVar('bybit_rate_limit_reservation', default=None)
+
+TRADING_PATHS = ('v5/order/', 'v5/position/', 'v5/execution/')
+
+# A reservation not used by a request within this many seconds is dropped
+RESERVATION_TTL = 1.0
+
+
+@contextmanager
+def rate_limit_priority(priority: RequestPriority) -> Iterator[None]:
+    """Run the enclosed requests with the given queueing priority.
+
+    Example:
+        with rate_limit_priority(RequestPriority.REPORTS):
+            await exchange.fetch_ohlcv(...)
+    """
+    token = _priority_override.set(priority)
+    try:
+        yield
+    finally:
+        _priority_override.reset(token)
+
+
+class TokenBucket:
+    """Token bucket with O(1) refill, wait-time and consume operations."""
+
+    __slots__ = ('capacity', 'refill_rate', 'tokens', 'updated', 'blocked_until')
+
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Args:
+            capacity: Maximum burst size
+            refill_rate: Tokens added per second
+        """
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_rate)
+            self.updated = now
+
+    def wait_time(self, now: float, tokens: float = 1.0) -> float:
+        """Seconds until ``tokens`` can be consumed (0 if available now)."""
+        self._refill(now)
+        wait = max(0.0, self.blocked_until - now)
+        if self.tokens < tokens:
+            wait = max(wait, (tokens - self.tokens) / self.refill_rate)
+        return wait
+
+    def consume(self, now: float, tokens: float = 1.0) -> None:
+        self._refill(now)
+        self.tokens -= tokens
+
+    def observe(self, limit: Optional[int], remaining: Optional[int], reset_in: Optional[float], now: float) -> None:
+        """Align the bucket with the server's view of the budget.
+
+        Args:
+            limit: Server-side limit for the window (X-Bapi-Limit)
+            remaining: Requests left in the window (X-Bapi-Limit-Status)
+            reset_in: Seconds until the window resets
+            now: Current monotonic time
+        """
+        self._refill(now)
+        if limit and limit > 0 and limit != self.capacity:
+            # Bybit reports per-second limits
+            self.capacity = float(limit)
+            self.refill_rate = float(limit)
+        if remaining is not None:
+            self.tokens = min(self.tokens, float(remaining))
+            if remaining <= 0 and reset_in and reset_in > 0:
+                self.blocked_until = max(self.blocked_until, now + reset_in)
+
+
+class WaitHistogram:
+    """Fixed-bucket histogram of rate limit wait times."""
+
+    BOUNDS_MS = (0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS_MS) + 1)
+        self.total = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    def observe(self, wait_seconds: float) -> None:
+        wait_ms = wait_seconds * 1000
+        for i, bound in enumerate(self.BOUNDS_MS):
+            if wait_ms <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += 1
+        self.total_wait_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def as_dict(self) -> Dict[str, Any]:
+        labels = [f"<={bound}ms" for bound in self.BOUNDS_MS] + [f">{self.BOUNDS_MS[-1]}ms"]
+        return {
+            'buckets': dict(zip(labels, self.counts)),
+            'count': self.total,
+            'avg_wait_ms': round(self.total_wait_ms / self.total, 3) if self.total else 0.0,
+            'max_wait_ms': round(self.max_wait_ms, 3)
+        }
+
+
+class RedisSharedBucket:
+    """Token bucket kept in Redis so several processes share one budget.
+
+    The refill-and-take step runs as a Lua script, so it is atomic across
+    processes and uses the Redis server clock.
+    """
+
+    SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(state[1]) or capacity
+local updated = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 60)
+return tostring(wait)
+"""
+
+    def __init__(self, key: str, capacity: float, refill_rate: float,
+                 host: str = 'localhost', port: int = 6379, password: Optional[str] = None):
+        self.key = key
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._client = aioredis.Redis(host=host, port=port, password=password or None)
+        self._script = self._client.register_script(self.SCRIPT)
+
+    async def take(self) -> float:
+        """Take one token; returns seconds to wait before retrying (0 if taken)."""
+        return float(await self._script(keys=[self.key], args=[self.capacity, self.refill_rate]))
+
+    async def close(self) -> None:
+        await self._client.close()
+
+
 class BybitRateLimiter:
     """Rate limiter for Bybit API to prevent exceeding API limits"""
-    
-    def __init__(self):
-        # IP-based rate limit: 600 requests per 5-second window
-        self.ip_limit = 600
-        self.ip_window = 5  # seconds
-        self.ip_request_timestamps = []
-        
-        # Endpoint-specific rate limits (default values)
+
+    # IP-based rate limit: 600 requests per 5-second window
+    IP_LIMIT = 600
+    IP_WINDOW = 5
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            config: Optional ``exchanges.bybit.rate_limiter`` settings:
+                ``endpoints`` / ``categories`` ({name: {'requests', 'per_second'}},
+                where per_second is the window length in seconds) and ``shared``
+                (``enabled``, ``host``, ``port``, ``key``) for the Redis budget
+        """
+        config = config or {}
+
+        # Path-based endpoint limits (requests per second)
         self.endpoint_limits = {
             # Market data endpoints (most are 10 req/s)
             'v5/market/': 10,
@@ -29,89 +230,226 @@ def __init__(self):
             # Default for any other endpoint
             'default': 5
         }
-        self.endpoint_request_timestamps = {}
-        
-        # Track rate limit from response headers
-        self.dynamic_limits = {}
-        self.last_reset_time = {}
-        self.api_calls = {}  # Track number of calls per endpoint
-        
-        self.lock = asyncio.Lock()
-    
+        # Logical endpoint limits used by BybitExchange._check_rate_limit
+        self.named_limits: Dict[str, Dict[str, float]] = dict(config.get('endpoints', {}))
+        self.category_limits: Dict[str, Dict[str, float]] = dict(config.get('categories', {}))
+
+        self.global_bucket = TokenBucket(self.IP_LIMIT, self.IP_LIMIT / self.IP_WINDOW)
+        self._buckets: Dict[str, TokenBucket] = {}
+
+        self.api_calls: Dict[str, int] = {}  # Track number of calls per endpoint
+        self.rate_limit_status: Dict[str, Any] = {}
+
+        # Fair queue of waiting callers: (priority, seq, future, buckets)
+        self._waiters: List[Tuple[int, int, asyncio.Future, Tuple[TokenBucket, ...]]] = []
+        self._seq = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        self._histograms = {priority: WaitHistogram() for priority in RequestPriority}
+        self._stats = {'immediate': 0, 'queued': 0, 'reserved_used': 0, 'shared_errors': 0}
+
+        self._shared: Optional[RedisSharedBucket] = None
+        shared = config.get('shared', {})
+        if shared.get('enabled'):
+            if aioredis is None:
+                logger.warning("Shared rate limit budget requested but redis is not installed - using local budget")
+            else:
+                self._shared = RedisSharedBucket(
+                    key=shared.get('key', 'bybit:rate_limit:global'),
+                    capacity=self.IP_LIMIT,
+                    refill_rate=self.IP_LIMIT / self.IP_WINDOW,
+                    host=shared.get('host', os.getenv('REDIS_HOST', 'localhost')),
+                    port=int(shared.get('port', os.getenv('REDIS_PORT', 6379))),
+                    password=shared.get('password', os.getenv('REDIS_PASSWORD'))
+                )
+
+    # ------------------------------------------------------------------
+    # Scope resolution
+    # ------------------------------------------------------------------
+
+    def _endpoint_bucket(self, endpoint: str) -> TokenBucket:
+        """Bucket for a logical endpoint name ('kline') or an API path."""
+        key = endpoint.lstrip('/')
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            return bucket
+
+        if '/' not in key:
+            # Logical names without a configured limit keep the legacy 100/s allowance
+            limit = self.named_limits.get(key, {'requests': 100, 'per_second': 1})
+            bucket = TokenBucket(limit['requests'], limit['requests'] / limit['per_second'])
+        else:
+            # Most specific matching path prefix wins
+            matches = [path for path in self.endpoint_limits if path != 'default' and path in key]
+            path_key = max(matches, key=len) if matches else 'default'
+            per_second = self.endpoint_limits[path_key]
+            bucket = TokenBucket(per_second, per_second)
+        self._buckets[key] = bucket
+        return bucket
+
+    def _category_bucket(self, category: Optional[str]) -> Optional[TokenBucket]:
+        if not category or category not in self.category_limits:
+            return None
+        key = f"category:{category}"
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            limit = self.category_limits[category]
+            bucket = self._buckets[key] = TokenBucket(limit['requests'], limit['requests'] / limit['per_second'])
+        return bucket
+
+    def configure_limits(self, endpoints: Dict[str, Dict[str, float]],
+                         categories: Optional[Dict[str, Dict[str, float]]] = None) -> None:
+        """Add or replace logical endpoint and category limits."""
+        self.named_limits.update(endpoints)
+        self.category_limits.update(categories or {})
+        for name in endpoints:
+            self._buckets.pop(name, None)
+        for name in categories or {}:
+            self._buckets.pop(f"category:{name}", None)
+
+    @staticmethod
+    def _default_priority(endpoint: str) -> RequestPriority:
+        override = _priority_override.get()
+        if override is not None:
+            return override
+        if any(path in endpoint for path in TRADING_PATHS):
+            return RequestPriority.TRADING
+        return RequestPriority.MARKET_DATA
+
+    # ------------------------------------------------------------------
+    # Acquisition
+    # ------------------------------------------------------------------
+
+    async def acquire(self, endpoint: str, category: Optional[str] = None,
+                      priority: Optional[RequestPriority] = None) -> float:
+        """Wait for a request slot in every scope of ``endpoint``.
+
+        Args:
+            endpoint: Logical endpoint name or API path
+            category: Bybit category ('linear', 'spot', ...)
+            priority: Queueing priority; derived from the path or the
+                enclosing ``rate_limit_priority`` block if omitted
+
+        Returns:
+            Seconds spent waiting
+        """
+        return await self._acquire(endpoint, category, priority, include_global=True)
+
+    async def _acquire(self, endpoint: str, category: Optional[str], priority: Optional[RequestPriority],
+                       include_global: bool) -> float:
+        if priority is None:
+            priority = self._default_priority(endpoint)
+        buckets = [self._endpoint_bucket(endpoint)]
+        if include_global:
+            buckets.append(self.global_bucket)
+        category_bucket = self._category_bucket(category)
+        if category_bucket is not None:
+            buckets.append(category_bucket)
+        buckets = tuple(buckets)
+
+        start = time.monotonic()
+        if not self._waiters and self._ready(buckets, start) == 0:
+            self._consume(buckets, start)
+            self._stats['immediate'] += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (int(priority), next(self._seq), future, buckets))
+            self._stats['queued'] += 1
+            if self._dispatcher is None or self._dispatcher.done():
+                self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch())
+            await future
+
+        if include_global and self._shared is not None:
+            await self._take_shared()
+
+        waited = time.monotonic() - start
+        self._histograms[priority].observe(waited)
+        if waited > 1.0:
+            logger.warning(f"Rate limit wait of {waited:.2f}s for {endpoint}")
+        return waited
+
+    async def reserve(self, endpoint: str, category: Optional[str] = None,
+                      priority: Optional[RequestPriority] = None) -> float:
+        """Acquire a slot now for the next request made by the current task.
+
+        Lets callers throttle under a logical name ('kline') or the request
+        path before issuing the request; ``wait_if_needed`` then does not
+        count the request against the global budget a second time (and
+        skips the endpoint bucket too when the reservation was for its path).
+        """
+        waited = await self.acquire(endpoint, category, priority)
+        _reservation.set((endpoint.lstrip('/'), time.monotonic() + RESERVATION_TTL))
+        return waited
+
     async def wait_if_needed(self, endpoint: str) -> float:
         """Check if we need to wait before making a request to stay within rate limits
-        
+
         Args:
             endpoint: The API endpoint being called
-            
+
         Returns:
             float: The current timestamp after waiting if necessary
         """
-        async with self.lock:
-            current_time = time.time()
-            
-            # Clean up old requests from IP limit tracking
-            self.ip_request_timestamps = [t for t in self.ip_request_timestamps 
-                                         if current_time - t < self.ip_window]
-            
-            # Check if we're approaching IP limit
-            if len(self.ip_request_timestamps) >= self.ip_limit * 0.95:  # 95% of limit
-                # Calculate time to wait
-                oldest_timestamp = min(self.ip_request_timestamps) if self.ip_request_timestamps else current_time
-                time_to_wait = self.ip_window - (current_time - oldest_timestamp)
-                if time_to_wait > 0:
-                    logger.warning(f"Approaching IP rate limit, waiting {time_to_wait:.2f}s")
-                    await asyncio.sleep(time_to_wait)
-                    current_time = time.time()  # Update current time after waiting
-            
-            # Determine endpoint rate limit
-            endpoint_key = 'default'
-            for key in self.endpoint_limits:
-                if key in endpoint:
-                    endpoint_key = key
-                    break
-            
-            # Initialize endpoint tracking if needed
-            if endpoint_key not in self.endpoint_request_timestamps:
-                self.endpoint_request_timestamps[endpoint_key] = []
-            
-            # Clean up old requests from endpoint tracking (1-second window)
-            self.endpoint_request_timestamps[endpoint_key] = [
-                t for t in self.endpoint_request_timestamps[endpoint_key] 
-                if current_time - t < 1
-            ]
-            
-            # Check if we're approaching endpoint limit
-            endpoint_limit = self.endpoint_limits.get(endpoint_key, self.endpoint_limits['default'])
-            
-            # Check if we have dynamic limit information from previous responses
-            if endpoint in self.dynamic_limits:
-                endpoint_limit = self.dynamic_limits[endpoint]
-            
-            if len(self.endpoint_request_timestamps[endpoint_key]) >= endpoint_limit * 0.95:  # 95% of limit
-                time_to_wait = 1.0  # Default to 1 second
-                if endpoint in self.last_reset_time:
-                    time_to_wait = max(0, self.last_reset_time[endpoint] - current_time)
-                
-                if time_to_wait > 0:
-                    logger.warning(f"Approaching endpoint rate limit for {endpoint}, waiting {time_to_wait:.2f}s")
-                    await asyncio.sleep(time_to_wait)
-                    current_time = time.time()  # Update current time after waiting
-            
-            # Record this request
-            self.ip_request_timestamps.append(current_time)
-            self.endpoint_request_timestamps[endpoint_key].append(current_time)
-            
-            # Record API call
-            if endpoint not in self.api_calls:
-                self.api_calls[endpoint] = 0
-            self.api_calls[endpoint] += 1
-            
-            return current_time
-    
+        reservation = _reservation.get()
+        if reservation is not None:
+            _reservation.set(None)
+            if reservation[1] < time.monotonic():
+                reservation = None
+        if reservation is None:
+            await self.acquire(endpoint)
+        else:
+            self._stats['reserved_used'] += 1
+            if reservation[0] != endpoint.lstrip('/'):
+                await self._acquire(endpoint, None, None, include_global=False)
+        self.record_api_call(endpoint)
+        return time.time()
+
+    def _ready(self, buckets: Tuple[TokenBucket, ...], now: float) -> float:
+        return max(bucket.wait_time(now) for bucket in buckets)
+
+    @staticmethod
+    def _consume(buckets: Tuple[TokenBucket, ...], now: float) -> None:
+        for bucket in buckets:
+            bucket.consume(now)
+
+    async def _dispatch(self) -> None:
+        """Grant queued requests in priority order as tokens become available."""
+        while self._waiters:
+            _, _, future, buckets = self._waiters[0]
+            if future.done():
+                # Caller was cancelled while waiting
+                heapq.heappop(self._waiters)
+                continue
+            now = time.monotonic()
+            wait = self._ready(buckets, now)
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+            heapq.heappop(self._waiters)
+            self._consume(buckets, now)
+            future.set_result(None)
+
+    async def _take_shared(self) -> None:
+        """Take a token from the cross-process budget, waiting until one is free."""
+        while True:
+            try:
+                wait = await self._shared.take()
+            except Exception as e:
+                self._stats['shared_errors'] += 1
+                if self._stats['shared_errors'] == 1 or self._stats['shared_errors'] % 100 == 0:
+                    logger.warning(f"Shared rate limit budget unavailable, using local budget: {e}")
+                return
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    # ------------------------------------------------------------------
+    # Feedback and reporting
+    # ------------------------------------------------------------------
+
     def update_from_headers(self, endpoint: str, headers: Dict[str, str]) -> None:
         """Update rate limit information from response headers
-        
+
         Args:
             endpoint: The API endpoint that was called
             headers: Response headers from the API call
@@ -121,37 +459,87 @@ def update_from_headers(self, endpoint: str, headers: Dict[str, str]) -> None:
             # X-Bapi-Limit: 100
             # X-Bapi-Limit-Status: 99
             # X-Bapi-Limit-Reset-Timestamp: 1672738134824
-            
-            if 'X-Bapi-Limit' in headers:
-                limit = int(headers['X-Bapi-Limit'])
-                self.dynamic_limits[endpoint] = limit
-                
+            if 'X-Bapi-Limit-Status' not in headers and 'X-Bapi-Limit' not in headers:
+                return
+
+            limit = int(headers['X-Bapi-Limit']) if 'X-Bapi-Limit' in headers else None
+            remaining = int(headers['X-Bapi-Limit-Status']) if 'X-Bapi-Limit-Status' in headers else None
+            reset_in = None
             if 'X-Bapi-Limit-Reset-Timestamp' in headers:
-                reset_timestamp = int(headers['X-Bapi-Limit-Reset-Timestamp']) / 1000  # Convert to seconds
-                self.last_reset_time[endpoint] = reset_timestamp
-                
-            if 'X-Bapi-Limit-Status' in headers:
-                remaining = int(headers['X-Bapi-Limit-Status'])
-                # If we're below 10% of our limit, log a warning
-                if remaining < (self.dynamic_limits.get(endpoint, 10) * 0.1):
-                    logger.warning(f"Low rate limit remaining for {endpoint}: {remaining}")
+                reset_in = int(headers['X-Bapi-Limit-Reset-Timestamp']) / 1000 - time.time()
+
+            self._endpoint_bucket(endpoint).observe(limit, remaining, reset_in, time.monotonic())
+            self.rate_limit_status[endpoint.lstrip('/')] = {'limit': limit, 'remaining': remaining}
+
+            # If we're below 10% of our limit, log a warning
+            if remaining is not None and remaining < (limit or 10) * 0.1:
+                logger.warning(f"Low rate limit remaining for {endpoint}: {remaining}")
         except Exception as e:
             logger.warning(f"Error parsing rate limit headers: {e}")
-    
+
     def record_api_call(self, endpoint: str) -> None:
         """Record an API call for tracking purposes
-        
+
         Args:
             endpoint: The API endpoint that was called
         """
         if endpoint not in self.api_calls:
             self.api_calls[endpoint] = 0
         self.api_calls[endpoint] += 1
-    
+
     def get_api_call_stats(self) -> Dict[str, int]:
         """Get statistics on API calls made
-        
+
         Returns:
             Dict mapping endpoints to call counts
         """
-        return self.api_calls.copy() 
\ No newline at end of file
+        return self.api_calls.copy()
+
+    def global_capacity(self) -> int:
+        """Requests currently available in the local global bucket."""
+        return self.IP_LIMIT - round(self.global_used())
+
+    def global_used(self) -> float:
+        """Approximate requests counted against the global window."""
+        self.global_bucket.wait_time(time.monotonic())
+        return max(0.0, self.global_bucket.capacity - self.global_bucket.tokens)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue, bucket and wait-time statistics for monitoring."""
+        now = time.monotonic()
+        return {
+            **self._stats,
+            'waiting': len(self._waiters),
+            'shared_budget': self._shared is not None,
+            'global_tokens': round(self.global_bucket.tokens, 2),
+            'buckets': {
+                key: {
+                    'tokens': round(bucket.tokens, 2),
+                    'capacity': bucket.capacity,
+                    'wait_seconds': round(bucket.wait_time(now), 3)
+                }
+                for key, bucket in self._buckets.items()
+            },
+            'wait_histograms': {
+                priority.name.lower(): histogram.as_dict()
+                for priority, histogram in self._histograms.items()
+            },
+            'server_status': dict(self.rate_limit_status)
+        }
+
+
+_shared_limiter: Optional[BybitRateLimiter] = None
+
+
+def get_bybit_rate_limiter(config: Optional[Dict[str, Any]] = None) -> BybitRateLimiter:
+    """Process-wide limiter shared by every Bybit REST path.
+
+    The first caller's config sets up the shared Redis budget; endpoint and
+    category limits passed by later callers are merged into the instance.
+    """
+    global _shared_limiter
+    if _shared_limiter is None:
+        _shared_limiter = BybitRateLimiter(config)
+    elif config:
+        _shared_limiter.configure_limits(config.get('endpoints', {}), config.get('categories', {}))
+    return _shared_limiter
@@ -319,6 +319,35 @@ async def _create_connection(self, topics: List[str], connection_id: str) -> Opt
                     self.logger.error(f"❌ Failed to establish connection {connection_id} after {max_retries} attempts")
 
         return None
+    async def resubscribe(self, topic: str) -> bool:
+        """Unsubscribe and subscribe a topic again on the connection carrying it.
+
+        Bybit answers a fresh orderbook subscription with a full snapshot, so
+        this is how a local book that lost its update-id chain gets back in sync.
+
+        Args:
+            topic: Subscribed topic, e.g. ``orderbook.50.BTCUSDT``
+
+        Returns:
+            True if the subscribe request was sent
+        """
+        for connection_id, conn_info in self.connections.items():
+            if topic not in conn_info.get('topics', []):
+                continue
+            ws = conn_info.get('ws')
+            if ws is None or ws.closed:
+                self.logger.warning(f"Cannot resubscribe {topic}: connection {connection_id} is closed")
+                return False
+            try:
+                await ws.send_json({"op": "unsubscribe", "args": [topic]})
+                await ws.send_json({"op": "subscribe", "args": [topic]})
+                self.logger.info(f"Resubscribed {topic} on {connection_id}")
+                return True
+            except Exception as e:
+                self.logger.error(f"Failed to resubscribe {topic} on {connection_id}: {str(e)}")
+                return False
+        return False
+
     async def _handle_messages(self, ws, topics, connection_id, session):
         """Handle incoming WebSocket messages
         
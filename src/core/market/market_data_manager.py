@@ -8,9 +8,13 @@
 import traceback
 from src.core.error.unified_exceptions import DataUnavailableError
 
-from src.core.exchanges.rate_limiter import BybitRateLimiter
+from src.core.exchanges.rate_limiter import get_bybit_rate_limiter
 from src.core.exchanges.websocket_manager import WebSocketManager
 from src.core.market.smart_intervals import SmartIntervalsManager, MarketActivity
+from src.core.market.ohlcv_store import get_ohlcv_store
+from src.core.market.orderbook_engine import LocalOrderBook
+from src.core.market.trade_tape import TradeTape, encode_side
+from src.core.market.refresh_planner import get_refresh_planner
 from src.core.cache.liquidation_cache import LiquidationCacheManager
 from src.core.models.liquidation import LiquidationEvent
 from src.data_storage.liquidation_storage import LiquidationStorage
@@ -27,7 +31,9 @@ async def fetch_real_open_interest(self, symbol: str) -> Dict:
             # get_primary_exchange is async; ensure we await it to obtain the client
             exchange_client = await self.exchange_manager.get_primary_exchange()
             if hasattr(exchange_client, 'fetch_open_interest'):
-                oi_data = await exchange_client.fetch_open_interest(symbol)
+                oi_data = await self.refresh_planner.load(
+                    'open_interest', symbol, lambda: exchange_client.fetch_open_interest(symbol)
+                )
                 return {
                     'current': oi_data.get('openInterest', 0),
                     'previous': oi_data.get('prevOpenInterest', 0),
@@ -57,8 +63,13 @@ def __init__(self, config: Dict[str, Any], exchange_manager, alert_manager=None)
         self.config = config
         self.exchange_manager = exchange_manager
         self.alert_manager = alert_manager
-        self.rate_limiter = BybitRateLimiter()
+        self.rate_limiter = get_bybit_rate_limiter()
         self.websocket_manager = WebSocketManager(config)
+        # Batches ticker refreshes across symbols and de-duplicates kline/OI
+        # loads with other users of the exchange manager
+        self.refresh_planner = get_refresh_planner(
+            exchange_manager, config.get('market_data', {}).get('refresh_planner')
+        )
         
         # Initialize logger
         self.logger = logger
@@ -72,6 +83,23 @@ def __init__(self, config: Dict[str, Any], exchange_manager, alert_manager=None)
         self._cache_enabled = self.config.get('market_data', {}).get('cache', {}).get('enabled', True)
         self._cache_ttl = self.config.get('market_data', {}).get('cache', {}).get('data_ttl', 30)
 
+        # Columnar candle store shared by the WebSocket and REST kline paths
+        # (and the exchange's delta kline refresh)
+        self.ohlcv_store = get_ohlcv_store(self.config)
+
+        # Incremental L2 books maintained from WebSocket snapshots/deltas
+        self.order_books: Dict[str, LocalOrderBook] = {}
+        # Symbol -> time a WebSocket resnapshot was requested; cleared by the snapshot
+        self._orderbook_resync_pending: Dict[str, float] = {}
+        self._orderbook_resync_timeout = self.config.get('market_data', {}).get('orderbook_resync_timeout', 30)
+
+        # Columnar trade tapes (retention by count and optionally by age)
+        tape_config = self.config.get('market_data', {}).get('trade_tape', {})
+        self._trade_tape_capacity = tape_config.get('capacity', 1000)
+        max_age_seconds = tape_config.get('max_age_seconds')
+        self._trade_tape_max_age_ms = int(max_age_seconds * 1000) if max_age_seconds else None
+        self.trade_tapes: Dict[str, TradeTape] = {}
+
         # Concurrency controls for optimized parallel fetching
         self._symbol_locks: Dict[str, asyncio.Lock] = {}  # Per-symbol locks
         self._timeframe_semaphore = asyncio.Semaphore(8)  # Limit concurrent TF fetches
@@ -275,9 +303,9 @@ async def _monitoring_loop(self):
         
         try:
             while self.running:
-                # Process all symbols
-                for symbol in self.symbols:
-                    await self._refresh_symbol_data(symbol)
+                # Process all symbols together so the refresh planner can
+                # batch their ticker refreshes into one bulk request
+                await asyncio.gather(*[self._refresh_symbol_data(symbol) for symbol in self.symbols])
                     
                 # Start WebSocket if delayed and this is the first cycle
                 if self.delay_websocket and not first_cycle_completed:
@@ -463,10 +491,11 @@ async def _refresh_symbol_components(self, symbol: str, components: List[str]) -
                     # Ensure kline dict exists in cache
                     if 'kline' not in self.data_cache[symbol]:
                         self.data_cache[symbol]['kline'] = {}
-                    # Merge fetched timeframes into existing cache
+                    # Merge fetched timeframes into the candle store
                     for tf, df in kline_data.items():
-                        self.data_cache[symbol]['kline'][tf] = df
+                        self.ohlcv_store.merge_frame(symbol, tf, df)
                         self.last_full_refresh[symbol]['components']['kline'][tf] = current_time
+                    self._get_ohlcv_frames(symbol)
                     self.stats['rest_calls'] += len(kline_tfs_to_fetch)
             except Exception as e:
                 logger.error(f"Error batch-fetching kline timeframes for {symbol}: {str(e)}")
@@ -475,10 +504,9 @@ async def _refresh_symbol_components(self, symbol: str, components: List[str]) -
         for component in other_components:
             try:
                 if component == 'ticker':
-                    # Fetch ticker
-                    ticker_data = await self._fetch_with_rate_limiting(
-                        'v5/market/tickers',
-                        lambda: self.exchange_manager.fetch_ticker(symbol)
+                    # Fetch ticker (batched with other symbols' ticker refreshes)
+                    ticker_data = await self.refresh_planner.fetch_ticker(
+                        symbol, staleness=current_time - self.last_full_refresh[symbol]['components']['ticker']
                     )
                     if ticker_data:
                         self.data_cache[symbol]['ticker'] = ticker_data
@@ -488,7 +516,7 @@ async def _refresh_symbol_components(self, symbol: str, components: List[str]) -
                     # Fetch both standard and RPI orderbook data
                     enhanced_orderbook_data = await self._fetch_enhanced_orderbook_data(symbol)
                     if enhanced_orderbook_data:
-                        self.data_cache[symbol]['orderbook'] = enhanced_orderbook_data['standard_orderbook']
+                        self._seed_order_book(symbol, enhanced_orderbook_data['standard_orderbook'])
                         self.data_cache[symbol]['rpi_orderbook'] = enhanced_orderbook_data.get('rpi_orderbook', {})
                         self.data_cache[symbol]['enhanced_orderbook'] = enhanced_orderbook_data.get('enhanced_orderbook', {})
                         self.data_cache[symbol]['rpi_enabled'] = enhanced_orderbook_data.get('rpi_enabled', False)
@@ -520,6 +548,7 @@ async def _refresh_symbol_components(self, symbol: str, components: List[str]) -
                             trades_data = trades_data or []
                     if trades_data:
                         self.data_cache[symbol]['trades'] = trades_data
+                        self._get_trade_tape(symbol).extend(trades_data)
                         self.last_full_refresh[symbol]['components']['trades'] = current_time
                 
                 elif component == 'long_short_ratio':
@@ -570,9 +599,13 @@ async def _refresh_symbol_components(self, symbol: str, components: List[str]) -
                     # Refresh open interest history for OI-price divergence calculation
                     primary_exchange = await self.exchange_manager.get_primary_exchange()
                     if primary_exchange and hasattr(primary_exchange, 'fetch_open_interest_history'):
-                        oi_data = await self._fetch_with_rate_limiting(
-                            'v5/market/open-interest',
-                            lambda: primary_exchange.fetch_open_interest_history(symbol, interval='5min', limit=200)
+                        oi_data = await self.refresh_planner.load(
+                            'open_interest_history', symbol,
+                            lambda: self._fetch_with_rate_limiting(
+                                'v5/market/open-interest',
+                                lambda: primary_exchange.fetch_open_interest_history(symbol, interval='5min', limit=200)
+                            ),
+                            staleness=current_time - self.last_full_refresh[symbol]['components'].get('open_interest', 0)
                         )
                         if oi_data and isinstance(oi_data, dict) and oi_data.get('history'):
                             history_list = oi_data.get('history', [])
@@ -688,6 +721,10 @@ async def _fetch_symbol_data_atomically(self, symbol: str) -> Dict[str, Any]:
                     if key == 'open_interest':
                         market_data[key] = {}
             
+            # Seed the trade tape so WS trades continue from the REST snapshot
+            if isinstance(market_data.get('trades'), list):
+                self._get_trade_tape(symbol).extend(market_data['trades'])
+
             # Fetch OHLCV data for all timeframes
             try:
                 kline_data = await self._fetch_timeframes(symbol)
@@ -947,19 +984,17 @@ async def _fetch_timeframes(self, symbol: str) -> Dict[str, Any]:
         try:
             all_tfs = ['base', 'ltf', 'mtf', 'htf']
 
-            # Start with existing cached data
-            timeframes = {}
-            if symbol in self.data_cache and 'kline' in self.data_cache[symbol]:
-                timeframes = self.data_cache[symbol]['kline'].copy()
-
             # PHASE 2b: Only fetch stale timeframes (skips base if WS is healthy)
             stale_data = await self._fetch_stale_klines_only(symbol)
 
-            # Merge stale fetches into result
+            # Merge stale fetches into the candle store (shared with the WS path)
             if stale_data:
-                timeframes.update(stale_data)
+                for tf_name, df in stale_data.items():
+                    self.ohlcv_store.merge_frame(symbol, tf_name, df)
                 self.logger.debug(f"Fetched {len(stale_data)} stale timeframes for {symbol}")
 
+            timeframes = self.ohlcv_store.get_frames(symbol)
+
             # Ensure all timeframes have entries (even if empty)
             for tf_name in all_tfs:
                 if tf_name not in timeframes:
@@ -987,8 +1022,9 @@ async def _fetch_with_rate_limiting(self, endpoint: str, fetch_func: Callable) -
         Returns:
             Response from the API call
         """
-        # Wait if needed to respect rate limits
-        await self.rate_limiter.wait_if_needed(endpoint)
+        # Wait for a slot in the limiter shared with the exchange; the
+        # exchange request made by fetch_func uses this reservation
+        await self.rate_limiter.reserve(endpoint)
         
         # Make the API call
         response = await fetch_func()
@@ -999,9 +1035,6 @@ async def _fetch_with_rate_limiting(self, endpoint: str, fetch_func: Callable) -
         elif isinstance(response, dict) and 'headers' in response:
             self.rate_limiter.update_from_headers(endpoint, response['headers'])
         
-        # Record API call for monitoring
-        self.rate_limiter.record_api_call(endpoint)
-        
         return response
     
     async def _handle_websocket_message(self, symbol: str, topic: str, message: Dict[str, Any]) -> None:
@@ -1041,7 +1074,10 @@ async def _handle_websocket_message(self, symbol: str, topic: str, message: Dict
                 elif "kline" in topic:
                     self._update_kline_from_ws(symbol, data)
                 elif "orderbook" in topic:
-                    self._update_orderbook_from_ws(symbol, data)
+                    # Message type (snapshot/delta) and ts live on the outer frame
+                    self._update_orderbook_from_ws(
+                        symbol, data, message.get('type'), message.get('ts')
+                    )
                 elif "publicTrade" in topic:
                     try:
                         self._update_trades_from_ws(symbol, data)
@@ -1276,9 +1312,6 @@ def _update_kline_from_ws(self, symbol: str, data: Dict[str, Any]) -> None:
                     symbol_data['warnings'] += 1
                     symbol_data['last_warning'] = now
             
-            # Process kline data
-            candles = []
-            
             # If it's a single candle
             if isinstance(kline_data, dict):
                 kline_data = [kline_data]
@@ -1302,6 +1335,7 @@ def _update_kline_from_ws(self, symbol: str, data: Dict[str, Any]) -> None:
                 for s in self.candle_processing['symbols'].values():
                     s['count'] = 0
             
+            candle_count = 0
             for candle in kline_data:
                 try:
                     # Process different possible formats
@@ -1332,62 +1366,29 @@ def _update_kline_from_ws(self, symbol: str, data: Dict[str, Any]) -> None:
                         self.logger.warning(f"Unknown candle format from WebSocket: {candle}")
                         continue
                     
-                    # Create candle dict
-                    parsed_candle = {
-                        'timestamp': timestamp,
-                        'open': open_price,
-                        'high': high_price,
-                        'low': low_price,
-                        'close': close_price,
-                        'volume': volume
-                    }
-                    
-                    candles.append(parsed_candle)
+                    # Upsert in place - the live candle is overwritten, a new one appended
+                    self.ohlcv_store.upsert_candle(
+                        symbol, timeframe, timestamp,
+                        open_price, high_price, low_price, close_price, volume
+                    )
+                    candle_count += 1
                 except (ValueError, KeyError, IndexError) as e:
                     self.logger.warning(f"Error parsing candle: {str(e)}")
                     continue
             
-            if not candles:
+            if not candle_count:
                 self.logger.warning(f"No valid candles extracted from WebSocket message for {symbol} {timeframe}")
                 return
                 
-            # Convert to DataFrame
-            df = pd.DataFrame(candles)
-            
-            # Convert timestamp to datetime and set as index
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.set_index('timestamp', inplace=True)
-            
             # Ensure symbol is in data cache
             if symbol not in self.data_cache:
                 self.data_cache[symbol] = {}
             
-            # Ensure ohlcv data exists
-            if 'ohlcv' not in self.data_cache[symbol]:
-                self.data_cache[symbol]['ohlcv'] = {}
-                
-            # Update specific timeframe
-            # If we don't have this timeframe yet, use this data directly
-            if timeframe not in self.data_cache[symbol]['ohlcv']:
-                self.data_cache[symbol]['ohlcv'][timeframe] = df
-                self.logger.info(f"Added new {timeframe} OHLCV data for {symbol} from WebSocket ({len(df)} candles)")
-            else:
-                # Update existing DataFrame with new data, avoiding duplicates
-                existing_df = self.data_cache[symbol]['ohlcv'][timeframe]
-                
-                # Combine and remove duplicates
-                combined_df = pd.concat([existing_df, df])
-                combined_df = combined_df[~combined_df.index.duplicated(keep='last')]
-                combined_df = combined_df.sort_index()
-                
-                # Update cache
-                self.data_cache[symbol]['ohlcv'][timeframe] = combined_df
-                
-                # Throttle logging
-                now = time.time()
-                if now - self.ws_log_throttle['kline']['last_log'] > self.ws_log_throttle['kline']['interval']:
-                    self.logger.debug(f"Updated {timeframe} kline for {symbol} from WebSocket ({len(df)} candles)")
-                    self.ws_log_throttle['kline']['last_log'] = now
+            # Throttle logging
+            now = time.time()
+            if now - self.ws_log_throttle['kline']['last_log'] > self.ws_log_throttle['kline']['interval']:
+                self.logger.debug(f"Updated {timeframe} kline for {symbol} from WebSocket ({candle_count} candles)")
+                self.ws_log_throttle['kline']['last_log'] = now
             
             # Update timestamp
             self.data_cache[symbol]['timestamp'] = int(time.time() * 1000)
@@ -1405,13 +1406,22 @@ def _update_kline_from_ws(self, symbol: str, data: Dict[str, Any]) -> None:
             self.logger.error(f"Error updating kline from WebSocket: {str(e)}")
             self.logger.debug(traceback.format_exc())
     
-    def _update_orderbook_from_ws(self, symbol: str, data: Dict[str, Any]) -> None:
-        """Update orderbook data from WebSocket message."""
+    def _update_orderbook_from_ws(self, symbol: str, data: Dict[str, Any],
+                                  msg_type: Optional[str] = None, msg_ts: Optional[int] = None) -> None:
+        """Update orderbook data from WebSocket message.
+
+        Snapshots replace the symbol's LocalOrderBook and deltas are applied
+        level by level. An update-id gap invalidates the book and requests a
+        WebSocket resnapshot; deltas are ignored until it lands.
+        """
         try:
             # Extract orderbook snapshot or update from message
             orderbook_data = {}
+            is_top_of_book = False
             
             if 'topic' in data and 'data' in data:
+                msg_type = msg_type or data.get('type')
+                msg_ts = msg_ts or data.get('ts')
                 orderbook_data = data['data']
             elif 'data' in data and isinstance(data['data'], dict):
                 orderbook_data = data['data']
@@ -1419,6 +1429,7 @@ def _update_orderbook_from_ws(self, symbol: str, data: Dict[str, Any]) -> None:
                 orderbook_data = data
             elif isinstance(data, dict) and ('bid1Price' in data or 'ask1Price' in data):
                 # Convert ticker-style orderbook to standard format
+                is_top_of_book = True
                 orderbook_data = {
                     'a': [],  # asks
                     'b': []   # bids
@@ -1434,88 +1445,46 @@ def _update_orderbook_from_ws(self, symbol: str, data: Dict[str, Any]) -> None:
             else:
                 self.logger.warning(f"Unknown orderbook data format from WebSocket: {data}")
                 return
-                
-            # Process bids and asks
-            bids = []
-            asks = []
-            
-            # Extract bids
-            if 'b' in orderbook_data:
-                for bid in orderbook_data['b']:
-                    try:
-                        price = float(bid[0])
-                        amount = float(bid[1])
-                        bids.append([price, amount])
-                    except (IndexError, ValueError):
-                        continue
             
-            # Extract asks
-            if 'a' in orderbook_data:
-                for ask in orderbook_data['a']:
-                    try:
-                        price = float(ask[0])
-                        amount = float(ask[1])
-                        asks.append([price, amount])
-                    except (IndexError, ValueError):
-                        continue
-            
-            # Get timestamp from data or current time
-            timestamp = int(orderbook_data.get('ts', time.time() * 1000))
+            msg_type = msg_type or orderbook_data.get('type')
+            timestamp = int(msg_ts or orderbook_data.get('ts') or time.time() * 1000)
+            update_id = orderbook_data.get('u')
+            sequence = orderbook_data.get('seq')
+            
+            book = self.order_books.get(symbol)
+            if book is None:
+                book = LocalOrderBook(symbol)
+                self.order_books[symbol] = book
+            
+            if is_top_of_book:
+                # Ticker-derived best bid/ask only - never overwrite a synced depth book
+                if not book.synced:
+                    book.apply_snapshot(orderbook_data['b'], orderbook_data['a'], timestamp=timestamp)
+                    book.invalidate()
+            elif msg_type == 'delta':
+                if not book.apply_delta(orderbook_data.get('b', []), orderbook_data.get('a', []),
+                                        update_id=update_id, sequence=sequence, timestamp=timestamp):
+                    self._schedule_orderbook_resync(symbol)
+                    return
+            else:
+                book.apply_snapshot(orderbook_data.get('b', []), orderbook_data.get('a', []),
+                                    update_id=update_id, sequence=sequence, timestamp=timestamp)
+                self._orderbook_resync_pending.pop(symbol, None)
             
             # Ensure symbol exists in cache
             if symbol not in self.data_cache:
                 self.data_cache[symbol] = {}
             
-            # Initialize orderbook if it doesn't exist
-            if 'orderbook' not in self.data_cache[symbol]:
-                self.data_cache[symbol]['orderbook'] = {
-                    'bids': [],
-                    'asks': [],
-                    'timestamp': timestamp
-                }
-            
-            # Update the orderbook - handle full snapshot or delta updates
-            if orderbook_data.get('type') == 'delta':
-                # Update existing orderbook with delta
-                self._apply_orderbook_delta(symbol, bids, asks)
-                # Always update the timestamp
-                self.data_cache[symbol]['orderbook']['timestamp'] = timestamp
-            else:
-                # For full snapshot or when only updating best bid/ask
-                current_book = self.data_cache[symbol]['orderbook']
-                
-                # If we received new bids, update them
-                if bids:
-                    current_book['bids'] = bids
-                
-                # If we received new asks, update them
-                if asks:
-                    current_book['asks'] = asks
-                
-                # Always update the timestamp
-                current_book['timestamp'] = timestamp
-            
-            # Sort bids (descending) and asks (ascending) by price
-            if self.data_cache[symbol]['orderbook']['bids']:
-                self.data_cache[symbol]['orderbook']['bids'] = sorted(
-                    self.data_cache[symbol]['orderbook']['bids'], 
-                    key=lambda x: float(x[0]), 
-                    reverse=True
-                )
-            
-            if self.data_cache[symbol]['orderbook']['asks']:
-                self.data_cache[symbol]['orderbook']['asks'] = sorted(
-                    self.data_cache[symbol]['orderbook']['asks'], 
-                    key=lambda x: float(x[0])
-                )
+            # The cached dict (levels and timestamp) is refreshed lazily by
+            # _get_orderbook(); only publish one if none exists yet
+            if not isinstance(self.data_cache[symbol].get('orderbook'), dict):
+                self.data_cache[symbol]['orderbook'] = book.to_dict()
             
             # Throttle logging based on configured intervals
             current_time = time.time()
             if (current_time - self.ws_log_throttle['orderbook']['last_log'] >= 
                 self.ws_log_throttle['orderbook']['interval']):
-                book_bids = self.data_cache[symbol]['orderbook']['bids']
-                book_asks = self.data_cache[symbol]['orderbook']['asks']
-                self.logger.debug(f"Updated orderbook for {symbol} from WebSocket ({len(book_bids)} bids, {len(book_asks)} asks)")
+                self.logger.debug(f"Updated orderbook for {symbol} from WebSocket ({len(book.bids)} bids, {len(book.asks)} asks)")
                 self.ws_log_throttle['orderbook']['last_log'] = current_time
                 
             # Update statistics
@@ -1528,11 +1497,106 @@ def _update_orderbook_from_ws(self, symbol: str, data: Dict[str, Any]) -> None:
         except Exception as e:
             self.logger.error(f"Error updating orderbook from WebSocket: {str(e)}")
             self.logger.debug(traceback.format_exc())
+
+    def _schedule_orderbook_resync(self, symbol: str) -> None:
+        """Request one WebSocket resnapshot for a symbol whose book lost sync.
+
+        A request that got no snapshot within ``orderbook_resync_timeout``
+        seconds is repeated on the next rejected delta.
+        """
+        now = time.time()
+        requested = self._orderbook_resync_pending.get(symbol)
+        if requested is not None and now - requested < self._orderbook_resync_timeout:
+            return
+        self._orderbook_resync_pending[symbol] = now
+        try:
+            create_tracked_task(self._resync_order_book(symbol), name=f"orderbook_resync_{symbol}")
+        except RuntimeError:
+            # No running loop (e.g. called from sync tests) - retry on the next delta
+            self._orderbook_resync_pending.pop(symbol, None)
+
+    async def _resync_order_book(self, symbol: str) -> None:
+        """Resubscribe a symbol's orderbook topic to get a fresh WebSocket snapshot.
+
+        The book stays unsynced, dropping deltas, until that snapshot arrives.
+        A REST snapshot keeps its levels readable in the meantime.
+        """
+        try:
+            if not await self.websocket_manager.resubscribe(f"orderbook.50.{symbol}"):
+                self.logger.warning(f"Could not resubscribe orderbook for {symbol}, will retry")
+            orderbook = await self._fetch_with_rate_limiting(
+                'v5/market/orderbook',
+                lambda: self.exchange_manager.fetch_order_book(symbol)
+            )
+            if orderbook:
+                self._seed_order_book(symbol, orderbook)
+        except Exception as e:
+            self.logger.error(f"Orderbook resync failed for {symbol}: {e}")
+
+    def _seed_order_book(self, symbol: str, orderbook: Dict[str, Any]) -> None:
+        """Load a REST orderbook snapshot into the symbol's LocalOrderBook.
+
+        REST and WebSocket update ids come from different depth streams, so a
+        REST snapshot cannot anchor the delta chain: the book keeps its levels
+        for readers but stays unsynced until a WebSocket snapshot arrives. A
+        synced book at least as recent as the snapshot is left untouched.
+        """
+        if not isinstance(orderbook, dict):
+            return
+        book = self.order_books.get(symbol)
+        if book is None:
+            book = LocalOrderBook(symbol)
+            self.order_books[symbol] = book
+        timestamp = orderbook.get('timestamp')
+        if book.synced and book.timestamp >= int(timestamp or 0):
+            if symbol in self.data_cache:
+                self.data_cache[symbol]['orderbook'] = book.to_dict()
+            return
+        book.apply_snapshot(
+            orderbook.get('bids', []),
+            orderbook.get('asks', []),
+            timestamp=timestamp
+        )
+        book.invalidate()
+        if symbol in self.data_cache:
+            self.data_cache[symbol]['orderbook'] = orderbook
+
+    def _get_orderbook(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Return the symbol's orderbook in the legacy bids/asks dict layout.
+
+        When a LocalOrderBook is tracking the symbol its levels are materialized
+        here (cached per book version) rather than on every WebSocket message.
+        """
+        cache = self.data_cache.get(symbol, {})
+        book = self.order_books.get(symbol)
+        if book is None or not book.version:
+            return cache.get('orderbook')
+
+        snapshot = book.to_dict()
+        cached_book = cache.get('orderbook')
+        if cached_book is not snapshot:
+            snapshot['timestamp'] = max(
+                snapshot['timestamp'],
+                cached_book.get('timestamp', 0) if isinstance(cached_book, dict) else 0
+            )
+            if symbol in self.data_cache:
+                self.data_cache[symbol]['orderbook'] = snapshot
+        return snapshot
+
+    def get_order_book(self, symbol: str) -> Optional[LocalOrderBook]:
+        """Get the incrementally maintained order book for a symbol, if any.
+
+        Allows consumers to run top-N, depth-at-bps and imbalance queries
+        without copying the level lists.
+        """
+        return self.order_books.get(symbol)
             
     def _update_trades_from_ws(self, symbol: str, data: Dict[str, Any]) -> None:
-        """Update trades data from WebSocket message."""
-        # Use the class logger attribute
-        
+        """Update trades data from WebSocket message.
+
+        Trades are appended straight into the symbol's columnar TradeTape; its
+        rolling ID filter drops duplicates in O(1) without rebuilding an ID set.
+        """
         # Ensure symbol exists in cache
         if symbol not in self.data_cache:
             self.data_cache[symbol] = {}
@@ -1553,96 +1617,83 @@ def _update_trades_from_ws(self, symbol: str, data: Dict[str, Any]) -> None:
             self.logger.error(f"Error extracting trades from WebSocket message: {str(e)}")
             return
         
-        # Process each trade
-        processed_trades = []
+        tape = self._get_trade_tape(symbol)
+        added = 0
         for trade in trades:
             try:
-                processed_trade = {
-                    'price': float(trade.get('p', trade.get('price', 0))),
-                    'amount': float(trade.get('v', trade.get('size', 0))),
-                    'cost': None,  # Will calculate below
-                    'side': trade.get('S', trade.get('side', '')).lower(),
-                    'timestamp': int(trade.get('T', trade.get('time', time.time() * 1000))),
-                    'datetime': None,  # Will be filled by analysis components if needed
-                    'id': trade.get('i', trade.get('trade_id', str(time.time()))),
-                    'symbol': symbol,
-                    'taker_or_maker': 'taker'  # Default to taker for public trades
-                }
-                
-                # Calculate cost (price * amount)
-                processed_trade['cost'] = processed_trade['price'] * processed_trade['amount']
-                
-                processed_trades.append(processed_trade)
+                trade_id = trade.get('i', trade.get('trade_id'))
+                added += tape.append(
+                    str(trade_id) if trade_id is not None else None,
+                    float(trade.get('p', trade.get('price', 0))),
+                    float(trade.get('v', trade.get('size', 0))),
+                    encode_side(trade.get('S', trade.get('side', ''))),
+                    int(trade.get('T', trade.get('time', time.time() * 1000)))
+                )
             except Exception as e:
                 self.logger.error(f"Error processing trade from WebSocket: {str(e)}")
-        
-        # Update cache - prepend new trades to existing ones, keeping the limit
-        existing_trades = self.data_cache[symbol].get('trades', [])
-        
-        # Ensure existing_trades is always a list
-        if not isinstance(existing_trades, list):
-            self.logger.warning(f"Existing trades for {symbol} is not a list (type: {type(existing_trades)}), resetting to empty list")
-            existing_trades = []
-            # Make sure the cache is updated with the empty list
-            self.data_cache[symbol]['trades'] = []
-            
-        max_trades = 1000  # Maximum trades to keep
-        
-        # Combine trades, ensuring no duplicates by ID
-        # Only extract IDs from valid dictionary entries in existing_trades
-        trade_ids = set()
-        try:
-            for t in existing_trades:
-                if isinstance(t, dict) and 'id' in t:
-                    trade_ids.add(t.get('id'))
-        except TypeError as e:
-            self.logger.error(f"Error extracting trade IDs: {e}, type of existing_trades: {type(existing_trades)}")
-            # Reset existing_trades to an empty list if it's not iterable
-            existing_trades = []
-            self.data_cache[symbol]['trades'] = []
-                
-        # Filter out trades we already have
-        unique_new_trades = [t for t in processed_trades if t.get('id') not in trade_ids]
-        
-        # Combine and limit - make sure we don't get TypeErrors by using proper conditionals
-        try:
-            # Force both to be valid lists, don't just check
-            unique_new_trades = list(unique_new_trades) if hasattr(unique_new_trades, '__iter__') else []
-            existing_trades = list(existing_trades) if hasattr(existing_trades, '__iter__') else []
-                
-            # Safe concatenation
-            all_trades = unique_new_trades + existing_trades
-            
-            # Limit the size
-            all_trades = all_trades[:max_trades]
-            
-            # Update cache
-            self.data_cache[symbol]['trades'] = all_trades
 
-            # Update last_full_refresh for health check freshness (fixes false stale alerts)
-            current_time = time.time()
-            if symbol in self.last_full_refresh:
-                self.last_full_refresh[symbol]['components']['trades'] = current_time
+        # Update last_full_refresh for health check freshness (fixes false stale alerts)
+        current_time = time.time()
+        if symbol in self.last_full_refresh:
+            self.last_full_refresh[symbol]['components']['trades'] = current_time
+
+        # Throttle logging based on configured intervals
+        if (current_time - self.ws_log_throttle['trades']['last_log'] >= 
+            self.ws_log_throttle['trades']['interval']):
+            if added:
+                self.logger.debug(f"Added {added} new trades for {symbol} from WebSocket")
+            self.ws_log_throttle['trades']['last_log'] = current_time
+
+    def _get_trade_tape(self, symbol: str) -> TradeTape:
+        """Get or create the columnar trade tape for a symbol."""
+        tape = self.trade_tapes.get(symbol)
+        if tape is None:
+            tape = TradeTape(
+                symbol,
+                capacity=self._trade_tape_capacity,
+                max_age_ms=self._trade_tape_max_age_ms
+            )
+            self.trade_tapes[symbol] = tape
+        return tape
 
-            # Throttle logging based on configured intervals
-            if (current_time - self.ws_log_throttle['trades']['last_log'] >= 
-                self.ws_log_throttle['trades']['interval']):
-                if processed_trades:
-                    self.logger.debug(f"Added {len(processed_trades)} new trades for {symbol} from WebSocket")
-                self.ws_log_throttle['trades']['last_log'] = current_time
-        except TypeError as e:
-            self.logger.error(f"TypeError in trade update: {e}")
-            self.logger.debug(f"Types: unique_new_trades={type(unique_new_trades)}, existing_trades={type(existing_trades)}")
-            
-            # Recover by setting trades to just the unique new trades if possible, otherwise keep existing
-            if isinstance(unique_new_trades, list):
-                self.data_cache[symbol]['trades'] = unique_new_trades
-            elif isinstance(existing_trades, list):
-                # No change needed, keep existing trades
-                pass
-            else:
-                # Last resort - just create a new empty list
-                self.data_cache[symbol]['trades'] = []
+    def materialize_cache(self, symbol: str) -> Dict[str, Any]:
+        """Bring the lazily materialized components of a symbol's cache up to date.
+
+        OHLCV frames, the orderbook dict and the trades list are derived from the
+        candle store, LocalOrderBook and trade tape on read. Callers that read
+        ``data_cache`` directly should go through this first.
+
+        Args:
+            symbol: Trading pair symbol
+
+        Returns:
+            The symbol's cache entry (empty dict if unknown)
+        """
+        if symbol not in self.data_cache:
+            return {}
+        if self.ohlcv_store.has_data(symbol):
+            self._get_ohlcv_frames(symbol)
+        self._get_orderbook(symbol)
+        self._get_trades(symbol)
+        return self.data_cache[symbol]
+
+    def get_trade_tape(self, symbol: str) -> Optional[TradeTape]:
+        """Get the columnar trade tape for a symbol, if any trades were seen."""
+        return self.trade_tapes.get(symbol)
+
+    def _get_trades(self, symbol: str) -> List[Dict[str, Any]]:
+        """Return recent trades in the legacy newest-first list-of-dicts layout.
+
+        Materialized from the trade tape (cached until the next append) and
+        published under the 'trades' cache key for existing readers.
+        """
+        tape = self.trade_tapes.get(symbol)
+        if tape is None or not len(tape):
+            return self.data_cache.get(symbol, {}).get('trades', [])
+        trades = tape.to_records()
+        if symbol in self.data_cache:
+            self.data_cache[symbol]['trades'] = trades
+        return trades
     
     def _update_liquidation_from_ws(self, symbol: str, data: Dict[str, Any]) -> None:
         """Update liquidation data from WebSocket message
@@ -1819,14 +1870,21 @@ async def get_market_data(self, symbol: str) -> Dict[str, Any]:
             
         # Include basic market data components
         market_data['ticker'] = self.data_cache[symbol].get('ticker')
-        market_data['orderbook'] = self.data_cache[symbol].get('orderbook')
-        market_data['trades'] = self.data_cache[symbol].get('trades', [])
+        market_data['orderbook'] = self._get_orderbook(symbol)
+        market_data['trades'] = self._get_trades(symbol)
+        if symbol in self.trade_tapes:
+            # Columnar view for array consumers (stacked imbalance, whale trades, CVD)
+            market_data['trade_tape'] = self.trade_tapes[symbol]
         
         # OHLCV data - required for market reports
         market_data['ohlcv'] = {}
         
+        # Prefer the candle store - frames are zero-copy views materialized on demand
+        if self.ohlcv_store.has_data(symbol):
+            market_data['ohlcv'] = self._get_ohlcv_frames(symbol)
+            self.logger.debug(f"Retrieved OHLCV data from candle store: {len(market_data['ohlcv'])} timeframes")
         # Check if ohlcv data exists directly in the symbol's cache
-        if 'ohlcv' in self.data_cache[symbol] and isinstance(self.data_cache[symbol]['ohlcv'], dict):
+        elif 'ohlcv' in self.data_cache[symbol] and isinstance(self.data_cache[symbol]['ohlcv'], dict):
             # Use the ohlcv data directly from the cache
             market_data['ohlcv'] = self.data_cache[symbol]['ohlcv']
             self.logger.debug(f"Retrieved OHLCV data from symbol cache: {len(market_data['ohlcv'])} timeframes")
@@ -2106,6 +2164,12 @@ def get_stats(self) -> Dict[str, Any]:
         
         # Add WebSocket status
         self.stats['websocket'] = self.websocket_manager.get_status()
+
+        # Add candle store footprint
+        self.stats['ohlcv_store'] = self.ohlcv_store.get_stats()
+
+        # Add refresh batching/coalescing counters
+        self.stats['refresh_planner'] = self.refresh_planner.get_stats()
         
         return self.stats
     
@@ -2210,6 +2274,25 @@ def _get_symbol_lock(self, symbol: str) -> asyncio.Lock:
             self._symbol_locks[symbol] = asyncio.Lock()
         return self._symbol_locks[symbol]
 
+    def _get_ohlcv_frames(self, symbol: str) -> Dict[str, pd.DataFrame]:
+        """Materialize the stored candles for a symbol as OHLCV DataFrames.
+
+        Frames wrap the candle store's buffers without copying and are rebuilt
+        only after candles were appended or merged. The result is also published
+        under the legacy 'ohlcv' and 'kline' cache keys for existing readers.
+
+        Args:
+            symbol: Trading pair symbol
+
+        Returns:
+            Dictionary mapping timeframe names to DataFrames
+        """
+        frames = self.ohlcv_store.get_frames(symbol)
+        if frames and symbol in self.data_cache:
+            self.data_cache[symbol]['ohlcv'] = frames
+            self.data_cache[symbol]['kline'] = frames
+        return frames
+
     async def _fetch_single_timeframe(
         self,
         symbol: str,
@@ -2353,14 +2436,7 @@ async def _fetch_stale_klines_only(self, symbol: str) -> Dict[str, pd.DataFrame]
             if interval == 0:
                 # Base (1m) - WebSocket provides this data
                 # BUT on cold start, we need REST to populate initial data
-                base_exists = (
-                    symbol in self.data_cache and
-                    'kline' in self.data_cache[symbol] and
-                    'base' in self.data_cache[symbol]['kline'] and
-                    self.data_cache[symbol]['kline']['base'] is not None and
-                    not self.data_cache[symbol]['kline']['base'].empty
-                )
-                if not base_exists:
+                if not self.ohlcv_store.has_data(symbol, 'base'):
                     stale_timeframes.append(tf_name)
                     self.logger.debug(f"{symbol} base needs initial fetch (cold start)")
                 continue
@@ -2419,8 +2495,8 @@ def _check_ws_health(self, symbol: str) -> bool:
                 )
                 return False
 
-        # Check orderbook freshness
-        orderbook = cache.get('orderbook')
+        # Check orderbook freshness (materialized from the live book if one is tracked)
+        orderbook = self._get_orderbook(symbol)
         if orderbook:
             ob_ts = orderbook.get('timestamp', 0)
             ob_age = (current_time - ob_ts) / 1000
@@ -2464,7 +2540,7 @@ async def _emergency_refresh(self, symbol: str) -> None:
                 lambda: self.exchange_manager.fetch_order_book(symbol)
             )
             if orderbook:
-                self.data_cache[symbol]['orderbook'] = orderbook
+                self._seed_order_book(symbol, orderbook)
                 self.logger.info(f"Emergency orderbook refresh for {symbol} successful")
 
         except Exception as e:
@@ -2487,6 +2563,12 @@ def _is_ws_data_fresh(self, symbol: str, data_type: str, max_age: int = 60) -> b
         if symbol not in self.data_cache:
             return False
 
+        if data_type == 'trades' and self.trade_tapes.get(symbol) is not None:
+            last_trade_ts = self.trade_tapes[symbol].last_timestamp
+            if last_trade_ts is None:
+                return False
+            return (time.time() * 1000 - last_trade_ts) / 1000 <= max_age
+
         data = self.data_cache[symbol].get(data_type)
         if not data:
             return False
@@ -2519,13 +2601,15 @@ def _build_from_ws_cache(self, symbol: str) -> Dict[str, Any]:
             return {}
 
         cache = self.data_cache[symbol]
+        if self.ohlcv_store.has_data(symbol):
+            self._get_ohlcv_frames(symbol)
 
         return {
             'symbol': symbol,
             'timestamp': int(time.time() * 1000),
             'ticker': cache.get('ticker'),
-            'orderbook': cache.get('orderbook'),
-            'trades': cache.get('trades', []),
+            'orderbook': self._get_orderbook(symbol),
+            'trades': self._get_trades(symbol),
             'kline': cache.get('kline', {}),
             'ohlcv': cache.get('kline', {}),  # Alias for compatibility
             'long_short_ratio': cache.get('long_short_ratio'),
@@ -2735,6 +2819,32 @@ def get_open_interest_data(self, symbol: str) -> Dict[str, Any]:
             self.logger.error(f"Error getting open interest data: {str(e)}")
             return None
             
+    def _data_age(self, symbol: str, data_type: str) -> float:
+        """Age in seconds of a cached component (infinite if missing)."""
+        data = self.data_cache.get(symbol, {}).get(data_type)
+        if not isinstance(data, dict) or not data.get('timestamp'):
+            return float('inf')
+        return time.time() - data['timestamp'] / 1000
+
+    def _kline_age(self, symbol: str) -> float:
+        """Seconds since the oldest REST kline fetch for a symbol (infinite if never fetched)."""
+        fetched = self._kline_fetch_timestamps.get(symbol)
+        if not fetched:
+            return float('inf')
+        return time.time() - min(fetched.values())
+
+    async def refresh_symbols(self, symbols: List[str], components: List[str] = None) -> None:
+        """Refresh components for several symbols in one planning window.
+
+        Ticker refreshes are served by a single bulk request and kline/OI
+        loads shared with other callers are fetched once.
+
+        Args:
+            symbols: Symbols to refresh
+            components: Component names to refresh, or None for all
+        """
+        await asyncio.gather(*[self.refresh_components(symbol, components) for symbol in symbols])
+
     async def refresh_components(self, symbol: str, components: List[str] = None) -> None:
         """Refresh specific components for a symbol.
         
@@ -2757,14 +2867,12 @@ async def refresh_components(self, symbol: str, components: List[str] = None) ->
             for component in components:
                 try:
                     if component == 'ticker':
-                        # Try to find exchange
-                        exchange = await self.exchange_manager.get_primary_exchange()
-                        if exchange:
-                            ticker = await exchange.fetch_ticker(symbol)
-                            if ticker:
-                                fetched_data['ticker'] = ticker
-                        else:
-                            self.logger.error("No exchange available for ticker fetch")
+                        # Batched with other symbols' ticker refreshes (one bulk call)
+                        ticker = await self.refresh_planner.fetch_ticker(
+                            symbol, staleness=self._data_age(symbol, 'ticker')
+                        )
+                        if ticker:
+                            fetched_data['ticker'] = ticker
                     
                     elif component == 'orderbook':
                         # Try to find exchange and fetch enhanced orderbook data
@@ -2772,6 +2880,7 @@ async def refresh_components(self, symbol: str, components: List[str] = None) ->
                         if exchange:
                             enhanced_orderbook_data = await self._fetch_enhanced_orderbook_data(symbol)
                             if enhanced_orderbook_data:
+                                self._seed_order_book(symbol, enhanced_orderbook_data['standard_orderbook'])
                                 fetched_data['orderbook'] = enhanced_orderbook_data['standard_orderbook']
                                 fetched_data['rpi_orderbook'] = enhanced_orderbook_data.get('rpi_orderbook', {})
                                 fetched_data['enhanced_orderbook'] = enhanced_orderbook_data.get('enhanced_orderbook', {})
@@ -2786,6 +2895,7 @@ async def refresh_components(self, symbol: str, components: List[str] = None) ->
                             trades = await exchange.fetch_trades(symbol, 100)
                             if trades:
                                 fetched_data['trades'] = trades
+                                self._get_trade_tape(symbol).extend(trades)
                         else:
                             self.logger.error("No exchange available for trades fetch")
                         
@@ -2793,7 +2903,10 @@ async def refresh_components(self, symbol: str, components: List[str] = None) ->
                         # Fetch OHLCV data using _fetch_timeframes method
                         try:
                             self.logger.info(f"Fetching OHLCV data for {symbol}")
-                            timeframes = await self._fetch_timeframes(symbol)
+                            timeframes = await self.refresh_planner.load(
+                                'kline', symbol, lambda: self._fetch_timeframes(symbol),
+                                staleness=self._kline_age(symbol)
+                            )
                             if timeframes:
                                 # Initialize ohlcv in data_cache if needed
                                 if 'ohlcv' not in self.data_cache[symbol]:
@@ -0,0 +1,158 @@
+"""
+Per-cycle market snapshot.
+
+A monitoring cycle used to fetch the same data several times:
+``TopSymbolsManager.get_top_symbols`` loaded full market data for every
+ranked symbol only to read price and turnover, then ``_process_symbol``
+fetched market data for the same symbols again, and the dashboard
+integration loaded it once more for its confluence cache.
+
+``MarketSnapshot`` is created once per cycle and shared by those callers.
+Entries are keyed by ``(symbol, component, version)``: the first request for
+a key runs the loader, concurrent requests wait for that same fetch, and
+later requests reuse the result while it is younger than ``max_age``.
+``version`` separates variants of a component (for example a different
+candle limit) that must not be served for each other.
+"""
+
+import asyncio
+import itertools
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+Key = Tuple[str, str, Hashable]
+
+_cycle_ids = itertools.count(1)
+
+
+class MarketSnapshot:
+    """Fetch-once store for the market data of one monitoring cycle."""
+
+    def __init__(self, max_age: float = 5.0, cycle_id: Optional[int] = None):
+        """
+        Args:
+            max_age: Seconds an entry is served before it is fetched again
+            cycle_id: Identifier reported in stats; numbered automatically
+        """
+        self.max_age = max_age
+        self.cycle_id = cycle_id if cycle_id is not None else next(_cycle_ids)
+        self.created_at = time.time()
+
+        self._entries: Dict[Key, Tuple[float, Any]] = {}
+        self._inflight: Dict[Key, asyncio.Future] = {}
+        # (symbol, component) -> version stored last, for peek()
+        self._latest: Dict[Tuple[str, str], Hashable] = {}
+
+        self.stats = {
+            'requests': 0,
+            'fetches': 0,
+            'hits': 0,
+            'coalesced': 0,
+            'expired': 0,
+            'errors': 0
+        }
+
+    def _fresh(self, key: Key) -> Optional[Tuple[float, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > self.max_age:
+            self.stats['expired'] += 1
+            del self._entries[key]
+            return None
+        return entry
+
+    async def get(self, symbol: str, component: str, loader: Callable[[], Awaitable[Any]],
+                  version: Hashable = None) -> Any:
+        """Return the snapshot value for a key, running ``loader`` on a miss.
+
+        Args:
+            symbol: Symbol the data belongs to
+            component: Component name ('ticker', 'market_data', ...)
+            loader: Coroutine function performing the fetch
+            version: Variant of the component
+
+        Returns:
+            The loader's result (``None`` results are not stored)
+        """
+        key = (symbol, component, version)
+        self.stats['requests'] += 1
+
+        entry = self._fresh(key)
+        if entry is not None:
+            self.stats['hits'] += 1
+            return entry[1]
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.stats['coalesced'] += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        # The exception is re-raised to every waiter; mark it retrieved
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        self.stats['fetches'] += 1
+        try:
+            value = await loader()
+        except BaseException as e:
+            self.stats['errors'] += 1
+            self._inflight.pop(key, None)
+            if isinstance(e, Exception):
+                future.set_exception(e)
+            else:
+                future.cancel()
+            raise
+        self._inflight.pop(key, None)
+        if value is not None:
+            self.put(symbol, component, value, version)
+        future.set_result(value)
+        return value
+
+    def put(self, symbol: str, component: str, value: Any, version: Hashable = None) -> None:
+        """Store a value fetched outside ``get`` (e.g. from a bulk request)."""
+        self._entries[(symbol, component, version)] = (time.monotonic(), value)
+        self._latest[(symbol, component)] = version
+
+    def put_many(self, component: str, values: Dict[str, Any], version: Hashable = None) -> None:
+        """Store one component for many symbols, skipping ``None`` values."""
+        for symbol, value in values.items():
+            if value is not None:
+                self.put(symbol, component, value, version)
+
+    def peek(self, symbol: str, component: str, version: Hashable = ...) -> Any:
+        """Return a stored value without fetching; None if absent or expired.
+
+        Without ``version`` the most recently stored version is returned.
+        Every successful peek counts as a fetch saved.
+        """
+        if version is ...:
+            if (symbol, component) not in self._latest:
+                return None
+            version = self._latest[(symbol, component)]
+        entry = self._fresh((symbol, component, version))
+        if entry is None:
+            return None
+        self.stats['requests'] += 1
+        self.stats['hits'] += 1
+        return entry[1]
+
+    def symbols(self, component: str) -> List[str]:
+        """Symbols with a stored value for ``component``."""
+        return [symbol for symbol, comp in self._latest if comp == component]
+
+    @property
+    def duplicate_fetches_saved(self) -> int:
+        """Requests answered without a fetch of their own."""
+        return self.stats['hits'] + self.stats['coalesced']
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Request, fetch and reuse counters for this cycle."""
+        return {
+            **self.stats,
+            'cycle_id': self.cycle_id,
+            'duplicate_fetches_saved': self.duplicate_fetches_saved,
+            'entries': len(self._entries),
+            'in_flight': len(self._inflight),
+            'age': time.time() - self.created_at
+        }
@@ -0,0 +1,325 @@
+"""
+Columnar OHLCV candle store backed by preallocated NumPy buffers.
+
+Replaces the per-message ``pd.concat`` + ``index.duplicated`` + ``sort_index``
+merge that ``MarketDataManager`` used to run for every WebSocket kline update.
+Each symbol/timeframe pair owns an ``OHLCVRingBuffer``:
+
+- The live (still forming) candle is upserted in place in O(1).
+- New candles are appended in amortized O(1); when the buffer runs out of
+  room the most recent ``capacity`` rows are compacted into a fresh
+  allocation, so frames handed out earlier keep pointing at valid memory.
+- DataFrames are only materialized when a consumer asks for them and wrap
+  the value block without copying it.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+# Default number of candles retained per timeframe (mirrors the REST fetch limits)
+DEFAULT_TIMEFRAME_CAPACITY = {
+    'base': 1000,
+    'ltf': 300,
+    'mtf': 200,
+    'htf': 200
+}
+
+
+def frame_to_arrays(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """Extract millisecond timestamps and the OHLCV value block from a DataFrame.
+
+    Accepts either a DatetimeIndex (the layout used throughout MarketDataManager)
+    or a ``timestamp`` column holding datetimes or epoch milliseconds.
+
+    Args:
+        df: OHLCV DataFrame
+
+    Returns:
+        Tuple of (int64 timestamps in ms, float64 values of shape (n, 5))
+    """
+    if df is None or df.empty:
+        return np.empty(0, dtype=np.int64), np.empty((0, len(OHLCV_COLUMNS)), dtype=np.float64)
+
+    if 'timestamp' in df.columns:
+        raw_ts = df['timestamp']
+        if pd.api.types.is_datetime64_any_dtype(raw_ts):
+            timestamps = raw_ts.values.astype('datetime64[ms]').astype(np.int64)
+        else:
+            timestamps = pd.to_numeric(raw_ts, errors='coerce').to_numpy(dtype=np.int64)
+    elif isinstance(df.index, pd.DatetimeIndex):
+        timestamps = df.index.values.astype('datetime64[ms]').astype(np.int64)
+    else:
+        timestamps = np.asarray(df.index, dtype=np.int64)
+
+    values = df.loc[:, list(OHLCV_COLUMNS)].to_numpy(dtype=np.float64)
+    return timestamps, values
+
+
+class OHLCVRingBuffer:
+    """Fixed-capacity, time-ordered OHLCV buffer for a single symbol/timeframe.
+
+    Rows live in a contiguous window ``[start, end)`` of arrays sized at twice
+    the capacity, which keeps every read a zero-copy slice.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self._allocate()
+        # ``version`` changes on every mutation; ``_layout_version`` only when
+        # rows are added, dropped or moved (in-place live candle updates are
+        # already visible through previously materialized views)
+        self.version = 0
+        self._layout_version = 0
+        self._frame_cache: Optional[Tuple[int, pd.DataFrame]] = None
+
+    def _allocate(self) -> None:
+        self._timestamps = np.zeros(self.capacity * 2, dtype=np.int64)
+        self._values = np.zeros((self.capacity * 2, len(OHLCV_COLUMNS)), dtype=np.float64)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Read-only view of the candle open times (epoch ms)."""
+        view = self._timestamps[self._start:self._end]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def values(self) -> np.ndarray:
+        """Read-only view of the (n, 5) open/high/low/close/volume block."""
+        view = self._values[self._start:self._end]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        """Open time of the most recent candle, or None when empty."""
+        if self._end == self._start:
+            return None
+        return int(self._timestamps[self._end - 1])
+
+    def upsert(self, timestamp: int, open_: float, high: float, low: float,
+               close: float, volume: float) -> None:
+        """Insert a candle or overwrite the one with the same open time.
+
+        Updating the live candle and appending the next one are O(1); only an
+        out-of-order historical candle falls back to a full merge.
+        """
+        timestamp = int(timestamp)
+        last = self.last_timestamp
+
+        if last is not None and timestamp == last:
+            row = self._values[self._end - 1]
+            row[0] = open_
+            row[1] = high
+            row[2] = low
+            row[3] = close
+            row[4] = volume
+        elif last is None or timestamp > last:
+            if self._end == len(self._timestamps):
+                self._compact()
+            self._timestamps[self._end] = timestamp
+            row = self._values[self._end]
+            row[0] = open_
+            row[1] = high
+            row[2] = low
+            row[3] = close
+            row[4] = volume
+            self._end += 1
+            if self._end - self._start > self.capacity:
+                self._start += 1
+            self._layout_version += 1
+        else:
+            self.merge(
+                np.array([timestamp], dtype=np.int64),
+                np.array([[open_, high, low, close, volume]], dtype=np.float64)
+            )
+            return
+
+        self.version += 1
+
+    def merge(self, timestamps: Iterable[int], values: Iterable) -> None:
+        """Merge a batch of candles (e.g. a REST fetch) into the buffer.
+
+        Incoming rows win over existing rows with the same open time. Only the
+        newest ``capacity`` candles are kept.
+
+        Args:
+            timestamps: Candle open times in epoch milliseconds
+            values: Array-like of shape (n, 5) in OHLCV column order
+        """
+        new_ts = np.asarray(timestamps, dtype=np.int64)
+        new_values = np.asarray(values, dtype=np.float64).reshape(-1, len(OHLCV_COLUMNS))
+        if new_ts.size == 0:
+            return
+
+        if len(self):
+            combined_ts = np.concatenate((self._timestamps[self._start:self._end], new_ts))
+            combined_values = np.concatenate((self._values[self._start:self._end], new_values))
+        else:
+            combined_ts, combined_values = new_ts, new_values
+
+        # Stable sort keeps incoming rows after existing rows with the same
+        # timestamp, so keeping the last of each run lets the new data win
+        order = np.argsort(combined_ts, kind='stable')
+        sorted_ts = combined_ts[order]
+        keep = np.ones(sorted_ts.size, dtype=bool)
+        keep[:-1] = sorted_ts[1:] != sorted_ts[:-1]
+        order = order[keep][-self.capacity:]
+
+        # Write into a fresh allocation so previously materialized views stay valid
+        self._allocate()
+        count = order.size
+        self._timestamps[:count] = combined_ts[order]
+        self._values[:count] = combined_values[order]
+        self._end = count
+        self.version += 1
+        self._layout_version += 1
+
+    def _compact(self) -> None:
+        """Move the live window to the front of a new allocation."""
+        timestamps = self._timestamps[self._start:self._end]
+        values = self._values[self._start:self._end]
+        self._allocate()
+        count = len(timestamps)
+        self._timestamps[:count] = timestamps
+        self._values[:count] = values
+        self._end = count
+        self._layout_version += 1
+
+    def to_dataframe(self, copy: bool = False) -> pd.DataFrame:
+        """Materialize the buffer as an OHLCV DataFrame indexed by timestamp.
+
+        With ``copy=False`` the frame wraps the underlying value block, so the
+        live candle keeps updating in place. The frame is cached until rows are
+        added, dropped or moved.
+
+        Args:
+            copy: Return an independent copy instead of a view
+
+        Returns:
+            DataFrame with open/high/low/close/volume columns
+        """
+        if not copy and self._frame_cache is not None:
+            cached_layout, cached_frame = self._frame_cache
+            if cached_layout == self._layout_version:
+                return cached_frame
+
+        index = pd.DatetimeIndex(
+            pd.to_datetime(self._timestamps[self._start:self._end], unit='ms'),
+            name='timestamp'
+        )
+        frame = pd.DataFrame(
+            self._values[self._start:self._end],
+            index=index,
+            columns=list(OHLCV_COLUMNS),
+            copy=copy
+        )
+        if not copy:
+            self._frame_cache = (self._layout_version, frame)
+        return frame
+
+
+class OHLCVStore:
+    """Per-symbol, per-timeframe collection of ``OHLCVRingBuffer`` instances."""
+
+    def __init__(self, capacities: Optional[Dict[str, int]] = None, default_capacity: int = 1000):
+        self.capacities = dict(DEFAULT_TIMEFRAME_CAPACITY)
+        if capacities:
+            self.capacities.update(capacities)
+        self.default_capacity = default_capacity
+        self._buffers: Dict[str, Dict[str, OHLCVRingBuffer]] = {}
+
+    def _buffer(self, symbol: str, timeframe: str) -> OHLCVRingBuffer:
+        symbol_buffers = self._buffers.setdefault(symbol, {})
+        buffer = symbol_buffers.get(timeframe)
+        if buffer is None:
+            buffer = OHLCVRingBuffer(self.capacities.get(timeframe, self.default_capacity))
+            symbol_buffers[timeframe] = buffer
+        return buffer
+
+    def get_buffer(self, symbol: str, timeframe: str) -> Optional[OHLCVRingBuffer]:
+        """Return the buffer for a symbol/timeframe without creating it."""
+        return self._buffers.get(symbol, {}).get(timeframe)
+
+    def has_data(self, symbol: str, timeframe: Optional[str] = None) -> bool:
+        """Check whether any candles are stored for a symbol (and timeframe)."""
+        symbol_buffers = self._buffers.get(symbol)
+        if not symbol_buffers:
+            return False
+        if timeframe is None:
+            return any(len(buffer) for buffer in symbol_buffers.values())
+        buffer = symbol_buffers.get(timeframe)
+        return buffer is not None and len(buffer) > 0
+
+    def upsert_candle(self, symbol: str, timeframe: str, timestamp: int, open_: float,
+                      high: float, low: float, close: float, volume: float) -> None:
+        """Upsert a single candle (WebSocket path)."""
+        self._buffer(symbol, timeframe).upsert(timestamp, open_, high, low, close, volume)
+
+    def merge_frame(self, symbol: str, timeframe: str, df: pd.DataFrame) -> None:
+        """Merge a fetched OHLCV DataFrame (REST path) into the store."""
+        if df is None or df.empty:
+            return
+        timestamps, values = frame_to_arrays(df)
+        self._buffer(symbol, timeframe).merge(timestamps, values)
+
+    def get_frame(self, symbol: str, timeframe: str, copy: bool = False) -> Optional[pd.DataFrame]:
+        """Materialize one timeframe as a DataFrame, or None if nothing is stored."""
+        buffer = self.get_buffer(symbol, timeframe)
+        if buffer is None or not len(buffer):
+            return None
+        return buffer.to_dataframe(copy=copy)
+
+    def get_frames(self, symbol: str, copy: bool = False) -> Dict[str, pd.DataFrame]:
+        """Materialize every non-empty timeframe stored for a symbol."""
+        return {
+            timeframe: buffer.to_dataframe(copy=copy)
+            for timeframe, buffer in self._buffers.get(symbol, {}).items()
+            if len(buffer)
+        }
+
+    def remove_symbol(self, symbol: str) -> None:
+        """Drop all buffers for a symbol."""
+        self._buffers.pop(symbol, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Summary counts for monitoring."""
+        buffers = [b for symbol_buffers in self._buffers.values() for b in symbol_buffers.values()]
+        return {
+            'symbols': len(self._buffers),
+            'buffers': len(buffers),
+            'candles': sum(len(b) for b in buffers),
+            'allocated_bytes': sum(b._timestamps.nbytes + b._values.nbytes for b in buffers)
+        }
+
+
+_shared_store: Optional[OHLCVStore] = None
+
+
+def get_ohlcv_store(config: Optional[Dict[str, Any]] = None) -> OHLCVStore:
+    """Process-wide candle store shared by MarketDataManager and the exchange kline paths.
+
+    The first caller's ``market_data.ohlcv_store`` settings set the capacities.
+    """
+    global _shared_store
+    if _shared_store is None:
+        store_config = (config or {}).get('market_data', {}).get('ohlcv_store', {})
+        _shared_store = OHLCVStore(
+            capacities=store_config.get('capacity'),
+            default_capacity=store_config.get('default_capacity', 1000)
+        )
+    return _shared_store
@@ -0,0 +1,251 @@
+"""
+Incremental L2 order book maintained from WebSocket snapshots and deltas.
+
+Replaces the rebuild-and-resort approach in ``MarketDataManager`` where every
+orderbook message re-parsed and re-sorted both full sides. Each side keeps a
+price-keyed dict for sizes plus a sorted price list located with ``bisect``,
+so level upserts/deletes cost O(log n) comparisons (plus a C-level memmove
+on insert/remove) and best-price/top-N reads are slices.
+
+Bybit update semantics:
+- ``snapshot`` messages replace the book; ``delta`` messages upsert levels
+  and a size of ``0`` deletes the level.
+- ``u`` increments by one per message. A skipped ``u`` means deltas were lost
+  and the book must be resynchronized from a fresh snapshot. ``u == 1`` on a
+  snapshot signals a service restart.
+"""
+
+import logging
+import time
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class OrderBookSide:
+    """One side of the book, ordered best price first."""
+
+    def __init__(self, is_bid: bool):
+        self.is_bid = is_bid
+        self._sizes: Dict[float, float] = {}
+        # Sorted ascending; bids store negated prices so index 0 is always best
+        self._keys: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def clear(self) -> None:
+        self._sizes.clear()
+        self._keys.clear()
+
+    def _key(self, price: float) -> float:
+        return -price if self.is_bid else price
+
+    def update(self, price: float, size: float) -> None:
+        """Upsert a level, or delete it when ``size`` is zero."""
+        if size <= 0:
+            if price in self._sizes:
+                del self._sizes[price]
+                key = self._key(price)
+                idx = bisect_left(self._keys, key)
+                if idx < len(self._keys) and self._keys[idx] == key:
+                    del self._keys[idx]
+            return
+
+        if price not in self._sizes:
+            key = self._key(price)
+            self._keys.insert(bisect_left(self._keys, key), key)
+        self._sizes[price] = size
+
+    def best(self) -> Optional[Tuple[float, float]]:
+        """Best level as (price, size), or None when the side is empty."""
+        if not self._keys:
+            return None
+        price = self._price(self._keys[0])
+        return price, self._sizes[price]
+
+    def _price(self, key: float) -> float:
+        return -key if self.is_bid else key
+
+    def top(self, n: Optional[int] = None) -> List[List[float]]:
+        """Best ``n`` levels (all when ``n`` is None) as [price, size] pairs."""
+        keys = self._keys if n is None else self._keys[:n]
+        sizes = self._sizes
+        if self.is_bid:
+            return [[-k, sizes[-k]] for k in keys]
+        return [[k, sizes[k]] for k in keys]
+
+    def total_size(self, n: Optional[int] = None) -> float:
+        """Summed size over the best ``n`` levels."""
+        keys = self._keys if n is None else self._keys[:n]
+        sizes = self._sizes
+        if self.is_bid:
+            return sum(sizes[-k] for k in keys)
+        return sum(sizes[k] for k in keys)
+
+    def size_within(self, limit_price: float) -> Tuple[float, float]:
+        """Size and notional of all levels at or better than ``limit_price``."""
+        end = bisect_right(self._keys, self._key(limit_price))
+        size = 0.0
+        notional = 0.0
+        sizes = self._sizes
+        for key in self._keys[:end]:
+            price = self._price(key)
+            level_size = sizes[price]
+            size += level_size
+            notional += level_size * price
+        return size, notional
+
+
+class LocalOrderBook:
+    """Incrementally maintained L2 book for a single symbol."""
+
+    def __init__(self, symbol: str, max_depth: Optional[int] = None):
+        self.symbol = symbol
+        self.max_depth = max_depth
+        self.bids = OrderBookSide(is_bid=True)
+        self.asks = OrderBookSide(is_bid=False)
+        self.update_id: Optional[int] = None
+        self.sequence: Optional[int] = None
+        self.timestamp: int = 0
+        self.synced = False
+        # Bumped on every applied message; used to cache materialized snapshots
+        self.version = 0
+        self._snapshot_cache: Optional[Tuple[int, Optional[int], Dict[str, Any]]] = None
+        self.stats = {
+            'snapshots': 0,
+            'deltas': 0,
+            'gaps': 0,
+            'stale_dropped': 0
+        }
+
+    @staticmethod
+    def _apply_levels(side: OrderBookSide, levels: Iterable) -> None:
+        for level in levels:
+            try:
+                side.update(float(level[0]), float(level[1]))
+            except (IndexError, TypeError, ValueError):
+                continue
+
+    def apply_snapshot(self, bids: Iterable, asks: Iterable, update_id: Optional[int] = None,
+                       sequence: Optional[int] = None, timestamp: Optional[int] = None) -> None:
+        """Replace the book with a full snapshot."""
+        self.bids.clear()
+        self.asks.clear()
+        self._apply_levels(self.bids, bids)
+        self._apply_levels(self.asks, asks)
+        self.update_id = int(update_id) if update_id is not None else None
+        self.sequence = int(sequence) if sequence is not None else None
+        self.timestamp = int(timestamp) if timestamp is not None else int(time.time() * 1000)
+        self.synced = True
+        self.version += 1
+        self.stats['snapshots'] += 1
+
+    def apply_delta(self, bids: Iterable, asks: Iterable, update_id: Optional[int] = None,
+                    sequence: Optional[int] = None, timestamp: Optional[int] = None) -> bool:
+        """Apply an incremental update.
+
+        Returns:
+            False when the delta cannot be applied (book not synced or an
+            update-id gap was detected) and a resnapshot is required.
+        """
+        if not self.synced:
+            return False
+
+        if update_id is not None:
+            update_id = int(update_id)
+            if self.update_id is not None:
+                if update_id <= self.update_id:
+                    # Already covered by the current snapshot
+                    self.stats['stale_dropped'] += 1
+                    return True
+                if update_id != self.update_id + 1:
+                    self.stats['gaps'] += 1
+                    self.synced = False
+                    logger.warning(
+                        f"Orderbook gap for {self.symbol}: expected u={self.update_id + 1}, got u={update_id}"
+                    )
+                    return False
+            self.update_id = update_id
+
+        self._apply_levels(self.bids, bids)
+        self._apply_levels(self.asks, asks)
+        if sequence is not None:
+            self.sequence = int(sequence)
+        self.timestamp = int(timestamp) if timestamp is not None else int(time.time() * 1000)
+        self.version += 1
+        self.stats['deltas'] += 1
+        return True
+
+    def invalidate(self) -> None:
+        """Mark the book as needing a fresh snapshot."""
+        self.synced = False
+
+    def best_bid(self) -> Optional[Tuple[float, float]]:
+        return self.bids.best()
+
+    def best_ask(self) -> Optional[Tuple[float, float]]:
+        return self.asks.best()
+
+    def mid_price(self) -> Optional[float]:
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return (bid[0] + ask[0]) / 2
+
+    def spread(self) -> Optional[float]:
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return ask[0] - bid[0]
+
+    def top(self, n: int) -> Dict[str, List[List[float]]]:
+        """Best ``n`` levels per side."""
+        return {'bids': self.bids.top(n), 'asks': self.asks.top(n)}
+
+    def depth(self, n: Optional[int] = None) -> Tuple[float, float]:
+        """Total (bid, ask) size over the best ``n`` levels (all when None)."""
+        return self.bids.total_size(n), self.asks.total_size(n)
+
+    def depth_within_bps(self, bps: float) -> Dict[str, float]:
+        """Size and notional resting within ``bps`` basis points of the mid price."""
+        mid = self.mid_price()
+        if mid is None:
+            return {'bid_size': 0.0, 'ask_size': 0.0, 'bid_notional': 0.0, 'ask_notional': 0.0}
+        offset = mid * bps / 10_000
+        bid_size, bid_notional = self.bids.size_within(mid - offset)
+        ask_size, ask_notional = self.asks.size_within(mid + offset)
+        return {
+            'bid_size': bid_size,
+            'ask_size': ask_size,
+            'bid_notional': bid_notional,
+            'ask_notional': ask_notional
+        }
+
+    def imbalance(self, n: Optional[int] = None) -> float:
+        """(bid - ask) / (bid + ask) size imbalance over the best ``n`` levels."""
+        bid_size, ask_size = self.depth(n)
+        total = bid_size + ask_size
+        return (bid_size - ask_size) / total if total > 0 else 0.0
+
+    def to_dict(self, depth: Optional[int] = None) -> Dict[str, Any]:
+        """Materialize the legacy ``{'bids', 'asks', 'timestamp'}`` layout.
+
+        The result is cached until the next applied message, so repeated reads
+        between updates do not rebuild the level lists.
+        """
+        depth = depth if depth is not None else self.max_depth
+        cached = self._snapshot_cache
+        if cached is not None and cached[0] == self.version and cached[1] == depth:
+            return cached[2]
+
+        snapshot = {
+            'symbol': self.symbol,
+            'bids': self.bids.top(depth),
+            'asks': self.asks.top(depth),
+            'timestamp': self.timestamp,
+            'update_id': self.update_id
+        }
+        self._snapshot_cache = (self.version, depth, snapshot)
+        return snapshot
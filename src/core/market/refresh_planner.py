@@ -0,0 +1,232 @@
+"""
+Cross-symbol REST refresh planner.
+
+``MarketDataManager.refresh_components`` used to issue one ticker request per
+symbol whenever the WebSocket ticker went stale, and the monitor,
+``TopSymbolsManager`` and ``CacheDataAggregator`` each loaded klines and open
+interest on their own. The planner sits between those callers and the
+exchange:
+
+- Ticker refreshes requested within a short window (``window`` seconds) are
+  served by one bulk ``/v5/market/tickers`` call
+  (``exchange.fetch_tickers_by_symbol``), with a per-symbol fallback for
+  exchanges without a bulk endpoint.
+- Other component loads (kline, open interest, ...) are single-flight per
+  ``(component, symbol)``: concurrent callers share one fetch, and the result
+  is reused for ``result_ttl`` seconds.
+- Queued work is started stalest-first, with at most ``max_concurrency``
+  loads running at once.
+
+One planner is shared per exchange manager (see ``get_refresh_planner``).
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.utils.task_tracker import create_tracked_task
+
+logger = logging.getLogger(__name__)
+
+Key = Tuple[str, str]
+
+
+class RefreshPlanner:
+    """Batches and de-duplicates REST refreshes across symbols and callers."""
+
+    def __init__(self, exchange_manager, window: float = 0.05, result_ttl: float = 2.0,
+                 max_concurrency: int = 8):
+        """
+        Args:
+            exchange_manager: Exchange manager used to reach the primary exchange
+            window: Seconds to collect requests before issuing REST calls
+            result_ttl: Seconds a fetched result is reused by later callers
+            max_concurrency: Maximum number of component loads run at once
+        """
+        self.exchange_manager = exchange_manager
+        self.window = window
+        self.result_ttl = result_ttl
+        self.max_concurrency = max_concurrency
+
+        self._inflight: Dict[Key, asyncio.Future] = {}
+        self._results: Dict[Key, Tuple[float, Any]] = {}
+        # symbol -> staleness of the pending ticker refresh
+        self._pending_tickers: Dict[str, float] = {}
+        # (-staleness, seq, key, loader) - stalest first
+        self._pending_loads: List[Tuple[float, int, Key, Callable[[], Awaitable[Any]]]] = []
+        self._seq = itertools.count()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        self.stats = {
+            'requests': 0,
+            'coalesced': 0,
+            'result_reuses': 0,
+            'bulk_ticker_calls': 0,
+            'single_ticker_calls': 0,
+            'loads': 0,
+            'errors': 0
+        }
+
+    async def fetch_ticker(self, symbol: str, staleness: float = 0.0) -> Optional[Dict[str, Any]]:
+        """Refresh the ticker for ``symbol`` as part of the next bulk request.
+
+        Args:
+            symbol: Symbol to refresh
+            staleness: Age in seconds of the caller's current ticker
+
+        Returns:
+            Ticker dict, or None if the exchange returned nothing
+        """
+        return await self._request(('ticker', symbol), staleness)
+
+    async def load(self, component: str, symbol: str, loader: Callable[[], Awaitable[Any]],
+                   staleness: float = 0.0) -> Any:
+        """Run ``loader`` once for all concurrent requests of ``(component, symbol)``.
+
+        Args:
+            component: Component name ('kline', 'open_interest', ...)
+            symbol: Symbol the component belongs to
+            loader: Coroutine function performing the fetch
+            staleness: Age in seconds of the caller's current data; stalest
+                loads are started first
+
+        Returns:
+            The loader's result
+        """
+        return await self._request((component, symbol), staleness, loader)
+
+    async def _request(self, key: Key, staleness: float,
+                       loader: Optional[Callable[[], Awaitable[Any]]] = None) -> Any:
+        self.stats['requests'] += 1
+
+        cached = self._results.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            self.stats['result_reuses'] += 1
+            return cached[1]
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.stats['coalesced'] += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            # The exception is re-raised to every waiter; mark it retrieved
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            self._inflight[key] = future
+            if loader is None:
+                self._pending_tickers[key[1]] = staleness
+            else:
+                heapq.heappush(self._pending_loads, (-staleness, next(self._seq), key, loader))
+            if self._flush_task is None:
+                self._flush_task = create_tracked_task(self._flush(), name="refresh_planner_flush")
+        return await asyncio.shield(future)
+
+    async def _flush(self) -> None:
+        """Issue the REST calls for everything requested during the window."""
+        await asyncio.sleep(self.window)
+
+        tickers = sorted(self._pending_tickers, key=self._pending_tickers.get, reverse=True)
+        loads = [heapq.heappop(self._pending_loads) for _ in range(len(self._pending_loads))]
+        self._pending_tickers = {}
+        # Requests arriving from here on start the next window
+        self._flush_task = None
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        jobs = [self._run_load(key, loader) for _, _, key, loader in loads]
+        if tickers:
+            jobs.insert(0, self._refresh_tickers(tickers))
+        await asyncio.gather(*jobs)
+
+    async def _run_load(self, key: Key, loader: Callable[[], Awaitable[Any]]) -> None:
+        async with self._semaphore:
+            self.stats['loads'] += 1
+            try:
+                self._resolve(key, await loader())
+            except Exception as e:
+                self.stats['errors'] += 1
+                self._fail(key, e)
+
+    async def _refresh_tickers(self, symbols: List[str]) -> None:
+        try:
+            exchange = await self.exchange_manager.get_primary_exchange()
+            if not exchange:
+                raise RuntimeError("No exchange available for ticker refresh")
+
+            tickers: Dict[str, Any] = {}
+            if len(symbols) > 1 and hasattr(exchange, 'fetch_tickers_by_symbol'):
+                self.stats['bulk_ticker_calls'] += 1
+                tickers = await exchange.fetch_tickers_by_symbol(symbols)
+
+            # Symbols missing from the bulk response (or no bulk endpoint)
+            missing = [symbol for symbol in symbols if symbol not in tickers]
+            if missing:
+                self.stats['single_ticker_calls'] += len(missing)
+                results = await asyncio.gather(
+                    *[exchange.fetch_ticker(symbol) for symbol in missing], return_exceptions=True
+                )
+                for symbol, result in zip(missing, results):
+                    if isinstance(result, Exception):
+                        self.stats['errors'] += 1
+                        self._fail(('ticker', symbol), result)
+                    else:
+                        tickers[symbol] = result
+
+            for symbol in symbols:
+                if ('ticker', symbol) in self._inflight:
+                    self._resolve(('ticker', symbol), tickers.get(symbol))
+        except Exception as e:
+            self.stats['errors'] += 1
+            for symbol in symbols:
+                self._fail(('ticker', symbol), e)
+
+    def _resolve(self, key: Key, value: Any) -> None:
+        if value is not None:
+            self._results[key] = (time.monotonic() + self.result_ttl, value)
+        future = self._inflight.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result(value)
+
+    def _fail(self, key: Key, error: Exception) -> None:
+        future = self._inflight.pop(key, None)
+        if future is not None and not future.done():
+            future.set_exception(error)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Request, coalescing and REST call counters."""
+        now = time.monotonic()
+        return {
+            **self.stats,
+            'in_flight': len(self._inflight),
+            'cached_results': sum(1 for expires, _ in self._results.values() if expires > now)
+        }
+
+
+_planners: 'weakref.WeakKeyDictionary[Any, RefreshPlanner]' = weakref.WeakKeyDictionary()
+
+
+def get_refresh_planner(exchange_manager, config: Optional[Dict[str, Any]] = None) -> RefreshPlanner:
+    """Planner shared by every component using ``exchange_manager``.
+
+    Args:
+        exchange_manager: Exchange manager the planner fetches through
+        config: Optional ``market_data.refresh_planner`` settings used when
+            the planner is first created (``window``, ``result_ttl``,
+            ``max_concurrency``)
+    """
+    planner = _planners.get(exchange_manager)
+    if planner is None:
+        config = config or {}
+        planner = RefreshPlanner(
+            exchange_manager,
+            window=config.get('window', 0.05),
+            result_ttl=config.get('result_ttl', 2.0),
+            max_concurrency=config.get('max_concurrency', 8)
+        )
+        _planners[exchange_manager] = planner
+    return planner
@@ -1,4 +1,3 @@
-from src.utils.task_tracker import create_tracked_task
 """Top symbols management functionality."""
 
 import logging
@@ -13,6 +12,8 @@
 
 from src.core.analysis.data_validator import DataValidator
 from src.core.exchanges.manager import ExchangeManager
+from src.core.market.market_snapshot import MarketSnapshot
+from src.core.market.refresh_planner import get_refresh_planner
 from src.data_processing.data_processor import DataProcessor
 from src.core.exchanges.base import RateLimitError
 from src.core.validation.service import AsyncValidationService
@@ -171,10 +172,15 @@ async def update_top_symbols(self) -> None:
                 self.logger.info(f"Using static symbol list with {len(static_symbols)} symbols")
                 valid_markets = []
                 
-                # Fetch data for static symbols
-                for symbol in static_symbols:
+                # Fetch data for static symbols (one bulk ticker request via the refresh planner)
+                planner = get_refresh_planner(self.exchange_manager)
+                tickers = await asyncio.gather(
+                    *[planner.fetch_ticker(symbol) for symbol in static_symbols], return_exceptions=True
+                )
+                for symbol, market_data in zip(static_symbols, tickers):
                     try:
-                        market_data = await exchange.fetch_ticker(symbol)
+                        if isinstance(market_data, Exception):
+                            raise market_data
                         if market_data:
                             valid_markets.append(market_data)
                         else:
@@ -522,14 +528,20 @@ async def refresh_market_data(self, symbols: Optional[List[str]] = None) -> None
             # Refresh each symbol
             refresh_count = 0
             error_count = 0
+
+            # Fetch fresh market data for all symbols (one bulk ticker request via the refresh planner)
+            planner = get_refresh_planner(self.exchange_manager)
+            tickers = await asyncio.gather(
+                *[planner.fetch_ticker(symbol) for symbol in symbols_to_refresh], return_exceptions=True
+            )
             
-            for symbol in symbols_to_refresh:
+            for symbol, market_data in zip(symbols_to_refresh, tickers):
                 try:
                     # Invalidate cache for this symbol
                     await self.invalidate_cache(symbol)
-                    
-                    # Fetch fresh market data
-                    market_data = await exchange.fetch_ticker(symbol)
+
+                    if isinstance(market_data, Exception):
+                        raise market_data
                     
                     if market_data:
                         # Normalize the data for consistent field access
@@ -1328,239 +1340,103 @@ async def get_top_symbols_bulk(self, limit: int = 10) -> List[Dict[str, Any]]:
             # Fall back to parallel method if bulk fails
             return await self.get_top_symbols(limit)
     
-    async def get_top_symbols(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get top symbols with their market data.
-        
-        This method returns a list of dictionaries containing symbol information
-        including price, volume, turnover, and other market metrics.
-        
-        OPTIMIZED: Now uses parallel fetching to reduce latency from 30s to 2-3s
-        
+    async def get_top_symbols(self, limit: int = 10, snapshot: Optional[MarketSnapshot] = None) -> List[Dict[str, Any]]:
+        """Get top symbols with their price, change, volume and turnover.
+
+        Ranking only needs ticker fields, so the tickers of all ranked symbols
+        are refreshed with one bulk request through the refresh planner
+        instead of loading full market data per symbol.
+
         Args:
             limit: Maximum number of symbols to return
-            
+            snapshot: Optional per-cycle snapshot; fetched tickers are stored
+                in it so later consumers in the cycle reuse them
+
         Returns:
             List of dictionaries with symbol market data
         """
         try:
-            self.logger.info(f"Getting top {limit} symbols with market data (PARALLEL MODE)")
-            
-            # Get the symbol strings first
             symbols = await self.get_symbols(limit=limit)
             if not symbols:
                 self.logger.warning("No symbols available from get_symbols")
                 return []
-            
-            # OPTIMIZATION: Fetch all market data in parallel instead of sequentially
-            self.logger.info(f"Starting parallel fetch for {len(symbols)} symbols")
+
             start_time = time.time()
-            
-            # Create tasks for parallel execution
-            tasks = []
-            for symbol in symbols:
-                # Create a task for each symbol fetch with the symbol parameter
-                task = create_tracked_task(
-                    self.get_market_data(symbol),
-                    name=f"get_market_data_{symbol}"
-                )
-                tasks.append(task)
-            
-            # Wait for all tasks with a reasonable timeout
-            try:
-                # Use asyncio.gather for parallel execution with return_exceptions=True
-                # This ensures one failure doesn't cancel all other requests
-                results = await asyncio.wait_for(
-                    asyncio.gather(*tasks, return_exceptions=True),
-                    timeout=12.0  # Increased timeout to 12 seconds for all parallel fetches
-                )
-                
-                fetch_duration = time.time() - start_time
-                self.logger.info(f"✅ Parallel fetch completed in {fetch_duration:.2f}s for {len(symbols)} symbols")
-                
-            except asyncio.TimeoutError:
-                self.logger.error(f"⚠️ Timeout after 12s while fetching {len(symbols)} symbols in parallel")
-                # Still process whatever results we got
-                results = []
-                completed_count = 0
-                for task in tasks:
-                    if task.done() and not task.cancelled():
-                        try:
-                            result = task.result()
-                            results.append(result)
-                            if result is not None and not isinstance(result, Exception):
-                                completed_count += 1
-                        except Exception as e:
-                            results.append(e)
-                    else:
-                        task.cancel()  # Cancel remaining tasks
-                        results.append(None)
-                        
-                self.logger.warning(f"Partial results: {completed_count}/{len(symbols)} symbols completed before timeout")
-            
-            # Process results in parallel fetch order
-            symbols_data = []
-            successful_fetches = 0
-            failed_fetches = 0
-            
-            for symbol, result in zip(symbols, results):
-                try:
-                    # Check if we got valid market data
-                    if isinstance(result, Exception):
-                        self.logger.debug(f"Failed to fetch {symbol}: {result}")
-                        failed_fetches += 1
-                        continue
-                    
-                    if not result or not isinstance(result, dict):
-                        self.logger.debug(f"No data for {symbol}")
-                        failed_fetches += 1
-                        continue
-                    
-                    market_data = result
-                    
-                    if market_data:
-                        # Extract key metrics from the market data
-                        price = 0
-                        change_24h = 0
-                        volume_24h = 0
-                        turnover_24h = 0
-                        
-                        # Extract price from Bybit ticker data structure
-                        ticker = market_data.get('ticker', {})
-                        
-                        # Debug logging to see what's in the data
-                        self.logger.debug(f"Market data for {symbol}: keys={list(market_data.keys())}")
-                        if 'price' in market_data:
-                            self.logger.debug(f"Price data for {symbol}: {market_data['price']}")
-                        if ticker:
-                            self.logger.debug(f"Ticker data for {symbol}: keys={list(ticker.keys())}, last_price={ticker.get('last_price')}")
-                        
-                        # Try to get price from the price object first
-                        if 'price' in market_data and isinstance(market_data['price'], dict):
-                            if 'last' in market_data['price'] and market_data['price']['last']:
-                                price = float(market_data['price']['last'])
-                        
-                        # If not found, try multiple fields for current price
-                        if price == 0:
-                            if 'last_price' in ticker and ticker['last_price']:
-                                price = float(ticker['last_price'])
-                            elif 'last' in ticker and ticker['last']:
-                                price = float(ticker['last'])
-                            elif 'lastPrice' in ticker and ticker['lastPrice']:
-                                price = float(ticker['lastPrice'])
-                            elif 'close' in ticker and ticker['close']:
-                                price = float(ticker['close'])
-                            elif 'last' in market_data and market_data['last']:
-                                price = float(market_data['last'])
-                            elif 'lastPrice' in market_data and market_data['lastPrice']:
-                                price = float(market_data['lastPrice'])
-                        
-                        # Try to get change from the price object first
-                        if 'price' in market_data and isinstance(market_data['price'], dict):
-                            if 'change_24h' in market_data['price'] and market_data['price']['change_24h']:
-                                # Calculate percentage from absolute change
-                                if price > 0:
-                                    change_24h = (float(market_data['price']['change_24h']) / (price - float(market_data['price']['change_24h']))) * 100
-                        
-                        # If not found, try multiple fields for 24h percentage change
-                        if change_24h == 0:
-                            if 'percentage' in ticker and ticker['percentage']:
-                                change_24h = float(ticker['percentage'])
-                            elif 'price24hPcnt' in ticker and ticker['price24hPcnt']:
-                                change_24h = float(ticker['price24hPcnt']) * 100
-                            elif 'price24hPcnt' in market_data and market_data['price24hPcnt']:
-                                change_24h = float(market_data['price24hPcnt']) * 100
-                            elif 'change' in ticker and ticker['change']:
-                                change_24h = float(ticker['change'])
-                        
-                        # Try to get volume from the price object first
-                        if 'price' in market_data and isinstance(market_data['price'], dict):
-                            if 'volume' in market_data['price'] and market_data['price']['volume']:
-                                volume_24h = float(market_data['price']['volume'])
-                        
-                        # If not found, try multiple fields for 24h volume
-                        if volume_24h == 0:
-                            if 'volume_24h' in ticker and ticker['volume_24h']:
-                                volume_24h = float(ticker['volume_24h'])
-                            elif 'baseVolume' in ticker and ticker['baseVolume']:
-                                volume_24h = float(ticker['baseVolume'])
-                            elif 'volume24h' in ticker and ticker['volume24h']:
-                                volume_24h = float(ticker['volume24h'])
-                            elif 'volume24h' in market_data and market_data['volume24h']:
-                                volume_24h = float(market_data['volume24h'])
-                            elif 'volume' in ticker and ticker['volume']:
-                                volume_24h = float(ticker['volume'])
-                        
-                        # Try to get turnover from the price object first
-                        if 'price' in market_data and isinstance(market_data['price'], dict):
-                            if 'turnover' in market_data['price'] and market_data['price']['turnover']:
-                                turnover_24h = float(market_data['price']['turnover'])
-                        
-                        # If not found, try multiple fields for 24h turnover
-                        if turnover_24h == 0:
-                            if 'quoteVolume' in ticker and ticker['quoteVolume']:
-                                turnover_24h = float(ticker['quoteVolume'])
-                            elif 'turnover24h' in ticker and ticker['turnover24h']:
-                                turnover_24h = float(ticker['turnover24h'])
-                            elif 'turnover24h' in market_data and market_data['turnover24h']:
-                                turnover_24h = float(market_data['turnover24h'])
-                            elif 'turnover' in ticker and ticker['turnover']:
-                                turnover_24h = float(ticker['turnover'])
-                        
-                        symbols_data.append({
-                            'symbol': symbol,
-                            'price': price,
-                            'change_24h': change_24h,
-                            'volume_24h': volume_24h,
-                            'turnover_24h': turnover_24h,
-                            'status': 'active'
-                        })
-                        
-                        self.logger.debug(f"Added market data for {symbol}: price={price}, change={change_24h}%")
-                        successful_fetches += 1
-                        
-                    else:
-                        # Add symbol with minimal data if market data fails
-                        self.logger.warning(f"No market data available for {symbol}, adding with default values")
-                        symbols_data.append({
-                            'symbol': symbol,
-                            'price': 0,
-                            'change_24h': 0,
-                            'volume_24h': 0,
-                            'turnover_24h': 0,
-                            'status': 'no_data'
-                        })
-                        failed_fetches += 1
-                        
-                except Exception as e:
-                    self.logger.error(f"Error processing market data for {symbol}: {str(e)}")
-                    # Add symbol with error status
-                    symbols_data.append({
-                        'symbol': symbol,
-                        'price': 0,
-                        'change_24h': 0,
-                        'volume_24h': 0,
-                        'turnover_24h': 0,
-                        'status': 'error'
-                    })
-                    failed_fetches += 1
-            
+            tickers = await self._fetch_ranking_tickers(symbols)
+            if snapshot is not None:
+                snapshot.put_many('ticker', tickers)
+
+            symbols_data = [self._ticker_summary(symbol, tickers.get(symbol)) for symbol in symbols]
             # Sort by turnover (highest first) to maintain consistency with selection criteria
             symbols_data.sort(key=lambda x: x['turnover_24h'], reverse=True)
-            
-            # Log performance summary for parallel fetching
-            total_duration = time.time() - start_time
-            self.logger.info(f"📊 Parallel fetch complete: {successful_fetches}/{len(symbols)} successful, "
-                           f"{failed_fetches} failed, total time: {total_duration:.2f}s "
-                           f"(avg {total_duration/max(len(symbols), 1):.3f}s per symbol)")
-            
-            self.logger.info(f"Successfully retrieved market data for {len(symbols_data)} symbols")
+
+            self.logger.info(
+                f"📊 Ranked {len(symbols_data)} symbols from {len(tickers)} tickers "
+                f"in {time.time() - start_time:.2f}s"
+            )
             return symbols_data[:limit]
-            
+
         except Exception as e:
             self.logger.error(f"Error getting top symbols with market data: {str(e)}")
             self.logger.debug(traceback.format_exc())
             return []
 
+    async def _fetch_ranking_tickers(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Tickers for ``symbols``, collected into one bulk request by the refresh planner."""
+        planner = get_refresh_planner(self.exchange_manager)
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(*[planner.fetch_ticker(symbol) for symbol in symbols], return_exceptions=True),
+                timeout=12.0
+            )
+        except asyncio.TimeoutError:
+            self.logger.error(f"⚠️ Timeout after 12s while fetching tickers for {len(symbols)} symbols")
+            return {}
+
+        tickers = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                self.logger.debug(f"Failed to fetch ticker for {symbol}: {result}")
+            elif isinstance(result, dict) and result:
+                tickers[symbol] = result
+        return tickers
+
+    @staticmethod
+    def _ticker_summary(symbol: str, ticker: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Ranking row for one symbol from its unified ticker."""
+        if not ticker:
+            return {
+                'symbol': symbol,
+                'price': 0,
+                'change_24h': 0,
+                'volume_24h': 0,
+                'turnover_24h': 0,
+                'status': 'no_data'
+            }
+
+        def _first(*keys: str) -> float:
+            for key in keys:
+                try:
+                    value = float(ticker.get(key) or 0)
+                except (TypeError, ValueError):
+                    continue
+                if value:
+                    return value
+            return 0.0
+
+        change_24h = _first('percentage')
+        if not change_24h and ticker.get('price24hPcnt'):
+            change_24h = _first('price24hPcnt') * 100
+
+        return {
+            'symbol': symbol,
+            'price': _first('last', 'last_price', 'lastPrice', 'close'),
+            'change_24h': change_24h,
+            'volume_24h': _first('baseVolume', 'volume_24h', 'volume24h', 'volume'),
+            'turnover_24h': _first('quoteVolume', 'turnover24h', 'turnover'),
+            'status': 'active'
+        }
+
 
 # SIMPLE OVERRIDE - Place this at the END of top_symbols.py
 
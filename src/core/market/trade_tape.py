@@ -0,0 +1,279 @@
+"""
+Columnar per-symbol trade tape for WebSocket public trades.
+
+Replaces the list-of-dicts cache in ``MarketDataManager._update_trades_from_ws``
+which rebuilt an ID set over up to 1000 trades and re-concatenated the list on
+every message. The tape stores trades in preallocated NumPy columns
+(price/size/side/timestamp) with a rolling ID filter, so appends and
+de-duplication are amortized O(1).
+
+Retention is bounded by count (``capacity``) and optionally by age
+(``max_age_ms``). Consumers such as stacked imbalance, whale detection and CVD
+read oldest-to-newest array views; ``to_records()`` materializes the legacy
+newest-first list of trade dicts for existing callers.
+"""
+
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SIDE_BUY = 1
+SIDE_SELL = -1
+SIDE_UNKNOWN = 0
+
+_SIDE_CODES = {'buy': SIDE_BUY, 'sell': SIDE_SELL}
+_SIDE_NAMES = {SIDE_BUY: 'buy', SIDE_SELL: 'sell', SIDE_UNKNOWN: ''}
+
+
+def encode_side(side: Any) -> int:
+    """Map an exchange side string ('Buy', 'sell', ...) to the tape's int8 code."""
+    if isinstance(side, str):
+        return _SIDE_CODES.get(side.lower(), SIDE_UNKNOWN)
+    return SIDE_UNKNOWN
+
+
+class TradeTape:
+    """Fixed-capacity columnar trade buffer for a single symbol.
+
+    Rows are kept oldest-to-newest in a contiguous ``[start, end)`` window of
+    arrays sized at twice the capacity, so every column read is a slice.
+    """
+
+    def __init__(self, symbol: str, capacity: int = 1000, max_age_ms: Optional[int] = None):
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.symbol = symbol
+        self.capacity = capacity
+        self.max_age_ms = max_age_ms
+        self._allocate()
+        # Rolling ID filter - ids leave the set as their trades are evicted
+        self._ids: Deque[str] = deque()
+        self._id_set: Set[str] = set()
+        self.version = 0
+        self._records_cache = None
+        self.stats = {
+            'appended': 0,
+            'duplicates': 0,
+            'out_of_order': 0,
+            'evicted': 0
+        }
+
+    @classmethod
+    def from_columns(cls, symbol: str, prices: np.ndarray, sizes: np.ndarray, sides: np.ndarray,
+                     timestamps: np.ndarray, trade_ids: Optional[List[Optional[str]]] = None,
+                     capacity: Optional[int] = None, appended: Optional[int] = None) -> 'TradeTape':
+        """Build a tape from oldest-first column arrays (e.g. shipped to a worker process).
+
+        ``appended`` carries over the source tape's append counter, so
+        consumers that use it as a read cursor keep working on the copy.
+        """
+        count = len(prices)
+        tape = cls(symbol, capacity=max(capacity or count, 1))
+        count = min(count, tape.capacity)
+        start = len(prices) - count
+        tape._price[:count] = prices[start:]
+        tape._size[:count] = sizes[start:]
+        tape._side[:count] = sides[start:]
+        tape._ts[:count] = timestamps[start:]
+        tape._end = count
+        ids = list(trade_ids[start:]) if trade_ids else [None] * count
+        tape._ids.extend(ids)
+        tape._id_set.update(trade_id for trade_id in ids if trade_id is not None)
+        tape.stats['appended'] = count if appended is None else int(appended)
+        tape.version = 1 if count else 0
+        return tape
+
+    def _allocate(self) -> None:
+        size = self.capacity * 2
+        self._price = np.zeros(size, dtype=np.float64)
+        self._size = np.zeros(size, dtype=np.float64)
+        self._side = np.zeros(size, dtype=np.int8)
+        self._ts = np.zeros(size, dtype=np.int64)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __contains__(self, trade_id: str) -> bool:
+        return trade_id in self._id_set
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self._price[self._start:self._end]
+
+    @property
+    def sizes(self) -> np.ndarray:
+        return self._size[self._start:self._end]
+
+    @property
+    def sides(self) -> np.ndarray:
+        """Side codes: 1 buy, -1 sell, 0 unknown."""
+        return self._side[self._start:self._end]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Trade times in epoch milliseconds."""
+        return self._ts[self._start:self._end]
+
+    @property
+    def ids(self) -> List[Optional[str]]:
+        """Trade ids (oldest first), None where the exchange sent none."""
+        return list(self._ids)
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        if self._end == self._start:
+            return None
+        return int(self._ts[self._end - 1])
+
+    def columns(self, since_ms: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Column views (oldest first), optionally limited to trades at/after ``since_ms``."""
+        start = self._start
+        if since_ms is not None:
+            start += int(np.searchsorted(self.timestamps, since_ms, side='left'))
+        return {
+            'price': self._price[start:self._end],
+            'size': self._size[start:self._end],
+            'side': self._side[start:self._end],
+            'timestamp': self._ts[start:self._end]
+        }
+
+    def append(self, trade_id: Optional[str], price: float, size: float,
+               side: int, timestamp: int) -> bool:
+        """Append one trade, skipping ids already on the tape.
+
+        Timestamps must be non-decreasing; a trade older than the newest one on
+        the tape is dropped so the time-ordered views stay sorted.
+
+        Returns:
+            True if the trade was added, False if it was a duplicate or out of order.
+        """
+        if trade_id is not None and trade_id in self._id_set:
+            self.stats['duplicates'] += 1
+            return False
+        if self._end > self._start and timestamp < self._ts[self._end - 1]:
+            self.stats['out_of_order'] += 1
+            return False
+
+        if self._end == len(self._ts):
+            self._compact()
+
+        idx = self._end
+        self._price[idx] = price
+        self._size[idx] = size
+        self._side[idx] = side
+        self._ts[idx] = timestamp
+        self._end += 1
+        # Keep the id deque aligned with rows so eviction pops the matching id
+        self._ids.append(trade_id)
+        if trade_id is not None:
+            self._id_set.add(trade_id)
+
+        if self._end - self._start > self.capacity:
+            self._evict(1)
+        if self.max_age_ms is not None:
+            self._expire(timestamp - self.max_age_ms)
+
+        self.version += 1
+        self.stats['appended'] += 1
+        return True
+
+    def extend(self, trades: Iterable[Dict[str, Any]]) -> int:
+        """Append trades given as dicts (REST/ccxt or legacy cache layout).
+
+        Trades are ordered by timestamp first, since REST responses are
+        usually newest-first.
+
+        Returns:
+            Number of trades added
+        """
+        added = 0
+        for trade in sorted(trades, key=lambda t: int(t.get('timestamp') or 0)):
+            try:
+                trade_id = trade.get('id')
+                added += self.append(
+                    str(trade_id) if trade_id is not None else None,
+                    float(trade.get('price', 0)),
+                    float(trade.get('amount', trade.get('size', 0))),
+                    encode_side(trade.get('side')),
+                    int(trade.get('timestamp') or 0)
+                )
+            except (TypeError, ValueError, AttributeError):
+                continue
+        return added
+
+    def _evict(self, count: int) -> None:
+        for _ in range(count):
+            trade_id = self._ids.popleft()
+            if trade_id is not None:
+                self._id_set.discard(trade_id)
+        self._start += count
+        self.stats['evicted'] += count
+
+    def _expire(self, cutoff_ms: int) -> None:
+        """Evict trades older than ``cutoff_ms`` from the head of the tape."""
+        if self._end == self._start or self._ts[self._start] >= cutoff_ms:
+            return
+        expired = int(np.searchsorted(self.timestamps, cutoff_ms, side='left'))
+        if expired:
+            self._evict(expired)
+
+    def _compact(self) -> None:
+        count = len(self)
+        price, size = self.prices.copy(), self.sizes.copy()
+        side, ts = self.sides.copy(), self.timestamps.copy()
+        self._allocate()
+        self._price[:count] = price
+        self._size[:count] = size
+        self._side[:count] = side
+        self._ts[:count] = ts
+        self._end = count
+
+    def buy_sell_volume(self, since_ms: Optional[int] = None) -> Dict[str, float]:
+        """Aggregate taker buy/sell volume over the tape (or since ``since_ms``)."""
+        cols = self.columns(since_ms)
+        sizes, sides = cols['size'], cols['side']
+        return {
+            'buy_volume': float(sizes[sides == SIDE_BUY].sum()),
+            'sell_volume': float(sizes[sides == SIDE_SELL].sum())
+        }
+
+    def cvd(self, since_ms: Optional[int] = None) -> np.ndarray:
+        """Cumulative volume delta series (oldest first)."""
+        cols = self.columns(since_ms)
+        return np.cumsum(cols['size'] * cols['side'])
+
+    def to_records(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Materialize trades as the legacy newest-first list of dicts.
+
+        Cached until the next append.
+        """
+        cached = self._records_cache
+        if cached is not None and cached[0] == self.version and cached[1] == limit:
+            return cached[2]
+
+        count = len(self) if limit is None else min(limit, len(self))
+        ids = list(self._ids)
+        records = []
+        for offset in range(1, count + 1):
+            idx = self._end - offset
+            price = float(self._price[idx])
+            amount = float(self._size[idx])
+            records.append({
+                'price': price,
+                'amount': amount,
+                'cost': price * amount,
+                'side': _SIDE_NAMES[int(self._side[idx])],
+                'timestamp': int(self._ts[idx]),
+                'datetime': None,
+                'id': ids[-offset],
+                'symbol': self.symbol,
+                'taker_or_maker': 'taker'
+            })
+        self._records_cache = (self.version, limit, records)
+        return records
@@ -79,7 +79,6 @@ def silence_matplotlib_logs():
 import matplotlib.dates as mdates
 import numpy as np
 import pandas as pd
-from jinja2 import Environment, FileSystemLoader
 from weasyprint import HTML
 from fpdf import FPDF
 import mplfinance as mpf
@@ -99,6 +98,9 @@ def silence_matplotlib_logs():
 from matplotlib.dates import MinuteLocator, DateFormatter
 from matplotlib.dates import AutoDateLocator
 
+from src.core.chart.render_service import RendererSpec, chart_cache_key, get_chart_render_service
+from src.core.reporting.report_pipeline import ReportTimer, get_report_pipeline, template_environment
+
 # Set matplotlib style for dark mode
 plt.style.use("dark_background")
 
@@ -434,11 +436,15 @@ def __init__(
                 )
                 self.template_dir = os.getcwd()
 
-        # Initialize Jinja environment
-        self.env = Environment(loader=FileSystemLoader(self.template_dir))
+        # Jinja environment shared by all generators using this template directory
+        self.env = template_environment(self.template_dir)
 
         # Add custom filters
         self.env.filters["format_number"] = self._format_number
+        self.env.filters["format_with_commas"] = self._format_with_commas
+
+        # Stage timings, section cache and PDF worker shared across reports
+        self.pipeline = get_report_pipeline(self.config)
 
         # Set up matplotlib styling for dark mode
         plt.rcParams.update(
@@ -490,6 +496,8 @@ async def generate_report(
         report_id = str(uuid.uuid4())[:8]
         symbol = signal_data.get('symbol', 'UNKNOWN')
         start_time = time.time()
+        timer = ReportTimer(report_id)
+        timer.stage("collect")
         
         # Validate input data
         try:
@@ -501,6 +509,10 @@ async def generate_report(
         except DataValidationError as e:
             self._log(f"[PDF_GEN:{report_id}] Data validation failed: {str(e)}", level=logging.ERROR)
             return False
+
+        # Render the report charts in parallel off the event loop
+        timer.stage("charts")
+        charts = await self._prerender_trading_charts(signal_data, ohlcv_data, output_path)
         
         # Retry logic with exponential backoff
         for attempt in range(self._max_retries):
@@ -518,11 +530,28 @@ async def generate_report(
                     except OSError as e:
                         raise FileOperationError(f"Failed to create output directory: {str(e)}")
                     
-                pdf_path, json_path, chart_path = self.generate_trading_report(
+                timer.stage("template")
+                pdf_jobs = []
+                # Every image was rendered above, so the template stage never touches
+                # pyplot and can run in a worker thread
+                pdf_path, json_path, chart_path = await asyncio.to_thread(
+                    self.generate_trading_report,
                     signal_data=signal_data,
                     ohlcv_data=ohlcv_data,
                     output_dir=output_path,
+                    candlestick_chart=charts.get("candlestick"),
+                    component_chart=charts.get("component"),
+                    confluence_analysis_image=charts.get("confluence_analysis"),
+                    deferred_pdf=pdf_jobs,
+                    confluence_radar=charts.get("confluence_radar"),
+                    inline_charts=False,
                 )
+
+                # Convert to PDF in the PDF worker while the event loop keeps running
+                if pdf_path and pdf_jobs:
+                    timer.stage("pdf")
+                    if not await self._write_report_pdf_async(*pdf_jobs[0]):
+                        pdf_path = None
                 
                 # Debug output the actual paths
                 self._log(f"[PDF_GEN:{report_id}] generate_trading_report returned - PDF path: {pdf_path}, JSON path: {json_path}", level=logging.INFO)
@@ -530,6 +559,7 @@ async def generate_report(
                 if pdf_path:
                     # Validate the generated PDF
                     try:
+                        timer.stage("validate")
                         validated_path = self._validate_and_process_pdf(pdf_path, signal_data, report_id)
                         
                         # Calculate processing time
@@ -540,6 +570,7 @@ async def generate_report(
                             f"(attempt: {attempt_time:.2f}s, total: {processing_time:.2f}s)",
                             level=logging.INFO
                         )
+                        self.pipeline.record("trading_report", timer)
 
                         # Clear the cache after successful generation
                         self._clear_downsample_cache()
@@ -595,6 +626,7 @@ async def generate_report(
             if attempt < self._max_retries - 1:
                 delay = self._retry_delay * (2 ** attempt if self._exponential_backoff else 1)
                 self._log(f"[PDF_GEN:{report_id}] Retrying in {delay:.1f}s...", level=logging.INFO)
+                timer.stage("retry_wait")
                 await asyncio.sleep(delay)
         
         # All retries failed
@@ -603,6 +635,7 @@ async def generate_report(
             f"[PDF_GEN:{report_id}] ❌ PDF generation failed after {self._max_retries} attempts in {total_time:.2f}s for {symbol}",
             level=logging.ERROR
         )
+        self.pipeline.record("trading_report_failed", timer)
         
         # Clear the cache even if we had an error
         self._clear_downsample_cache()
@@ -2222,6 +2255,313 @@ def _prepare_for_json(self, obj: Any, visited: Optional[set] = None) -> Any:
             if isinstance(obj, (dict, list)) and obj_id in visited:
                 visited.discard(obj_id)
 
+    def render_spec(self) -> RendererSpec:
+        """How chart render workers build their own copy of this generator."""
+        if getattr(self, '_render_spec', None) is None:
+            self._render_spec = RendererSpec(f"{__name__}:ReportGenerator", (self.config,))
+        return self._render_spec
+
+    async def render_chart_async(self, method: str, cache_key: Optional[Any] = None, **kwargs) -> Optional[str]:
+        """
+        Run one of the chart methods in the shared chart render service.
+
+        Args:
+            method: Chart method name, e.g. "_create_candlestick_chart"
+            cache_key: Key from ``chart_cache_key``; None renders every time
+            **kwargs: Arguments of the chart method
+
+        Returns:
+            Path of the chart, or None if it could not be rendered
+        """
+        try:
+            service = get_chart_render_service(self.config)
+            return await service.render(self.render_spec(), method, kwargs, cache_key=cache_key, local=self)
+        except Exception as e:
+            self._log(f"Chart render service failed for {method}: {str(e)}", logging.WARNING)
+            return None
+
+    async def _render_candlestick_async(
+        self, signal_data: Dict[str, Any], ohlcv_data: pd.DataFrame, output_path: Optional[str] = None
+    ) -> Optional[str]:
+        """Render the candlestick chart ``generate_trading_report`` would draw for a signal."""
+        entry_price, stop_loss, targets = self._resolve_chart_levels(signal_data)
+        chart_dir = self._chart_dir(output_path)
+        symbol = signal_data.get("symbol", "UNKNOWN")
+        return await self.render_chart_async(
+            "_create_candlestick_chart",
+            cache_key=chart_cache_key(
+                symbol, ohlcv_data, signal_data.get("timeframe"),
+                entry_price=entry_price, stop_loss=stop_loss, targets=targets, chart_mode="light"
+            ),
+            symbol=symbol,
+            ohlcv_data=ohlcv_data,
+            entry_price=entry_price,
+            stop_loss=stop_loss,
+            targets=targets,
+            output_dir=chart_dir,
+            chart_mode="light",
+        )
+
+    async def _prerender_trading_charts(
+        self, signal_data: Dict[str, Any], ohlcv_data: Optional[pd.DataFrame], output_path: Optional[str] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        Render the images of a trading report in parallel in the chart render service.
+
+        Returns:
+            Paths by image ("candlestick", "component", "confluence_radar",
+            "confluence_analysis"); None for images that could not be rendered
+        """
+        chart_dir = self._chart_dir(output_path)
+        symbol = signal_data.get("symbol", "UNKNOWN")
+        jobs = {}
+        if ohlcv_data is not None and not ohlcv_data.empty:
+            jobs["candlestick"] = self._render_candlestick_async(signal_data, ohlcv_data, output_path)
+
+        elif signal_data.get("trade_params"):
+            jobs["candlestick"] = self._render_simulated_async(signal_data, chart_dir)
+
+        components = self._collect_components(signal_data)
+        if components and isinstance(components, dict):
+            jobs["component"] = self.render_chart_async(
+                "_create_component_chart", components=components, output_dir=chart_dir
+            )
+            component_scores, overall_score = self._confluence_scores(components, signal_data)
+            jobs["confluence_radar"] = self.render_chart_async(
+                "_create_confluence_radar",
+                component_scores=component_scores,
+                overall_score=overall_score,
+                symbol=symbol,
+            )
+
+        confluence_text = self._confluence_text(signal_data)
+        if confluence_text:
+            jobs["confluence_analysis"] = self.render_chart_async(
+                "_create_confluence_image",
+                confluence_text=confluence_text,
+                output_dir=chart_dir,
+                symbol=symbol,
+                timestamp=signal_data.get("timestamp", datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+                signal_type=signal_data.get("signal_type", "UNKNOWN"),
+            )
+
+        charts = dict(zip(jobs, await asyncio.gather(*jobs.values())))
+
+        # Same fallback as generate_trading_report: a simulated chart when the real one failed
+        if ohlcv_data is not None and not ohlcv_data.empty and not charts["candlestick"] \
+                and signal_data.get("trade_params"):
+            charts["candlestick"] = await self._render_simulated_async(signal_data, chart_dir, from_ohlcv=True)
+        return charts
+
+    async def _render_simulated_async(
+        self, signal_data: Dict[str, Any], chart_dir: str, from_ohlcv: bool = False
+    ) -> Optional[str]:
+        """Render the simulated chart ``generate_trading_report`` would draw for a signal."""
+        price = signal_data.get("price", 0)
+        if from_ohlcv:
+            entry_price, stop_loss, targets = self._resolve_chart_levels(signal_data)
+            entry_price = entry_price or price
+        else:
+            trade_params = signal_data.get("trade_params", {})
+            entry_price = trade_params.get("entry_price", price)
+            stop_loss = trade_params.get("stop_loss", None)
+            targets = trade_params.get("targets", None)
+        return await self.render_chart_async(
+            "_create_simulated_chart",
+            symbol=signal_data.get("symbol", "UNKNOWN"),
+            entry_price=entry_price,
+            stop_loss=stop_loss,
+            targets=targets,
+            output_dir=chart_dir,
+            chart_mode="light",
+        )
+
+    @staticmethod
+    def _chart_dir(output_path: Optional[str]) -> str:
+        """Directory for the charts of a report written to ``output_path``."""
+        if output_path and output_path.lower().endswith('.pdf'):
+            return os.path.dirname(output_path)
+        return output_path or os.path.join(os.getcwd(), 'reports', 'pdf')
+
+    @staticmethod
+    def _collect_components(signal_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Components of a signal, with ``analysis_components`` merged in."""
+        # Get components from either 'components' or 'analysis_components'
+        components = signal_data.get("components", {})
+        analysis_components = signal_data.get("analysis_components", {})
+
+        # Merge analysis_components into components if they exist
+        if analysis_components and isinstance(analysis_components, dict):
+            # If components is empty, use analysis_components directly
+            if not components:
+                components = analysis_components
+            else:
+                # Merge analysis_components into components
+                for key, value in analysis_components.items():
+                    if key not in components:
+                        components[key] = value
+        return components
+
+    @staticmethod
+    def _confluence_text(signal_data: Dict[str, Any]) -> Optional[str]:
+        """Confluence analysis text of a signal, if any."""
+        confluence_text = signal_data.get("confluence_analysis", None)
+        if not confluence_text:
+            # Fallbacks to maintain confluence narrative in PDFs
+            if isinstance(signal_data.get("breakdown"), dict):
+                confluence_text = signal_data.get("breakdown", {}).get("formatted_analysis")
+            if not confluence_text:
+                confluence_text = signal_data.get("formatted_analysis")
+        return confluence_text if isinstance(confluence_text, str) else None
+
+    @staticmethod
+    def _confluence_scores(components: Dict[str, Any], signal_data: Dict[str, Any]) -> Tuple[Dict[str, float], Any]:
+        """Component scores and overall score shown on the confluence radar."""
+        component_scores = {}
+        component_keys = {
+            "technical": "Technical",
+            "volume": "Volume",
+            "orderbook": "Orderbook",
+            "orderflow": "Orderflow",
+            "sentiment": "Sentiment",
+            "price_structure": "Price Structure",
+            "range_analysis": "Range Analysis",
+        }
+
+        for key, display_name in component_keys.items():
+            comp_value = components.get(key, {})
+
+            # Handle different data types for component values
+            if isinstance(comp_value, dict):
+                score = comp_value.get("score", 50)
+            elif isinstance(comp_value, (int, float)):
+                score = float(comp_value)
+            elif hasattr(comp_value, "item") and callable(getattr(comp_value, "item")):
+                # Handle numpy values
+                score = float(comp_value.item())
+            else:
+                score = 50  # Default value
+
+            component_scores[display_name] = score
+
+        return component_scores, signal_data.get("score", 50)
+
+    def _create_confluence_radar(
+        self, component_scores: Dict[str, float], overall_score: Any, symbol: str = "UNKNOWN"
+    ) -> Optional[str]:
+        """
+        Save the confluence radar and its 3D companion page.
+
+        Returns:
+            Path of the radar PNG (the 3D page sits next to it as ``*_3d.html``),
+            or None on error
+        """
+        try:
+            from src.monitoring.visualizers.confluence_visualizer import ConfluenceVisualizer
+
+            radar_path, threed_path = ConfluenceVisualizer().save_visualizations(
+                component_scores=component_scores,
+                overall_score=overall_score,
+                symbol=symbol,
+                timestamp=datetime.now().strftime("%Y%m%d_%H%M%S"),
+            )
+            self._log(f"Created confluence visualization and 3D chart at: {threed_path}")
+            return radar_path
+        except Exception as e:
+            self._log(f"Error creating confluence visualization: {str(e)}", level=logging.ERROR)
+            return None
+
+    def _write_report_pdf(self, html_content: str, pdf_path: str, html_path: str) -> None:
+        """Convert a rendered report to PDF: Chrome Headless, else WeasyPrint."""
+        # Try Chrome Headless first (full CSS support: gradients, shadows, etc.)
+        # Falls back to WeasyPrint if Chrome is unavailable
+        chrome_success = self._render_pdf_with_chrome(html_content, pdf_path, html_path)
+
+        if not chrome_success:
+            self._log("Falling back to WeasyPrint for PDF generation", logging.INFO)
+            HTML(string=html_content).write_pdf(pdf_path)
+
+    async def _write_report_pdf_async(self, html_content: str, pdf_path: str, html_path: str) -> bool:
+        """``_write_report_pdf`` off the event loop: Chrome on a thread, WeasyPrint in the PDF worker."""
+        try:
+            if await asyncio.to_thread(self._render_pdf_with_chrome, html_content, pdf_path, html_path):
+                return True
+            self._log("Falling back to WeasyPrint for PDF generation", logging.INFO)
+            if await self.pipeline.render_pdf(html_content, pdf_path):
+                return True
+            self._log(f"Error generating PDF: WeasyPrint could not render {pdf_path}", logging.ERROR)
+        except Exception as e:
+            self._log(f"Error generating PDF: {str(e)}", logging.ERROR)
+        return False
+
+    def _resolve_chart_levels(
+        self, signal_data: Dict[str, Any]
+    ) -> Tuple[Optional[float], Optional[float], Optional[List[Dict]]]:
+        """
+        Entry, stop loss and targets drawn on the candlestick chart of a signal.
+
+        Missing stop losses come from the StopLossCalculator and missing targets
+        from ``_generate_default_targets``.
+        """
+        trade_params = signal_data.get("trade_params", {})
+        entry_price = (
+            trade_params.get("entry_price", None)
+            or signal_data.get("entry_price", None)
+            or signal_data.get("price", None)
+        )
+        stop_loss = trade_params.get("stop_loss", None) or signal_data.get("stop_loss", None)
+
+        # Calculate stop loss if missing using StopLossCalculator
+        sig_type = (signal_data.get("signal_type", "NEUTRAL") or "NEUTRAL").upper()
+        if stop_loss is None and entry_price:
+            try:
+                from src.core.risk.stop_loss_calculator import get_stop_loss_calculator, StopLossMethod
+
+                # Get configuration for calculator
+                config = self.config if hasattr(self, 'config') else {}
+
+                # Initialize stop loss calculator if not already done
+                try:
+                    stop_calc = get_stop_loss_calculator()
+                except ValueError:
+                    # First initialization
+                    stop_calc = get_stop_loss_calculator(config)
+
+                # Calculate stop loss using confidence-based method
+                confluence_score = signal_data.get("confluence_score", signal_data.get("score", 50))
+
+                if sig_type in ["LONG", "SHORT"]:
+                    stop_loss = stop_calc.calculate_stop_loss_price(
+                        entry_price=entry_price,
+                        signal_type=sig_type,
+                        confluence_score=confluence_score,
+                        method=StopLossMethod.CONFIDENCE_BASED
+                    )
+                    self._log(f"Chart: Calculated stop loss using StopLossCalculator: {sig_type} @ {entry_price:.6f} → {stop_loss:.6f}", logging.INFO)
+                else:
+                    # Fallback for NEUTRAL or invalid signal types
+                    self._log(f"Chart: Signal type {sig_type} not supported for stop loss calculation, using default 3%", logging.WARNING)
+                    stop_loss = entry_price * 0.97  # Default 3% for neutral
+            except Exception as calc_error:
+                # Fallback if calculator fails
+                self._log(f"Chart: StopLossCalculator failed, using simple fallback: {calc_error}", logging.WARNING)
+                if sig_type in ["BUY", "LONG", "BULLISH"]:
+                    stop_loss = entry_price * 0.97  # ~3% risk
+                elif sig_type in ["SELL", "SHORT", "BEARISH"]:
+                    stop_loss = entry_price * 1.03
+        targets = trade_params.get("targets", None) or signal_data.get("targets", None)
+
+        # Ensure targets are always available - generate defaults if none provided
+        if not targets and entry_price:
+            signal_type = signal_data.get("signal_type", "BULLISH")
+            targets = self._generate_default_targets(
+                entry_price=entry_price,
+                stop_loss=stop_loss,
+                signal_type=signal_type
+            )
+            self._log(f"Generated {len(targets)} default targets for report generation", logging.INFO)
+        return entry_price, stop_loss, targets
+
     def _add_watermark_to_template(
         self, html_content: str, watermark_text: str = "VIRTUOSO CRYPTO"
     ) -> str:
@@ -2294,6 +2634,12 @@ def generate_trading_report(
         output_dir: Optional[str] = None,
         template_style: str = "horizontal",
         chart_mode: str = "light",
+        candlestick_chart: Optional[str] = None,
+        component_chart: Optional[str] = None,
+        confluence_analysis_image: Optional[str] = None,
+        deferred_pdf: Optional[List[Tuple[str, str, str]]] = None,
+        confluence_radar: Optional[str] = None,
+        inline_charts: bool = True,
     ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
         Generate a PDF trading report from the provided signal data.
@@ -2304,6 +2650,16 @@ def generate_trading_report(
             output_dir: Directory to save the report (defaults to a temporary directory)
             template_style: "vertical" (A4 portrait) or "horizontal" (A4 landscape)
             chart_mode: "dark" or "light" (warm amber background for charts)
+            candlestick_chart: Chart already rendered by the chart render service;
+                rendered inline when None
+            component_chart: Pre-rendered component chart, rendered inline when None
+            confluence_analysis_image: Pre-rendered confluence analysis image,
+                rendered inline when None
+            deferred_pdf: When given, the PDF is not written here; ``(html_content,
+                pdf_path, html_path)`` is appended for the caller to convert
+            confluence_radar: Pre-rendered confluence radar, rendered inline when None
+            inline_charts: Draw missing images here; False never touches pyplot,
+                so the report can be built off the event loop
 
         Returns:
             Tuple of (pdf_path, json_path, chart_path) or (None, None, None) if generation failed
@@ -2355,10 +2711,11 @@ def generate_trading_report(
             # Initialize context for template rendering
             context = {}
 
-            # Initialize image paths to None
-            candlestick_chart = None
-            component_chart = None
-            confluence_analysis_image = None
+            # Initialize image paths to None, dropping pre-rendered images that no longer exist
+            if component_chart and not os.path.exists(component_chart):
+                component_chart = None
+            if confluence_analysis_image and not os.path.exists(confluence_analysis_image):
+                confluence_analysis_image = None
             confluence_visualization = None
 
             # Extract basic signal data
@@ -2404,68 +2761,18 @@ def generate_trading_report(
             )
 
             # Create candlestick chart if OHLCV data is provided
+            if candlestick_chart and not os.path.exists(candlestick_chart):
+                candlestick_chart = None
             try:
-                if ohlcv_data is not None and not ohlcv_data.empty:
+                if candlestick_chart:
+                    self._log(f"Using pre-rendered candlestick chart: {candlestick_chart}")
+                elif not inline_charts:
+                    self._log("Candlestick chart was not pre-rendered, leaving it out", logging.DEBUG)
+                elif ohlcv_data is not None and not ohlcv_data.empty:
                     self._log("Creating candlestick chart from OHLCV data")
 
-                    # Get trade parameters if available
                     trade_params = signal_data.get("trade_params", {})
-                    entry_price = (
-                        trade_params.get("entry_price", None)
-                        or signal_data.get("entry_price", None)
-                        or signal_data.get("price", None)
-                    )
-                    stop_loss = trade_params.get("stop_loss", None) or signal_data.get("stop_loss", None)
-
-                    # Calculate stop loss if missing using StopLossCalculator
-                    sig_type = (signal_data.get("signal_type", "NEUTRAL") or "NEUTRAL").upper()
-                    if stop_loss is None and entry_price:
-                        try:
-                            from src.core.risk.stop_loss_calculator import get_stop_loss_calculator, StopLossMethod
-
-                            # Get configuration for calculator
-                            config = self.config if hasattr(self, 'config') else {}
-
-                            # Initialize stop loss calculator if not already done
-                            try:
-                                stop_calc = get_stop_loss_calculator()
-                            except ValueError:
-                                # First initialization
-                                stop_calc = get_stop_loss_calculator(config)
-
-                            # Calculate stop loss using confidence-based method
-                            confluence_score = signal_data.get("confluence_score", signal_data.get("score", 50))
-
-                            if sig_type in ["LONG", "SHORT"]:
-                                stop_loss = stop_calc.calculate_stop_loss_price(
-                                    entry_price=entry_price,
-                                    signal_type=sig_type,
-                                    confluence_score=confluence_score,
-                                    method=StopLossMethod.CONFIDENCE_BASED
-                                )
-                                self._log(f"Chart: Calculated stop loss using StopLossCalculator: {sig_type} @ {entry_price:.6f} → {stop_loss:.6f}", logging.INFO)
-                            else:
-                                # Fallback for NEUTRAL or invalid signal types
-                                self._log(f"Chart: Signal type {sig_type} not supported for stop loss calculation, using default 3%", logging.WARNING)
-                                stop_loss = entry_price * 0.97  # Default 3% for neutral
-                        except Exception as calc_error:
-                            # Fallback if calculator fails
-                            self._log(f"Chart: StopLossCalculator failed, using simple fallback: {calc_error}", logging.WARNING)
-                            if sig_type in ["BUY", "LONG", "BULLISH"]:
-                                stop_loss = entry_price * 0.97  # ~3% risk
-                            elif sig_type in ["SELL", "SHORT", "BEARISH"]:
-                                stop_loss = entry_price * 1.03
-                    targets = trade_params.get("targets", None) or signal_data.get("targets", None)
-                    
-                    # Ensure targets are always available - generate defaults if none provided
-                    if not targets and entry_price:
-                        signal_type = signal_data.get("signal_type", "BULLISH")
-                        targets = self._generate_default_targets(
-                            entry_price=entry_price,
-                            stop_loss=stop_loss,
-                            signal_type=signal_type
-                        )
-                        self._log(f"Generated {len(targets)} default targets for report generation", logging.INFO)
+                    entry_price, stop_loss, targets = self._resolve_chart_levels(signal_data)
 
                     # Create chart
                     candlestick_chart = self._create_candlestick_chart(
@@ -2517,20 +2824,7 @@ def generate_trading_report(
 
             # Create component chart image
             try:
-                # Get components from either 'components' or 'analysis_components'
-                components = signal_data.get("components", {})
-                analysis_components = signal_data.get("analysis_components", {})
-
-                # Merge analysis_components into components if they exist
-                if analysis_components and isinstance(analysis_components, dict):
-                    # If components is empty, use analysis_components directly
-                    if not components:
-                        components = analysis_components
-                    else:
-                        # Merge analysis_components into components
-                        for key, value in analysis_components.items():
-                            if key not in components:
-                                components[key] = value
+                components = self._collect_components(signal_data)
 
                 self._log(f"Components type: {type(components)}")
                 self._log(
@@ -2538,72 +2832,28 @@ def generate_trading_report(
                 )
 
                 if components and isinstance(components, dict):
-                    component_chart = self._create_component_chart(
-                        components, output_dir
-                    )
+                    if not component_chart and inline_charts:
+                        component_chart = self._create_component_chart(
+                            components, output_dir
+                        )
                     self._log(f"Component chart created: {component_chart is not None}")
 
                     # Add confluence visualization
                     try:
-                        from src.monitoring.visualizers.confluence_visualizer import (
-                            ConfluenceVisualizer,
-                        )
-
-                        # Extract component scores
-                        component_scores = {}
-                        component_keys = {
-                            "technical": "Technical",
-                            "volume": "Volume",
-                            "orderbook": "Orderbook",
-                            "orderflow": "Orderflow",
-                            "sentiment": "Sentiment",
-                            "price_structure": "Price Structure",
-                            "range_analysis": "Range Analysis",
-                        }
-
-                        for key, display_name in component_keys.items():
-                            comp_value = components.get(key, {})
-
-                            # Handle different data types for component values
-                            if isinstance(comp_value, dict):
-                                score = comp_value.get("score", 50)
-                            elif isinstance(comp_value, (int, float)):
-                                score = float(comp_value)
-                            elif hasattr(comp_value, "item") and callable(
-                                getattr(comp_value, "item")
-                            ):
-                                # Handle numpy values
-                                score = float(comp_value.item())
-                            else:
-                                score = 50  # Default value
-
-                            component_scores[display_name] = score
-
-                        overall_score = signal_data.get("score", 50)
-
-                        # Create radar visualization
-                        visualizer = ConfluenceVisualizer()
-                        confluence_visualization = visualizer.generate_base64_image(
-                            component_scores, overall_score
-                        )
-
-                        # Save 3D visualization for possible linking in HTML reports
-                        symbol = signal_data.get("symbol", "UNKNOWN")
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        _, threed_path = visualizer.save_visualizations(
-                            component_scores=component_scores,
-                            overall_score=overall_score,
-                            symbol=symbol,
-                            timestamp=timestamp,
-                        )
-
-                        self._log(
-                            f"Created confluence visualization and 3D chart at: {threed_path}"
-                        )
-
-                        # Add to template context
-                        context["confluence_visualization"] = confluence_visualization
-                        context["confluence_3d_link"] = os.path.abspath(threed_path)
+                        if not confluence_radar and inline_charts:
+                            component_scores, overall_score = self._confluence_scores(components, signal_data)
+                            confluence_radar = self._create_confluence_radar(
+                                component_scores, overall_score, symbol=symbol
+                            )
+                        if confluence_radar and os.path.exists(confluence_radar):
+                            with open(confluence_radar, "rb") as f:
+                                confluence_visualization = base64.b64encode(f.read()).decode("utf-8")
+
+                            # Add to template context
+                            context["confluence_visualization"] = confluence_visualization
+                            context["confluence_3d_link"] = os.path.abspath(
+                                confluence_radar.replace("_radar.png", "_3d.html")
+                            )
                     except Exception as e:
                         self._log(
                             f"Error creating confluence visualization: {str(e)}",
@@ -2616,14 +2866,10 @@ def generate_trading_report(
 
             # Create confluence analysis image if text is provided
             try:
-                confluence_text = signal_data.get("confluence_analysis", None)
-                if not confluence_text:
-                    # Fallbacks to maintain confluence narrative in PDFs
-                    if isinstance(signal_data.get("breakdown"), dict):
-                        confluence_text = signal_data.get("breakdown", {}).get("formatted_analysis")
-                    if not confluence_text:
-                        confluence_text = signal_data.get("formatted_analysis")
-                if confluence_text and isinstance(confluence_text, str):
+                confluence_text = self._confluence_text(signal_data)
+                if confluence_analysis_image:
+                    self._log(f"Using pre-rendered confluence analysis image: {confluence_analysis_image}")
+                elif confluence_text and inline_charts:
                     self._log("Creating confluence analysis image from text")
                     confluence_analysis_image = self._create_confluence_image(
                         confluence_text,
@@ -3250,13 +3496,10 @@ def generate_trading_report(
                 with open(html_path, "w") as f:
                     f.write(html_content)
 
-                # Try Chrome Headless first (full CSS support: gradients, shadows, etc.)
-                # Falls back to WeasyPrint if Chrome is unavailable
-                chrome_success = self._render_pdf_with_chrome(html_content, pdf_path, html_path)
-
-                if not chrome_success:
-                    self._log("Falling back to WeasyPrint for PDF generation", logging.INFO)
-                    HTML(string=html_content).write_pdf(pdf_path)
+                if deferred_pdf is not None:
+                    deferred_pdf.append((html_content, pdf_path, html_path))
+                else:
+                    self._write_report_pdf(html_content, pdf_path, html_path)
 
                 # Export JSON data
                 json_path = self._export_json_data(signal_data, json_filename, json_dir)
@@ -3997,6 +4240,8 @@ async def generate_market_html_report(
         Returns:
             True if successful, False otherwise
         """
+        timer = ReportTimer(f"market_{int(time.time())}")
+        timer.stage("collect")
         try:
             # Set up directories
             reports_base_dir = os.path.join(os.getcwd(), 'reports')
@@ -4224,11 +4469,8 @@ async def generate_market_html_report(
 
             self.logger.debug(f"Loading template: {template_path}")
             try:
-                env = Environment(loader=FileSystemLoader(self.template_dir))
-                # Add custom filters
-                env.filters["format_with_commas"] = self._format_with_commas
-                env.filters["format_number"] = self._format_number
-                template = env.get_template(template_name)
+                # Compiled once per template directory and reused across reports
+                template = self.env.get_template(template_name)
                 self.logger.debug("Template loaded successfully")
             except Exception as template_error:
                 self.logger.error(f"Error loading template: {str(template_error)}")
@@ -4250,7 +4492,10 @@ async def generate_market_html_report(
                 )
                 return await self.generate_market_report(market_data, output_path)
 
-            # Test render each part of the template to find problematic sections
+            # Test render each part of the template to find problematic sections.
+            # Sections whose data passed with this template before are not rendered again.
+            timer.stage("validate")
+            section_scope = f"{template_path}:{os.path.getmtime(template_path)}"
             try:
                 self.logger.debug(
                     "Testing partial renders to identify problematic sections"
@@ -4258,93 +4503,38 @@ async def generate_market_html_report(
                 test_data = {"report_date": market_data.get("report_date", "Unknown")}
 
                 # Test basic sections
-                template.render(report_date=test_data["report_date"])
+                await asyncio.to_thread(template.render, report_date=test_data["report_date"])
                 self.logger.debug("Basic report_date render successful")
 
-                # Test market overview
-                if "market_overview" in market_data:
-                    try:
-                        overview_data = market_data["market_overview"]
-                        template.render(
-                            report_date=test_data["report_date"],
-                            market_overview=overview_data,
-                        )
-                        self.logger.debug("market_overview render successful")
-                    except Exception as section_error:
-                        self.logger.error(
-                            f"Error rendering market_overview section: {str(section_error)}"
-                        )
-                        # Remove problematic section
-                        market_data.pop("market_overview", None)
-
-                # Test top performers
-                if "top_performers" in market_data:
-                    try:
-                        performers_data = market_data["top_performers"]
-                        template.render(
-                            report_date=test_data["report_date"],
-                            top_performers=performers_data,
-                        )
-                        self.logger.debug("top_performers render successful")
-                    except Exception as section_error:
-                        self.logger.error(
-                            f"Error rendering top_performers section: {str(section_error)}"
-                        )
-                        # Remove problematic section
-                        market_data.pop("top_performers", None)
-
-                # Test market sentiment
-                if "market_sentiment" in market_data:
-                    try:
-                        sentiment_data = market_data["market_sentiment"]
-                        template.render(
-                            report_date=test_data["report_date"],
-                            market_sentiment=sentiment_data,
-                        )
-                        self.logger.debug("market_sentiment render successful")
-                    except Exception as section_error:
-                        self.logger.error(
-                            f"Error rendering market_sentiment section: {str(section_error)}"
-                        )
-                        # Remove problematic section
-                        market_data.pop("market_sentiment", None)
-
-                # Test trading signals
-                if "trading_signals" in market_data:
+                for section in ("market_overview", "top_performers", "market_sentiment",
+                                "trading_signals", "notable_news"):
+                    if section not in market_data:
+                        continue
+                    section_data = market_data[section]
+                    if self.pipeline.sections.contains(section_scope, section, section_data):
+                        self.logger.debug(f"{section} unchanged since last report, skipping test render")
+                        continue
                     try:
-                        signals_data = market_data["trading_signals"]
-                        template.render(
+                        await asyncio.to_thread(
+                            template.render,
                             report_date=test_data["report_date"],
-                            trading_signals=signals_data,
-                        )
-                        self.logger.debug("trading_signals render successful")
-                    except Exception as section_error:
-                        self.logger.error(
-                            f"Error rendering trading_signals section: {str(section_error)}"
-                        )
-                        # Remove problematic section
-                        market_data.pop("trading_signals", None)
-
-                # Test notable news
-                if "notable_news" in market_data:
-                    try:
-                        news_data = market_data["notable_news"]
-                        template.render(
-                            report_date=test_data["report_date"], notable_news=news_data
+                            **{section: section_data},
                         )
-                        self.logger.debug("notable_news render successful")
+                        self.pipeline.sections.add(section_scope, section, section_data)
+                        self.logger.debug(f"{section} render successful")
                     except Exception as section_error:
                         self.logger.error(
-                            f"Error rendering notable_news section: {str(section_error)}"
+                            f"Error rendering {section} section: {str(section_error)}"
                         )
                         # Remove problematic section
-                        market_data.pop("notable_news", None)
+                        market_data.pop(section, None)
 
                 self.logger.debug("All section renders tested")
             except Exception as test_error:
                 self.logger.error(f"Error during test rendering: {str(test_error)}")
 
             # Render the template with market data
+            timer.stage("template")
             try:
                 self.logger.debug("Rendering full template")
 
@@ -4365,9 +4555,24 @@ async def generate_market_html_report(
                 if market_data.get("futures_premium") and isinstance(market_data["futures_premium"], dict):
                     futures_premium = market_data["futures_premium"]
                     
-                    # Create charts for HTML report
-                    chart_path = self._create_futures_premium_chart(futures_premium, output_dir or ".")
-                    term_chart_path = self._create_term_structure_chart(futures_premium, output_dir or ".")
+                    # Create charts for HTML report, in parallel; unchanged premiums reuse the last run's charts
+                    timer.stage("charts")
+                    chart_dir = output_dir or "."
+                    chart_key = chart_cache_key(
+                        "futures_premium", None, None,
+                        output_dir=chart_dir, data=self.pipeline.sections.fingerprint(futures_premium)
+                    )
+                    chart_path, term_chart_path = await asyncio.gather(
+                        self.render_chart_async(
+                            "_create_futures_premium_chart", cache_key=chart_key + ("premium",),
+                            futures_premium_data=futures_premium, output_dir=chart_dir
+                        ),
+                        self.render_chart_async(
+                            "_create_term_structure_chart", cache_key=chart_key + ("term_structure",),
+                            futures_premium_data=futures_premium, output_dir=chart_dir
+                        ),
+                    )
+                    timer.stage("template")
                     
                     # Add chart paths to market data for template
                     if chart_path:
@@ -4398,7 +4603,7 @@ def default(self, obj):
                 except Exception as log_error:
                     self.logger.error(f"Error logging market data structure: {str(log_error)}")
 
-                html_content = template.render(**market_data)
+                html_content = await asyncio.to_thread(template.render, **market_data)
                 
                 # Log HTML content preview
                 html_preview = html_content[:500] + "..." if len(html_content) > 500 else html_content
@@ -4514,9 +4719,11 @@ def default(self, obj):
 
             # Generate PDF from HTML if requested
             if generate_pdf:
+                timer.stage("pdf")
                 pdf_path = os.path.join(pdf_dir, os.path.basename(html_path).replace(".html", ".pdf"))
                 try:
                     pdf_success = await self.generate_pdf(html_path, pdf_path)
+                    self.pipeline.record("market_report", timer)
                     if pdf_success:
                         self.logger.info(
                             f"Successfully generated PDF from HTML: {pdf_path}"
@@ -4533,6 +4740,7 @@ def default(self, obj):
                     self.logger.debug(traceback.format_exc())
                     return False
 
+            self.pipeline.record("market_report", timer)
             return True
 
         except Exception as e:
@@ -4821,7 +5029,8 @@ async def generate_pdf(self, html_path: str, pdf_path: str) -> bool:
                 # Preprocess HTML to improve PDF compatibility
                 processed_html_path = self._preprocess_html_for_pdf(html_path)
                 
-                pdfkit.from_file(processed_html_path, pdf_path, options=options)
+                # wkhtmltopdf is a subprocess; wait for it on a thread, not the event loop
+                await asyncio.to_thread(pdfkit.from_file, processed_html_path, pdf_path, options=options)
 
                 # Clean up temporary file if created
                 if processed_html_path != html_path and os.path.exists(processed_html_path):
@@ -4838,42 +5047,28 @@ async def generate_pdf(self, html_path: str, pdf_path: str) -> bool:
                 self.logger.warning("pdfkit not available, trying weasyprint")
 
                 # Fall back to weasyprint if pdfkit is not available
-                try:
-                    from weasyprint import HTML, CSS
-                    from weasyprint.css import get_all_computed_styles
-                    from weasyprint.css.targets import TargetCollector
-
-                    self.logger.debug("Using weasyprint for PDF generation")
-                    
-                    # Read and clean HTML content for WeasyPrint compatibility
-                    with open(html_path, 'r', encoding='utf-8') as f:
-                        html_content = f.read()
-                    
-                    # Remove problematic CSS that WeasyPrint doesn't support
-                    html_content = self._clean_html_for_weasyprint(html_content)
-                    
-                    # Create HTML document from string instead of file to avoid encoding issues
-                    html_doc = HTML(string=html_content, base_url=f"file://{os.path.dirname(html_path)}/")
-                    
-                    # Generate PDF with error handling
-                    try:
-                        html_doc.write_pdf(pdf_path)
-                    except Exception as weasy_error:
-                        self.logger.error(f"WeasyPrint PDF generation failed: {str(weasy_error)}")
-                        # Try with simplified HTML
-                        simplified_html = self._create_simplified_html(html_content)
-                        html_doc = HTML(string=simplified_html)
-                        html_doc.write_pdf(pdf_path)
-
-                    if os.path.exists(pdf_path):
-                        self.logger.info(f"PDF generated successfully using weasyprint: {pdf_path}")
-                        return True
-                    else:
-                        self.logger.error(f"PDF file was not created by weasyprint: {pdf_path}")
-                        return False
+                self.logger.debug("Using weasyprint for PDF generation")
+                
+                # Read and clean HTML content for WeasyPrint compatibility
+                with open(html_path, 'r', encoding='utf-8') as f:
+                    html_content = f.read()
+                
+                # Remove problematic CSS that WeasyPrint doesn't support
+                html_content = self._clean_html_for_weasyprint(html_content)
+                
+                # Render in the PDF worker (fonts and stylesheets stay cached there)
+                base_url = f"file://{os.path.dirname(html_path)}/"
+                if not await self.pipeline.render_pdf(html_content, pdf_path, base_url=base_url):
+                    self.logger.error("WeasyPrint PDF generation failed, retrying with simplified HTML")
+                    # Try with simplified HTML
+                    simplified_html = self._create_simplified_html(html_content)
+                    await self.pipeline.render_pdf(simplified_html, pdf_path)
 
-                except ImportError:
-                    self.logger.error("Neither pdfkit nor weasyprint is available for PDF generation")
+                if os.path.exists(pdf_path):
+                    self.logger.info(f"PDF generated successfully using weasyprint: {pdf_path}")
+                    return True
+                else:
+                    self.logger.error(f"PDF file was not created by weasyprint: {pdf_path}")
                     return False
 
         except Exception as e:
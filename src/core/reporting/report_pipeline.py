@@ -0,0 +1,265 @@
+"""
+Report Pipeline
+Stage timing, cross-run caches and out-of-process PDF rendering for reports.
+
+``ReportGenerator`` builds trading and market reports in stages::
+
+    collect -> charts (in parallel) -> template -> pdf (worker process)
+
+Charts go through the shared ``ChartRenderService``. This module holds the
+rest of what those stages share between generator instances (the market
+reporter creates a new ``ReportGenerator`` for every scheduled run):
+
+* ``ReportTimer`` measures each stage of one report; the pipeline keeps the
+  recent timings per report kind for ``get_stats()``.
+* ``template_environment`` keeps one Jinja environment per template
+  directory, so templates are compiled once rather than per report.
+* ``SectionCache`` remembers fingerprints of report sections that were
+  already checked, so sections whose data did not change since the last run
+  are not test-rendered again.
+* ``PdfRenderer`` runs WeasyPrint in a render service worker that keeps its
+  font configuration and the parsed ``<style>`` sheets between reports.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from typing import Any, Deque, Dict, Optional
+
+from jinja2 import Environment, FileSystemLoader
+
+from src.core.chart.render_service import ChartRenderService, RendererSpec
+
+logger = logging.getLogger(__name__)
+
+_STYLE_RE = re.compile(r'<style(\s[^>]*)?>(.*?)</style>', re.IGNORECASE | re.DOTALL)
+
+
+class ReportTimer:
+    """Wall time of each stage of one report.
+
+    ``stage(name)`` ends the running stage and starts the next one; a stage
+    entered twice (e.g. on a retry) accumulates.
+    """
+
+    def __init__(self, report_id: str):
+        self.report_id = report_id
+        self.stages: Dict[str, float] = {}
+        self._started = time.perf_counter()
+        self._current: Optional[str] = None
+        self._stage_started = 0.0
+
+    def stage(self, name: str) -> None:
+        self.done()
+        self._current = name
+        self._stage_started = time.perf_counter()
+
+    def done(self) -> None:
+        if self._current is not None:
+            elapsed = time.perf_counter() - self._stage_started
+            self.stages[self._current] = self.stages.get(self._current, 0.0) + elapsed
+            self._current = None
+
+    @property
+    def total(self) -> float:
+        return time.perf_counter() - self._started
+
+    def summary(self) -> str:
+        self.done()
+        stages = ", ".join(f"{name} {elapsed:.2f}s" for name, elapsed in self.stages.items())
+        return f"{stages} (total {self.total:.2f}s)"
+
+
+def template_environment(template_dir: str) -> Environment:
+    """Shared Jinja environment of a template directory.
+
+    Compiled templates stay cached in it; Jinja still reloads a template
+    whose file changed.
+    """
+    env = _environments.get(template_dir)
+    if env is None:
+        with _environments_lock:
+            env = _environments.get(template_dir)
+            if env is None:
+                env = _environments[template_dir] = Environment(loader=FileSystemLoader(template_dir))
+    return env
+
+
+_environments: Dict[str, Environment] = {}
+_environments_lock = threading.Lock()
+
+
+class SectionCache:
+    """Fingerprints of report sections already processed, kept across runs."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._seen: 'OrderedDict[str, str]' = OrderedDict()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    @staticmethod
+    def fingerprint(data: Any) -> str:
+        raw = json.dumps(data, sort_keys=True, default=str)
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    def contains(self, scope: str, section: str, data: Any) -> bool:
+        """Whether ``section`` was already processed in ``scope`` with this data."""
+        key = f"{scope}:{section}"
+        if self._seen.get(key) == self.fingerprint(data):
+            self._seen.move_to_end(key)
+            self.stats['hits'] += 1
+            return True
+        self.stats['misses'] += 1
+        return False
+
+    def add(self, scope: str, section: str, data: Any) -> None:
+        key = f"{scope}:{section}"
+        self._seen[key] = self.fingerprint(data)
+        self._seen.move_to_end(key)
+        while len(self._seen) > self.max_entries:
+            self._seen.popitem(last=False)
+
+
+class PdfRenderer:
+    """WeasyPrint HTML to PDF conversion with cached fonts and stylesheets.
+
+    Lives in a render service worker: the ``<style>`` blocks of a report are
+    parsed once and reused for every later report with the same CSS.
+    """
+
+    def __init__(self, max_stylesheets: int = 16):
+        self.max_stylesheets = max_stylesheets
+        self._font_config = None
+        self._stylesheets: 'OrderedDict[str, Any]' = OrderedDict()
+
+    def _stylesheet(self, css_text: str, base_url: Optional[str]):
+        from weasyprint import CSS
+
+        key = hashlib.sha1(f"{base_url}\0{css_text}".encode()).hexdigest()
+        sheet = self._stylesheets.get(key)
+        if sheet is None:
+            sheet = self._stylesheets[key] = CSS(string=css_text, base_url=base_url, font_config=self._font_config)
+            while len(self._stylesheets) > self.max_stylesheets:
+                self._stylesheets.popitem(last=False)
+        else:
+            self._stylesheets.move_to_end(key)
+        return sheet
+
+    def write_pdf(self, html_content: str, pdf_path: str, base_url: Optional[str] = None) -> str:
+        from weasyprint import HTML
+        from weasyprint.text.fonts import FontConfiguration
+
+        if self._font_config is None:
+            self._font_config = FontConfiguration()
+
+        # Plain <style> blocks become cached stylesheets; media-specific ones stay in the document
+        styles = []
+
+        def extract(match):
+            if match.group(1) and 'media' in match.group(1).lower():
+                return match.group(0)
+            styles.append(match.group(2))
+            return ''
+
+        body = _STYLE_RE.sub(extract, html_content)
+        HTML(string=body, base_url=base_url).write_pdf(
+            pdf_path,
+            stylesheets=[self._stylesheet(css, base_url) for css in styles],
+            font_config=self._font_config
+        )
+        return pdf_path
+
+
+class ReportPipeline:
+    """Shared PDF rendering, section cache and stage timings of reports."""
+
+    def __init__(self, pdf_workers: int = 1, mode: str = 'process', section_entries: int = 256):
+        """
+        Args:
+            pdf_workers: Worker processes converting HTML to PDF
+            mode: 'process' (default) or 'thread'
+            section_entries: Report sections remembered by ``SectionCache``
+        """
+        self.sections = SectionCache(section_entries)
+        self._pdf_service = ChartRenderService(max_workers=pdf_workers, mode=mode, preload=('weasyprint',))
+        self._pdf_spec = RendererSpec(f"{__name__}:PdfRenderer")
+        self._local_renderer = PdfRenderer() if mode == 'thread' else None
+        self._timings: Dict[str, Dict[str, Deque[float]]] = defaultdict(lambda: defaultdict(lambda: deque(maxlen=100)))
+        self.stats = {'pdf_renders': 0, 'pdf_failures': 0}
+
+    async def render_pdf(self, html_content: str, pdf_path: str, base_url: Optional[str] = None) -> bool:
+        """Convert HTML to ``pdf_path`` with WeasyPrint in a worker."""
+        path = await self._pdf_service.render(
+            self._pdf_spec, 'write_pdf',
+            {'html_content': html_content, 'pdf_path': pdf_path, 'base_url': base_url},
+            local=self._local_renderer
+        )
+        if path and os.path.exists(pdf_path):
+            self.stats['pdf_renders'] += 1
+            return True
+        self.stats['pdf_failures'] += 1
+        return False
+
+    def record(self, kind: str, timer: ReportTimer) -> None:
+        """Log the stage timings of a finished report and keep them for ``get_stats``."""
+        summary = timer.summary()
+        for name, elapsed in timer.stages.items():
+            self._timings[kind][name].append(elapsed)
+        self._timings[kind]['total'].append(timer.total)
+        logger.info(f"[{kind}:{timer.report_id}] Report stages: {summary}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Stage timings per report kind plus cache and PDF worker counters."""
+        stages = {}
+        for kind, timings in self._timings.items():
+            stages[kind] = {}
+            for name, values in timings.items():
+                ordered = sorted(values)
+                stages[kind][name] = {
+                    'count': len(ordered),
+                    'p50': ordered[len(ordered) // 2],
+                    'max': ordered[-1]
+                }
+        return {
+            **self.stats,
+            'stages': stages,
+            'sections': dict(self.sections.stats),
+            'templates_cached': len(_environments),
+            'pdf_worker': self._pdf_service.get_stats()
+        }
+
+    def shutdown(self) -> None:
+        self._pdf_service.shutdown()
+
+
+_pipeline: Optional[ReportPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def get_report_pipeline(config: Optional[Dict[str, Any]] = None) -> ReportPipeline:
+    """Shared report pipeline; ``config`` (``report_pipeline`` section) applies on first call."""
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                settings = dict((config or {}).get('report_pipeline', {}))
+                _pipeline = ReportPipeline(
+                    pdf_workers=settings.get('pdf_workers', 1),
+                    mode=settings.get('mode', 'process'),
+                    section_entries=settings.get('section_entries', 256)
+                )
+    return _pipeline
+
+
+def shutdown_report_pipeline() -> None:
+    """Stop the shared pipeline's PDF worker."""
+    global _pipeline
+    with _pipeline_lock:
+        pipeline, _pipeline = _pipeline, None
+    if pipeline is not None:
+        pipeline.shutdown()
@@ -10,6 +10,7 @@
 from typing import Dict, List, Any, Optional
 import asyncio
 
+from ..analysis.correlation_engine import CorrelationEngine
 from ..data import get_real_market_data_service
 from ..resilience import handle_errors, RetryConfig
 
@@ -35,6 +36,18 @@ def __init__(self, exchange_manager=None):
             "BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT", 
             "ADAUSDT", "DOTUSDT", "AVAXUSDT"
         ]
+
+        # Shared price panel: one fetch per symbol for matrices and betas
+        self.engine = CorrelationEngine(self._load_closes, cache_ttl=self.cache_ttl, min_observations=10)
+
+    async def _load_closes(self, symbol: str, days: int, timeframe: str) -> Optional[pd.Series]:
+        """Close prices for the correlation engine."""
+        df = await self.market_data_service.fetch_historical_ohlcv(
+            symbol=symbol,
+            timeframe=timeframe,
+            days=days
+        )
+        return None if df.empty else df['close']
         
     @handle_errors(
         operation='get_price_data',
@@ -78,63 +91,29 @@ async def calculate_correlation_matrix(self, symbols: List[str], days: int = 30)
         Calculate correlation matrix using real market data.
         """
         try:
-            # Fetch price data for all symbols concurrently
-            self.logger.info(f"Fetching real market data for {len(symbols)} symbols over {days} days")
-            
-            symbol_data = {}
-            successful_symbols = []
-            failed_symbols = []
-            
-            # Fetch data for all symbols
-            for symbol in symbols:
-                try:
-                    df = await self.get_price_data(symbol, days)
-                    if not df.empty and 'returns' in df.columns and len(df) >= 10:
-                        symbol_data[symbol] = df['returns'].dropna()
-                        successful_symbols.append(symbol)
-                        self.logger.info(f"✅ Got {len(df)} data points for {symbol}")
-                    else:
-                        failed_symbols.append(symbol)
-                        self.logger.warning(f"⚠️ Insufficient data for {symbol} (got {len(df) if not df.empty else 0} points)")
-                except Exception as e:
-                    failed_symbols.append(symbol)
-                    self.logger.error(f"❌ Failed to get data for {symbol}: {e}")
-            
-            if not symbol_data:
+            self.logger.info(f"Building price panel for {len(symbols)} symbols over {days} days")
+            result = await self.engine.correlation_matrix(symbols, days)
+
+            failed_symbols = result['missing']
+            successful_symbols = [s for s in symbols if s not in failed_symbols]
+            if not successful_symbols:
                 return self._fallback_correlation_matrix(symbols, "No real market data available for any symbol")
-            
-            if len(symbol_data) < len(symbols):
-                self.logger.warning(f"Only {len(symbol_data)}/{len(symbols)} symbols have data. Failed: {failed_symbols}")
-            
-            # Calculate correlation matrix using only symbols with data
+
+            if failed_symbols:
+                self.logger.warning(f"Only {len(successful_symbols)}/{len(symbols)} symbols have data. Failed: {failed_symbols}")
+
+            # Symbols without data stay None; too few common observations read as 0.0
             correlations = []
-            working_symbols = list(symbol_data.keys())
-            
             for i, sym1 in enumerate(symbols):
                 row = []
                 for j, sym2 in enumerate(symbols):
                     if i == j:
                         corr = 1.0
-                    elif sym1 in symbol_data and sym2 in symbol_data:
-                        # Calculate real correlation
-                        returns1 = symbol_data[sym1]
-                        returns2 = symbol_data[sym2]
-                        
-                        # Align the series by time index
-                        aligned_data = pd.DataFrame({
-                            'returns1': returns1,
-                            'returns2': returns2
-                        }).dropna()
-                        
-                        if len(aligned_data) >= 10:  # Need at least 10 observations
-                            corr = aligned_data['returns1'].corr(aligned_data['returns2'])
-                            if pd.isna(corr):
-                                corr = 0.0
-                        else:
-                            corr = 0.0
+                    elif sym1 in failed_symbols or sym2 in failed_symbols:
+                        corr = None
                     else:
-                        corr = None  # No data available
-                    
+                        value = result['matrix'][i, j]
+                        corr = 0.0 if np.isnan(value) else value
                     row.append(round(float(corr), 3) if corr is not None else None)
                 correlations.append(row)
             
@@ -147,7 +126,9 @@ async def calculate_correlation_matrix(self, symbols: List[str], days: int = 30)
                 "data_source": "real_market_data",
                 "successful_symbols": successful_symbols,
                 "failed_symbols": failed_symbols,
-                "data_points_used": {sym: len(data) for sym, data in symbol_data.items()}
+                "data_points_used": {
+                    sym: int(result['observations'][i, i]) for i, sym in enumerate(symbols) if sym in successful_symbols
+                }
             }
             
         except Exception as e:
@@ -159,61 +140,22 @@ async def calculate_beta_time_series(self, symbols: List[str], window_days: int
         Calculate beta time series relative to Bitcoin.
         """
         try:
-            # Get Bitcoin data first (benchmark)
-            btc_df = await self.get_price_data_from_integration("BTCUSDT", window_days + num_windows)
-            if btc_df.empty or 'returns' not in btc_df.columns:
+            rolled = await self.engine.rolling_betas(symbols, window=window_days, num_windows=num_windows)
+            if not rolled:
                 return self._fallback_beta_series(symbols, num_windows)
-            
+
             series_data = {}
-            
             for symbol in symbols:
-                if symbol == "BTCUSDT":
-                    continue  # Skip Bitcoin itself
-                
-                # Get asset data
-                asset_df = await self.get_price_data_from_integration(symbol, window_days + num_windows)
-                if asset_df.empty or 'returns' not in asset_df.columns:
-                    continue
-                
-                data_points = []
-                
-                for i in range(num_windows):
-                    end_date = datetime.now(timezone.utc) - timedelta(days=i)
-                    
-                    # Calculate beta for this window
-                    if len(asset_df) >= window_days and len(btc_df) >= window_days:
-                        # Get returns for the window
-                        asset_returns = asset_df['returns'].iloc[-(window_days+i):-(i) if i > 0 else None]
-                        btc_returns = btc_df['returns'].iloc[-(window_days+i):-(i) if i > 0 else None]
-                        
-                        # Align the data
-                        min_len = min(len(asset_returns), len(btc_returns))
-                        if min_len >= 10:
-                            asset_returns = asset_returns.iloc[-min_len:]
-                            btc_returns = btc_returns.iloc[-min_len:]
-                            
-                            # Calculate beta
-                            covariance = np.cov(asset_returns, btc_returns)[0, 1]
-                            btc_variance = np.var(btc_returns)
-                            
-                            if btc_variance > 0:
-                                beta = covariance / btc_variance
-                            else:
-                                beta = 1.0
-                        else:
-                            beta = 1.0
-                    else:
-                        beta = 1.0
-                    
-                    data_points.append({
-                        "date": end_date.strftime("%Y-%m-%d"),
-                        "timestamp": int(end_date.timestamp() * 1000),
-                        "beta": round(float(beta), 3)
-                    })
-                
-                # Reverse for chronological order
-                data_points.reverse()
-                series_data[symbol] = data_points
+                if symbol == "BTCUSDT" or symbol not in rolled:
+                    continue  # Skip Bitcoin itself and symbols without data
+                series_data[symbol] = [
+                    {
+                        "date": point["timestamp"].strftime("%Y-%m-%d"),
+                        "timestamp": int(point["timestamp"].timestamp() * 1000),
+                        "beta": round(point["beta"], 3) if point["beta"] is not None else None
+                    }
+                    for point in rolled[symbol]
+                ]
             
             return {
                 "series_data": series_data,
@@ -226,6 +168,20 @@ async def calculate_beta_time_series(self, symbols: List[str], window_days: int
         except Exception as e:
             self.logger.error(f"Error calculating beta time series: {e}")
             return self._fallback_beta_series(symbols, num_windows)
+
+    async def calculate_betas(self, symbols: List[str], days: int = 30) -> Dict[str, float]:
+        """
+        Beta of each symbol relative to Bitcoin over the last ``days`` days.
+
+        Returns:
+            Mapping of symbol to beta for symbols with enough data
+        """
+        try:
+            betas = await self.engine.betas(symbols, days)
+            return {symbol: round(stats["beta"], 3) for symbol, stats in betas.items()}
+        except Exception as e:
+            self.logger.error(f"Error calculating betas: {e}")
+            return {}
     
     async def get_correlation_heatmap(self, symbols: List[str], days: int = 30) -> Dict[str, Any]:
         """
@@ -215,7 +215,7 @@ async def _update_confluence_cache(self):
                 for symbol in symbols:
                     try:
                         if hasattr(self.monitor, 'market_data_manager') and hasattr(self.monitor, 'confluence_analyzer') and self.monitor.confluence_analyzer:
-                            market_data = await self.monitor.market_data_manager.get_market_data(symbol)
+                            market_data = await self._get_market_data(symbol)
                             if market_data:
                                 # Guard: analyzer may be None or not initialized or missing method
                                 analyzer = getattr(self.monitor, 'confluence_analyzer', None)
@@ -502,7 +502,7 @@ async def _update_signals(self):
                 for symbol in symbols:
                     try:
                         # Get market data for symbol
-                        market_data = await self.monitor.market_data_manager.get_market_data(symbol)
+                        market_data = await self._get_market_data(symbol)
                         if not market_data:
                             continue
                             
@@ -548,7 +548,7 @@ async def _update_signals(self):
                             symbol = symbol_info.get('symbol', symbol_info) if isinstance(symbol_info, dict) else symbol_info
                             try:
                                 # Get market data for symbol
-                                market_data = await self.monitor.market_data_manager.get_market_data(symbol)
+                                market_data = await self._get_market_data(symbol)
                                 if not market_data:
                                     continue
                                     
@@ -676,6 +676,16 @@ async def _update_market_overview(self):
         except Exception as e:
             self.logger.error(f"Error updating market overview: {e}")
     
+    async def _get_market_data(self, symbol: Any) -> Optional[Dict[str, Any]]:
+        """Market data for a symbol, preferring the monitor's current cycle snapshot."""
+        snapshot = getattr(self.monitor, 'market_snapshot', None)
+        if snapshot is not None:
+            symbol_str = symbol.get('symbol') if isinstance(symbol, dict) else symbol
+            market_data = snapshot.peek(symbol_str, 'market_data')
+            if market_data:
+                return market_data
+        return await self.monitor.market_data_manager.get_market_data(symbol)
+
     async def _extract_confluence_score(self, symbol: str, market_data: Dict[str, Any]) -> float:
         """Extract confluence score from market data or calculate a simple one."""
         try:
@@ -962,7 +972,7 @@ async def get_top_symbols(self, limit: int = 10) -> List[Dict[str, Any]]:
                     symbols_data = []
                     for symbol in symbols:
                         try:
-                            market_data = await market_data_manager.get_market_data(symbol)
+                            market_data = await self._get_market_data(symbol)
                             if market_data:
                                 # Extract key metrics from Bybit data
                                 ticker = market_data.get('ticker', {})
@@ -1236,7 +1246,7 @@ async def get_confluence_analysis(self, symbol: str) -> Dict[str, Any]:
             # Try to generate fresh analysis
             if hasattr(self.monitor, 'market_data_manager') and hasattr(self.monitor, 'confluence_analyzer'):
                 try:
-                    market_data = await self.monitor.market_data_manager.get_market_data(symbol)
+                    market_data = await self._get_market_data(symbol)
                     if market_data and self.monitor.confluence_analyzer:
                         try:
                             analyzer = getattr(self.monitor, 'confluence_analyzer', None)
@@ -0,0 +1,179 @@
+"""
+In-memory MFE/MAE tracking for active trading signals.
+
+``SignalPerformanceTracker.update_excursion`` used to run a SELECT and
+possibly an UPDATE against virtuoso.db for every signal on every price
+update. ``ExcursionTracker`` keeps the excursion state of all active
+signals in per-symbol NumPy arrays instead: one price update evaluates every
+active signal of that symbol in a single vectorized pass and marks the rows
+that reached a new extreme as dirty. Dirty rows are handed out in batches
+(``drain_dirty``) for the tracker to flush with one ``executemany``.
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set
+
+import numpy as np
+
+_FLOAT_FIELDS = ('direction', 'entry', 'mfe', 'mae', 'mfe_price', 'mae_price', 'mfe_at', 'mae_at')
+
+
+class _SymbolBook:
+    """Column arrays for the active signals of one symbol."""
+
+    __slots__ = ('ids', 'index') + _FLOAT_FIELDS
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        for name in _FLOAT_FIELDS:
+            setattr(self, name, np.empty(0))
+
+    def add(self, signal_id: str, values: Dict[str, float]) -> None:
+        self.index[signal_id] = len(self.ids)
+        self.ids.append(signal_id)
+        for name in _FLOAT_FIELDS:
+            setattr(self, name, np.append(getattr(self, name), values[name]))
+
+    def remove(self, signal_id: str) -> int:
+        pos = self.index.pop(signal_id)
+        self.ids.pop(pos)
+        for name in _FLOAT_FIELDS:
+            setattr(self, name, np.delete(getattr(self, name), pos))
+        self.index = {sid: i for i, sid in enumerate(self.ids)}
+        return pos
+
+    def row(self, pos: int) -> Dict[str, Any]:
+        return {name: float(getattr(self, name)[pos]) for name in _FLOAT_FIELDS}
+
+
+def _iso(epoch: float) -> Optional[str]:
+    # Same naive-UTC isoformat the tracker uses for its other timestamps
+    if np.isnan(epoch):
+        return None
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).replace(tzinfo=None).isoformat()
+
+
+class ExcursionTracker:
+    """Active-signal excursion table keyed by symbol."""
+
+    def __init__(self):
+        self._books: Dict[str, _SymbolBook] = {}
+        self._symbol_of: Dict[str, str] = {}
+        self._dirty: Set[str] = set()
+        self.stats = {'price_updates': 0, 'signals_evaluated': 0, 'new_extremes': 0}
+
+    def __len__(self) -> int:
+        return len(self._symbol_of)
+
+    def __contains__(self, signal_id: str) -> bool:
+        return signal_id in self._symbol_of
+
+    def symbols(self) -> List[str]:
+        return list(self._books)
+
+    def signal_ids(self) -> List[str]:
+        return list(self._symbol_of)
+
+    def add(
+        self,
+        signal_id: str,
+        symbol: str,
+        signal_type: str,
+        entry_price: float,
+        mfe_pct: Optional[float] = None,
+        mae_pct: Optional[float] = None
+    ) -> bool:
+        """Start tracking a signal; returns False without a usable entry price."""
+        if not entry_price:
+            return False
+        if signal_id in self._symbol_of:
+            self.remove(signal_id)
+        book = self._books.setdefault(symbol, _SymbolBook())
+        book.add(signal_id, {
+            'direction': 1.0 if signal_type == 'LONG' else -1.0,
+            'entry': float(entry_price),
+            'mfe': float(mfe_pct or 0.0),
+            'mae': float(mae_pct or 0.0),
+            'mfe_price': np.nan,
+            'mae_price': np.nan,
+            'mfe_at': np.nan,
+            'mae_at': np.nan
+        })
+        self._symbol_of[signal_id] = symbol
+        return True
+
+    def remove(self, signal_id: str) -> Optional[Dict[str, Any]]:
+        """Stop tracking a signal; returns its pending update if it was dirty."""
+        symbol = self._symbol_of.pop(signal_id, None)
+        if symbol is None:
+            return None
+        book = self._books[symbol]
+        pending = self._update_row(signal_id, book.row(book.index[signal_id])) if signal_id in self._dirty else None
+        self._dirty.discard(signal_id)
+        book.remove(signal_id)
+        if not book.ids:
+            del self._books[symbol]
+        return pending
+
+    def update_price(self, symbol: str, price: float, timestamp: Optional[float] = None) -> int:
+        """Evaluate every active signal of ``symbol``; returns new extremes found."""
+        book = self._books.get(symbol)
+        if book is None or not price:
+            return 0
+        now = timestamp if timestamp is not None else time.time()
+
+        excursion = book.direction * (price - book.entry) / book.entry * 100
+        new_mfe = excursion > book.mfe
+        new_mae = excursion < book.mae
+        if new_mfe.any():
+            book.mfe[new_mfe] = excursion[new_mfe]
+            book.mfe_price[new_mfe] = price
+            book.mfe_at[new_mfe] = now
+        if new_mae.any():
+            book.mae[new_mae] = excursion[new_mae]
+            book.mae_price[new_mae] = price
+            book.mae_at[new_mae] = now
+
+        changed = np.flatnonzero(new_mfe | new_mae)
+        self._dirty.update(book.ids[i] for i in changed)
+        self.stats['price_updates'] += 1
+        self.stats['signals_evaluated'] += len(book.ids)
+        self.stats['new_extremes'] += len(changed)
+        return len(changed)
+
+    def get(self, signal_id: str) -> Optional[Dict[str, Any]]:
+        symbol = self._symbol_of.get(signal_id)
+        if symbol is None:
+            return None
+        book = self._books[symbol]
+        row = book.row(book.index[signal_id])
+        return {'symbol': symbol, 'mfe_pct': row['mfe'], 'mae_pct': row['mae']}
+
+    @staticmethod
+    def _update_row(signal_id: str, row: Dict[str, float]) -> Dict[str, Any]:
+        """Columns to write for a dirty signal (None keeps the stored value)."""
+        has_mfe, has_mae = not np.isnan(row['mfe_at']), not np.isnan(row['mae_at'])
+        return {
+            'signal_id': signal_id,
+            'mfe_pct': row['mfe'] if has_mfe else None,
+            'mfe_price': row['mfe_price'] if has_mfe else None,
+            'mfe_at': _iso(row['mfe_at']),
+            'mae_pct': row['mae'] if has_mae else None,
+            'mae_price': row['mae_price'] if has_mae else None,
+            'mae_at': _iso(row['mae_at'])
+        }
+
+    @property
+    def dirty_count(self) -> int:
+        return len(self._dirty)
+
+    def drain_dirty(self) -> List[Dict[str, Any]]:
+        """Pending updates for every dirty signal; clears the dirty set."""
+        updates = []
+        for signal_id in self._dirty:
+            book = self._books[self._symbol_of[signal_id]]
+            updates.append(self._update_row(signal_id, book.row(book.index[signal_id])))
+        self._dirty.clear()
+        return updates
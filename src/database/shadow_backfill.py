@@ -0,0 +1,293 @@
+"""
+Batch forward-return backfill for the shadow mode tables.
+
+The ``update_*_forward_returns`` helpers in ``shadow_storage`` work one row
+at a time: the caller fetches pending rows, looks up a price per row and
+issues one UPDATE per row and horizon. ``ShadowReturnBackfill`` does the
+same work set-based:
+
+1. Collect pending rows from every shadow table (``return_calculated_at IS
+   NULL`` within the lookback window, served by an index on
+   ``(return_calculated_at, timestamp)``).
+2. Load price history once per symbol through a ``price_loader``
+   (the in-memory OHLCV store when it covers the window, otherwise a single
+   kline fetch).
+3. Compute every horizon with a vectorized as-of join (``searchsorted`` on
+   candle open times).
+4. Write each table with one ``executemany``.
+
+``return_calculated_at`` is only set once every horizon of a row is filled,
+so a row stays pending (and cheap to find) until its longest horizon has
+matured. Already-filled returns are never overwritten.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .shadow_storage import get_db_path
+from .sqlite_access import SQLiteAccess, get_db_access
+
+logger = logging.getLogger(__name__)
+
+HORIZON_MS = {
+    '15m': 15 * 60_000,
+    '1h': 60 * 60_000,
+    '4h': 4 * 60 * 60_000,
+    '24h': 24 * 60 * 60_000
+}
+
+# Candle intervals tried (finest first) when fetching klines for a window
+KLINE_INTERVALS_MS = (
+    ('1m', 60_000),
+    ('5m', 5 * 60_000),
+    ('15m', 15 * 60_000),
+    ('1h', 60 * 60_000),
+    ('4h', 4 * 60 * 60_000)
+)
+
+# (timestamps in ms, close prices, candle interval in ms), oldest first
+PriceHistory = Tuple[np.ndarray, np.ndarray, int]
+PriceLoader = Callable[[str, int, int], Awaitable[Optional[PriceHistory]]]
+
+
+@dataclass(frozen=True)
+class ReturnTable:
+    """Forward-return layout of one shadow table."""
+    name: str
+    horizons: Tuple[str, ...]
+    price_column: str
+    calculated_at_ms: bool = False  # INTEGER ms instead of ISO text
+    fill_price: bool = True         # backfill a missing entry price
+
+
+RETURN_TABLES = (
+    ReturnTable('shadow_dual_regime', ('15m', '1h', '4h', '24h'), 'entry_price'),
+    ReturnTable('shadow_crypto_regime', ('15m', '1h', '4h', '24h'), 'entry_price'),
+    ReturnTable('shadow_cas_signals', ('1h', '4h', '24h'), 'current_price',
+                calculated_at_ms=True, fill_price=False),
+    ReturnTable('shadow_distribution_signals', ('15m', '1h', '4h', '24h'), 'entry_price'),
+)
+
+
+def as_of_prices(history: PriceHistory, targets: np.ndarray) -> np.ndarray:
+    """Close of the candle containing each target time (NaN outside the history)."""
+    timestamps, closes, interval_ms = history
+    idx = np.searchsorted(timestamps, targets, side='right') - 1
+    valid = (idx >= 0) & (targets < timestamps[-1] + interval_ms) if len(timestamps) else np.zeros(len(targets), bool)
+    prices = np.full(len(targets), np.nan)
+    prices[valid] = closes[idx[valid]]
+    return prices
+
+
+def ohlcv_store_price_loader(store, timeframe: str = 'base') -> PriceLoader:
+    """Price loader reading candles already held by an ``OHLCVStore``."""
+    async def load(symbol: str, start_ms: int, end_ms: int) -> Optional[PriceHistory]:
+        buffer = store.get_buffer(symbol, timeframe)
+        if buffer is None or len(buffer) < 2:
+            return None
+        timestamps = buffer.timestamps
+        if timestamps[0] > start_ms:
+            return None  # Window not covered
+        return timestamps.copy(), buffer.values[:, 3].copy(), int(np.median(np.diff(timestamps)))
+    return load
+
+
+def exchange_price_loader(exchange, limit: int = 1000) -> PriceLoader:
+    """Price loader issuing a single kline fetch per symbol.
+
+    Picks the finest interval whose ``limit`` candles reach back to the
+    start of the window.
+    """
+    async def load(symbol: str, start_ms: int, end_ms: int) -> Optional[PriceHistory]:
+        now_ms = int(time.time() * 1000)
+        interval, interval_ms = KLINE_INTERVALS_MS[-1]
+        for candidate, candidate_ms in KLINE_INTERVALS_MS:
+            if (now_ms - start_ms) / candidate_ms <= limit:
+                interval, interval_ms = candidate, candidate_ms
+                break
+        candles = await exchange.fetch_ohlcv(symbol, timeframe=interval, limit=limit)
+        if not candles:
+            return None
+        data = np.asarray(candles, dtype=np.float64)
+        return data[:, 0].astype(np.int64), data[:, 4], interval_ms
+    return load
+
+
+def chain_price_loaders(*loaders: PriceLoader) -> PriceLoader:
+    """Use the first loader that returns history for a symbol."""
+    async def load(symbol: str, start_ms: int, end_ms: int) -> Optional[PriceHistory]:
+        for loader in loaders:
+            history = await loader(symbol, start_ms, end_ms)
+            if history is not None and len(history[0]):
+                return history
+        return None
+    return load
+
+
+class ShadowReturnBackfill:
+    """Set-based forward-return backfill across all shadow tables."""
+
+    def __init__(
+        self,
+        price_loader: PriceLoader,
+        lookback_hours: float = 48,
+        tables: Sequence[ReturnTable] = RETURN_TABLES,
+        db: Optional[SQLiteAccess] = None
+    ):
+        """
+        Args:
+            price_loader: ``async (symbol, start_ms, end_ms) -> PriceHistory``
+            lookback_hours: Oldest signal age still backfilled
+            tables: Shadow tables to process
+            db: Access layer (default: shared virtuoso.db)
+        """
+        self.price_loader = price_loader
+        self.lookback_ms = int(lookback_hours * 3600 * 1000)
+        self.tables = tuple(tables)
+        self.db = db
+        self._indexes_ready = False
+        self.stats = {'runs': 0, 'rows_updated': 0, 'rows_completed': 0, 'symbols_loaded': 0}
+
+    def _db(self) -> SQLiteAccess:
+        return self.db or get_db_access(get_db_path())
+
+    def ensure_indexes(self) -> None:
+        """Create the ``(return_calculated_at, timestamp)`` pending-row indexes."""
+        def create(conn):
+            existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            for table in self.tables:
+                if table.name not in existing:
+                    continue
+                conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS idx_{table.name}_pending '
+                    f'ON {table.name}(return_calculated_at, timestamp)'
+                )
+        self._db().write(create)
+        self._indexes_ready = True
+
+    def _load_pending(self, now_ms: int) -> Dict[str, List[Any]]:
+        """Pending rows per table: (id, symbol, timestamp, price, *returns)."""
+        min_horizon = min(HORIZON_MS[h] for table in self.tables for h in table.horizons)
+        start_ms, end_ms = now_ms - self.lookback_ms, now_ms - min_horizon
+
+        def load(conn):
+            pending = {}
+            existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            for table in self.tables:
+                if table.name not in existing:
+                    continue
+                columns = ', '.join(f'return_{h}' for h in table.horizons)
+                pending[table.name] = conn.execute(
+                    f'SELECT id, symbol, timestamp, {table.price_column}, {columns} FROM {table.name} '
+                    f'WHERE return_calculated_at IS NULL AND timestamp BETWEEN ? AND ?',
+                    (start_ms, end_ms)
+                ).fetchall()
+            return pending
+
+        return self._db().read(load)
+
+    async def run(self, now_ms: Optional[int] = None) -> Dict[str, int]:
+        """Backfill every matured, missing return; returns rows updated per table."""
+        now_ms = now_ms or int(time.time() * 1000)
+        db = self._db()
+        if not self._indexes_ready:
+            await db.run_async(self.ensure_indexes)
+
+        pending = await db.run_async(self._load_pending, now_ms)
+        rows_by_table = {name: rows for name, rows in pending.items() if rows}
+        if not rows_by_table:
+            return {}
+
+        # One price history per symbol, covering its oldest pending row
+        windows: Dict[str, List[int]] = {}
+        for rows in rows_by_table.values():
+            for row in rows:
+                window = windows.setdefault(row[1], [row[2], row[2]])
+                window[0] = min(window[0], row[2])
+                window[1] = max(window[1], row[2])
+        histories: Dict[str, PriceHistory] = {}
+        for symbol, (first_ms, last_ms) in windows.items():
+            try:
+                history = await self.price_loader(symbol, first_ms, min(now_ms, last_ms + HORIZON_MS['24h']))
+            except Exception as e:
+                logger.warning(f"Forward-return backfill: price history for {symbol} failed: {e}")
+                continue
+            if history is not None and len(history[0]):
+                histories[symbol] = history
+        self.stats['symbols_loaded'] += len(histories)
+
+        updates = {}
+        for table in self.tables:
+            rows = rows_by_table.get(table.name)
+            if rows:
+                params, completed = self._compute(table, rows, histories, now_ms)
+                if params:
+                    updates[table] = params
+                    self.stats['rows_completed'] += completed
+
+        if updates:
+            await db.write_async(lambda conn: self._write(conn, updates))
+
+        self.stats['runs'] += 1
+        self.stats['rows_updated'] += sum(len(p) for p in updates.values())
+        return {table.name: len(params) for table, params in updates.items()}
+
+    def _compute(
+        self,
+        table: ReturnTable,
+        rows: List[Any],
+        histories: Dict[str, PriceHistory],
+        now_ms: int
+    ) -> Tuple[List[tuple], int]:
+        """Vectorized returns for one table, grouped by symbol."""
+        symbols = np.array([row[1] for row in rows], dtype=object)
+        calculated_at = now_ms if table.calculated_at_ms else datetime.fromtimestamp(
+            now_ms / 1000, tz=timezone.utc).isoformat()
+        params, completed = [], 0
+
+        for symbol in np.unique(symbols):
+            history = histories.get(symbol)
+            if history is None:
+                continue
+            group = [rows[i] for i in np.flatnonzero(symbols == symbol)]
+            ids = [row[0] for row in group]
+            timestamps = np.array([row[2] for row in group], dtype=np.int64)
+            stored = np.array([np.nan if row[3] is None else row[3] for row in group], dtype=np.float64)
+            existing = np.array([[np.nan if v is None else v for v in row[4:]] for row in group], dtype=np.float64)
+
+            entry = np.where(stored > 0, stored, as_of_prices(history, timestamps) if table.fill_price else np.nan)
+            returns = np.full(existing.shape, np.nan)
+            for col, horizon in enumerate(table.horizons):
+                targets = timestamps + HORIZON_MS[horizon]
+                matured = targets <= now_ms
+                exit_prices = as_of_prices(history, targets)
+                returns[:, col] = np.where(matured, (exit_prices - entry) / entry * 100, np.nan)
+
+            new = np.isnan(existing) & ~np.isnan(returns)
+            done = (~np.isnan(existing) | new).all(axis=1)
+            for i in np.flatnonzero(new.any(axis=1) | done):
+                params.append((
+                    *[float(returns[i, c]) if new[i, c] else None for c in range(len(table.horizons))],
+                    float(entry[i]) if table.fill_price and np.isnan(stored[i]) and not np.isnan(entry[i]) else None,
+                    calculated_at if done[i] else None,
+                    ids[i]
+                ))
+                completed += int(done[i])
+
+        return params, completed
+
+    @staticmethod
+    def _write(conn, updates: Dict[ReturnTable, List[tuple]]) -> None:
+        for table, params in updates.items():
+            assignments = ', '.join(f'return_{h} = COALESCE(return_{h}, ?)' for h in table.horizons)
+            conn.executemany(
+                f'UPDATE {table.name} SET {assignments}, '
+                f'{table.price_column} = COALESCE({table.price_column}, ?), '
+                f'return_calculated_at = COALESCE(?, return_calculated_at) WHERE id = ?',
+                params
+            )
@@ -10,15 +10,20 @@
 - shadow_crypto_regime: Crypto-specific regime detections
 - shadow_cas_signals: Cascade Absorption Signal (CAS) predictions
 - shadow_distribution_signals: Whale Distribution Detector (WDD) signals
+
+All access goes through the shared ``sqlite_access`` layer: reads use a
+long-lived per-thread connection and writes are batched by its writer
+thread. Async callers should use ``get_db_access().run_async(...)``.
 """
 
-import sqlite3
 import json
 import logging
 import os
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
 
+from .sqlite_access import SQLiteAccess, get_db_access
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,192 +32,193 @@ def get_db_path() -> str:
     return os.path.join(os.getcwd(), 'data', 'virtuoso.db')
 
 
+def _db() -> SQLiteAccess:
+    """Shared virtuoso.db access layer (long-lived connections, batched writes)."""
+    return get_db_access(get_db_path())
+
+
 def init_shadow_tables():
     """
     Initialize shadow mode tables in the database.
     Creates tables if they don't exist.
     """
     try:
-        db_path = get_db_path()
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
-
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # BTC Predictions table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS shadow_btc_predictions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp INTEGER NOT NULL,
-                symbol TEXT NOT NULL,
-                signal_type TEXT NOT NULL,
-                original_score REAL NOT NULL,
-                would_boost REAL NOT NULL,
-                btc_direction TEXT,
-                confidence REAL,
-                stability_score REAL,
-                beta REAL,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-
-        # Create index for efficient querying
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_btc_pred_timestamp
-            ON shadow_btc_predictions(timestamp)
-        ''')
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_btc_pred_symbol
-            ON shadow_btc_predictions(symbol)
-        ''')
-
-        # Dual-Regime Adjustments table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS shadow_dual_regime (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp INTEGER NOT NULL,
-                symbol TEXT NOT NULL,
-                signal_type TEXT NOT NULL,
-                score_before REAL NOT NULL,
-                score_after REAL NOT NULL,
-                adjustment REAL NOT NULL,
-                market_regime TEXT,
-                symbol_regime TEXT,
-                fear_greed REAL,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                entry_price REAL,
-                return_15m REAL,
-                return_1h REAL,
-                return_4h REAL,
-                return_24h REAL,
-                return_calculated_at TEXT
-            )
-        ''')
-
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_dual_regime_timestamp
-            ON shadow_dual_regime(timestamp)
-        ''')
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_dual_regime_symbol
-            ON shadow_dual_regime(symbol)
-        ''')
-
-        # Crypto Regime Detections table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS shadow_crypto_regime (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp INTEGER NOT NULL,
-                symbol TEXT NOT NULL,
-                signal_type TEXT NOT NULL,
-                base_regime TEXT NOT NULL,
-                crypto_regime TEXT NOT NULL,
-                funding_rate REAL,
-                oi_change_pct REAL,
-                volatility_percentile REAL,
-                atr_expansion REAL,
-                detection_data TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                entry_price REAL,
-                return_15m REAL,
-                return_1h REAL,
-                return_4h REAL,
-                return_24h REAL,
-                return_calculated_at TEXT
-            )
-        ''')
-
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_crypto_regime_timestamp
-            ON shadow_crypto_regime(timestamp)
-        ''')
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_crypto_regime_symbol
-            ON shadow_crypto_regime(symbol)
-        ''')
-
-        # CAS (Cascade Absorption Signal) table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS shadow_cas_signals (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp INTEGER NOT NULL,
-                symbol TEXT NOT NULL,
-                cas_score REAL NOT NULL,
-                signal_direction TEXT NOT NULL,
-                signal_strength TEXT NOT NULL,
-                proximity REAL,
-                magnitude REAL,
-                whale_signal REAL,
-                retail_extreme REAL,
-                alignment REAL,
-                trend_damping REAL,
-                cascade_side TEXT,
-                cascade_price REAL,
-                current_price REAL,
-                atr REAL,
-                confidence REAL,
-                is_valid INTEGER,
-                reason TEXT,
-                return_1h REAL,
-                return_4h REAL,
-                return_24h REAL,
-                return_calculated_at INTEGER,
-                components_json TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_cas_timestamp
-            ON shadow_cas_signals(timestamp)
-        ''')
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_cas_symbol
-            ON shadow_cas_signals(symbol)
-        ''')
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_cas_is_valid
-            ON shadow_cas_signals(is_valid)
-        ''')
-
-        # Distribution Signals (WDD - Whale Distribution Detector) table
-        # Tracks CVD bearish divergence: Price↑ + CVD↓ = whales distributing
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS shadow_distribution_signals (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp INTEGER NOT NULL,
-                symbol TEXT NOT NULL,
-                divergence_type TEXT NOT NULL,
-                divergence_strength REAL,
-                price_trend REAL,
-                cvd_trend REAL,
-                entry_price REAL,
-                volume_profile TEXT,
-                lookback_bars INTEGER,
-                return_15m REAL,
-                return_1h REAL,
-                return_4h REAL,
-                return_24h REAL,
-                return_calculated_at TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_dist_timestamp
-            ON shadow_distribution_signals(timestamp)
-        ''')
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_dist_symbol
-            ON shadow_distribution_signals(symbol)
-        ''')
-        cursor.execute('''
-            CREATE INDEX IF NOT EXISTS idx_dist_divergence_type
-            ON shadow_distribution_signals(divergence_type)
-        ''')
-
-        conn.commit()
-        conn.close()
+        def _create_tables(conn):
+            cursor = conn.cursor()
+
+            # BTC Predictions table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS shadow_btc_predictions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp INTEGER NOT NULL,
+                    symbol TEXT NOT NULL,
+                    signal_type TEXT NOT NULL,
+                    original_score REAL NOT NULL,
+                    would_boost REAL NOT NULL,
+                    btc_direction TEXT,
+                    confidence REAL,
+                    stability_score REAL,
+                    beta REAL,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            # Create index for efficient querying
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_btc_pred_timestamp
+                ON shadow_btc_predictions(timestamp)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_btc_pred_symbol
+                ON shadow_btc_predictions(symbol)
+            ''')
+
+            # Dual-Regime Adjustments table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS shadow_dual_regime (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp INTEGER NOT NULL,
+                    symbol TEXT NOT NULL,
+                    signal_type TEXT NOT NULL,
+                    score_before REAL NOT NULL,
+                    score_after REAL NOT NULL,
+                    adjustment REAL NOT NULL,
+                    market_regime TEXT,
+                    symbol_regime TEXT,
+                    fear_greed REAL,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    entry_price REAL,
+                    return_15m REAL,
+                    return_1h REAL,
+                    return_4h REAL,
+                    return_24h REAL,
+                    return_calculated_at TEXT
+                )
+            ''')
+
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_dual_regime_timestamp
+                ON shadow_dual_regime(timestamp)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_dual_regime_symbol
+                ON shadow_dual_regime(symbol)
+            ''')
+
+            # Crypto Regime Detections table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS shadow_crypto_regime (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp INTEGER NOT NULL,
+                    symbol TEXT NOT NULL,
+                    signal_type TEXT NOT NULL,
+                    base_regime TEXT NOT NULL,
+                    crypto_regime TEXT NOT NULL,
+                    funding_rate REAL,
+                    oi_change_pct REAL,
+                    volatility_percentile REAL,
+                    atr_expansion REAL,
+                    detection_data TEXT,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    entry_price REAL,
+                    return_15m REAL,
+                    return_1h REAL,
+                    return_4h REAL,
+                    return_24h REAL,
+                    return_calculated_at TEXT
+                )
+            ''')
+
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_crypto_regime_timestamp
+                ON shadow_crypto_regime(timestamp)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_crypto_regime_symbol
+                ON shadow_crypto_regime(symbol)
+            ''')
+
+            # CAS (Cascade Absorption Signal) table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS shadow_cas_signals (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp INTEGER NOT NULL,
+                    symbol TEXT NOT NULL,
+                    cas_score REAL NOT NULL,
+                    signal_direction TEXT NOT NULL,
+                    signal_strength TEXT NOT NULL,
+                    proximity REAL,
+                    magnitude REAL,
+                    whale_signal REAL,
+                    retail_extreme REAL,
+                    alignment REAL,
+                    trend_damping REAL,
+                    cascade_side TEXT,
+                    cascade_price REAL,
+                    current_price REAL,
+                    atr REAL,
+                    confidence REAL,
+                    is_valid INTEGER,
+                    reason TEXT,
+                    return_1h REAL,
+                    return_4h REAL,
+                    return_24h REAL,
+                    return_calculated_at INTEGER,
+                    components_json TEXT,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_cas_timestamp
+                ON shadow_cas_signals(timestamp)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_cas_symbol
+                ON shadow_cas_signals(symbol)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_cas_is_valid
+                ON shadow_cas_signals(is_valid)
+            ''')
+
+            # Distribution Signals (WDD - Whale Distribution Detector) table
+            # Tracks CVD bearish divergence: Price↑ + CVD↓ = whales distributing
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS shadow_distribution_signals (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp INTEGER NOT NULL,
+                    symbol TEXT NOT NULL,
+                    divergence_type TEXT NOT NULL,
+                    divergence_strength REAL,
+                    price_trend REAL,
+                    cvd_trend REAL,
+                    entry_price REAL,
+                    volume_profile TEXT,
+                    lookback_bars INTEGER,
+                    return_15m REAL,
+                    return_1h REAL,
+                    return_4h REAL,
+                    return_24h REAL,
+                    return_calculated_at TEXT,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_dist_timestamp
+                ON shadow_distribution_signals(timestamp)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_dist_symbol
+                ON shadow_distribution_signals(symbol)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_dist_divergence_type
+                ON shadow_distribution_signals(divergence_type)
+            ''')
+
+        _db().write(_create_tables)
         logger.info("Shadow mode database tables initialized")
         return True
 
@@ -245,11 +251,7 @@ def store_btc_prediction(prediction: Dict[str, Any]) -> Optional[int]:
         Inserted row ID or None on failure
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
+        row_id = _db().execute('''
             INSERT INTO shadow_btc_predictions (
                 timestamp, symbol, signal_type, original_score, would_boost,
                 btc_direction, confidence, stability_score, beta
@@ -266,10 +268,6 @@ def store_btc_prediction(prediction: Dict[str, Any]) -> Optional[int]:
             prediction.get('beta')
         ))
 
-        conn.commit()
-        row_id = cursor.lastrowid
-        conn.close()
-
         logger.debug(f"Stored BTC prediction for {prediction.get('symbol')} (id={row_id})")
         return row_id
 
@@ -297,10 +295,7 @@ def get_btc_predictions(
         List of prediction dictionaries
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = _db().connection().cursor()
 
         query = 'SELECT * FROM shadow_btc_predictions WHERE 1=1'
         params = []
@@ -322,7 +317,6 @@ def get_btc_predictions(
 
         cursor.execute(query, params)
         rows = cursor.fetchall()
-        conn.close()
 
         return [dict(row) for row in rows]
 
@@ -356,11 +350,7 @@ def store_dual_regime_adjustment(adjustment: Dict[str, Any]) -> Optional[int]:
         Inserted row ID or None on failure
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
+        row_id = _db().execute('''
             INSERT INTO shadow_dual_regime (
                 timestamp, symbol, signal_type, score_before, score_after,
                 adjustment, market_regime, symbol_regime, fear_greed, entry_price
@@ -378,10 +368,6 @@ def store_dual_regime_adjustment(adjustment: Dict[str, Any]) -> Optional[int]:
             adjustment.get('entry_price')
         ))
 
-        conn.commit()
-        row_id = cursor.lastrowid
-        conn.close()
-
         logger.debug(f"Stored dual-regime adjustment for {adjustment.get('symbol')} (id={row_id})")
         return row_id
 
@@ -400,10 +386,7 @@ def get_dual_regime_adjustments(
     Retrieve dual-regime adjustments from the database.
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = _db().connection().cursor()
 
         query = 'SELECT * FROM shadow_dual_regime WHERE 1=1'
         params = []
@@ -425,7 +408,6 @@ def get_dual_regime_adjustments(
 
         cursor.execute(query, params)
         rows = cursor.fetchall()
-        conn.close()
 
         return [dict(row) for row in rows]
 
@@ -457,10 +439,6 @@ def update_dual_regime_forward_returns(
         True if updated successfully
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
         updates = []
         params = []
 
@@ -491,10 +469,8 @@ def update_dual_regime_forward_returns(
             query = f"UPDATE shadow_dual_regime SET {', '.join(updates)} WHERE id = ?"
             params.append(record_id)
 
-            cursor.execute(query, params)
-            conn.commit()
+            _db().execute(query, params)
 
-        conn.close()
         return True
 
     except Exception as e:
@@ -517,10 +493,7 @@ def get_dual_regime_pending_returns(
         List of records missing the specified return
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = _db().connection().cursor()
 
         # Calculate cutoff timestamp
         cutoff_ms = int((datetime.now(timezone.utc).timestamp() - (hours_back * 3600)) * 1000)
@@ -538,7 +511,6 @@ def get_dual_regime_pending_returns(
         ''', (cutoff_ms,))
 
         rows = cursor.fetchall()
-        conn.close()
 
         return [dict(row) for row in rows]
 
@@ -573,14 +545,10 @@ def store_crypto_regime_detection(detection: Dict[str, Any]) -> Optional[int]:
         Inserted row ID or None on failure
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
         detection_data = detection.get('detection_data', {})
         detection_json = json.dumps(detection_data) if detection_data else None
 
-        cursor.execute('''
+        row_id = _db().execute('''
             INSERT INTO shadow_crypto_regime (
                 timestamp, symbol, signal_type, base_regime, crypto_regime,
                 funding_rate, oi_change_pct, volatility_percentile, atr_expansion,
@@ -600,10 +568,6 @@ def store_crypto_regime_detection(detection: Dict[str, Any]) -> Optional[int]:
             detection.get('entry_price')
         ))
 
-        conn.commit()
-        row_id = cursor.lastrowid
-        conn.close()
-
         logger.debug(f"Stored crypto regime detection for {detection.get('symbol')} (id={row_id})")
         return row_id
 
@@ -635,10 +599,6 @@ def update_crypto_regime_forward_returns(
         True if updated successfully
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
         updates = []
         params = []
 
@@ -669,10 +629,8 @@ def update_crypto_regime_forward_returns(
             query = f"UPDATE shadow_crypto_regime SET {', '.join(updates)} WHERE id = ?"
             params.append(record_id)
 
-            cursor.execute(query, params)
-            conn.commit()
+            _db().execute(query, params)
 
-        conn.close()
         return True
 
     except Exception as e:
@@ -696,10 +654,7 @@ def get_crypto_regime_pending_returns(
         List of records missing the specified return(s)
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = _db().connection().cursor()
 
         # Calculate cutoff timestamp
         cutoff_ms = int((datetime.now(timezone.utc).timestamp() - (hours_back * 3600)) * 1000)
@@ -725,7 +680,6 @@ def get_crypto_regime_pending_returns(
         ''', (cutoff_ms,))
 
         rows = cursor.fetchall()
-        conn.close()
 
         # Parse JSON fields
         results = []
@@ -755,10 +709,7 @@ def get_crypto_regime_detections(
     Retrieve crypto regime detections from the database.
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = _db().connection().cursor()
 
         query = 'SELECT * FROM shadow_crypto_regime WHERE 1=1'
         params = []
@@ -780,7 +731,6 @@ def get_crypto_regime_detections(
 
         cursor.execute(query, params)
         rows = cursor.fetchall()
-        conn.close()
 
         # Parse JSON fields
         results = []
@@ -827,10 +777,6 @@ def store_cas_signal(signal: Dict[str, Any]) -> Optional[int]:
         Inserted row ID or None on failure
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
         # Extract components for JSON storage
         components = signal.get('components', {})
         if not components:
@@ -844,7 +790,7 @@ def store_cas_signal(signal: Dict[str, Any]) -> Optional[int]:
             }
         components_json = json.dumps(components)
 
-        cursor.execute('''
+        row_id = _db().execute('''
             INSERT INTO shadow_cas_signals (
                 timestamp, symbol, cas_score, signal_direction, signal_strength,
                 proximity, magnitude, whale_signal, retail_extreme,
@@ -875,10 +821,6 @@ def store_cas_signal(signal: Dict[str, Any]) -> Optional[int]:
             components_json
         ))
 
-        conn.commit()
-        row_id = cursor.lastrowid
-        conn.close()
-
         logger.debug(f"Stored CAS signal for {signal.get('symbol')} (id={row_id}, score={signal.get('cas_score', 0):.1f})")
         return row_id
 
@@ -910,10 +852,7 @@ def get_cas_signals(
         List of signal dictionaries
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = _db().connection().cursor()
 
         query = 'SELECT * FROM shadow_cas_signals WHERE 1=1'
         params = []
@@ -942,7 +881,6 @@ def get_cas_signals(
 
         cursor.execute(query, params)
         rows = cursor.fetchall()
-        conn.close()
 
         # Parse JSON fields
         results = []
@@ -982,10 +920,6 @@ def update_cas_forward_returns(
         True if updated successfully
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
         updates = []
         params = []
 
@@ -1008,10 +942,8 @@ def update_cas_forward_returns(
             query = f"UPDATE shadow_cas_signals SET {', '.join(updates)} WHERE id = ?"
             params.append(signal_id)
 
-            cursor.execute(query, params)
-            conn.commit()
+            _db().execute(query, params)
 
-        conn.close()
         return True
 
     except Exception as e:
@@ -1034,10 +966,7 @@ def get_cas_signals_pending_returns(
         List of signals missing the specified return
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = _db().connection().cursor()
 
         # Calculate cutoff timestamp
         cutoff_ms = int((datetime.now(timezone.utc).timestamp() - (hours_back * 3600)) * 1000)
@@ -1056,7 +985,6 @@ def get_cas_signals_pending_returns(
         ''', (cutoff_ms,))
 
         rows = cursor.fetchall()
-        conn.close()
 
         return [dict(row) for row in rows]
 
@@ -1089,11 +1017,7 @@ def store_distribution_signal(signal: Dict[str, Any]) -> Optional[int]:
         Inserted row ID or None on failure
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
+        row_id = _db().execute('''
             INSERT INTO shadow_distribution_signals (
                 timestamp, symbol, divergence_type, divergence_strength,
                 price_trend, cvd_trend, entry_price, volume_profile, lookback_bars
@@ -1110,10 +1034,6 @@ def store_distribution_signal(signal: Dict[str, Any]) -> Optional[int]:
             signal.get('lookback_bars', 20)
         ))
 
-        conn.commit()
-        row_id = cursor.lastrowid
-        conn.close()
-
         logger.debug(f"Stored distribution signal for {signal.get('symbol')} "
                     f"(id={row_id}, type={signal.get('divergence_type')}, "
                     f"strength={signal.get('divergence_strength', 0):.1f})")
@@ -1147,10 +1067,7 @@ def get_distribution_signals(
         List of signal dictionaries
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = _db().connection().cursor()
 
         query = 'SELECT * FROM shadow_distribution_signals WHERE 1=1'
         params = []
@@ -1180,7 +1097,6 @@ def get_distribution_signals(
 
         cursor.execute(query, params)
         rows = cursor.fetchall()
-        conn.close()
 
         # Parse JSON fields
         results = []
@@ -1221,10 +1137,6 @@ def update_distribution_forward_returns(
         True if updated successfully
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
         updates = []
         params = []
 
@@ -1251,10 +1163,8 @@ def update_distribution_forward_returns(
             query = f"UPDATE shadow_distribution_signals SET {', '.join(updates)} WHERE id = ?"
             params.append(record_id)
 
-            cursor.execute(query, params)
-            conn.commit()
+            _db().execute(query, params)
 
-        conn.close()
         return True
 
     except Exception as e:
@@ -1277,10 +1187,7 @@ def get_distribution_pending_returns(
         List of signals missing the specified return
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = _db().connection().cursor()
 
         # Calculate cutoff timestamp
         cutoff_ms = int((datetime.now(timezone.utc).timestamp() - (hours_back * 3600)) * 1000)
@@ -1300,7 +1207,6 @@ def get_distribution_pending_returns(
         ''', (cutoff_ms,))
 
         rows = cursor.fetchall()
-        conn.close()
 
         return [dict(row) for row in rows]
 
@@ -1324,9 +1230,7 @@ def get_shadow_statistics(days: int = 7) -> Dict[str, Any]:
         Dictionary with statistics for each shadow mode type
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+        cursor = _db().connection().cursor()
 
         # Calculate timestamp cutoff
         cutoff_ms = int((datetime.now(timezone.utc).timestamp() - (days * 86400)) * 1000)
@@ -1489,7 +1393,6 @@ def get_shadow_statistics(days: int = 7) -> Dict[str, Any]:
         dist_wins = row[1] or 0
         stats['distribution_signals']['win_rate_1h'] = round(dist_wins / dist_total * 100, 1) if dist_total > 0 else None
 
-        conn.close()
         return stats
 
     except Exception as e:
@@ -1508,19 +1411,15 @@ def cleanup_old_shadow_data(days_to_keep: int = 30) -> int:
         Total number of rows deleted
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
         cutoff_ms = int((datetime.now(timezone.utc).timestamp() - (days_to_keep * 86400)) * 1000)
-        total_deleted = 0
 
-        for table in ['shadow_btc_predictions', 'shadow_dual_regime', 'shadow_crypto_regime', 'shadow_cas_signals', 'shadow_distribution_signals']:
-            cursor.execute(f'DELETE FROM {table} WHERE timestamp < ?', (cutoff_ms,))
-            total_deleted += cursor.rowcount
+        def _delete(conn):
+            deleted = 0
+            for table in ['shadow_btc_predictions', 'shadow_dual_regime', 'shadow_crypto_regime', 'shadow_cas_signals', 'shadow_distribution_signals']:
+                deleted += conn.execute(f'DELETE FROM {table} WHERE timestamp < ?', (cutoff_ms,)).rowcount
+            return deleted
 
-        conn.commit()
-        conn.close()
+        total_deleted = _db().write(_delete)
 
         if total_deleted > 0:
             logger.info(f"Cleaned up {total_deleted} old shadow records (older than {days_to_keep} days)")
@@ -7,30 +7,104 @@
 - Excursion tracking (MFE/MAE)
 - Pattern classification
 - Validation cohort tagging
+
+MFE/MAE state of active signals is kept in memory (``ExcursionTracker``) and
+flushed to SQLite in batches; see ``update_price`` / ``flush_excursions``.
 """
 
 import sqlite3
+import time
 from datetime import datetime
-from typing import Optional, Dict, Any, Literal
+from typing import Optional, Dict, Any, Iterable, List, Literal
 import json
 import logging
 
+from .excursion_tracker import ExcursionTracker
+from .sqlite_access import get_db_access
+
 logger = logging.getLogger(__name__)
 
+_CLOSED_FILTER = "status = 'closed' AND outcome IN ('win', 'loss', 'stopped_out')"
+
+# Additive aggregates behind a performance summary; shared by the live query
+# and the daily rollup table so both can be combined
+_SUMMARY_AGGREGATES = """
+    COUNT(*) AS total_signals,
+    COALESCE(SUM(outcome = 'win'), 0) AS wins,
+    COALESCE(SUM(outcome = 'loss'), 0) AS losses,
+    COALESCE(SUM(outcome = 'stopped_out'), 0) AS stopped_out,
+    SUM(pnl_pct) AS sum_pnl, COUNT(pnl_pct) AS n_pnl,
+    SUM(CASE WHEN outcome = 'win' THEN pnl_pct END) AS sum_win,
+    COUNT(CASE WHEN outcome = 'win' THEN pnl_pct END) AS n_win,
+    SUM(CASE WHEN outcome = 'loss' THEN pnl_pct END) AS sum_loss,
+    COUNT(CASE WHEN outcome = 'loss' THEN pnl_pct END) AS n_loss,
+    SUM(r_multiple) AS sum_r, COUNT(r_multiple) AS n_r,
+    SUM(duration_hours) AS sum_duration, COUNT(duration_hours) AS n_duration,
+    MAX(pnl_pct) AS max_pnl, MIN(pnl_pct) AS min_pnl,
+    SUM(mfe_pct) AS sum_mfe, COUNT(mfe_pct) AS n_mfe,
+    SUM(mae_pct) AS sum_mae, COUNT(mae_pct) AS n_mae
+"""
+
+_AGGREGATE_COLUMNS = (
+    'total_signals', 'wins', 'losses', 'stopped_out', 'sum_pnl', 'n_pnl',
+    'sum_win', 'n_win', 'sum_loss', 'n_loss', 'sum_r', 'n_r',
+    'sum_duration', 'n_duration', 'max_pnl', 'min_pnl',
+    'sum_mfe', 'n_mfe', 'sum_mae', 'n_mae'
+)
+
+_ROLLUP_TABLE = f"""
+    CREATE TABLE IF NOT EXISTS signal_performance_rollups (
+        day TEXT NOT NULL,
+        signal_type TEXT NOT NULL,
+        signal_pattern TEXT NOT NULL,
+        {', '.join(f'{c} REAL' for c in _AGGREGATE_COLUMNS)},
+        PRIMARY KEY (day, signal_type, signal_pattern)
+    )
+"""
+
+# How far the rollups are up to date: every day through ``rolled_through`` and
+# every close up to ``closed_watermark``. Kept in the database so closes by
+# other processes and days completed since the last rebuild are picked up.
+_ROLLUP_STATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS signal_performance_rollup_state (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        rolled_through TEXT NOT NULL,
+        closed_watermark TEXT NOT NULL
+    )
+"""
+
+_CLOSED_AT_INDEX = "CREATE INDEX IF NOT EXISTS idx_trading_signals_closed_at ON trading_signals(closed_at)"
+
+_EXCURSION_UPDATE = """
+    UPDATE trading_signals SET
+        mfe_pct = COALESCE(?, mfe_pct),
+        mfe_price = COALESCE(?, mfe_price),
+        mfe_at = COALESCE(?, mfe_at),
+        mae_pct = COALESCE(?, mae_pct),
+        mae_price = COALESCE(?, mae_price),
+        mae_at = COALESCE(?, mae_at)
+    WHERE signal_id = ? AND status = 'active'
+"""
+
 
 class SignalPerformanceTracker:
     """
     Tracks and updates trading signal performance metrics.
     """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str = "data/virtuoso.db", flush_interval: float = 0.0):
         """
         Initialize tracker with database path.
 
         Args:
             db_path: Path to SQLite database file
+            flush_interval: Seconds between excursion flushes; 0 writes new
+                extremes through on every update
         """
         self.db_path = db_path
+        self.flush_interval = flush_interval
+        self.excursions = ExcursionTracker()
+        self._last_flush: Optional[float] = None  # first dirty batch flushes immediately
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get database connection with row factory."""
@@ -155,6 +229,11 @@ def close_signal(
                 logger.error(f"Signal {signal_id} has no entry price")
                 return False
 
+            # Persist the in-memory excursion before the signal leaves 'active'
+            pending = self.excursions.remove(signal_id)
+            if pending:
+                self._write_excursions([pending])
+
             # Calculate P&L
             pnl_pct = self._calculate_pnl_pct(signal_type, entry_price, exit_price)
 
@@ -224,6 +303,9 @@ def update_excursion(
         """
         Update maximum favorable/adverse excursion for active signal.
 
+        The signal is loaded from the database the first time it is seen and
+        evaluated in memory afterwards.
+
         Args:
             signal_id: Unique signal identifier
             current_price: Current market price
@@ -232,66 +314,115 @@ def update_excursion(
             True if successful, False otherwise
         """
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            if signal_id not in self.excursions:
+                conn = self._get_connection()
+                row = conn.execute(
+                    """
+                    SELECT signal_id, symbol, signal_type, entry_price, current_price, mfe_pct, mae_pct
+                    FROM trading_signals
+                    WHERE signal_id = ? AND status = 'active'
+                    """,
+                    (signal_id,),
+                ).fetchone()
+                conn.close()
+
+                if not row or not self._track(row):
+                    return False
+
+            symbol = self.excursions.get(signal_id)["symbol"]
+            self.excursions.update_price(symbol, current_price)
+            self.maybe_flush()
+            return True
 
-            # Get signal data
-            cursor.execute(
-                """
-                SELECT signal_type, entry_price, mfe_pct, mae_pct, current_price
-                FROM trading_signals
-                WHERE signal_id = ? AND status = 'active'
-                """,
-                (signal_id,),
-            )
-            row = cursor.fetchone()
+        except Exception as e:
+            logger.error(f"Error updating excursion for {signal_id}: {e}")
+            return False
 
-            if not row:
-                return False
+    def _track(self, row) -> bool:
+        """Start tracking a ``trading_signals`` row (mapping) in memory."""
+        return self.excursions.add(
+            row["signal_id"],
+            row["symbol"],
+            row["signal_type"],
+            row["entry_price"] or row["current_price"],
+            row["mfe_pct"],
+            row["mae_pct"],
+        )
 
-            signal_type = row["signal_type"]
-            entry_price = row["entry_price"] or row["current_price"]
-            current_mfe = row["mfe_pct"] or 0
-            current_mae = row["mae_pct"] or 0
+    def sync_active(self, signals: Iterable[Dict[str, Any]]) -> None:
+        """
+        Align the in-memory excursion table with the given active signals.
 
-            if not entry_price:
-                return False
+        New signals start tracking from their stored MFE/MAE; signals that
+        are no longer active are dropped after flushing pending updates.
 
-            # Calculate current excursion
-            if signal_type == "LONG":
-                excursion_pct = (current_price - entry_price) / entry_price * 100
-            else:  # SHORT
-                excursion_pct = (entry_price - current_price) / entry_price * 100
-
-            # Update if new extreme reached
-            updates = {}
-            now = datetime.utcnow().isoformat()
-
-            if excursion_pct > current_mfe:
-                updates["mfe_pct"] = excursion_pct
-                updates["mfe_price"] = current_price
-                updates["mfe_at"] = now
-
-            if excursion_pct < current_mae:
-                updates["mae_pct"] = excursion_pct
-                updates["mae_price"] = current_price
-                updates["mae_at"] = now
-
-            if updates:
-                set_clause = ", ".join([f"{k} = ?" for k in updates.keys()])
-                values = list(updates.values()) + [signal_id]
-                cursor.execute(
-                    f"UPDATE trading_signals SET {set_clause} WHERE signal_id = ?",
-                    values,
-                )
-                conn.commit()
+        Args:
+            signals: Active ``trading_signals`` rows
+        """
+        signals = list(signals)
+        active = {s["signal_id"] for s in signals}
+        pending = [
+            update for update in (
+                self.excursions.remove(signal_id)
+                for signal_id in self.excursions.signal_ids() if signal_id not in active
+            ) if update
+        ]
+        if pending:
+            self._write_excursions(pending)
+
+        for signal in signals:
+            if signal["signal_id"] not in self.excursions:
+                self._track(signal)
+
+    def update_price(self, symbol: str, price: float) -> int:
+        """
+        Evaluate every tracked signal of a symbol against a new price.
 
-            conn.close()
-            return True
+        Args:
+            symbol: Trading symbol
+            price: Current market price
 
+        Returns:
+            Number of signals that reached a new extreme
+        """
+        changed = self.excursions.update_price(symbol, price)
+        self.maybe_flush()
+        return changed
+
+    def maybe_flush(self) -> int:
+        """Flush dirty excursions once ``flush_interval`` has elapsed."""
+        if not self.excursions.dirty_count:
+            return 0
+        if self._last_flush is not None and time.monotonic() - self._last_flush < self.flush_interval:
+            return 0
+        return self.flush_excursions()
+
+    def flush_excursions(self) -> int:
+        """
+        Write all dirty excursions with a single batched UPDATE.
+
+        Returns:
+            Number of signals written
+        """
+        self._last_flush = time.monotonic()
+        updates = self.excursions.drain_dirty()
+        if updates:
+            self._write_excursions(updates)
+        return len(updates)
+
+    def _write_excursions(self, updates: List[Dict[str, Any]]) -> None:
+        params = [
+            (u["mfe_pct"], u["mfe_price"], u["mfe_at"], u["mae_pct"], u["mae_price"], u["mae_at"], u["signal_id"])
+            for u in updates
+        ]
+        try:
+            get_db_access(self.db_path).write(lambda conn: conn.executemany(_EXCURSION_UPDATE, params))
         except Exception as e:
-            logger.error(f"Error updating excursion for {signal_id}: {e}")
-            return False
+            logger.error(f"Error flushing excursions for {len(params)} signals: {e}")
+
+    def close(self) -> None:
+        """Flush pending excursions."""
+        self.flush_excursions()
 
     @staticmethod
     def _calculate_pnl_pct(signal_type: str, entry_price: float, exit_price: float) -> float:
@@ -407,6 +538,7 @@ def get_performance_summary(
         signal_type: Optional[str] = None,
         signal_pattern: Optional[str] = None,
         days: int = 7,
+        use_rollups: bool = False,
     ) -> Dict[str, Any]:
         """
         Get performance summary statistics.
@@ -415,87 +547,245 @@ def get_performance_summary(
             signal_type: Filter by LONG/SHORT (optional)
             signal_pattern: Filter by pattern type (optional)
             days: Number of days to look back
+            use_rollups: Read whole days from ``signal_performance_rollups``
+                and only aggregate the partial first day and today live
 
         Returns:
             Dictionary with performance metrics
         """
         try:
+            filters, params = [], []
+            if signal_type:
+                filters.append("signal_type = ?")
+                params.append(signal_type)
+            if signal_pattern:
+                filters.append("signal_pattern = ?")
+                params.append(signal_pattern)
+            cutoff = f"-{int(days)} days"
+
             conn = self._get_connection()
-            cursor = conn.cursor()
+            try:
+                if use_rollups:
+                    totals = self._summary_from_rollups(conn, filters, params, cutoff)
+                else:
+                    totals = self._aggregate(
+                        conn, filters + ["created_at > datetime('now', ?)"], params + [cutoff]
+                    )
+            finally:
+                conn.close()
+
+            return self._summarize(totals)
 
-            # Build query
-            where_clauses = [
-                "status = 'closed'",
-                "outcome IN ('win', 'loss', 'stopped_out')",
-                f"created_at > datetime('now', '-{days} days')",
-            ]
+        except Exception as e:
+            logger.error(f"Error getting performance summary: {e}")
+            return {"error": str(e)}
 
-            if signal_type:
-                where_clauses.append(f"signal_type = '{signal_type}'")
-            if signal_pattern:
-                where_clauses.append(f"signal_pattern = '{signal_pattern}'")
+    @staticmethod
+    def _aggregate(conn: sqlite3.Connection, filters: List[str], params: List[Any]) -> Dict[str, Any]:
+        where_sql = " AND ".join([_CLOSED_FILTER] + filters)
+        row = conn.execute(
+            f"SELECT {_SUMMARY_AGGREGATES} FROM trading_signals WHERE {where_sql}", params
+        ).fetchone()
+        return dict(row)
+
+    def _summary_from_rollups(
+        self,
+        conn: sqlite3.Connection,
+        filters: List[str],
+        params: List[Any],
+        cutoff: str,
+    ) -> Dict[str, Any]:
+        """Combine rolled-up whole days with the live edges of the window."""
+        self._sync_rollups()
 
-            where_sql = " AND ".join(where_clauses)
+        # Whole days strictly inside the window come from the rollup table
+        sums = ", ".join(
+            f"{'MAX' if c == 'max_pnl' else 'MIN' if c == 'min_pnl' else 'SUM'}({c}) AS {c}"
+            for c in _AGGREGATE_COLUMNS
+        )
+        where_sql = " AND ".join(
+            ["day > DATE('now', ?)", "day < DATE('now')"] + filters
+        )
+        rolled = dict(conn.execute(
+            f"SELECT {sums} FROM signal_performance_rollups WHERE {where_sql}", [cutoff] + params
+        ).fetchone())
+
+        # The partial first day and today are aggregated from trading_signals
+        live = self._aggregate(
+            conn,
+            filters + [
+                "created_at > datetime('now', ?)",
+                "(DATE(created_at) = DATE('now', ?) OR DATE(created_at) >= DATE('now'))",
+            ],
+            params + [cutoff, cutoff],
+        )
+        return self._combine(rolled, live)
 
-            cursor.execute(
-                f"""
-                SELECT
-                    COUNT(*) as total_signals,
-                    COUNT(*) FILTER (WHERE outcome = 'win') as wins,
-                    COUNT(*) FILTER (WHERE outcome = 'loss') as losses,
-                    COUNT(*) FILTER (WHERE outcome = 'stopped_out') as stopped_out,
-                    AVG(pnl_pct) as avg_pnl,
-                    AVG(CASE WHEN outcome = 'win' THEN pnl_pct END) as avg_win,
-                    AVG(CASE WHEN outcome = 'loss' THEN pnl_pct END) as avg_loss,
-                    AVG(r_multiple) as avg_r_multiple,
-                    AVG(duration_hours) as avg_duration_hours,
-                    MAX(pnl_pct) as max_win,
-                    MIN(pnl_pct) as min_loss,
-                    AVG(mfe_pct) as avg_mfe,
-                    AVG(mae_pct) as avg_mae
-                FROM trading_signals
-                WHERE {where_sql}
-                """
-            )
+    @staticmethod
+    def _combine(*parts: Dict[str, Any]) -> Dict[str, Any]:
+        totals: Dict[str, Any] = {}
+        for column in _AGGREGATE_COLUMNS:
+            values = [p[column] for p in parts if p.get(column) is not None]
+            if column == "max_pnl":
+                totals[column] = max(values) if values else None
+            elif column == "min_pnl":
+                totals[column] = min(values) if values else None
+            else:
+                totals[column] = sum(values) if values else None
+        return totals
 
-            row = cursor.fetchone()
-            conn.close()
+    def refresh_rollups(self, days: Optional[Iterable[str]] = None) -> int:
+        """
+        Rebuild daily performance rollups for completed days.
 
-            if row["total_signals"] == 0:
-                return {"message": "No closed signals found"}
+        Args:
+            days: 'YYYY-MM-DD' days to rebuild (default: all)
 
-            win_rate = (row["wins"] / row["total_signals"]) * 100 if row["wins"] else 0
-            profit_factor = (
-                abs(row["avg_win"] * row["wins"] / (row["avg_loss"] * row["losses"]))
-                if row["losses"] and row["avg_loss"]
-                else None
-            )
+        Returns:
+            Number of rollup rows written
+        """
+        days = sorted(set(days)) if days is not None else None
 
-            return {
-                "total_signals": row["total_signals"],
-                "wins": row["wins"],
-                "losses": row["losses"],
-                "stopped_out": row["stopped_out"],
-                "win_rate": round(win_rate, 2),
-                "avg_pnl_pct": round(row["avg_pnl"], 2) if row["avg_pnl"] else None,
-                "avg_win_pct": round(row["avg_win"], 2) if row["avg_win"] else None,
-                "avg_loss_pct": round(row["avg_loss"], 2) if row["avg_loss"] else None,
-                "profit_factor": round(profit_factor, 2) if profit_factor else None,
-                "avg_r_multiple": round(row["avg_r_multiple"], 2)
-                if row["avg_r_multiple"]
-                else None,
-                "avg_duration_hours": round(row["avg_duration_hours"], 2)
-                if row["avg_duration_hours"]
-                else None,
-                "max_win_pct": round(row["max_win"], 2) if row["max_win"] else None,
-                "min_loss_pct": round(row["min_loss"], 2) if row["min_loss"] else None,
-                "avg_mfe_pct": round(row["avg_mfe"], 2) if row["avg_mfe"] else None,
-                "avg_mae_pct": round(row["avg_mae"], 2) if row["avg_mae"] else None,
-            }
+        def rebuild(conn):
+            self._create_rollup_tables(conn)
+            if days is not None:
+                return self._rebuild_rollups(conn, days)
+            watermark = self._closed_watermark(conn)
+            written = self._rebuild_rollups(conn, None)
+            self._record_rollup_state(conn, watermark)
+            return written
 
-        except Exception as e:
-            logger.error(f"Error getting performance summary: {e}")
-            return {"error": str(e)}
+        return get_db_access(self.db_path).write(rebuild)
+
+    def _sync_rollups(self) -> int:
+        """
+        Bring the rollups up to date before they are read.
+
+        Rebuilds every day completed since ``rolled_through`` and the creation
+        day of every signal closed after ``closed_watermark``, whichever process
+        closed it. The first call on a database rebuilds everything.
+
+        Returns:
+            Number of rollup rows written
+        """
+        def sync(conn):
+            self._create_rollup_tables(conn)
+            watermark = self._closed_watermark(conn)
+            state = conn.execute(
+                "SELECT rolled_through, closed_watermark FROM signal_performance_rollup_state"
+            ).fetchone()
+            if state is None:
+                written = self._rebuild_rollups(conn, None)
+            else:
+                rolled_through, closed_watermark = state
+                days = {
+                    day for (day,) in conn.execute(
+                        """
+                        SELECT DISTINCT DATE(created_at) FROM trading_signals
+                        WHERE created_at >= DATE(?, '+1 day') AND created_at < DATE('now')
+                        """,
+                        (rolled_through,),
+                    )
+                }
+                # Closes are detected through closed_at, which close_signal always sets
+                days.update(
+                    day for (day,) in conn.execute(
+                        "SELECT DISTINCT DATE(created_at) FROM trading_signals WHERE closed_at > ?",
+                        (closed_watermark,),
+                    )
+                )
+                written = self._rebuild_rollups(conn, sorted(days)) if days else 0
+            self._record_rollup_state(conn, watermark)
+            return written
+
+        return get_db_access(self.db_path).write(sync)
+
+    @staticmethod
+    def _create_rollup_tables(conn: sqlite3.Connection) -> None:
+        conn.execute(_ROLLUP_TABLE)
+        conn.execute(_ROLLUP_STATE_TABLE)
+        conn.execute(_CLOSED_AT_INDEX)
+
+    @staticmethod
+    def _closed_watermark(conn: sqlite3.Connection) -> str:
+        return conn.execute("SELECT COALESCE(MAX(closed_at), '') FROM trading_signals").fetchone()[0]
+
+    @staticmethod
+    def _record_rollup_state(conn: sqlite3.Connection, watermark: str) -> None:
+        conn.execute(
+            """
+            INSERT INTO signal_performance_rollup_state (id, rolled_through, closed_watermark)
+            VALUES (1, DATE('now', '-1 day'), ?)
+            ON CONFLICT(id) DO UPDATE SET
+                rolled_through = excluded.rolled_through,
+                closed_watermark = excluded.closed_watermark
+            """,
+            (watermark,),
+        )
+
+    @staticmethod
+    def _rebuild_rollups(conn: sqlite3.Connection, days: Optional[List[str]]) -> int:
+        """Rebuild the rollups for ``days``, or for every completed day when None."""
+        day_filter, params = "", []
+        if days is not None:
+            placeholders = ", ".join("?" for _ in days)
+            day_filter = f"AND DATE(created_at) IN ({placeholders})"
+            params = list(days)
+            conn.execute(f"DELETE FROM signal_performance_rollups WHERE day IN ({placeholders})", params)
+        else:
+            conn.execute("DELETE FROM signal_performance_rollups")
+        cursor = conn.execute(
+            f"""
+            INSERT INTO signal_performance_rollups
+                (day, signal_type, signal_pattern, {', '.join(_AGGREGATE_COLUMNS)})
+            SELECT DATE(created_at), signal_type, COALESCE(signal_pattern, ''), {_SUMMARY_AGGREGATES}
+            FROM trading_signals
+            WHERE {_CLOSED_FILTER} AND DATE(created_at) < DATE('now') {day_filter}
+            GROUP BY DATE(created_at), signal_type, COALESCE(signal_pattern, '')
+            """,
+            params,
+        )
+        return cursor.rowcount
+
+    @staticmethod
+    def _summarize(totals: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn additive aggregates into the summary metrics."""
+        total = int(totals["total_signals"] or 0)
+        if total == 0:
+            return {"message": "No closed signals found"}
+
+        def mean(sum_key: str, count_key: str) -> Optional[float]:
+            return totals[sum_key] / totals[count_key] if totals[count_key] else None
+
+        def rounded(value: Optional[float]) -> Optional[float]:
+            return round(value, 2) if value else None
+
+        wins, losses = int(totals["wins"] or 0), int(totals["losses"] or 0)
+        avg_win, avg_loss = mean("sum_win", "n_win"), mean("sum_loss", "n_loss")
+        win_rate = (wins / total) * 100 if wins else 0
+        profit_factor = (
+            abs(avg_win * wins / (avg_loss * losses))
+            if losses and avg_loss and avg_win is not None
+            else None
+        )
+
+        return {
+            "total_signals": total,
+            "wins": wins,
+            "losses": losses,
+            "stopped_out": int(totals["stopped_out"] or 0),
+            "win_rate": round(win_rate, 2),
+            "avg_pnl_pct": rounded(mean("sum_pnl", "n_pnl")),
+            "avg_win_pct": rounded(avg_win),
+            "avg_loss_pct": rounded(avg_loss),
+            "profit_factor": rounded(profit_factor),
+            "avg_r_multiple": rounded(mean("sum_r", "n_r")),
+            "avg_duration_hours": rounded(mean("sum_duration", "n_duration")),
+            "max_win_pct": rounded(totals["max_pnl"]),
+            "min_loss_pct": rounded(totals["min_pnl"]),
+            "avg_mfe_pct": rounded(mean("sum_mfe", "n_mfe")),
+            "avg_mae_pct": rounded(mean("sum_mae", "n_mae")),
+        }
 
 
 # ============================================================================
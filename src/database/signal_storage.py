@@ -5,7 +5,6 @@
 This module provides functions to save signal data from JSON reports to the database.
 """
 
-import sqlite3
 import json
 import logging
 import os
@@ -13,6 +12,8 @@
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+from .sqlite_access import SQLiteAccess, get_db_access
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +22,11 @@ def get_db_path() -> str:
     return os.path.join(os.getcwd(), 'data', 'virtuoso.db')
 
 
+def _db() -> SQLiteAccess:
+    """Shared virtuoso.db access layer (long-lived connections, batched writes)."""
+    return get_db_access(get_db_path())
+
+
 def store_trading_signal(
     signal_data: Dict[str, Any],
     json_path: Optional[str] = None,
@@ -51,14 +57,6 @@ def store_trading_signal(
         The ID of the inserted row, or None if insertion failed
     """
     try:
-        db_path = get_db_path()
-
-        # Ensure database directory exists
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
-
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
         # Extract data from signal_data
         symbol = signal_data.get('symbol', '').upper().replace('/', '')
         signal_type = signal_data.get('signal_type', 'UNKNOWN')
@@ -76,13 +74,6 @@ def store_trading_signal(
         score_str = f"{score:.1f}".replace('.', 'p')
         signal_id = f"{symbol.lower()}_{signal_type}_{score_str}_{timestamp_str}"
 
-        # Check for duplicate
-        cursor.execute('SELECT id FROM trading_signals WHERE signal_id = ?', (signal_id,))
-        if cursor.fetchone():
-            logger.debug(f"Signal {signal_id} already exists, skipping")
-            conn.close()
-            return None
-
         # Current timestamp in milliseconds
         timestamp_ms = int(datetime.now().timestamp() * 1000)
 
@@ -119,15 +110,7 @@ def store_trading_signal(
         # Trade params JSON
         trade_params_json = json.dumps(trade_params) if trade_params else None
 
-        # Insert into database
-        cursor.execute('''
-            INSERT INTO trading_signals (
-                signal_id, symbol, signal_type, confluence_score, reliability,
-                entry_price, stop_loss, current_price, timestamp,
-                targets, components, interpretations, insights, influential_components,
-                sent_to_discord, json_path, pdf_path, trade_params
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        row = (
             signal_id, symbol, signal_type, score, reliability,
             entry_price, stop_loss, price, timestamp_ms,
             targets_json, components_json, interpretations_json, insights_json, influential_json,
@@ -135,11 +118,26 @@ def store_trading_signal(
             json_path,
             pdf_path,
             trade_params_json
-        ))
+        )
+
+        def _insert(conn):
+            # Check for duplicate (in the same transaction as the insert)
+            if conn.execute('SELECT id FROM trading_signals WHERE signal_id = ?', (signal_id,)).fetchone():
+                return None
+            return conn.execute('''
+                INSERT INTO trading_signals (
+                    signal_id, symbol, signal_type, confluence_score, reliability,
+                    entry_price, stop_loss, current_price, timestamp,
+                    targets, components, interpretations, insights, influential_components,
+                    sent_to_discord, json_path, pdf_path, trade_params
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', row).lastrowid
 
-        conn.commit()
-        inserted_id = cursor.lastrowid
-        conn.close()
+        # Insert into database
+        inserted_id = _db().write(_insert)
+        if inserted_id is None:
+            logger.debug(f"Signal {signal_id} already exists, skipping")
+            return None
 
         logger.info(f"Stored trading signal {signal_id} to database (id={inserted_id})")
         return inserted_id
@@ -166,10 +164,7 @@ def get_recent_signals(
         List of signal dictionaries
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = _db().connection().cursor()
 
         query = 'SELECT * FROM trading_signals WHERE 1=1'
         params = []
@@ -200,7 +195,6 @@ def get_recent_signals(
                         pass
             signals.append(signal)
 
-        conn.close()
         return signals
 
     except Exception as e:
@@ -219,10 +213,7 @@ def get_signal_by_id(signal_id: str) -> Optional[Dict[str, Any]]:
         Signal dictionary or None if not found
     """
     try:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = _db().connection().cursor()
 
         cursor.execute('SELECT * FROM trading_signals WHERE signal_id = ?', (signal_id,))
         row = cursor.fetchone()
@@ -236,10 +227,8 @@ def get_signal_by_id(signal_id: str) -> Optional[Dict[str, Any]]:
                         signal[json_field] = json.loads(signal[json_field])
                     except:
                         pass
-            conn.close()
             return signal
 
-        conn.close()
         return None
 
     except Exception as e:
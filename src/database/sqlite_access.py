@@ -0,0 +1,259 @@
+"""Shared SQLite access layer for virtuoso.db.
+
+The shadow-mode and signal storage modules used to open a new connection
+per call, run one statement, commit (fsync) and close, synchronously inside
+async monitor code. This module keeps the connections instead:
+
+- Reads use one long-lived connection per thread (WAL, so readers never
+  wait on the writer).
+- Writes go to a single writer thread that owns the write connection.
+  Jobs queued together are committed as one transaction of up to
+  ``batch_size`` jobs, each inside its own SAVEPOINT so a failing statement
+  only rolls back its own job. A batch holding a job somebody is waiting on
+  commits as soon as the queue is drained; fire-and-forget writes
+  (``wait=False``) are held up to ``commit_interval`` seconds to collect
+  more rows. Callers get their result once the batch is committed.
+- ``run_async`` / ``execute_async`` / ``read_async`` run the blocking calls
+  off the event loop.
+
+Statements are reused through each connection's prepared statement cache.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class SQLiteAccess:
+    """Pooled access to one SQLite database file."""
+
+    def __init__(
+        self,
+        db_path: str,
+        batch_size: int = 200,
+        commit_interval: float = 0.05,
+        read_workers: int = 4,
+        busy_timeout_ms: int = 5000
+    ):
+        """Initialize the access layer.
+
+        Args:
+            db_path: Path to the SQLite database file
+            batch_size: Maximum write jobs per commit
+            commit_interval: Maximum seconds a batch of fire-and-forget
+                writes stays open for more jobs
+            read_workers: Threads used by the async wrappers
+            busy_timeout_ms: How long a connection waits on a locked database
+        """
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.commit_interval = commit_interval
+        self.busy_timeout_ms = busy_timeout_ms
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._local = threading.local()
+        self._jobs: 'queue.Queue' = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=read_workers, thread_name_prefix="sqlite_access")
+        self._writer = threading.Thread(target=self._writer_loop, name="sqlite_writer", daemon=True)
+        self._closed = False
+        self.stats = {
+            'writes': 0,
+            'write_errors': 0,
+            'commits': 0,
+            'connections_opened': 0
+        }
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout_ms / 1000, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(f'PRAGMA busy_timeout={int(self.busy_timeout_ms)}')
+        self.stats['connections_opened'] += 1
+        return conn
+
+    # -- Reads -------------------------------------------------------------
+
+    def connection(self) -> sqlite3.Connection:
+        """Long-lived connection for the calling thread (for reads)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def read(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run ``fn(conn)`` on the calling thread's connection."""
+        return fn(self.connection())
+
+    # -- Writes ------------------------------------------------------------
+
+    def write(self, fn: Callable[[sqlite3.Connection], Any], wait: bool = True) -> Any:
+        """Run ``fn(conn)`` on the writer thread inside a batched transaction.
+
+        With ``wait`` (default) the result is returned after the commit and
+        exceptions raised by ``fn`` propagate; otherwise a ``Future`` is
+        returned immediately and a failure is also logged, since
+        fire-and-forget callers usually never read it.
+        """
+        future = self._submit(fn, wait)
+        if wait:
+            return future.result()
+        future.add_done_callback(self._log_failed_write)
+        return future
+
+    def _submit(self, fn: Callable[[sqlite3.Connection], Any], wait: bool) -> Future:
+        if self._closed:
+            raise RuntimeError(f"SQLite access for {self.db_path} is closed")
+        future: Future = Future()
+        self._jobs.put((fn, future, wait))
+        return future
+
+    def _log_failed_write(self, future: Future):
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"Background write to {self.db_path} failed: {future.exception()}")
+
+    def execute(self, sql: str, params: Sequence[Any] = (), wait: bool = True) -> Any:
+        """Execute one write statement; returns the cursor's ``lastrowid``."""
+        return self.write(lambda conn: conn.execute(sql, params).lastrowid, wait=wait)
+
+    def _writer_loop(self):
+        conn = self._connect()
+        conn.isolation_level = None  # explicit BEGIN/COMMIT
+        while True:
+            job = self._jobs.get()
+            if job is _STOP:
+                break
+
+            batch = [job]
+            waited_on = job[2]
+            deadline = time.monotonic() + self.commit_interval
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    if waited_on:
+                        job = self._jobs.get_nowait()
+                    else:
+                        job = self._jobs.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if job is _STOP:
+                    stop = True
+                    break
+                batch.append(job)
+                waited_on = waited_on or job[2]
+
+            self._run_batch(conn, batch)
+            if stop:
+                break
+        conn.close()
+
+    def _run_batch(self, conn: sqlite3.Connection, batch):
+        results = []
+        try:
+            conn.execute('BEGIN')
+            for fn, future, _ in batch:
+                conn.execute('SAVEPOINT job')
+                try:
+                    results.append((future, fn(conn), None))
+                    conn.execute('RELEASE SAVEPOINT job')
+                except Exception as e:
+                    conn.execute('ROLLBACK TO SAVEPOINT job')
+                    conn.execute('RELEASE SAVEPOINT job')
+                    results.append((future, None, e))
+                    self.stats['write_errors'] += 1
+            conn.execute('COMMIT')
+            self.stats['commits'] += 1
+        except Exception as e:
+            logger.error(f"SQLite batch commit failed for {self.db_path}: {e}")
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            self.stats['write_errors'] += len(batch)
+            results = [(future, None, e) for _, future, _ in batch]
+
+        self.stats['writes'] += len(batch)
+        for future, result, error in results:
+            if future.cancelled():
+                # The awaiting coroutine was cancelled (``write_async``); the write still committed
+                continue
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+    def flush(self):
+        """Block until every write queued so far is committed."""
+        if not self._closed:
+            self.write(lambda conn: None)
+
+    # -- Async wrappers ----------------------------------------------------
+
+    async def run_async(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking storage function in the access layer's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def read_async(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        return await self.run_async(self.read, fn)
+
+    async def write_async(self, fn: Callable[[sqlite3.Connection], Any]) -> Any:
+        return await asyncio.wrap_future(self._submit(fn, wait=False))
+
+    async def execute_async(self, sql: str, params: Sequence[Any] = ()) -> Any:
+        return await asyncio.wrap_future(
+            self._submit(lambda conn: conn.execute(sql, params).lastrowid, wait=False)
+        )
+
+    # -- Lifecycle ---------------------------------------------------------
+
+    def close(self):
+        """Commit pending writes and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._jobs.put(_STOP)
+        self._writer.join()
+        self._executor.shutdown(wait=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, 'queued_writes': self._jobs.qsize(), 'db_path': self.db_path}
+
+
+_instances: Dict[str, SQLiteAccess] = {}
+_instances_lock = threading.Lock()
+
+
+def get_db_access(db_path: Optional[str] = None) -> SQLiteAccess:
+    """Shared ``SQLiteAccess`` for a database path (default: data/virtuoso.db)."""
+    if db_path is None:
+        db_path = os.path.join(os.getcwd(), 'data', 'virtuoso.db')
+    db_path = os.path.abspath(db_path)
+    access = _instances.get(db_path)
+    if access is None or access._closed:
+        with _instances_lock:
+            access = _instances.get(db_path)
+            if access is None or access._closed:
+                access = _instances[db_path] = SQLiteAccess(db_path)
+    return access
+
+
+def close_all():
+    """Close every shared access layer (flushes pending writes)."""
+    with _instances_lock:
+        for access in _instances.values():
+            access.close()
+        _instances.clear()
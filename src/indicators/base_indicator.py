@@ -815,20 +815,24 @@ def _validate_ohlcv_data(self, data: Dict[str, pd.DataFrame]) -> bool:
             return False
 
     def calculate_depth(self, orderbook):
+        # Incrementally maintained books (LocalOrderBook) answer directly without copying levels
+        if hasattr(orderbook, 'depth') and callable(orderbook.depth):
+            return orderbook.depth()
+
         if not isinstance(orderbook, dict):
             raise ValueError("Orderbook must be a dictionary")
             
         try:
-            # Convert string values to float before creating numpy arrays
-            bids = np.array([[float(price), float(size)] for price, size in orderbook.get('bids', [])])
-            asks = np.array([[float(price), float(size)] for price, size in orderbook.get('asks', [])])
+            # Vectorized conversion handles both numeric and string levels
+            bids = np.asarray(orderbook.get('bids', []), dtype=np.float64)
+            asks = np.asarray(orderbook.get('asks', []), dtype=np.float64)
             
             # Calculate depth using numpy arrays directly
             bid_depth = np.sum(bids[:, 1]) if len(bids) > 0 else 0
             ask_depth = np.sum(asks[:, 1]) if len(asks) > 0 else 0
             
             return bid_depth, ask_depth
-        except (ValueError, TypeError) as e:
+        except (ValueError, TypeError, IndexError) as e:
             self.logger.error(f"Error calculating depth: {str(e)}")
             return 0, 0
 
@@ -175,6 +175,302 @@ def to_dict(self) -> Dict:
         }
 
 
+# ============================================================================
+# INCREMENTAL LEVEL HISTOGRAM (columnar ingestion)
+# ============================================================================
+
+SIDE_BUY = 1
+SIDE_SELL = -1
+SIDE_UNKNOWN = 0
+
+# Outlier / whale size quantiles shared with the DataFrame path
+OUTLIER_QUANTILE = 0.999
+WHALE_QUANTILE = 0.90
+
+
+def encode_sides(sides: Any) -> np.ndarray:
+    """
+    Normalize a side column to int8 codes (1 buy, -1 sell, 0 unknown).
+
+    Accepts integer/float codes (sign is used) or string labels such as
+    'Buy'/'sell'/'b'/'s'.
+    """
+    arr = np.asarray(sides)
+    if arr.dtype.kind in ('U', 'S', 'O'):
+        labels = np.char.lower(arr.astype(str))
+        codes = np.zeros(labels.shape, dtype=np.int8)
+        codes[np.isin(labels, ('buy', 'b'))] = SIDE_BUY
+        codes[np.isin(labels, ('sell', 's'))] = SIDE_SELL
+        return codes
+    return np.sign(arr.astype(np.float64)).astype(np.int8)
+
+
+def _bucket_by_level(
+    level_index: np.ndarray,
+    sizes: np.ndarray,
+    sides: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Sum buy/sell volume and trade counts per level index (unknown side split 50/50)."""
+    levels, inverse = np.unique(level_index, return_inverse=True)
+    buy = np.where(sides == SIDE_BUY, sizes, np.where(sides == SIDE_SELL, 0.0, sizes * 0.5))
+    sell = sizes - buy
+    return (
+        levels,
+        np.bincount(inverse, weights=buy, minlength=len(levels)),
+        np.bincount(inverse, weights=sell, minlength=len(levels)),
+        np.bincount(inverse, minlength=len(levels))
+    )
+
+
+class TradeLevelHistogram:
+    """
+    Rolling per-tick-level buy/sell histogram for a single symbol.
+
+    Trades arrive as columnar batches (price/size/side/timestamp arrays).
+    Each batch is bucketed with ``np.unique``/``np.bincount`` and folded into
+    running per-level totals; rows leaving the ``window_ms`` window are
+    subtracted the same way. The raw rows are kept in a contiguous
+    ``[start, end)`` window of preallocated arrays, so the size quantiles
+    used for outlier and whale filtering read array views and no DataFrame
+    is ever built.
+    """
+
+    def __init__(self, tick_size: float, window_ms: int, initial_capacity: int = 4096):
+        if tick_size <= 0:
+            raise ValueError(f"tick_size must be positive, got {tick_size}")
+        self.tick_size = tick_size
+        self.window_ms = window_ms
+        self._allocate(max(int(initial_capacity), 16))
+        # level index -> [buy_volume, sell_volume, trade_count]
+        self._levels: Dict[int, List[float]] = {}
+        # Last seen TradeTape 'appended' counter, for incremental tape reads
+        self._tape_cursor: Optional[int] = None
+        self.version = 0
+        self.stats = {
+            'ingested': 0,
+            'expired': 0,
+            'invalid': 0,
+            'out_of_order': 0
+        }
+
+    def _allocate(self, size: int) -> None:
+        self._level = np.zeros(size, dtype=np.int64)
+        self._size = np.zeros(size, dtype=np.float64)
+        self._side = np.zeros(size, dtype=np.int8)
+        self._ts = np.zeros(size, dtype=np.int64)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def level_index(self) -> np.ndarray:
+        return self._level[self._start:self._end]
+
+    @property
+    def sizes(self) -> np.ndarray:
+        return self._size[self._start:self._end]
+
+    @property
+    def sides(self) -> np.ndarray:
+        return self._side[self._start:self._end]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._ts[self._start:self._end]
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        if self._end == self._start:
+            return None
+        return int(self._ts[self._end - 1])
+
+    def ingest(self, prices: Any, sizes: Any, sides: Any, timestamps: Any) -> int:
+        """
+        Add a columnar batch of trades.
+
+        Args:
+            prices: Trade prices
+            sizes: Trade sizes (absolute value is used)
+            sides: Side codes or labels, see ``encode_sides``
+            timestamps: Trade times in epoch ms (seconds are detected and scaled)
+
+        Returns:
+            Number of trades added
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        sizes = np.abs(np.asarray(sizes, dtype=np.float64))
+        sides = encode_sides(sides)
+        ts = np.asarray(timestamps, dtype=np.float64)
+        if len(ts) and np.nanmax(ts) < 1e12:
+            ts = ts * 1000
+
+        valid = (
+            np.isfinite(prices) & (prices > 0) &
+            np.isfinite(sizes) & (sizes > 0) &
+            np.isfinite(ts)
+        )
+        if not valid.all():
+            self.stats['invalid'] += int((~valid).sum())
+            prices, sizes, sides, ts = prices[valid], sizes[valid], sides[valid], ts[valid]
+        if len(prices) == 0:
+            return 0
+
+        ts = ts.astype(np.int64)
+        if len(ts) > 1 and (np.diff(ts) < 0).any():
+            order = np.argsort(ts, kind='stable')
+            prices, sizes, sides, ts = prices[order], sizes[order], sides[order], ts[order]
+
+        # Rows older than what is already held would break the sorted window
+        last = self.last_timestamp
+        if last is not None and ts[0] < last:
+            first = int(np.searchsorted(ts, last, side='left'))
+            self.stats['out_of_order'] += first
+            prices, sizes, sides, ts = prices[first:], sizes[first:], sides[first:], ts[first:]
+            if len(ts) == 0:
+                return 0
+
+        level_index = np.rint(prices / self.tick_size).astype(np.int64)
+        count = len(level_index)
+        if self._end + count > len(self._ts):
+            self._compact(count)
+
+        end = self._end + count
+        self._level[self._end:end] = level_index
+        self._size[self._end:end] = sizes
+        self._side[self._end:end] = sides
+        self._ts[self._end:end] = ts
+        self._end = end
+
+        self._fold(level_index, sizes, sides, sign=1)
+        self._expire(int(ts[-1]) - self.window_ms)
+
+        self.version += 1
+        self.stats['ingested'] += count
+        return count
+
+    def ingest_tape(self, tape: Any) -> int:
+        """
+        Add only the trades appended to a ``TradeTape`` since the last call.
+
+        The tape's monotonically increasing ``stats['appended']`` counter is
+        used as a cursor, so repeated calls with the same tape never double
+        count and a call after a long pause takes whatever is still on it.
+        """
+        appended = int(tape.stats['appended'])
+        new = len(tape) if self._tape_cursor is None else appended - self._tape_cursor
+        self._tape_cursor = appended
+        new = min(new, len(tape))
+        if new <= 0:
+            return 0
+
+        cols = tape.columns()
+        tail = slice(len(tape) - new, None)
+        return self.ingest(cols['price'][tail], cols['size'][tail],
+                           cols['side'][tail], cols['timestamp'][tail])
+
+    def _fold(self, level_index: np.ndarray, sizes: np.ndarray, sides: np.ndarray, sign: int) -> None:
+        levels, buy, sell, counts = _bucket_by_level(level_index, sizes, sides)
+        totals = self._levels
+        for level, b, s, c in zip(levels.tolist(), buy.tolist(), sell.tolist(), counts.tolist()):
+            bucket = totals.get(level)
+            if sign > 0:
+                if bucket is None:
+                    totals[level] = [b, s, c]
+                else:
+                    bucket[0] += b
+                    bucket[1] += s
+                    bucket[2] += c
+            elif bucket is not None:
+                bucket[2] -= c
+                if bucket[2] <= 0:
+                    del totals[level]
+                else:
+                    bucket[0] = max(bucket[0] - b, 0.0)
+                    bucket[1] = max(bucket[1] - s, 0.0)
+
+    def _expire(self, cutoff_ms: int) -> None:
+        """Drop rows older than ``cutoff_ms`` and subtract them from the totals."""
+        if self._end == self._start or self._ts[self._start] >= cutoff_ms:
+            return
+        expired = int(np.searchsorted(self.timestamps, cutoff_ms, side='left'))
+        if expired:
+            head = slice(self._start, self._start + expired)
+            self._fold(self._level[head], self._size[head], self._side[head], sign=-1)
+            self._start += expired
+            self.stats['expired'] += expired
+
+    def _compact(self, incoming: int) -> None:
+        count = len(self)
+        size = max(len(self._ts), 2 * (count + incoming))
+        level, sizes = self.level_index.copy(), self.sizes.copy()
+        sides, ts = self.sides.copy(), self.timestamps.copy()
+        self._allocate(size)
+        self._level[:count] = level
+        self._size[:count] = sizes
+        self._side[:count] = sides
+        self._ts[:count] = ts
+        self._end = count
+
+    def build_levels(self) -> Tuple[Dict[float, PriceLevelData], Optional[float], int]:
+        """
+        Materialize ``PriceLevelData`` from the running totals.
+
+        Size outliers (above the 99.9th percentile) are removed and whale
+        trades (at/above the 90th percentile of the remaining sizes) are
+        counted as sparse corrections over the window, matching the
+        DataFrame path.
+
+        Returns:
+            (levels keyed by price, whale threshold, number of trades used)
+        """
+        totals = {level: list(bucket) for level, bucket in self._levels.items()}
+        level_index, sizes, sides = self.level_index, self.sizes, self.sides
+
+        kept = None
+        if len(sizes) > 100:
+            outliers = sizes > np.quantile(sizes, OUTLIER_QUANTILE)
+            if outliers.any():
+                levels, buy, sell, counts = _bucket_by_level(
+                    level_index[outliers], sizes[outliers], sides[outliers]
+                )
+                for level, b, s, c in zip(levels.tolist(), buy.tolist(), sell.tolist(), counts.tolist()):
+                    bucket = totals[level]
+                    bucket[0] = max(bucket[0] - b, 0.0)
+                    bucket[1] = max(bucket[1] - s, 0.0)
+                    bucket[2] -= c
+                kept = ~outliers
+
+        kept_sizes = sizes if kept is None else sizes[kept]
+        num_trades = len(kept_sizes)
+
+        whale_counts: Dict[int, int] = {}
+        whale_threshold = None
+        if num_trades >= 10:
+            whale_threshold = float(np.quantile(kept_sizes, WHALE_QUANTILE))
+            whale_mask = sizes >= whale_threshold
+            if kept is not None:
+                whale_mask &= kept
+            levels, counts = np.unique(level_index[whale_mask], return_counts=True)
+            whale_counts = dict(zip(levels.tolist(), counts.tolist()))
+
+        tick_size = self.tick_size
+        result: Dict[float, PriceLevelData] = {}
+        for level, (buy_volume, sell_volume, trade_count) in totals.items():
+            if trade_count <= 0:
+                continue
+            price = level * tick_size
+            result[price] = PriceLevelData(
+                price=price,
+                buy_volume=buy_volume,
+                sell_volume=sell_volume,
+                trade_count=int(trade_count),
+                whale_trades=whale_counts.get(level, 0)
+            )
+        return result, whale_threshold, num_trades
+
+
 # ============================================================================
 # MAIN CALCULATOR
 # ============================================================================
@@ -205,6 +501,9 @@ def __init__(self, config: Optional[StackedImbalanceConfig] = None):
         self._cache: Dict[str, StackedImbalanceResult] = {}
         self._cache_timestamps: Dict[str, float] = {}
 
+        # Incremental per-symbol level histograms for columnar trade batches
+        self._histograms: Dict[str, TradeLevelHistogram] = {}
+
         # GAP #2: Debug statistics
         self._debug_stats = {
             'calculation_counts': {'total': 0, 'bullish': 0, 'bearish': 0, 'neutral': 0},
@@ -399,6 +698,82 @@ def _aggregate_trades_by_level_df(
 
         return levels
 
+    # ========================================================================
+    # Columnar Trade Ingestion
+    # ========================================================================
+
+    @staticmethod
+    def _is_trade_tape(trades: Any) -> bool:
+        """Duck-type check for ``core.market.trade_tape.TradeTape``."""
+        return callable(getattr(trades, 'columns', None)) and 'appended' in getattr(trades, 'stats', {})
+
+    @classmethod
+    def _is_columnar_batch(cls, trades: Any) -> bool:
+        """True for a structured array, a dict of column arrays or a TradeTape."""
+        if isinstance(trades, np.ndarray):
+            return trades.dtype.names is not None
+        if isinstance(trades, dict):
+            return 'price' in trades
+        return cls._is_trade_tape(trades)
+
+    @staticmethod
+    def _batch_columns(trades: Any) -> Optional[Tuple[Any, Any, Any, Any]]:
+        """Pull (price, size, side, timestamp) columns from a structured array or dict."""
+        names = trades.dtype.names if isinstance(trades, np.ndarray) else tuple(trades.keys())
+
+        def column(*candidates):
+            for name in candidates:
+                if name in names:
+                    return trades[name]
+            return None
+
+        prices = column('price')
+        sizes = column('size', 'qty', 'amount')
+        if prices is None or sizes is None:
+            return None
+        sides = column('side')
+        if sides is None:
+            sides = np.zeros(len(prices), dtype=np.int8)
+        timestamps = column('timestamp', 'time')
+        if timestamps is None:
+            timestamps = np.full(len(prices), time.time() * 1000)
+        return prices, sizes, sides, timestamps
+
+    def get_histogram(self, symbol: str) -> TradeLevelHistogram:
+        """Get or create the rolling level histogram for a symbol."""
+        histogram = self._histograms.get(symbol)
+        if histogram is None:
+            histogram = TradeLevelHistogram(
+                tick_size=self.get_tick_size(symbol),
+                window_ms=self.config.window_minutes * 60_000
+            )
+            self._histograms[symbol] = histogram
+        return histogram
+
+    def ingest_trades(self, symbol: str, trades: Any) -> int:
+        """
+        Fold a columnar trade batch into the symbol's level histogram.
+
+        Args:
+            symbol: Trading pair (e.g., 'BTCUSDT')
+            trades: NumPy structured array or dict of arrays with 'price',
+                'size'/'qty'/'amount', 'side' and 'timestamp'/'time' fields,
+                or a TradeTape (only trades appended since the last call
+                are read)
+
+        Returns:
+            Number of trades added
+        """
+        histogram = self.get_histogram(symbol)
+        if self._is_trade_tape(trades):
+            return histogram.ingest_tape(trades)
+
+        columns = self._batch_columns(trades)
+        if columns is None:
+            self._debug_stats['validation_rejections']['invalid_data'] += 1
+            return 0
+        return histogram.ingest(*columns)
+
     # ========================================================================
     # GAP #12: Data Validation
     # ========================================================================
@@ -873,15 +1248,22 @@ def _update_performance_stats(self, elapsed_ms: float):
     async def calculate(
         self,
         symbol: str,
-        trades: Optional[List[Dict]] = None,
+        trades: Optional[Any] = None,
         market_data: Optional[Dict] = None
     ) -> StackedImbalanceResult:
         """
         Main calculation entry point.
 
+        Columnar input (a structured array, dict of arrays, or the
+        ``trade_tape`` published in market_data) is folded into the symbol's
+        rolling level histogram, so only stack detection and scoring run
+        here. Calling with neither trades nor market_data scores whatever
+        the histogram already holds.
+
         Args:
             symbol: Trading pair (e.g., 'BTCUSDT')
-            trades: List of recent trades (optional if market_data provided)
+            trades: List of recent trades or a columnar batch
+                (optional if market_data provided)
             market_data: Full market data dict (optional if trades provided)
 
         Returns:
@@ -892,12 +1274,28 @@ async def calculate(
 
         self._debug_stats['calculation_counts']['total'] += 1
 
+        # ===== Columnar Ingestion (before the cache so no batch is lost) =====
+        t0 = time.time()
+        columnar = False
+        if trades is not None and self._is_columnar_batch(trades):
+            self.ingest_trades(symbol, trades)
+            columnar = True
+        elif trades is None and market_data and market_data.get('trade_tape') is not None:
+            self.ingest_trades(symbol, market_data['trade_tape'])
+            columnar = True
+        elif trades is None and not market_data and symbol in self._histograms:
+            columnar = True
+        timings['extraction'] = (time.time() - t0) * 1000
+
         # ===== Check Cache =====
         cache_key = f"{symbol}_stacked_imbalance"
         cached = self._get_cached(cache_key)
         if cached:
             return cached
 
+        if columnar:
+            return await self._calculate_from_histogram(symbol, timings, total_start, cache_key)
+
         # ===== Extract Trades as DataFrame (vectorized path) =====
         t0 = time.time()
         if trades is None and market_data:
@@ -957,6 +1355,56 @@ async def calculate(
         if not levels:
             return self._neutral_result("no_price_levels")
 
+        return self._build_result(
+            symbol, levels, num_trades, tick_size, whale_threshold,
+            timings, total_start, cache_key
+        )
+
+    async def _calculate_from_histogram(
+        self,
+        symbol: str,
+        timings: Dict[str, float],
+        total_start: float,
+        cache_key: str
+    ) -> StackedImbalanceResult:
+        """Score the precomputed level histogram (columnar path)."""
+        histogram = self._histograms.get(symbol)
+        if histogram is None or len(histogram) == 0:
+            return self._neutral_result("no_trades_data")
+
+        if len(histogram) < self.config.min_total_trades:
+            self._debug_stats['validation_rejections']['insufficient_trades'] += 1
+            return self._neutral_result("insufficient_trades")
+
+        age_seconds = time.time() - histogram.last_timestamp / 1000
+        if age_seconds > self.config.max_stale_seconds:
+            self._debug_stats['validation_rejections']['stale_data'] += 1
+            return self._neutral_result("stale_data")
+
+        t0 = time.time()
+        levels, whale_threshold, num_trades = histogram.build_levels()
+        timings['aggregation'] = (time.time() - t0) * 1000
+
+        if not levels:
+            return self._neutral_result("no_price_levels")
+
+        return self._build_result(
+            symbol, levels, num_trades, histogram.tick_size, whale_threshold,
+            timings, total_start, cache_key
+        )
+
+    def _build_result(
+        self,
+        symbol: str,
+        levels: Dict[float, PriceLevelData],
+        num_trades: int,
+        tick_size: float,
+        whale_threshold: Optional[float],
+        timings: Dict[str, float],
+        total_start: float,
+        cache_key: str
+    ) -> StackedImbalanceResult:
+        """Run stack detection, scoring and confidence over aggregated levels."""
         # ===== Stack Detection =====
         t0 = time.time()
         bullish_stacks, bearish_stacks = self.detect_stacks(levels)
@@ -1068,7 +1516,7 @@ def create_calculator(config: Optional[StackedImbalanceConfig] = None) -> Stacke
 
 async def calculate_stacked_imbalance(
     symbol: str,
-    trades: Optional[List[Dict]] = None,
+    trades: Optional[Any] = None,
     market_data: Optional[Dict] = None
 ) -> Dict[str, Any]:
     """
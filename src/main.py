@@ -435,7 +435,20 @@ async def cleanup_all_components():
             logger.warning("Alert manager cleanup timed out")
         except Exception as e:
             logger.error(f"Error cleaning up alert manager: {str(e)}")
-    
+
+    # Stop chart and PDF render worker processes
+    try:
+        from src.core.chart.render_service import shutdown_chart_render_service
+        from src.core.reporting.report_pipeline import shutdown_report_pipeline
+
+        await asyncio.wait_for(asyncio.to_thread(shutdown_chart_render_service), timeout=10.0)
+        await asyncio.wait_for(asyncio.to_thread(shutdown_report_pipeline), timeout=10.0)
+        logger.info("Render workers stopped")
+    except asyncio.TimeoutError:
+        logger.warning("Render worker shutdown timed out")
+    except Exception as e:
+        logger.error(f"Error stopping render workers: {str(e)}")
+
     # Clean up any remaining aiohttp sessions, connectors, and CCXT instances
     try:
         import gc
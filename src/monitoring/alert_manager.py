@@ -24,6 +24,9 @@
 import sqlite3
 import math
 from src.utils.task_tracker import create_tracked_task
+from src.core.analysis.liquidation_window import LiquidationWindowAggregator, register_liquidation_aggregator
+from src.core.alert_outbox import AlertOutbox
+from src.core.chart.render_service import chart_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -233,12 +236,13 @@ def __init__(self, config: Dict[str, Any], database: Optional[Any] = None, cache
         self.large_order_cooldown = 300  # Default 5 minutes cooldown between large order alerts for the same symbol
 
         # Aggregate liquidation tracking - alerts when cumulative liquidations exceed threshold within time window
-        self._liquidation_buffer = {}  # Symbol -> list of (timestamp, usd_value, side, price, size) tuples
-        self._liquidation_buffer_global = []  # Global list of (timestamp, symbol, usd_value, side, price, size) for cross-symbol aggregation
         self._last_aggregate_alert = {}  # Symbol -> timestamp of last aggregate alert
         self._last_global_aggregate_alert = 0  # Timestamp of last global aggregate alert
         self.aggregate_liquidation_threshold = 1000000  # $1M aggregate threshold (Conservative - filters bottom 28% noise)
         self.aggregate_liquidation_window = 300  # 5 minute window for aggregation
+        # Per-symbol and global 1m/5m/15m running totals, shared with caches and API routes
+        self.liquidation_aggregator = LiquidationWindowAggregator(windows=(60, self.aggregate_liquidation_window, 900))
+        register_liquidation_aggregator(self.liquidation_aggregator)
         self.aggregate_liquidation_cooldown = 600  # 10 minute cooldown between aggregate alerts
         self.global_aggregate_threshold = 2000000  # $2M for cross-symbol aggregate alerts (Conservative)
         self.global_aggregate_cooldown = 900  # 15 minute cooldown for global alerts
@@ -329,8 +333,27 @@ def __init__(self, config: Dict[str, Any], database: Optional[Any] = None, cache
             'failed_deliveries': 0,
             'retries': 0,
             'file_attachments': 0,
-            'file_attachment_failures': 0
+            'file_attachment_failures': 0,
+            'queued': 0
         }
+
+        # Webhook outbox: send paths enqueue and return, per-webhook workers deliver
+        self.alert_outbox = None
+        outbox_config = config.get('monitoring', {}).get('alerts', {}).get('outbox', {})
+        if outbox_config.get('enabled', True):
+            try:
+                self.alert_outbox = AlertOutbox(
+                    db_path=outbox_config.get('db_path', config.get('monitoring', {}).get('alerts', {}).get('db_path', 'data/virtuoso.db')),
+                    max_attempts=outbox_config.get('max_attempts', 5),
+                    initial_retry_delay=outbox_config.get('initial_retry_delay', 2.0),
+                    max_retry_delay=outbox_config.get('max_retry_delay', 60.0),
+                    coalesce_window=outbox_config.get('coalesce_window', 0.5),
+                    request_timeout=self.webhook_timeout,
+                    logger=self.logger
+                )
+            except Exception as e:
+                self.logger.error(f"Failed to initialize alert outbox, webhooks will be sent inline: {e}")
+                self.alert_outbox = None
         
         # Metrics tracking
         self._ohlcv_cache = {}  # Cache for OHLCV data
@@ -1881,38 +1904,18 @@ async def _track_liquidation_for_aggregate(
         try:
             current_time = time.time()
 
-            # Clean up old entries from symbol buffer
-            if symbol not in self._liquidation_buffer:
-                self._liquidation_buffer[symbol] = []
-
-            # Remove entries older than the aggregation window
-            cutoff_time = current_time - self.aggregate_liquidation_window
-
-            # Buffer entry format: (timestamp, usd_value, side, price, size)
-            self._liquidation_buffer[symbol] = [
-                entry for entry in self._liquidation_buffer[symbol]
-                if entry[0] > cutoff_time
-            ]
-
-            # Add new liquidation to symbol buffer with full details
-            self._liquidation_buffer[symbol].append((current_time, usd_value, side.upper(), price, size))
-
-            # Also track in global buffer for cross-symbol aggregation
-            # Global format: (timestamp, symbol, usd_value, side, price, size)
-            self._liquidation_buffer_global = [
-                entry for entry in self._liquidation_buffer_global
-                if entry[0] > cutoff_time
-            ]
-            self._liquidation_buffer_global.append((current_time, symbol, usd_value, side.upper(), price, size))
+            # Running totals are updated in place; no per-event rescans of the window
+            self.liquidation_aggregator.add(symbol, usd_value, side, price, size, timestamp=current_time)
 
             # Debug logging for buffer operations (helps verify aggregate tracking without waiting for threshold)
-            symbol_buffer_total = sum(entry[1] for entry in self._liquidation_buffer[symbol])
-            global_buffer_total = sum(entry[2] for entry in self._liquidation_buffer_global)
-            self.logger.debug(
-                f"Aggregate buffer update: {symbol} +${usd_value:,.0f} {side.upper()} @ {price:.4f} | "
-                f"Symbol buffer: {len(self._liquidation_buffer[symbol])} entries (${symbol_buffer_total:,.0f}) | "
-                f"Global buffer: {len(self._liquidation_buffer_global)} entries (${global_buffer_total:,.0f})"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                symbol_stats = self.liquidation_aggregator.window_stats(symbol, self.aggregate_liquidation_window, current_time)
+                global_stats = self.liquidation_aggregator.window_stats(None, self.aggregate_liquidation_window, current_time)
+                self.logger.debug(
+                    f"Aggregate buffer update: {symbol} +${usd_value:,.0f} {side.upper()} @ {price:.4f} | "
+                    f"Symbol window: {symbol_stats['count']} entries (${symbol_stats['total_usd']:,.0f}) | "
+                    f"Global window: {global_stats['count']} entries (${global_stats['total_usd']:,.0f})"
+                )
 
             # Check symbol-specific aggregate
             await self._check_symbol_aggregate_alert(symbol, current_time)
@@ -1926,20 +1929,17 @@ async def _track_liquidation_for_aggregate(
     async def _check_symbol_aggregate_alert(self, symbol: str, current_time: float) -> None:
         """Check if symbol-specific aggregate liquidation threshold is exceeded."""
         try:
-            # Check cooldown
+            # Check cooldown. The window is not cleared after an alert, so the
+            # cooldown spans at least one window to never count an event twice.
             last_alert = self._last_aggregate_alert.get(symbol, 0)
-            if current_time - last_alert < self.aggregate_liquidation_cooldown:
+            if current_time - last_alert < max(self.aggregate_liquidation_cooldown, self.aggregate_liquidation_window):
                 return
 
-            # Calculate aggregate value for this symbol
-            # Buffer format: (timestamp, usd_value, side, price, size)
-            buffer = self._liquidation_buffer.get(symbol, [])
-            if len(buffer) < 3:  # Need at least 3 liquidations to be notable
+            stats = self.liquidation_aggregator.window_stats(symbol, self.aggregate_liquidation_window, current_time)
+            if stats['count'] < 3:  # Need at least 3 liquidations to be notable
                 return
 
-            total_value = sum(entry[1] for entry in buffer)
-            long_value = sum(entry[1] for entry in buffer if entry[2] == 'BUY')
-            short_value = sum(entry[1] for entry in buffer if entry[2] == 'SELL')
+            total_value = stats['total_usd']
 
             # Check threshold
             if total_value >= self.aggregate_liquidation_threshold:
@@ -1948,25 +1948,12 @@ async def _check_symbol_aggregate_alert(self, symbol: str, current_time: float)
                 # which allowed multiple concurrent calls to pass the cooldown check
                 self._last_aggregate_alert[symbol] = current_time
 
-                # Clear buffer IMMEDIATELY to prevent duplicate alerts with stale data
-                buffer_copy = list(buffer)  # Copy for processing
-                self._liquidation_buffer[symbol] = []
-
-                # Extract additional metrics for improved alert
-                # Find largest liquidation
-                largest = max(buffer_copy, key=lambda x: x[1])
-                largest_value = largest[1]
-                largest_side = "LONG" if largest[2] == 'BUY' else "SHORT"
-                largest_price = largest[3]
-
-                # Calculate average liquidation price (weighted by value)
-                total_weighted_price = sum(entry[1] * entry[3] for entry in buffer_copy)
-                avg_liq_price = total_weighted_price / total_value if total_value > 0 else 0
+                largest = stats['largest']
+                avg_liq_price = stats['avg_price']
 
                 # Calculate time span and rate
-                first_timestamp = min(entry[0] for entry in buffer_copy)
-                time_span_seconds = current_time - first_timestamp
-                rate_per_minute = (len(buffer_copy) / time_span_seconds * 60) if time_span_seconds > 0 else 0
+                time_span_seconds = current_time - stats['first_timestamp']
+                rate_per_minute = (stats['count'] / time_span_seconds * 60) if time_span_seconds > 0 else 0
 
                 # Get current price from cache if available
                 current_price = self._price_cache.get(symbol, avg_liq_price)
@@ -1974,20 +1961,18 @@ async def _check_symbol_aggregate_alert(self, symbol: str, current_time: float)
                 await self._send_aggregate_liquidation_alert(
                     symbol=symbol,
                     total_value=total_value,
-                    long_value=long_value,
-                    short_value=short_value,
-                    count=len(buffer_copy),
+                    long_value=stats['long_usd'],
+                    short_value=stats['short_usd'],
+                    count=stats['count'],
                     window_minutes=self.aggregate_liquidation_window // 60,
                     is_global=False,
-                    largest_value=largest_value,
-                    largest_side=largest_side,
-                    largest_price=largest_price,
+                    largest_value=largest['usd_value'],
+                    largest_side="LONG" if largest['side'] == 'BUY' else "SHORT",
+                    largest_price=largest['price'],
                     avg_liq_price=avg_liq_price,
                     current_price=current_price,
                     rate_per_minute=rate_per_minute
                 )
-                # NOTE: Cooldown and buffer clear now done at the start of this block
-                # to prevent async race conditions
 
         except Exception as e:
             self.logger.error(f"Error checking symbol aggregate alert: {str(e)}")
@@ -1995,68 +1980,46 @@ async def _check_symbol_aggregate_alert(self, symbol: str, current_time: float)
     async def _check_global_aggregate_alert(self, current_time: float) -> None:
         """Check if global (cross-symbol) aggregate liquidation threshold is exceeded."""
         try:
-            # Check cooldown
-            if current_time - self._last_global_aggregate_alert < self.global_aggregate_cooldown:
+            # Check cooldown (spanning at least one window, see the symbol check)
+            if current_time - self._last_global_aggregate_alert < max(self.global_aggregate_cooldown, self.aggregate_liquidation_window):
                 return
 
-            # Calculate global aggregate
-            # Global format: (timestamp, symbol, usd_value, side, price, size)
-            buffer = self._liquidation_buffer_global
-            if len(buffer) < 5:  # Need at least 5 liquidations across symbols
+            stats = self.liquidation_aggregator.window_stats(None, self.aggregate_liquidation_window, current_time)
+            if stats['count'] < 5:  # Need at least 5 liquidations across symbols
                 return
 
-            total_value = sum(entry[2] for entry in buffer)
-            long_value = sum(entry[2] for entry in buffer if entry[3] == 'BUY')
-            short_value = sum(entry[2] for entry in buffer if entry[3] == 'SELL')
-
-            # Get affected symbols
-            affected_symbols = list(set(entry[1] for entry in buffer))
+            total_value = stats['total_usd']
 
             # Check threshold
             if total_value >= self.global_aggregate_threshold:
                 # CRITICAL: Set cooldown IMMEDIATELY to prevent async race condition
                 self._last_global_aggregate_alert = current_time
 
-                # Clear buffer IMMEDIATELY and take a copy for processing
-                buffer_copy = list(buffer)
-                self._liquidation_buffer_global = []
-
-                # Find largest liquidation across all symbols
-                largest = max(buffer_copy, key=lambda x: x[2])
-                largest_value = largest[2]
-                largest_symbol = largest[1]
-                largest_side = "LONG" if largest[3] == 'BUY' else "SHORT"
-                largest_price = largest[4]
+                # Affected symbols, largest USD value first
+                symbol_values = stats['symbols']
+                affected_symbols = list(symbol_values)
+                largest = stats['largest']
 
                 # Calculate time span and rate
-                first_timestamp = min(entry[0] for entry in buffer_copy)
-                time_span_seconds = current_time - first_timestamp
-                rate_per_minute = (len(buffer_copy) / time_span_seconds * 60) if time_span_seconds > 0 else 0
-
-                # Get symbol-wise breakdown for top symbols
-                symbol_values = {}
-                for entry in buffer_copy:
-                    sym = entry[1]
-                    symbol_values[sym] = symbol_values.get(sym, 0) + entry[2]
+                time_span_seconds = current_time - stats['first_timestamp']
+                rate_per_minute = (stats['count'] / time_span_seconds * 60) if time_span_seconds > 0 else 0
 
                 await self._send_aggregate_liquidation_alert(
                     symbol=", ".join(affected_symbols[:3]) + ("..." if len(affected_symbols) > 3 else ""),
                     total_value=total_value,
-                    long_value=long_value,
-                    short_value=short_value,
-                    count=len(buffer_copy),
+                    long_value=stats['long_usd'],
+                    short_value=stats['short_usd'],
+                    count=stats['count'],
                     window_minutes=self.aggregate_liquidation_window // 60,
                     is_global=True,
                     affected_symbols=affected_symbols,
-                    largest_value=largest_value,
-                    largest_side=largest_side,
-                    largest_price=largest_price,
-                    largest_symbol=largest_symbol,
+                    largest_value=largest['usd_value'],
+                    largest_side="LONG" if largest['side'] == 'BUY' else "SHORT",
+                    largest_price=largest['price'],
+                    largest_symbol=largest['symbol'],
                     rate_per_minute=rate_per_minute,
                     symbol_breakdown=symbol_values
                 )
-                # NOTE: Cooldown and buffer clear now done at the start of this block
-                # to prevent async race conditions
 
         except Exception as e:
             self.logger.error(f"Error checking global aggregate alert: {str(e)}")
@@ -2285,6 +2248,9 @@ async def stop(self) -> None:
             if self._client_session and not self._client_session.closed:
                 await self._client_session.close()
                 self.logger.info("Closed HTTP client session")
+
+            if self.alert_outbox is not None:
+                await self.alert_outbox.stop()
             
             self.logger.info("Alert manager stopped")
             
@@ -2956,6 +2922,32 @@ async def send_confluence_alert(
             # Execute webhook
             self.logger.debug(f"[TXN:{txn_id}][SIG:{sig_id}][ALERT:{alert_id}] Executing webhook")
             
+            stored_details = {
+                'confluence_score': confluence_score,
+                'signal_type': signal_type,
+                'price': price,  # Fixed: was 'current_price' which was undefined
+                'reliability': reliability,
+                'components': components,
+                'transaction_id': txn_id,
+                'signal_id': sig_id
+            }
+
+            outbox_id = await self._enqueue_webhook(self.discord_webhook_url, self._webhook_payload(webhook),
+                                                    alert_type='confluence', log_prefix=f"[TXN:{txn_id}][SIG:{sig_id}][ALERT:{alert_id}]")
+            if outbox_id is not None:
+                self.logger.info(f"[TXN:{txn_id}][SIG:{sig_id}][ALERT:{alert_id}] Queued confluence alert for {symbol} (outbox id {outbox_id})")
+                self._mark_alert_sent_improved(alert_key, 'confluence', content_for_dedup)
+                await self._store_and_cache_alert_direct(
+                    alert_type='confluence',
+                    symbol=symbol,
+                    message=title,
+                    level='WARNING' if signal_type in ['LONG', 'SHORT'] else 'INFO',
+                    details=stored_details
+                )
+                self._alert_stats['total'] = int(self._alert_stats.get('total', 0)) + 1
+                self._alert_stats['sent'] = int(self._alert_stats.get('sent', 0)) + 1
+                return
+
             # Add retry logic for webhook execution
             max_retries = 3
             retry_delay = 2  # seconds
@@ -2977,15 +2969,7 @@ async def send_confluence_alert(
                             symbol=symbol,
                             message=title,
                             level='WARNING' if signal_type in ['LONG', 'SHORT'] else 'INFO',
-                            details={
-                                'confluence_score': confluence_score,
-                                'signal_type': signal_type,
-                                'price': price,  # Fixed: was 'current_price' which was undefined
-                                'reliability': reliability,
-                                'components': components,
-                                'transaction_id': txn_id,
-                                'signal_id': sig_id
-                            }
+                            details=stored_details
                         )
 
                         # Note: PDF attachment is handled by send_signal_alert() workflow
@@ -3580,6 +3564,12 @@ async def _send_discord_alert(self, alert: Dict[str, Any]) -> None:
                 self.logger.error(f"[ALERT:{alert_id}] Discord webhook URL format validation failed for {webhook_type}")
                 self._alert_stats['errors'] = int(self._alert_stats.get('errors', 0)) + 1
                 return
+
+            outbox_id = await self._enqueue_webhook(webhook_url, self._webhook_payload(webhook),
+                                                    alert_type=alert_type or None, log_prefix=f"[ALERT:{alert_id}]")
+            if outbox_id is not None:
+                self._alert_stats['sent'] = int(self._alert_stats.get('sent', 0)) + 1
+                return
             
             for attempt in range(max_retries):
                 try:
@@ -3923,6 +3913,21 @@ async def send_discord_webhook_message(self, message: Dict[str, Any], files: Lis
                             
             if embed_count > 0:
                 self.logger.debug(f"[WEBHOOK_DELIVERY:{delivery_id}] Added {embed_count} embeds")
+
+            # The outbox worker uploads the files and retries; the caller only waits for the enqueue
+            outbox_id = await self._enqueue_webhook(
+                webhook_url, self._webhook_payload(webhook), files=[f['path'] for f in validated_files],
+                alert_type=alert_type, log_prefix=f"[WEBHOOK_DELIVERY:{delivery_id}]"
+            )
+            if outbox_id is not None:
+                self._delivery_stats['queued'] += 1
+                return True, {
+                    'status': 'queued',
+                    'outbox_id': outbox_id,
+                    'delivery_time': time.time() - start_time,
+                    'file_attachments': len(validated_files),
+                    'embeds': embed_count
+                }
             
             # Add files if provided
             file_count = 0
@@ -4048,6 +4053,39 @@ async def send_discord_webhook_message(self, message: Dict[str, Any], files: Lis
             
             return False, {'error': f'Unexpected error: {str(e)}', 'total_time': total_time}
     
+    @staticmethod
+    def _webhook_payload(webhook: DiscordWebhook) -> Dict[str, Any]:
+        """JSON body of a built ``DiscordWebhook``, as stored in the outbox."""
+        payload = dict(webhook.json)
+        payload.pop('wait', None)
+        if not payload.get('attachments'):
+            payload.pop('attachments', None)
+        return payload
+
+    async def _enqueue_webhook(
+        self,
+        webhook_url: str,
+        payload: Dict[str, Any],
+        files: Optional[List[str]] = None,
+        alert_type: Optional[str] = None,
+        log_prefix: str = ""
+    ) -> Optional[int]:
+        """Queue a webhook message in the outbox.
+
+        Returns:
+            The outbox id, or None when the outbox is disabled or the enqueue
+            failed and the caller should send inline
+        """
+        if self.alert_outbox is None:
+            return None
+        try:
+            outbox_id = await self.alert_outbox.enqueue(webhook_url, payload, files=files, alert_type=alert_type)
+        except Exception as e:
+            self.logger.warning(f"{log_prefix} Outbox enqueue failed, sending inline: {e}")
+            return None
+        self.logger.debug(f"{log_prefix} Queued webhook message {outbox_id} (queue depth {self.alert_outbox.queue_depth})")
+        return outbox_id
+
     # ========== IMPROVED SESSION MANAGEMENT FROM REFACTORED VERSION ==========
     async def _ensure_webhook_session(self):
         """
@@ -4084,6 +4122,10 @@ async def cleanup(self):
             # Close webhook session
             await self._close_webhook_session()
 
+            # Deliver what the outbox can in a few seconds; the rest stays queued for the next start
+            if self.alert_outbox is not None:
+                await self.alert_outbox.stop()
+
             # Clean up throttle entries
             self._cleanup_throttle_entries()
 
@@ -4186,15 +4228,18 @@ def get_delivery_stats(self) -> Dict[str, Any]:
         Returns:
             Dictionary containing delivery statistics
         """
+        outbox_stats = self.alert_outbox.get_stats() if self.alert_outbox is not None else {}
+        # Queued messages count once the outbox has delivered or given up on them
+        delivered = self._delivery_stats['successful_deliveries'] + outbox_stats.get('delivered', 0)
+        failed = self._delivery_stats['failed_deliveries'] + outbox_stats.get('failed', 0)
         return {
             **self._delivery_stats,
-            'success_rate': (
-                self._delivery_stats['successful_deliveries'] / max(1, self._delivery_stats['total_attempts'])
-            ) * 100,
+            'success_rate': (delivered / max(1, delivered + failed)) * 100,
             'file_attachment_success_rate': (
                 (self._delivery_stats['file_attachments'] - self._delivery_stats['file_attachment_failures']) / 
                 max(1, self._delivery_stats['file_attachments'])
-            ) * 100 if self._delivery_stats['file_attachments'] > 0 else 100
+            ) * 100 if self._delivery_stats['file_attachments'] > 0 else 100,
+            'outbox': outbox_stats
         }
 
     def register_discord_handler(self) -> None:
@@ -4237,6 +4282,10 @@ async def start(self) -> None:
             
             # Re-initialize Discord webhook client
             self._init_discord_webhook()
+
+            # Resume delivery of messages left in the outbox by the previous run
+            if self.alert_outbox is not None:
+                await self.alert_outbox.start()
             
             # Send startup notification (disabled to avoid noise)
             # await self.send_alert(
@@ -4646,11 +4695,15 @@ async def _generate_chart_from_signal_data(self, signal_data: Dict[str, Any], tr
             chart_dir = os.path.join(os.getcwd(), 'reports', 'charts')
             os.makedirs(chart_dir, exist_ok=True)
             
-            # Try to create the chart
-            if hasattr(self.pdf_generator, '_create_candlestick_chart'):
+            # Try to create the chart (in the chart render service, off the event loop)
+            if hasattr(self.pdf_generator, 'render_chart_async'):
+                timeframe = signal_data.get('timeframe')
                 if ohlcv_data is not None:
                     # Use real OHLCV data if available
-                    chart_path = self.pdf_generator._create_candlestick_chart(
+                    chart_path = await self.pdf_generator.render_chart_async(
+                        '_create_candlestick_chart',
+                        cache_key=chart_cache_key(symbol, ohlcv_data, timeframe, entry_price=entry_price,
+                                                  stop_loss=stop_loss, targets=targets, chart_mode='light'),
                         symbol=symbol,
                         ohlcv_data=ohlcv_data,
                         entry_price=entry_price,
@@ -4660,8 +4713,11 @@ async def _generate_chart_from_signal_data(self, signal_data: Dict[str, Any], tr
                     )
                 else:
                     # Use simulated chart if no OHLCV data
-                    if hasattr(self.pdf_generator, '_create_simulated_chart') and entry_price:
-                        chart_path = self.pdf_generator._create_simulated_chart(
+                    if entry_price:
+                        chart_path = await self.pdf_generator.render_chart_async(
+                            '_create_simulated_chart',
+                            cache_key=chart_cache_key(symbol, None, timeframe, entry_price=entry_price,
+                                                      stop_loss=stop_loss, targets=targets, chart_mode='light'),
                             symbol=symbol,
                             entry_price=entry_price,
                             stop_loss=stop_loss,
@@ -6240,6 +6296,9 @@ async def _send_system_webhook_alert(self, message: str, details: Optional[Dict[
 
             self.logger.debug(f"Routing system alert to {webhook_type} webhook...")
 
+            if await self._enqueue_webhook(webhook_url, payload, alert_type='system', log_prefix="[SYSTEM_ALERT]") is not None:
+                return
+
             async with aiohttp.ClientSession() as session:
                 async with session.post(
                     webhook_url,
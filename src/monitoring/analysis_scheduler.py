@@ -0,0 +1,435 @@
+"""
+Event-driven per-symbol analysis scheduler for MarketMonitor.
+
+Replaces the fixed-cycle batch in ``MarketMonitor._monitoring_cycle`` where
+every symbol was fanned out behind one semaphore and the next cycle waited on
+``asyncio.gather`` for all of them, so one slow symbol stalled the batch and
+quiet symbols were recomputed as often as hot ones.
+
+Each symbol is re-analyzed independently when its inputs have changed
+materially, or when its deadline expires:
+
+- ``candle_close``: a new base-timeframe candle opened in the OHLCV store
+- ``imbalance_drift``: top-of-book imbalance moved by ``imbalance_drift``
+- ``trade_volume``: traded volume rate since the last run exceeds
+  ``volume_surge_ratio`` times the symbol's running average
+- ``deadline``: nothing changed, but ``interval`` seconds have passed
+
+The deadline interval is based on ``SmartIntervalsManager``'s 'analysis'
+interval (market-wide activity) and shortened per symbol by realized
+volatility, so volatile symbols are refreshed sooner and are dequeued first.
+Symbols run on a bounded worker pool with a per-run timeout; queue depth,
+queue wait and trigger-to-result latency are exposed as backpressure metrics
+through ``get_stats()``.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.utils.task_tracker import create_tracked_task
+
+logger = logging.getLogger(__name__)
+
+TRIGGER_NEW = 'new_symbol'
+TRIGGER_CANDLE = 'candle_close'
+TRIGGER_IMBALANCE = 'imbalance_drift'
+TRIGGER_VOLUME = 'trade_volume'
+TRIGGER_DEADLINE = 'deadline'
+
+# Lower rank is dequeued first; ties are broken by volatility (higher first)
+_TRIGGER_RANK = {
+    TRIGGER_NEW: 0,
+    TRIGGER_CANDLE: 1,
+    TRIGGER_VOLUME: 2,
+    TRIGGER_IMBALANCE: 2,
+    TRIGGER_DEADLINE: 3,
+}
+
+# Smoothing factor for the per-symbol traded volume rate
+_VOLUME_EWMA_ALPHA = 0.3
+
+
+@dataclass
+class SymbolSchedule:
+    """Scheduling state for a single symbol."""
+    symbol: str
+    interval: float
+    last_started: float = 0.0
+    last_finished: float = 0.0
+    last_duration: float = 0.0
+    last_trigger: Optional[str] = None
+    # Input baselines captured when the last run started
+    last_candle_ts: Optional[int] = None
+    last_imbalance: Optional[float] = None
+    volume_rate: Optional[float] = None
+    volatility: float = 0.0
+    queued: bool = False
+    in_flight: bool = False
+    runs: int = 0
+    timeouts: int = 0
+    errors: int = 0
+
+
+def _percentiles(samples: Iterable[float]) -> Dict[str, float]:
+    values = sorted(samples)
+    if not values:
+        return {'avg': 0.0, 'p50': 0.0, 'p95': 0.0, 'max': 0.0}
+    last = len(values) - 1
+    return {
+        'avg': round(sum(values) / len(values), 4),
+        'p50': round(values[last // 2], 4),
+        'p95': round(values[int(last * 0.95)], 4),
+        'max': round(values[-1], 4),
+    }
+
+
+class AnalysisScheduler:
+    """
+    Dispatches per-symbol analysis runs when their inputs change.
+
+    Args:
+        analyze: Coroutine function run for a symbol (e.g. ``MarketMonitor._process_symbol``)
+        config: Application config; settings are read from ``monitoring.scheduler``
+        market_data_manager: Source of the OHLCV store, order books, trade tapes
+            and smart intervals used as change probes. Without it only
+            deadlines drive scheduling.
+        max_concurrent: Maximum number of symbols analyzed at once
+    """
+
+    def __init__(
+        self,
+        analyze: Callable[[str], Awaitable[Any]],
+        config: Optional[Dict[str, Any]] = None,
+        market_data_manager=None,
+        max_concurrent: int = 10,
+        logger: Optional[logging.Logger] = None
+    ):
+        self._analyze = analyze
+        self.market_data_manager = market_data_manager
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.logger = logger or logging.getLogger(__name__)
+
+        scheduler_config = (config or {}).get('monitoring', {}).get('scheduler', {})
+        self.enabled = scheduler_config.get('enabled', True)
+        self.min_interval = float(scheduler_config.get('min_interval_seconds', 5))
+        self.max_interval = float(scheduler_config.get('max_interval_seconds', 60))
+        self.tick_interval = float(scheduler_config.get('tick_interval_seconds', 1))
+        self.analysis_timeout = float(scheduler_config.get('analysis_timeout_seconds', 60))
+        self.deadline_grace = float(scheduler_config.get('deadline_grace_seconds', 5))
+        self.base_timeframe = scheduler_config.get('base_timeframe', 'base')
+        self.imbalance_drift = float(scheduler_config.get('imbalance_drift', 0.15))
+        self.imbalance_levels = int(scheduler_config.get('imbalance_levels', 10))
+        self.volume_surge_ratio = float(scheduler_config.get('volume_surge_ratio', 2.0))
+        self.volatility_reference = float(scheduler_config.get('volatility_reference', 0.002))
+        self.volatility_lookback = int(scheduler_config.get('volatility_lookback', 20))
+
+        self._states: Dict[str, SymbolSchedule] = {}
+        self._queue: List[Tuple[int, float, float, int, str, str]] = []
+        self._sequence = itertools.count()
+        self._tasks: Set[asyncio.Task] = set()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running = False
+
+        self._queue_waits: Deque[float] = deque(maxlen=512)
+        self._latencies: Deque[float] = deque(maxlen=512)
+        self.stats = {
+            'dispatched': 0,
+            'completed': 0,
+            'timeouts': 0,
+            'errors': 0,
+            'deadline_misses': 0,
+            'saturated_ticks': 0,
+            'max_queue_depth': 0,
+            'triggers': {reason: 0 for reason in _TRIGGER_RANK},
+        }
+
+    # ------------------------------------------------------------------
+    # Symbol set
+    # ------------------------------------------------------------------
+
+    def set_symbols(self, symbols: Iterable[Any]) -> None:
+        """Replace the scheduled symbol set (dicts with a 'symbol' key are accepted)."""
+        wanted = []
+        for symbol in symbols:
+            symbol_str = symbol['symbol'] if isinstance(symbol, dict) and 'symbol' in symbol else symbol
+            if symbol_str:
+                wanted.append(str(symbol_str))
+
+        for symbol in wanted:
+            if symbol not in self._states:
+                self._states[symbol] = SymbolSchedule(symbol=symbol, interval=self._base_interval())
+
+        wanted_set = set(wanted)
+        for symbol in list(self._states):
+            # In-flight runs are left to finish; their state goes on the next refresh
+            if symbol not in wanted_set and not self._states[symbol].in_flight:
+                del self._states[symbol]
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._states)
+
+    def all_analyzed(self) -> bool:
+        """True once every scheduled symbol has completed at least one run."""
+        return bool(self._states) and all(state.runs > 0 for state in self._states.values())
+
+    # ------------------------------------------------------------------
+    # Change probes
+    # ------------------------------------------------------------------
+
+    def _base_interval(self) -> float:
+        smart_intervals = getattr(self.market_data_manager, 'smart_intervals', None)
+        if smart_intervals is not None and getattr(smart_intervals, 'enabled', False):
+            try:
+                return float(smart_intervals.get_current_interval('analysis'))
+            except Exception as e:
+                self.logger.debug(f"Smart interval lookup failed: {e}")
+        return self.max_interval
+
+    def _candle_timestamp(self, symbol: str) -> Optional[int]:
+        store = getattr(self.market_data_manager, 'ohlcv_store', None)
+        buffer = store.get_buffer(symbol, self.base_timeframe) if store is not None else None
+        return buffer.last_timestamp if buffer is not None else None
+
+    def _imbalance(self, symbol: str) -> Optional[float]:
+        books = getattr(self.market_data_manager, 'order_books', None) or {}
+        book = books.get(symbol)
+        if book is None or not book.synced:
+            return None
+        return book.imbalance(self.imbalance_levels)
+
+    def _traded_volume(self, symbol: str, since: float) -> Optional[float]:
+        tapes = getattr(self.market_data_manager, 'trade_tapes', None) or {}
+        tape = tapes.get(symbol)
+        if tape is None or not len(tape):
+            return None
+        volume = tape.buy_sell_volume(since_ms=int(since * 1000))
+        return volume['buy_volume'] + volume['sell_volume']
+
+    def _volatility(self, symbol: str) -> float:
+        """Standard deviation of recent base-timeframe log returns."""
+        store = getattr(self.market_data_manager, 'ohlcv_store', None)
+        buffer = store.get_buffer(symbol, self.base_timeframe) if store is not None else None
+        if buffer is None or len(buffer) < 3:
+            return 0.0
+        closes = [c for c in buffer.values[-(self.volatility_lookback + 1):, 3].tolist() if c > 0]
+        returns = [math.log(b / a) for a, b in zip(closes, closes[1:])]
+        if len(returns) < 2:
+            return 0.0
+        mean = sum(returns) / len(returns)
+        return math.sqrt(sum((r - mean) ** 2 for r in returns) / (len(returns) - 1))
+
+    def _symbol_interval(self, volatility: float) -> float:
+        """Deadline interval, shortened as volatility rises above the reference."""
+        base = self._base_interval()
+        if self.volatility_reference > 0:
+            base = base / (1.0 + volatility / self.volatility_reference)
+        return max(self.min_interval, base)
+
+    def _evaluate(self, state: SymbolSchedule, now: float) -> Optional[str]:
+        """Return the reason a symbol should run now, or None."""
+        if state.last_started == 0:
+            return TRIGGER_NEW
+
+        elapsed = now - state.last_started
+        if elapsed >= self.min_interval:
+            try:
+                candle_ts = self._candle_timestamp(state.symbol)
+                if candle_ts is not None and state.last_candle_ts is not None and candle_ts > state.last_candle_ts:
+                    return TRIGGER_CANDLE
+
+                imbalance = self._imbalance(state.symbol)
+                if (imbalance is not None and state.last_imbalance is not None
+                        and abs(imbalance - state.last_imbalance) >= self.imbalance_drift):
+                    return TRIGGER_IMBALANCE
+
+                if state.volume_rate:
+                    volume = self._traded_volume(state.symbol, state.last_started)
+                    if volume is not None and volume / elapsed >= self.volume_surge_ratio * state.volume_rate:
+                        return TRIGGER_VOLUME
+            except Exception as e:
+                self.logger.debug(f"Change probe failed for {state.symbol}: {e}")
+
+        if elapsed >= state.interval:
+            return TRIGGER_DEADLINE
+        return None
+
+    def _capture_baseline(self, state: SymbolSchedule, now: float) -> None:
+        """Record the inputs a run is about to analyze, for the next change check."""
+        try:
+            if state.last_started:
+                volume = self._traded_volume(state.symbol, state.last_started)
+                elapsed = now - state.last_started
+                if volume is not None and elapsed > 0:
+                    rate = volume / elapsed
+                    state.volume_rate = rate if state.volume_rate is None else (
+                        _VOLUME_EWMA_ALPHA * rate + (1 - _VOLUME_EWMA_ALPHA) * state.volume_rate
+                    )
+            state.last_candle_ts = self._candle_timestamp(state.symbol)
+            state.last_imbalance = self._imbalance(state.symbol)
+            state.volatility = self._volatility(state.symbol)
+        except Exception as e:
+            self.logger.debug(f"Baseline capture failed for {state.symbol}: {e}")
+        state.interval = self._symbol_interval(state.volatility)
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def _enqueue_due(self, now: float) -> None:
+        for state in self._states.values():
+            if state.queued or state.in_flight:
+                continue
+            reason = self._evaluate(state, now)
+            if reason is None:
+                continue
+            state.queued = True
+            self.stats['triggers'][reason] += 1
+            heapq.heappush(
+                self._queue,
+                (_TRIGGER_RANK[reason], -state.volatility, now, next(self._sequence), state.symbol, reason)
+            )
+
+    def dispatch_due(self, now: Optional[float] = None) -> int:
+        """Queue symbols whose inputs changed and start as many as workers allow.
+
+        Returns:
+            Number of runs started
+        """
+        now = time.time() if now is None else now
+        self._enqueue_due(now)
+
+        started = 0
+        while self._queue and len(self._tasks) < self.max_concurrent:
+            _, _, enqueued_at, _, symbol, reason = heapq.heappop(self._queue)
+            state = self._states.get(symbol)
+            if state is None:
+                continue
+            state.queued = False
+            state.in_flight = True
+            task = create_tracked_task(
+                self._run_symbol(state, reason, enqueued_at),
+                name=f"analysis_{symbol}"
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            started += 1
+
+        self.stats['dispatched'] += started
+        self.stats['max_queue_depth'] = max(self.stats['max_queue_depth'], len(self._queue))
+        if self._queue:
+            self.stats['saturated_ticks'] += 1
+        return started
+
+    async def _run_symbol(self, state: SymbolSchedule, reason: str, enqueued_at: float) -> None:
+        started = time.time()
+        self._queue_waits.append(started - enqueued_at)
+        if state.last_started and started - (state.last_started + state.interval) > self.deadline_grace:
+            self.stats['deadline_misses'] += 1
+
+        self._capture_baseline(state, started)
+        state.last_started = started
+        state.last_trigger = reason
+        try:
+            await asyncio.wait_for(self._analyze(state.symbol), timeout=self.analysis_timeout)
+        except asyncio.TimeoutError:
+            state.timeouts += 1
+            self.stats['timeouts'] += 1
+            self.logger.warning(f"Analysis for {state.symbol} timed out after {self.analysis_timeout:.0f}s")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            state.errors += 1
+            self.stats['errors'] += 1
+            self.logger.error(f"Analysis for {state.symbol} failed: {str(e)}")
+        finally:
+            finished = time.time()
+            state.last_finished = finished
+            state.last_duration = finished - started
+            state.runs += 1
+            state.in_flight = False
+            self.stats['completed'] += 1
+            self._latencies.append(finished - enqueued_at)
+            if self._wakeup is not None:
+                # A worker is free - dispatch queued symbols without waiting for the next tick
+                self._wakeup.set()
+
+    async def run(self) -> None:
+        """Dispatcher loop; runs until ``stop()`` is called."""
+        self._running = True
+        self._wakeup = asyncio.Event()
+        self.logger.info(
+            f"Analysis scheduler started (workers={self.max_concurrent}, "
+            f"min_interval={self.min_interval}s, base_interval={self._base_interval()}s)"
+        )
+        while self._running:
+            try:
+                self.dispatch_due()
+            except Exception as e:
+                self.logger.error(f"Analysis scheduler dispatch error: {str(e)}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.tick_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def start(self) -> None:
+        """Start the dispatcher loop if it is not already running."""
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = create_tracked_task(self.run(), name="analysis_scheduler")
+
+    async def stop(self) -> None:
+        """Stop dispatching and cancel in-flight runs."""
+        self._running = False
+        tasks = list(self._tasks)
+        if self._dispatcher is not None:
+            tasks.append(self._dispatcher)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._dispatcher = None
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Backpressure and latency metrics for monitoring."""
+        now = time.time()
+        overdue = [
+            state.symbol for state in self._states.values()
+            if state.last_started and not state.in_flight
+            and now - (state.last_started + state.interval) > self.deadline_grace
+        ]
+        return {
+            'running': self._running,
+            'symbols': len(self._states),
+            'queue_depth': len(self._queue),
+            'in_flight': len(self._tasks),
+            'workers': self.max_concurrent,
+            'overdue_symbols': overdue,
+            'queue_wait_seconds': _percentiles(self._queue_waits),
+            'trigger_to_result_seconds': _percentiles(self._latencies),
+            **{key: (dict(value) if isinstance(value, dict) else value) for key, value in self.stats.items()},
+            'per_symbol': {
+                state.symbol: {
+                    'interval': round(state.interval, 2),
+                    'volatility': round(state.volatility, 6),
+                    'last_trigger': state.last_trigger,
+                    'last_duration': round(state.last_duration, 3),
+                    'runs': state.runs,
+                    'timeouts': state.timeouts,
+                    'errors': state.errors,
+                }
+                for state in self._states.values()
+            },
+        }
@@ -712,6 +712,7 @@ def __init__(self, cache_adapter, config: Optional[Dict[str, Any]] = None, excha
 
         # Market-wide data (fetched from exchange)
         self.market_wide_tickers = {}  # All perpetual tickers from exchange
+        self.market_snapshot = None  # Current cycle's MarketSnapshot, set by the monitor
         self.last_ticker_fetch = 0  # Last time we fetched market-wide tickers
         self.ticker_fetch_interval = 60  # Fetch tickers every 60 seconds
 
@@ -859,6 +860,12 @@ async def add_analysis_result(self, symbol: str, analysis_result: Dict[str, Any]
                 if 'confluence_score' in analysis_result:
                     logger.info(f"DEBUG: Confluence score for {symbol}: {analysis_result['confluence_score']}")
 
+            # Reuse the market data fetched this cycle instead of leaving the buffers empty
+            if 'market_data' not in analysis_result and self.market_snapshot is not None:
+                snapshot_data = self.market_snapshot.peek(symbol, 'market_data')
+                if snapshot_data:
+                    analysis_result = {**analysis_result, 'market_data': snapshot_data}
+
             # Add to buffer with timestamp
             timestamped_result = {
                 **analysis_result,
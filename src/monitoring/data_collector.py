@@ -142,7 +142,7 @@ async def _perform_initialization(self) -> None:
         self.logger.info("DataCollector initialized with timeframes: %s", self.timeframes)
     
     @measure_performance()
-    async def fetch_market_data(self, symbol: str) -> Dict[str, Any]:
+    async def fetch_market_data(self, symbol: str, snapshot=None) -> Dict[str, Any]:
         """Fetch complete market data for a symbol.
 
         This is the main entry point for fetching all market data for a symbol.
@@ -155,6 +155,8 @@ async def fetch_market_data(self, symbol: str) -> Dict[str, Any]:
 
         Args:
             symbol: Trading pair symbol
+            snapshot: Optional per-cycle ``MarketSnapshot``; a ticker already
+                fetched for symbol ranking is reused instead of refetched
 
         Returns:
             Dictionary containing all market data for the symbol
@@ -166,7 +168,11 @@ async def fetch_market_data(self, symbol: str) -> Dict[str, Any]:
         if self.market_data_manager is not None:
             mdm_cache = getattr(self.market_data_manager, 'data_cache', {})
             if symbol in mdm_cache and mdm_cache[symbol]:
-                mdm_data = mdm_cache[symbol]
+                # OHLCV/orderbook/trades are materialized lazily from MDM's columnar stores
+                if hasattr(self.market_data_manager, 'materialize_cache'):
+                    mdm_data = self.market_data_manager.materialize_cache(symbol)
+                else:
+                    mdm_data = mdm_cache[symbol]
                 # Verify cache has essential data (ticker at minimum)
                 if mdm_data.get('ticker'):
                     self._fetch_stats['cache_hits'] += 1
@@ -192,6 +198,7 @@ async def fetch_market_data(self, symbol: str) -> Dict[str, Any]:
                         'ohlcv': mdm_data.get('ohlcv', mdm_data.get('kline', {})),
                         'orderbook': mdm_data.get('orderbook'),
                         'trades': mdm_data.get('trades', []),
+                        'trade_tape': getattr(self.market_data_manager, 'trade_tapes', {}).get(symbol),
                         'ticker': mdm_data.get('ticker'),
                         'long_short_ratio': mdm_data.get('long_short_ratio'),
                         'risk_limit': mdm_data.get('risk_limits'),
@@ -226,7 +233,7 @@ async def fetch_market_data(self, symbol: str) -> Dict[str, Any]:
                 self._fetch_ohlcv_all_timeframes(exchange, symbol),
                 self._fetch_orderbook(exchange, symbol),
                 self._fetch_trades(exchange, symbol),
-                self._fetch_ticker(exchange, symbol),
+                self._fetch_ticker(exchange, symbol, snapshot),
                 self._fetch_long_short_ratio(exchange, symbol),  # Add LSR fetching
                 self._fetch_risk_limits(exchange, symbol),  # Add risk limits fetching
                 self._fetch_premium_index(exchange, symbol),  # Phase 1: premium index
@@ -468,7 +475,7 @@ async def _fetch_trades(self, exchange, symbol: str) -> List[Dict[str, Any]]:
             return []
     
     @retry_on_error(max_attempts=2, delay=0.5)
-    async def _fetch_ticker(self, exchange, symbol: str) -> Dict[str, Any]:
+    async def _fetch_ticker(self, exchange, symbol: str, snapshot=None) -> Dict[str, Any]:
         """Fetch ticker data with batch cache optimization.
 
         PHASE 1: Uses batch ticker cache when available (60s TTL).
@@ -477,11 +484,17 @@ async def _fetch_ticker(self, exchange, symbol: str) -> Dict[str, Any]:
         Args:
             exchange: Exchange instance
             symbol: Trading pair symbol
+            snapshot: Optional per-cycle snapshot checked before any cache
 
         Returns:
             Ticker dictionary with symbol, last, timestamp fields
         """
         try:
+            if snapshot is not None:
+                ticker = snapshot.peek(symbol, 'ticker')
+                if ticker:
+                    return ticker
+
             # PHASE 1: Check batch ticker cache first (double-check locking pattern)
             cache_entry = self._batch_ticker_cache.get(symbol)
             if cache_entry:
@@ -2415,7 +2415,9 @@ async def generate_market_summary(self) -> Dict[str, Any]:
                 if report.get('signal_type') in ['LONG', 'SHORT']:
                     try:
                         from src.database.signal_storage import store_trading_signal
-                        store_trading_signal(
+                        from src.database.sqlite_access import get_db_access
+                        await get_db_access().run_async(
+                            store_trading_signal,
                             signal_data=report,
                             json_path=reports_json_path,
                             pdf_path=reports_pdf_path
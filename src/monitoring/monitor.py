@@ -45,6 +45,7 @@
 from .websocket_manager import MonitoringWebSocketManager
 from .metrics_tracker import MetricsTracker
 from .alert_manager import AlertManager
+from .analysis_scheduler import AnalysisScheduler
 
 # Import utilities
 from .utils.timestamp import TimestampUtility
@@ -55,6 +56,8 @@
 from .utils.logging import LoggingUtility
 from .metrics_manager import MetricsManager
 from .health_monitor import HealthMonitor
+from src.core.analysis.confluence_pool import ConfluenceProcessPool
+from src.core.market.market_snapshot import MarketSnapshot
 import logging
 
 logger = logging.getLogger(__name__)
@@ -207,6 +210,17 @@ def __init__(
         # Whale trade detection cooldown tracking (Bug #2 fix - initialize here to avoid race condition)
         self._last_whale_trade_alert = {}
 
+        # Event-driven per-symbol scheduler (created on first cycle, once dependencies are resolved)
+        self.analysis_scheduler: Optional[AnalysisScheduler] = None
+
+        # Worker-process pool for confluence analysis (created on first use when enabled)
+        self.confluence_pool: Optional[ConfluenceProcessPool] = None
+
+        # Market data shared by ranking, symbol processing, the cache aggregator
+        # and the dashboard within one cycle (replaced at the start of each cycle)
+        self.market_snapshot: Optional[MarketSnapshot] = None
+        self._last_snapshot_stats: Optional[Dict[str, Any]] = None
+
         # Maintain symbols attribute for backward compatibility
         self.symbols = []
         
@@ -708,6 +722,12 @@ async def stop_monitoring(self) -> None:
         
         # Stop components
         try:
+            if self.analysis_scheduler is not None:
+                await self.analysis_scheduler.stop()
+
+            if self.confluence_pool is not None:
+                await self.confluence_pool.stop()
+
             if hasattr(self.data_collector, 'stop'):
                 await self.data_collector.stop()
             
@@ -763,6 +783,9 @@ def get_monitoring_health(self) -> Dict[str, Any]:
             'error_count': self._error_count,
             'first_cycle_completed': self.first_cycle_completed,
             'symbols_count': len(self.symbols) if self.symbols else 0,
+            'scheduler': self.analysis_scheduler.get_stats() if self.analysis_scheduler else None,
+            'confluence_pool': self.confluence_pool.get_stats() if self.confluence_pool else None,
+            'market_snapshot': self._last_snapshot_stats,
         }
 
     async def _run_monitoring_loop(self) -> None:
@@ -864,9 +887,10 @@ async def _monitoring_cycle(self) -> None:
             # Get max_symbols from config, default to 15 per config.yaml
             max_symbols = self.config.get('market', {}).get('symbols', {}).get('max_symbols', 15)
             self.logger.info(f"🎯 Configured to process {max_symbols} symbols per cycle")
+            snapshot = self._rotate_market_snapshot()
             try:
                 symbols = await asyncio.wait_for(
-                    self.top_symbols_manager.get_top_symbols(limit=max_symbols),
+                    self.top_symbols_manager.get_top_symbols(limit=max_symbols, snapshot=snapshot),
                     timeout=15.0  # Increased timeout to 15 seconds
                 )
             except asyncio.TimeoutError:
@@ -891,50 +915,26 @@ async def _monitoring_cycle(self) -> None:
             self.symbols = symbols
             self.logger.info(f"Processing {len(symbols)} symbols")
             
-            # Process symbols concurrently with controlled concurrency
-            # Read from config.monitoring.performance.max_concurrent_symbols
-            max_concurrent = self.config.get('monitoring', {}).get('performance', {}).get('max_concurrent_symbols', 10)
-            semaphore = asyncio.Semaphore(max_concurrent)
-            self.logger.info(f"Processing symbols with concurrency limit: {max_concurrent}")
-            
-            async def process_symbol_with_semaphore(symbol):
-                async with semaphore:
-                    return await self._process_symbol(symbol)  # CRITICAL FIX: Return the result!
-            
-            # Process all symbols concurrently
-            tasks = [process_symbol_with_semaphore(symbol) for symbol in symbols]
-            self.logger.info(f"📋 Created {len(tasks)} tasks for symbol processing")
-
-            # Performance tracking (time already imported at module level)
-            cycle_start_time = time.time()
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            cycle_elapsed_time = time.time() - cycle_start_time
-
-            # Enhanced result validation to detect both exceptions AND silent failures
-            exceptions = [r for r in results if isinstance(r, Exception)]
-            none_results = [i for i, r in enumerate(results) if r is None]
-            successful_tasks = len(results) - len(exceptions) - len(none_results)
-
-            if exceptions:
-                self.logger.error(f"❌ {len(exceptions)} tasks failed with exceptions:")
-                for i, exc in enumerate(exceptions):
-                    self.logger.error(f"  Task {i}: {exc}")
-
-            if none_results:
-                self.logger.error(f"⚠️ {len(none_results)} tasks completed but did no work (silent failures)")
-
-            # Performance metrics logging
-            if successful_tasks > 0:
-                avg_time_per_symbol = cycle_elapsed_time / len(symbols)
+            scheduler = self._get_analysis_scheduler()
+            if scheduler is not None:
+                # Symbols are analyzed independently as their inputs change;
+                # this cycle only refreshes the symbol set and reports backpressure
+                scheduler.set_symbols(symbols)
+                scheduler.start()
+                stats = scheduler.get_stats()
                 self.logger.info(
-                    f"✅ {successful_tasks}/{len(symbols)} symbols processed successfully in {cycle_elapsed_time:.2f}s "
-                    f"(avg: {avg_time_per_symbol:.2f}s/symbol, concurrency: {max_concurrent})"
+                    f"📋 Scheduler: {stats['symbols']} symbols, queue={stats['queue_depth']}, "
+                    f"in_flight={stats['in_flight']}/{stats['workers']}, "
+                    f"p95 trigger-to-result={stats['trigger_to_result_seconds']['p95']:.2f}s, "
+                    f"overdue={len(stats['overdue_symbols'])}"
                 )
+                if not self.first_cycle_completed and not scheduler.all_analyzed():
+                    self.logger.info("Waiting for the scheduler to complete its first pass over all symbols")
+                    return
             else:
-                self.logger.error("🚨 NO TASKS COMPLETED SUCCESSFULLY - SYSTEM MALFUNCTION DETECTED")
-            
+                await self._process_symbols_batch(symbols)
+                self._finish_market_snapshot(snapshot)
+
             # Mark first cycle as completed
             if not self.first_cycle_completed:
                 self.first_cycle_completed = True
@@ -953,6 +953,147 @@ async def process_symbol_with_semaphore(symbol):
             self.logger.error(traceback.format_exc())  # Changed from debug to error level
             raise  # Re-raise to ensure proper error handling in the main loop
     
+    def _rotate_market_snapshot(self) -> MarketSnapshot:
+        """Start this cycle's market snapshot and hand it to the consumers.
+
+        With the scheduler, symbols of the previous cycle may still be
+        processing when the next cycle starts; the outgoing snapshot's stats
+        are recorded here so both modes report complete per-cycle numbers.
+        """
+        if self.market_snapshot is not None and self._last_snapshot_stats is None:
+            self._finish_market_snapshot(self.market_snapshot)
+        snapshot_config = self.config.get('monitoring', {}).get('snapshot', {})
+        self.market_snapshot = MarketSnapshot(max_age=snapshot_config.get('max_age', 5.0))
+        self._last_snapshot_stats = None
+        if getattr(self, 'cache_data_aggregator', None) is not None:
+            self.cache_data_aggregator.market_snapshot = self.market_snapshot
+        return self.market_snapshot
+
+    def _finish_market_snapshot(self, snapshot: MarketSnapshot) -> None:
+        """Record and log the duplicate-fetch savings of a cycle's snapshot."""
+        stats = snapshot.get_stats()
+        self._last_snapshot_stats = stats
+        self.logger.info(
+            f"📦 Snapshot #{stats['cycle_id']}: {stats['fetches']} fetches, "
+            f"{stats['duplicate_fetches_saved']} duplicate fetches saved "
+            f"({stats['hits']} reused, {stats['coalesced']} coalesced)"
+        )
+
+    def _get_analysis_scheduler(self) -> Optional[AnalysisScheduler]:
+        """Create the event-driven scheduler on first use, unless disabled in config."""
+        if self.analysis_scheduler is None:
+            scheduler_config = self.config.get('monitoring', {}).get('scheduler', {})
+            if not scheduler_config.get('enabled', True):
+                return None
+            max_concurrent = self.config.get('monitoring', {}).get('performance', {}).get('max_concurrent_symbols', 10)
+            self.analysis_scheduler = AnalysisScheduler(
+                self._process_symbol,
+                config=self.config,
+                market_data_manager=self.market_data_manager,
+                max_concurrent=max_concurrent,
+                logger=self.logger
+            )
+        elif self.analysis_scheduler.market_data_manager is None:
+            # Market data manager may be injected after the first cycle
+            self.analysis_scheduler.market_data_manager = self.market_data_manager
+        return self.analysis_scheduler
+
+    def _get_confluence_pool(self) -> Optional[ConfluenceProcessPool]:
+        """Create the confluence worker pool on first use, unless disabled in config."""
+        if self.confluence_pool is None:
+            pool_config = self.config.get('confluence', {}).get('process_pool', {})
+            if not pool_config.get('enabled', False):
+                return None
+            self.confluence_pool = ConfluenceProcessPool(
+                self.config,
+                logger=self.logger.getChild('confluence_pool')
+            )
+        return self.confluence_pool
+
+    async def _run_confluence_analysis(self, analyzer, market_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Run confluence analysis in the worker pool, or on the event loop.
+
+        Worker failures (other than timeouts) are retried in-loop when
+        ``confluence.process_pool.fallback_to_loop_on_error`` is set.
+        """
+        pool = self._get_confluence_pool()
+        if pool is None:
+            return await analyzer.analyze(market_data)
+        try:
+            return await pool.analyze(market_data)
+        except asyncio.TimeoutError:
+            raise
+        except Exception as e:
+            if not pool.fallback_to_loop_on_error:
+                raise
+            self.logger.warning(
+                f"Confluence worker failed for {market_data.get('symbol')}, running in-loop: {e}"
+            )
+            return await analyzer.analyze(market_data)
+
+    async def _process_symbols_batch(self, symbols: List[Any]) -> None:
+        """Fixed-cycle batch: process every symbol and wait for all of them.
+
+        Used when the event-driven scheduler is disabled
+        (``monitoring.scheduler.enabled: false``).
+        """
+        # Process symbols concurrently with controlled concurrency
+        # Read from config.monitoring.performance.max_concurrent_symbols
+        max_concurrent = self.config.get('monitoring', {}).get('performance', {}).get('max_concurrent_symbols', 10)
+        semaphore = asyncio.Semaphore(max_concurrent)
+        self.logger.info(f"Processing symbols with concurrency limit: {max_concurrent}")
+        
+        async def process_symbol_with_semaphore(symbol):
+            async with semaphore:
+                return await self._process_symbol(symbol)  # CRITICAL FIX: Return the result!
+        
+        # Process all symbols concurrently
+        tasks = [process_symbol_with_semaphore(symbol) for symbol in symbols]
+        self.logger.info(f"📋 Created {len(tasks)} tasks for symbol processing")
+
+        # Performance tracking (time already imported at module level)
+        cycle_start_time = time.time()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        cycle_elapsed_time = time.time() - cycle_start_time
+
+        # Enhanced result validation to detect both exceptions AND silent failures
+        exceptions = [r for r in results if isinstance(r, Exception)]
+        none_results = [i for i, r in enumerate(results) if r is None]
+        successful_tasks = len(results) - len(exceptions) - len(none_results)
+
+        if exceptions:
+            self.logger.error(f"❌ {len(exceptions)} tasks failed with exceptions:")
+            for i, exc in enumerate(exceptions):
+                self.logger.error(f"  Task {i}: {exc}")
+
+        if none_results:
+            self.logger.error(f"⚠️ {len(none_results)} tasks completed but did no work (silent failures)")
+
+        # Performance metrics logging
+        if successful_tasks > 0:
+            avg_time_per_symbol = cycle_elapsed_time / len(symbols)
+            self.logger.info(
+                f"✅ {successful_tasks}/{len(symbols)} symbols processed successfully in {cycle_elapsed_time:.2f}s "
+                f"(avg: {avg_time_per_symbol:.2f}s/symbol, concurrency: {max_concurrent})"
+            )
+        else:
+            self.logger.error("🚨 NO TASKS COMPLETED SUCCESSFULLY - SYSTEM MALFUNCTION DETECTED")
+
+    async def _fetch_cycle_market_data(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Market data for ``symbol`` from the cycle snapshot, fetching it on a miss."""
+        snapshot = self.market_snapshot
+        if snapshot is None:
+            return await self.data_collector.fetch_market_data(symbol)
+
+        async def load():
+            market_data = await self.data_collector.fetch_market_data(symbol, snapshot=snapshot)
+            # Failed fetches are not shared with the other consumers
+            return market_data if market_data and 'error' not in market_data else None
+
+        return await snapshot.get(symbol, 'market_data', load)
+
     @handle_monitoring_error(reraise=True)
     async def _process_symbol(self, symbol: str) -> None:
         """Process a single symbol through the monitoring pipeline."""
@@ -971,9 +1112,9 @@ async def _process_symbol(self, symbol: str) -> None:
             
             self.logger.debug(f"Processing symbol: {symbol_str}")
             
-            # Step 1: Fetch market data
+            # Step 1: Fetch market data (once per cycle, shared through the snapshot)
             self.logger.debug(f"🎯 TASK STEP 1: Fetching market data for {symbol_str}")
-            market_data = await self.data_collector.fetch_market_data(symbol_str)
+            market_data = await self._fetch_cycle_market_data(symbol_str)
             if not market_data:
                 self.logger.warning(f"No market data available for {symbol_str}")
                 return {"success": False, "reason": "no_market_data", "symbol": symbol_str}
@@ -1000,7 +1141,7 @@ async def _process_symbol(self, symbol: str) -> None:
                     else:
                         self.logger.warning('[LSR-MONITOR] No LSR in market_data being passed to confluence')
                     self.logger.debug(f"[MONITOR-DEBUG] market_data has premium_index={bool(market_data.get('premium_index'))}")
-                    analysis_result = await analyzer.analyze(market_data)
+                    analysis_result = await self._run_confluence_analysis(analyzer, market_data)
                     if analysis_result:
                         # Log confluence score
                         confluence_score = analysis_result.get('confluence_score', 0)
@@ -1418,6 +1559,28 @@ async def _detect_and_update_regime(
         except Exception as e:
             self.logger.warning(f"Regime detection failed for {symbol}: {e}")
 
+    @staticmethod
+    def _whale_trades_from_tape(trade_tape, recent_cutoff: float, current_time: float,
+                                alert_threshold_usd: float) -> List[Dict[str, Any]]:
+        """Select whale trades from a columnar TradeTape without per-trade dict parsing."""
+        cols = trade_tape.columns(since_ms=int(recent_cutoff * 1000))
+        values = cols['price'] * cols['size']
+        mask = np.isfinite(values) & (values >= alert_threshold_usd) & (cols['size'] > 0)
+        side_names = {1: 'buy', -1: 'sell'}
+
+        whale_trades = []
+        for idx in np.flatnonzero(mask):
+            ts = cols['timestamp'][idx] / 1000
+            whale_trades.append({
+                'size': float(cols['size'][idx]),
+                'price': float(cols['price'][idx]),
+                'value_usd': float(values[idx]),
+                'side': side_names.get(int(cols['side'][idx]), 'unknown'),
+                'timestamp': ts,
+                'time_ago': int(current_time - ts)
+            })
+        return whale_trades
+
     async def _detect_whale_trades(self, symbol: str, market_data: Dict[str, Any]) -> None:
         """Detect individual large trades (executed whales), not just orderbook positioning.
 
@@ -1459,13 +1622,21 @@ async def _detect_whale_trades(self, symbol: str, market_data: Dict[str, Any]) -
             return
 
         # Analyze recent trades (last 5 minutes)
-        trades = market_data.get('trades', [])
-        if not trades or not isinstance(trades, list):
-            return
-
         recent_cutoff = current_time - 300  # 5 min lookback
         whale_trades = []
 
+        # Columnar fast path: one vectorized mask over the trade tape
+        trade_tape = market_data.get('trade_tape')
+        if trade_tape is not None and len(trade_tape):
+            whale_trades = self._whale_trades_from_tape(
+                trade_tape, recent_cutoff, current_time, alert_threshold_usd
+            )
+            trades = []
+        else:
+            trades = market_data.get('trades', [])
+            if not trades or not isinstance(trades, list):
+                return
+
         # Bug #1 fix: Comprehensive error handling in trade parsing loop
         for trade in trades:
             try:
@@ -2001,7 +2172,10 @@ async def get_ohlcv_for_report(self, symbol: str, timeframe: str = 'base') -> Op
             import pandas as pd  # Local import to avoid hard dependency if unused
             if self.market_data_manager and hasattr(self.market_data_manager, 'data_cache'):
                 cache = getattr(self.market_data_manager, 'data_cache', {})
-                md = cache.get(symbol) or {}
+                if hasattr(self.market_data_manager, 'materialize_cache'):
+                    md = self.market_data_manager.materialize_cache(symbol) or {}
+                else:
+                    md = cache.get(symbol) or {}
                 kline = md.get('kline') or {}
                 df = kline.get(timeframe)
                 # Normalize list-of-candles to DataFrame if necessary
@@ -2046,7 +2220,10 @@ def get_stats(self) -> Dict[str, Any]:
                 'validator': bool(self.validator),
                 'signal_processor': bool(self.signal_processor),
                 'metrics_tracker': bool(self.metrics_tracker),
-            }
+            },
+            'scheduler': self.analysis_scheduler.get_stats() if self.analysis_scheduler else None,
+            'confluence_pool': self.confluence_pool.get_stats() if self.confluence_pool else None,
+            'market_snapshot': self._last_snapshot_stats,
         }
 
     async def _process_analysis_result(self, symbol: str, result: Dict[str, Any], market_data: Optional[Dict[str, Any]] = None) -> None:
@@ -32,7 +32,8 @@ def __init__(
         db_path: str = "data/virtuoso.db",
         market_data_manager=None,
         auto_close_enabled: bool = False,
-        update_interval: int = 60
+        update_interval: int = 60,
+        flush_interval: float = 30.0
     ):
         """
         Initialize position monitor.
@@ -42,12 +43,13 @@ def __init__(
             market_data_manager: Manager for fetching current prices
             auto_close_enabled: Whether to automatically close signals on TP/SL hits
             update_interval: How often to update excursions (seconds)
+            flush_interval: How often dirty excursions are written to the database (seconds)
         """
         self.db_path = db_path
         self.market_data_manager = market_data_manager
         self.auto_close_enabled = auto_close_enabled
         self.update_interval = update_interval
-        self.tracker = SignalPerformanceTracker(db_path)
+        self.tracker = SignalPerformanceTracker(db_path, flush_interval=flush_interval)
         self.running = False
         self.monitor_task = None
 
@@ -70,6 +72,7 @@ async def stop(self):
                 await self.monitor_task
             except asyncio.CancelledError:
                 pass
+        self.tracker.close()
         logger.info("Signal position monitor stopped")
 
     async def _monitor_loop(self):
@@ -90,6 +93,7 @@ async def update_all_positions(self):
         try:
             # Get all active signals from database
             active_signals = self._get_active_signals()
+            self.tracker.sync_active(active_signals)
 
             if not active_signals:
                 logger.debug("No active signals to monitor")
@@ -97,50 +101,48 @@ async def update_all_positions(self):
 
             logger.info(f"Monitoring {len(active_signals)} active signals")
 
-            # Update each signal
+            # One price per symbol, evaluated against all of its signals at once
+            by_symbol: Dict[str, List[Dict[str, Any]]] = {}
             for signal in active_signals:
+                by_symbol.setdefault(signal['symbol'], []).append(signal)
+
+            for symbol, signals in by_symbol.items():
                 try:
-                    await self._update_signal_position(signal)
+                    await self._update_symbol_positions(symbol, signals)
                 except Exception as e:
-                    logger.error(f"Error updating signal {signal['signal_id']}: {e}")
+                    logger.error(f"Error updating signals for {symbol}: {e}")
+
+            self.tracker.maybe_flush()
 
         except Exception as e:
             logger.error(f"Error updating positions: {e}")
             logger.debug(traceback.format_exc())
 
-    async def _update_signal_position(self, signal: Dict[str, Any]):
+    async def _update_symbol_positions(self, symbol: str, signals: List[Dict[str, Any]]):
         """
-        Update excursion for a single signal.
+        Update excursions for all active signals of one symbol.
 
         Args:
-            signal: Signal data from database
+            symbol: Trading symbol
+            signals: Active signals for the symbol
         """
-        signal_id = signal['signal_id']
-        symbol = signal['symbol']
-
-        try:
-            # Get current price
-            current_price = await self._get_current_price(symbol)
-
-            if current_price is None:
-                logger.warning(f"Could not get price for {symbol}, skipping excursion update")
-                return
+        current_price = await self._get_current_price(symbol)
 
-            # Update excursion in database
-            success = self.tracker.update_excursion(signal_id, current_price)
-
-            if success:
-                logger.debug(f"Updated excursion for {signal_id}: price={current_price}")
-            else:
-                logger.warning(f"Failed to update excursion for {signal_id}")
+        if current_price is None:
+            logger.warning(f"Could not get price for {symbol}, skipping excursion update")
+            return
 
-            # Check for auto-close conditions if enabled
-            if self.auto_close_enabled:
-                await self._check_auto_close(signal, current_price)
+        changed = self.tracker.update_price(symbol, current_price)
+        logger.debug(f"Updated excursions for {len(signals)} {symbol} signals: price={current_price}, new extremes={changed}")
 
-        except Exception as e:
-            logger.error(f"Error updating signal {signal_id}: {e}")
-            logger.debug(traceback.format_exc())
+        # Check for auto-close conditions if enabled
+        if self.auto_close_enabled:
+            for signal in signals:
+                try:
+                    await self._check_auto_close(signal, current_price)
+                except Exception as e:
+                    logger.error(f"Error checking auto-close for {signal['signal_id']}: {e}")
+                    logger.debug(traceback.format_exc())
 
     async def _check_auto_close(self, signal: Dict[str, Any], current_price: float):
         """
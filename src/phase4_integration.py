@@ -171,6 +171,11 @@ def _load_configuration(self) -> Dict[str, Any]:
                 'hot_retention_hours': int(os.getenv('EVENT_STORE_HOT_RETENTION_HOURS', '24')),
                 'warm_retention_days': int(os.getenv('EVENT_STORE_WARM_RETENTION_DAYS', '30')),
                 'max_memory_events': int(os.getenv('EVENT_STORE_MAX_MEMORY_EVENTS', '100000')),
+                'durability': os.getenv('EVENT_STORE_DURABILITY', 'enqueue'),
+                'write_queue_size': int(os.getenv('EVENT_STORE_WRITE_QUEUE_SIZE', '50000')),
+                'write_batch_size': int(os.getenv('EVENT_STORE_WRITE_BATCH_SIZE', '1000')),
+                'write_batch_interval_ms': float(os.getenv('EVENT_STORE_WRITE_BATCH_INTERVAL_MS', '50')),
+                'sqlite_synchronous': os.getenv('EVENT_STORE_SQLITE_SYNCHRONOUS', 'NORMAL'),
             },
             'cache': {
                 'l1_max_size': int(os.getenv('CACHE_L1_MAX_SIZE', '10000')),
@@ -331,7 +336,13 @@ async def _initialize_event_sourcing(self):
             self.event_sourcing = EventSourcingManager(
                 storage_path=str(storage_path),
                 enable_real_time_streaming=True,
-                retention_policy=retention_policy
+                retention_policy=retention_policy,
+                write_options={
+                    key: config[key] for key in (
+                        'durability', 'write_queue_size', 'write_batch_size',
+                        'write_batch_interval_ms', 'sqlite_synchronous'
+                    )
+                }
             )
             
             await self.event_sourcing.initialize()
@@ -74,6 +74,7 @@
 
 # Import alpha detector for divergence analysis
 from .bitcoin_beta_alpha_detector import BitcoinBetaAlphaDetector, AlphaOpportunity
+from src.core.chart.render_service import RendererSpec, chart_cache_key, get_chart_render_service
 
 logger = logging.getLogger(__name__)
 
@@ -802,21 +803,23 @@ async def _generate_charts(self, market_data: Dict[str, Dict[str, pd.DataFrame]]
         """
         try:
             chart_paths = {}
-            
-            # Generate main performance comparison chart
-            main_chart = await self._create_performance_chart(market_data, 'htf', beta_analysis)
-            if main_chart:
-                chart_paths['performance'] = main_chart
-                
-            # Generate beta comparison chart
-            beta_chart = await self._create_beta_comparison_chart(beta_analysis)
-            if beta_chart:
-                chart_paths['beta_comparison'] = beta_chart
-                
-            # Generate correlation heatmap
-            correlation_chart = await self._create_correlation_heatmap(beta_analysis)
-            if correlation_chart:
-                chart_paths['correlation'] = correlation_chart
+            fingerprint = self._market_fingerprint(market_data)
+            
+            # Performance comparison, beta comparison and correlation heatmap render in parallel
+            charts = {
+                'performance': self._render_chart(
+                    '_create_performance_chart', ('performance', 'htf', fingerprint),
+                    market_data=market_data, timeframe='htf', beta_analysis=beta_analysis),
+                'beta_comparison': self._render_chart(
+                    '_create_beta_comparison_chart', ('beta_comparison', fingerprint),
+                    beta_analysis=beta_analysis),
+                'correlation': self._render_chart(
+                    '_create_correlation_heatmap', ('correlation', fingerprint),
+                    beta_analysis=beta_analysis),
+            }
+            for name, path in zip(charts, await asyncio.gather(*charts.values())):
+                if path:
+                    chart_paths[name] = path
                 
             # Generate high-resolution PNG exports for each section
             await self._generate_high_res_png_exports(market_data, beta_analysis, chart_paths)
@@ -850,44 +853,32 @@ async def _generate_high_res_png_exports(self, market_data: Dict[str, Dict[str,
             png_dir.mkdir(exist_ok=True)
             
             self.logger.info("Generating high-resolution PNG exports for each section...")
+            fingerprint = self._market_fingerprint(market_data)
+            exports = {}
             
             # 1. Performance Charts for Each Timeframe
             for tf_key, tf_display in [('htf', '4H'), ('mtf', '30M'), ('ltf', '5M'), ('base', '1M')]:
                 if tf_key in self.timeframes:
-                    png_path = await self._create_performance_chart_png(
-                        market_data, tf_key, beta_analysis, 
-                        png_dir / f'performance_{tf_display.lower()}_{timestamp}.png'
-                    )
-                    if png_path:
-                        png_exports[f'performance_{tf_display.lower()}'] = png_path
-            
-            # 2. Beta Comparison Chart (High-Res)
-            beta_png_path = await self._create_beta_comparison_png(
-                beta_analysis, png_dir / f'beta_comparison_{timestamp}.png'
-            )
-            if beta_png_path:
-                png_exports['beta_comparison'] = beta_png_path
-            
-            # 3. Correlation Heatmap (High-Res)
-            correlation_png_path = await self._create_correlation_heatmap_png(
-                beta_analysis, png_dir / f'correlation_heatmap_{timestamp}.png'
-            )
-            if correlation_png_path:
-                png_exports['correlation_heatmap'] = correlation_png_path
-            
-            # 4. Individual Symbol Beta Analysis
-            individual_png_path = await self._create_individual_beta_analysis_png(
-                beta_analysis, png_dir / f'individual_beta_analysis_{timestamp}.png'
-            )
-            if individual_png_path:
-                png_exports['individual_beta_analysis'] = individual_png_path
-            
-            # 5. Summary Statistics Table
-            summary_png_path = await self._create_summary_statistics_png(
-                beta_analysis, png_dir / f'summary_statistics_{timestamp}.png'
-            )
-            if summary_png_path:
-                png_exports['summary_statistics'] = summary_png_path
+                    name = f'performance_{tf_display.lower()}'
+                    exports[name] = self._render_chart(
+                        '_create_performance_chart_png', (name, fingerprint),
+                        market_data=market_data, timeframe=tf_key, beta_analysis=beta_analysis,
+                        output_path=png_dir / f'{name}_{timestamp}.png')
+            
+            # 2. Beta Comparison Chart (High-Res), 3. Correlation Heatmap (High-Res),
+            # 4. Individual Symbol Beta Analysis, 5. Summary Statistics Table
+            for name, method in [('beta_comparison', '_create_beta_comparison_png'),
+                                 ('correlation_heatmap', '_create_correlation_heatmap_png'),
+                                 ('individual_beta_analysis', '_create_individual_beta_analysis_png'),
+                                 ('summary_statistics', '_create_summary_statistics_png')]:
+                exports[name] = self._render_chart(
+                    method, (name, fingerprint),
+                    beta_analysis=beta_analysis, output_path=png_dir / f'{name}_{timestamp}.png')
+            
+            # All sections render in parallel in the chart render service
+            for name, png_path in zip(exports, await asyncio.gather(*exports.values())):
+                if png_path:
+                    png_exports[name] = png_path
             
             # Log the generated PNG exports
             self.logger.info(f"Generated {len(png_exports)} high-resolution PNG exports:")
@@ -901,6 +892,32 @@ async def _generate_high_res_png_exports(self, market_data: Dict[str, Dict[str,
             self.logger.error(f"Error generating PNG exports: {str(e)}")
             return {}
 
+    def _render_spec(self) -> RendererSpec:
+        """How chart render workers rebuild this report (charts need only the config)."""
+        if getattr(self, '_chart_renderer_spec', None) is None:
+            self._chart_renderer_spec = RendererSpec(f"{__name__}:BitcoinBetaReport", (None, None, self.config))
+        return self._chart_renderer_spec
+
+    @staticmethod
+    def _market_fingerprint(market_data: Dict[str, Dict[str, pd.DataFrame]]) -> Tuple:
+        """Last candle of every symbol and timeframe; the beta analysis derives from the same data."""
+        return tuple(chart_cache_key(symbol, df, tf)
+                     for symbol, frames in sorted(market_data.items())
+                     for tf, df in sorted(frames.items()))
+
+    async def _render_chart(self, method: str, cache_key: Optional[Tuple] = None, **kwargs) -> Optional[str]:
+        """Run one of the chart methods below in the chart render service.
+
+        A chart already rendered from the same candles is returned from the
+        service cache rather than drawn again.
+        """
+        try:
+            service = get_chart_render_service(self.config)
+            return await service.render(self._render_spec(), method, kwargs, cache_key=cache_key, local=self)
+        except Exception as e:
+            self.logger.error(f"Error rendering {method}: {str(e)}")
+            return None
+
     async def _create_performance_chart_png(self, market_data: Dict[str, Dict[str, pd.DataFrame]], 
                                           timeframe: str, 
                                           beta_analysis: Dict[str, Dict[str, Dict[str, float]]],
@@ -0,0 +1,77 @@
+"""
+Unit Tests for the correlation matrix routes
+
+Covers price correlations when only part of the requested universe has a
+price series: the real matrix is served for the available symbols and the
+missing ones are reported instead of falling back to the mock matrix.
+"""
+
+import asyncio
+import importlib.util
+import pathlib
+import types
+
+import numpy as np
+
+# Load the routes module on its own: importing it through src.api would run
+# src/api/__init__.py, which builds the whole application.
+_ROUTES_PATH = pathlib.Path(__file__).resolve().parents[2] / 'src' / 'api' / 'routes' / 'correlation.py'
+_spec = importlib.util.spec_from_file_location('correlation_routes_under_test', _ROUTES_PATH)
+correlation_routes = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(correlation_routes)
+
+SYMBOLS = ['BTCUSDT', 'ETHUSDT', 'NEWUSDT']
+
+
+class FakeEngine:
+    def __init__(self, missing):
+        self.missing = missing
+
+    async def correlation_matrix(self, symbols, days=30):
+        matrix = np.full((len(symbols), len(symbols)), np.nan)
+        if 'BTCUSDT' not in self.missing:
+            matrix[0, 1] = matrix[1, 0] = 0.876
+        np.fill_diagonal(matrix, 1.0)
+        return {'symbols': list(symbols), 'matrix': matrix, 'missing': list(self.missing)}
+
+
+def _use_engine(monkeypatch, missing):
+    service = types.SimpleNamespace(engine=FakeEngine(missing))
+    module = types.ModuleType('src.core.services.simple_correlation_service')
+    module.get_simple_correlation_service = lambda: service
+    monkeypatch.setitem(
+        __import__('sys').modules, 'src.core.services.simple_correlation_service', module
+    )
+
+
+def test_partial_universe_keeps_real_correlations(monkeypatch):
+    _use_engine(monkeypatch, ['NEWUSDT'])
+
+    matrix, missing = asyncio.run(correlation_routes._price_correlations(SYMBOLS))
+
+    assert missing == ['NEWUSDT']
+    assert matrix['BTCUSDT']['ETHUSDT'] == 0.88
+    assert matrix['ETHUSDT']['BTCUSDT'] == 0.88
+    assert matrix['NEWUSDT']['NEWUSDT'] == 1.0
+    assert matrix['NEWUSDT']['BTCUSDT'] is None
+    assert matrix['BTCUSDT']['NEWUSDT'] is None
+
+
+def test_no_price_data_returns_none(monkeypatch):
+    _use_engine(monkeypatch, SYMBOLS)
+
+    matrix, missing = asyncio.run(correlation_routes._price_correlations(SYMBOLS))
+
+    assert matrix is None
+    assert missing == SYMBOLS
+
+
+def test_matrix_route_reports_missing_symbols(monkeypatch):
+    _use_engine(monkeypatch, ['NEWUSDT'])
+    monkeypatch.setattr(correlation_routes, 'get_dashboard_integration', lambda: None)
+
+    result = asyncio.run(correlation_routes._get_matrix_data_internal(SYMBOLS, '1h', True))
+
+    assert result['metadata']['missing_symbols'] == ['NEWUSDT']
+    assert result['correlation_matrix']['BTCUSDT']['ETHUSDT'] == 0.88
+    assert result['matrix_data']['NEWUSDT']['correlations']['ETHUSDT'] is None
@@ -0,0 +1,171 @@
+"""
+Unit Tests for API gateway request coalescing
+
+Covers single-flight backend fetches for concurrent misses, serving expired
+responses while one background refresh runs (stale-while-revalidate), failed
+refreshes and the coalescing metrics.
+"""
+
+import asyncio
+import importlib.util
+import json
+import pathlib
+
+from fastapi import HTTPException
+from starlette.requests import Request
+
+# Load the gateway module on its own: importing it through src.api would run
+# src/api/__init__.py, which builds the whole application (routes, exchanges,
+# dashboards) just to reach one class.
+_GATEWAY_PATH = pathlib.Path(__file__).resolve().parents[2] / 'src' / 'api' / 'gateway.py'
+_spec = importlib.util.spec_from_file_location('gateway_under_test', _GATEWAY_PATH)
+gateway_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(gateway_module)
+APIGateway = gateway_module.APIGateway
+
+PATH = '/api/dashboard/data'
+
+
+class FakeCache:
+    """Gateway cache that always misses, so expiry is driven by the stale store."""
+
+    def __init__(self):
+        self.writes = []
+
+    async def get(self, key, default=None):
+        return default, None
+
+    async def set(self, key, value, ttl_override=None):
+        self.writes.append((key, value))
+
+    def get_performance_metrics(self):
+        return {}
+
+
+class FakeBackend:
+    """Counts backend calls; each call waits for ``release`` and answers with a scripted result."""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self, backend_url, path, params=None, timeout=5):
+        self.calls += 1
+        result = self.results.pop(0)
+        await self.release.wait()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def _request(path=PATH):
+    return Request({
+        'type': 'http',
+        'method': 'GET',
+        'scheme': 'http',
+        'server': ('testserver', 80),
+        'path': path,
+        'query_string': b'',
+        'headers': [],
+        'client': ('10.0.0.1', 5000),
+    })
+
+
+def _gateway(backend, **route):
+    gateway = APIGateway(cache=FakeCache(), enable_circuit_breaker=False)
+    gateway.route_config[PATH].update(route)
+    gateway._fetch_from_backend = backend
+    return gateway
+
+
+def _body(response):
+    return json.loads(response.body)
+
+
+async def _settle(gateway):
+    while gateway._inflight:
+        await asyncio.sleep(0.01)
+
+
+def test_concurrent_misses_share_one_backend_fetch():
+    async def run():
+        backend = FakeBackend([{'price': 1}])
+        gateway = _gateway(backend)
+        requests = [asyncio.create_task(gateway.route_request(_request())) for _ in range(10)]
+        await asyncio.sleep(0.05)
+        backend.release.set()
+        return backend, gateway, await asyncio.gather(*requests)
+
+    backend, gateway, responses = asyncio.run(run())
+    assert backend.calls == 1
+    assert [_body(r) for r in responses] == [{'price': 1}] * 10
+    assert all(r.headers['X-Cache'] == 'MISS' for r in responses)
+    assert sum(r.headers.get('X-Coalesced') == 'true' for r in responses) == 9
+    assert gateway.cache.writes == [(gateway._get_cache_key(_request()), {'price': 1})]
+
+
+def test_expired_response_is_served_stale_with_one_refresh():
+    async def run():
+        backend = FakeBackend([{'price': 1}, {'price': 2}])
+        gateway = _gateway(backend, cache_ttl=0, max_stale=30)
+        backend.release.set()
+        first = await gateway.route_request(_request())
+
+        # Past its TTL: every caller gets the old response while a single refresh runs
+        backend.release.clear()
+        stale = await asyncio.gather(*[gateway.route_request(_request()) for _ in range(5)])
+        backend.release.set()
+        await _settle(gateway)
+        refreshed = await gateway.route_request(_request())
+        return backend, first, stale, refreshed
+
+    backend, first, stale, refreshed = asyncio.run(run())
+    assert first.headers['X-Cache'] == 'MISS'
+    assert all(r.headers['X-Cache'] == 'STALE' and _body(r) == {'price': 1} for r in stale)
+    assert _body(refreshed) == {'price': 2}
+    # One fetch for the miss, one refresh for the five stale serves, one for the last request
+    assert backend.calls == 3
+
+
+def test_failed_refresh_keeps_serving_stale_data():
+    async def run():
+        backend = FakeBackend([{'price': 1}, HTTPException(status_code=502, detail='down'), {'price': 3}])
+        gateway = _gateway(backend, cache_ttl=0, max_stale=30)
+        backend.release.set()
+        await gateway.route_request(_request())
+
+        during_failure = await gateway.route_request(_request())
+        await _settle(gateway)
+        after_failure = await gateway.route_request(_request())
+        await _settle(gateway)
+        return gateway, during_failure, after_failure
+
+    gateway, during_failure, after_failure = asyncio.run(run())
+    for response in (during_failure, after_failure):
+        assert response.status_code == 200 and response.headers['X-Cache'] == 'STALE'
+        assert _body(response) == {'price': 1}
+    assert gateway.coalescing_stats['refresh_failures'] == 1
+    assert gateway._get_stale_response(gateway._get_cache_key(_request()),
+                                       gateway.route_config[PATH]) == {'price': 3}
+
+
+def test_coalescing_metrics_are_reported():
+    async def run():
+        backend = FakeBackend([{'price': 1}, {'price': 2}])
+        gateway = _gateway(backend, cache_ttl=0, max_stale=30)
+        misses = [asyncio.create_task(gateway.route_request(_request())) for _ in range(4)]
+        await asyncio.sleep(0.05)
+        backend.release.set()
+        await asyncio.gather(*misses)
+
+        await asyncio.gather(*[gateway.route_request(_request()) for _ in range(3)])
+        await _settle(gateway)
+        return await gateway.get_gateway_metrics()
+
+    coalescing = asyncio.run(run())['coalescing']
+    assert coalescing['backend_fetches'] == 2 and coalescing['coalesced_requests'] == 3
+    assert coalescing['coalescing_ratio'] == 0.6
+    assert coalescing['stale_served'] == 3 and coalescing['background_refreshes'] == 1
+    assert coalescing['refresh_failures'] == 0 and coalescing['in_flight'] == 0
+    assert coalescing['stale_entries'] == 1 and coalescing['max_stale_seconds'] == 30
@@ -0,0 +1,186 @@
+"""
+Unit Tests for the confluence process pool
+
+Covers the shared-memory market data round trip, worker execution, per-task
+timeouts with pool restarts that let other running analyses finish, and
+worker recycling.
+"""
+
+import asyncio
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.analysis.confluence_pool import (
+    ConfluenceProcessPool,
+    pack_market_data,
+    unpack_market_data,
+)
+from src.core.market.trade_tape import SIDE_BUY, SIDE_SELL, TradeTape
+
+
+class StubAnalyzer:
+    """Sums closes in the worker; sleeps for symbols named SLOW or MEDIUM."""
+
+    def __init__(self, config):
+        self.config = config
+
+    async def analyze(self, market_data):
+        if market_data['symbol'] == 'SLOW':
+            time.sleep(5)
+        elif market_data['symbol'] == 'MEDIUM':
+            time.sleep(1)
+        closes = market_data['ohlcv']['base']['close']
+        return {
+            'symbol': market_data['symbol'],
+            'close_sum': float(closes.sum()),
+            'best_bid': market_data['orderbook']['bids'][0][0],
+            'trades': len(market_data['trade_tape']),
+            'pid': os.getpid()
+        }
+
+
+async def build_stub_analyzer(config):
+    """Async factory, like the DI-based default one."""
+    return StubAnalyzer(config)
+
+
+def _market_data(symbol='BTCUSDT'):
+    index = pd.DatetimeIndex(pd.to_datetime(np.arange(5) * 60_000, unit='ms'), name='timestamp')
+    base = pd.DataFrame(
+        {col: np.arange(5, dtype=float) + i for i, col in enumerate(('open', 'high', 'low', 'close', 'volume'))},
+        index=index
+    )
+    tape = TradeTape(symbol, capacity=10)
+    tape.append('a', 100.0, 1.0, SIDE_BUY, 1_000)
+    tape.append('b', 101.0, 2.0, SIDE_SELL, 2_000)
+    return {
+        'symbol': symbol,
+        'ohlcv': {'base': base, 'ltf': pd.DataFrame()},
+        'orderbook': {'bids': [[99.0, 1.5], [98.0, 2.0]], 'asks': [[100.0, 1.0]], 'timestamp': 123},
+        'trade_tape': tape,
+        'trades': tape.to_records(),
+        'ticker': {'last': 100.0}
+    }
+
+
+def _config(**pool):
+    settings = {'enabled': True, 'workers': 1, 'task_timeout_seconds': 10, 'start_method': 'fork'}
+    settings.update(pool)
+    return {'confluence': {'process_pool': settings}}
+
+
+def test_pack_round_trip():
+    market_data = _market_data()
+    block, spec = pack_market_data(market_data)
+    try:
+        assert 'trade_tape' not in spec['fields']
+        assert 'trades' not in spec['fields']
+        restored = unpack_market_data(spec)
+    finally:
+        block.close()
+        block.unlink()
+
+    pd.testing.assert_frame_equal(restored['ohlcv']['base'], market_data['ohlcv']['base'])
+    assert restored['ohlcv']['ltf'].empty
+    assert restored['orderbook'] == market_data['orderbook']
+    assert restored['trades'] == market_data['trades']
+    assert restored['ticker'] == {'last': 100.0}
+
+    tape = restored['trade_tape']
+    np.testing.assert_array_equal(tape.prices, [100.0, 101.0])
+    assert tape.stats['appended'] == market_data['trade_tape'].stats['appended']
+    assert 'a' in tape
+
+
+def test_non_numeric_frames_are_pickled():
+    market_data = {'symbol': 'X', 'ohlcv': {'base': pd.DataFrame({'note': ['a', 'b']})}}
+    block, spec = pack_market_data(market_data)
+    assert block is None
+    restored = unpack_market_data(spec)
+    pd.testing.assert_frame_equal(restored['ohlcv']['base'], market_data['ohlcv']['base'])
+
+
+def test_analysis_runs_in_worker():
+    async def scenario():
+        pool = ConfluenceProcessPool(_config(), analyzer_factory=f'{__name__}:StubAnalyzer')
+        try:
+            result = await pool.analyze(_market_data())
+        finally:
+            await pool.stop()
+        return result, pool.get_stats()
+
+    result, stats = asyncio.run(scenario())
+    assert result['close_sum'] == pytest.approx(3 * 5 + 10)
+    assert result['best_bid'] == 99.0
+    assert result['trades'] == 2
+    assert result['pid'] != os.getpid()
+    assert stats['completed'] == 1
+    assert stats['shared_bytes'] > 0
+
+
+def test_timeout_restarts_pool():
+    async def scenario():
+        pool = ConfluenceProcessPool(
+            _config(task_timeout_seconds=0.5),
+            analyzer_factory=f'{__name__}:StubAnalyzer'
+        )
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await pool.analyze(_market_data('SLOW'))
+            result = await pool.analyze(_market_data())
+        finally:
+            await pool.stop()
+        return result, pool.get_stats()
+
+    result, stats = asyncio.run(scenario())
+    assert result['symbol'] == 'BTCUSDT'
+    assert stats['timeouts'] == 1
+    assert stats['restarts'] == 1
+
+
+def test_timeout_lets_other_tasks_finish():
+    async def scenario():
+        pool = ConfluenceProcessPool(
+            _config(workers=2, task_timeout_seconds=1.5),
+            analyzer_factory=f'{__name__}:build_stub_analyzer'
+        )
+        try:
+            slow = asyncio.ensure_future(pool.analyze(_market_data('SLOW')))
+            await asyncio.sleep(1.0)
+            medium = asyncio.ensure_future(pool.analyze(_market_data('MEDIUM')))
+            with pytest.raises(asyncio.TimeoutError):
+                await slow
+            # The timed-out pool is retired but still finishes the other analysis
+            assert pool.get_stats()['draining_pools'] == 1
+            result = await medium
+            stats = pool.get_stats()
+        finally:
+            await pool.stop()
+        return result, stats
+
+    result, stats = asyncio.run(scenario())
+    assert result['symbol'] == 'MEDIUM'
+    assert stats['timeouts'] == 1 and stats['restarts'] == 1
+    assert stats['draining_pools'] == 0 and stats['completed'] == 1
+
+
+def test_workers_are_recycled():
+    async def scenario():
+        pool = ConfluenceProcessPool(
+            _config(max_tasks_per_worker=2),
+            analyzer_factory=f'{__name__}:StubAnalyzer'
+        )
+        try:
+            pids = [(await pool.analyze(_market_data()))['pid'] for _ in range(4)]
+        finally:
+            await pool.stop()
+        return pids, pool.get_stats()
+
+    pids, stats = asyncio.run(scenario())
+    assert pids[0] == pids[1]
+    assert pids[2] != pids[0]
+    assert stats['recycles'] == 1
@@ -0,0 +1,137 @@
+"""
+Unit Tests for the panel-based correlation engine
+
+Covers agreement with pandas/NumPy references, one fetch per symbol for a
+whole matrix, rolling betas and the CorrelationCalculator integration.
+"""
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.analysis.correlation_calculator import CorrelationCalculator
+from src.core.analysis.correlation_engine import (
+    CorrelationEngine,
+    beta_vector,
+    correlation_matrix,
+    rolling_betas,
+)
+
+SYMBOLS = ['BTCUSDT', 'ETHUSDT', 'SOLUSDT', 'XRPUSDT', 'ADAUSDT']
+
+
+def _closes(days=90, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(end=pd.Timestamp('2026-01-01'), periods=days, freq='D')
+    market = rng.normal(0, 0.02, days)
+    closes = {}
+    for i, symbol in enumerate(SYMBOLS):
+        returns = (0.5 + 0.3 * i) * market + rng.normal(0, 0.01, days)
+        closes[symbol] = pd.Series(100 * np.cumprod(1 + returns), index=index)
+    return closes
+
+
+class CountingLoader:
+    def __init__(self, closes):
+        self.closes = closes
+        self.calls = []
+
+    async def __call__(self, symbol, days, timeframe):
+        self.calls.append(symbol)
+        await asyncio.sleep(0)
+        return self.closes.get(symbol)
+
+
+def test_matrix_matches_pandas_with_gaps():
+    rng = np.random.default_rng(1)
+    returns = rng.normal(size=(120, 6))
+    returns[:, 1] += returns[:, 0]
+    returns[rng.random(returns.shape) < 0.1] = np.nan
+
+    corr, observations = correlation_matrix(returns)
+    expected = pd.DataFrame(returns).corr().to_numpy()
+    assert np.allclose(corr, expected)
+    assert observations[0, 1] == np.sum(~np.isnan(returns[:, 0]) & ~np.isnan(returns[:, 1]))
+
+    ranks, _ = correlation_matrix(returns[:, :2].copy()[~np.isnan(returns[:, :2]).any(axis=1)], method='spearman')
+    complete = pd.DataFrame(returns[:, :2]).dropna()
+    assert ranks[0, 1] == pytest.approx(complete.corr(method='spearman').iloc[0, 1])
+
+
+def test_betas_match_least_squares():
+    rng = np.random.default_rng(2)
+    bench = rng.normal(size=200)
+    returns = np.column_stack([bench, 1.5 * bench + rng.normal(0, 0.5, 200), -0.5 * bench + rng.normal(0, 0.5, 200)])
+
+    stats = beta_vector(returns, 0)
+    for col in (1, 2):
+        slope, intercept = np.polyfit(bench, returns[:, col], 1)
+        assert stats['beta'][col] == pytest.approx(slope)
+        assert stats['alpha'][col] == pytest.approx(intercept)
+    assert stats['beta'][0] == pytest.approx(1.0)
+
+    rolled = rolling_betas(returns, 0, window=30, num_windows=5)
+    assert list(rolled['end']) == [195, 196, 197, 198, 199]
+    for k, end in enumerate(rolled['end']):
+        window = slice(end - 29, end + 1)
+        assert rolled['beta'][k, 1] == pytest.approx(np.polyfit(bench[window], returns[window, 1], 1)[0])
+
+
+def test_engine_fetches_each_symbol_once():
+    loader = CountingLoader(_closes())
+    engine = CorrelationEngine(loader)
+
+    async def run():
+        matrix, betas, series = await asyncio.gather(
+            engine.correlation_matrix(SYMBOLS + ['MISSINGUSDT'], days=30),
+            engine.betas(SYMBOLS, days=30),
+            engine.rolling_betas(SYMBOLS, window=30, num_windows=7),
+        )
+        again = await engine.correlation_matrix(SYMBOLS + ['MISSINGUSDT'], days=30)
+        return matrix, betas, series, again
+
+    matrix, betas, series, again = asyncio.run(run())
+    assert sorted(loader.calls) == sorted(SYMBOLS + ['MISSINGUSDT'])
+    assert again is matrix and engine.stats['result_hits'] == 1
+
+    assert matrix['missing'] == ['MISSINGUSDT'] and np.isnan(matrix['matrix'][0, 5])
+    returns = pd.DataFrame(_closes()).pct_change().iloc[1:]
+    returns = returns[returns.index >= returns.index[-1] - pd.Timedelta(days=30)]
+    assert np.allclose(matrix['matrix'][:5, :5], returns.corr().to_numpy())
+
+    assert betas['BTCUSDT']['beta'] == pytest.approx(1.0)
+    assert betas['ADAUSDT']['beta'] > betas['ETHUSDT']['beta'] > 0
+    assert 'BTCUSDT' not in series and len(series['ETHUSDT']) == 7
+    assert series['ETHUSDT'][-1]['timestamp'] == pd.Timestamp('2026-01-01')
+
+
+def test_calculator_uses_shared_panel():
+    closes = _closes()
+
+    class FakeExchangeManager:
+        def __init__(self):
+            self.calls = 0
+
+        async def fetch_ohlcv(self, symbol, timeframe, limit, since):
+            self.calls += 1
+            series = closes[symbol]
+            return [[int(ts.timestamp() * 1000), c, c, c, c, 1.0] for ts, c in series.items()]
+
+    exchange = FakeExchangeManager()
+    calculator = CorrelationCalculator(exchange)
+
+    async def run():
+        matrix = await calculator.calculate_correlation_matrix(SYMBOLS, days=30)
+        series = await calculator.calculate_beta_time_series(SYMBOLS[1:], days_per_window=30, num_windows=7)
+        return matrix, series
+
+    matrix, series = asyncio.run(run())
+    assert exchange.calls == len(SYMBOLS)
+    assert matrix['status'] == 'success' and matrix['correlation_matrix'][0][0] == 1.0
+    assert all(-1.0 <= v <= 1.0 for row in matrix['correlation_matrix'] for v in row)
+
+    betas = [point['beta'] for point in series['series_data']['SOLUSDT']]
+    assert len(betas) == 7 and len(set(betas)) > 1  # one beta per window, not one beta repeated
+    assert series['series_data']['SOLUSDT'][-1]['date'] == '2026-01-01'
@@ -0,0 +1,95 @@
+"""
+Unit Tests for the sliding-window liquidation aggregator
+
+Covers agreement with a brute-force rescan over several windows, largest
+liquidation expiry, the global per-symbol breakdown and scope pruning.
+"""
+
+import random
+
+import pytest
+
+from src.core.analysis.liquidation_window import (
+    LiquidationWindowAggregator,
+    get_liquidation_aggregator,
+    register_liquidation_aggregator,
+)
+
+
+def _reference(events, symbol, window, now, bucket=1.0):
+    # An event stays counted until its whole bucket has left the window
+    live = [e for e in events
+            if (e['timestamp'] // bucket) * bucket + bucket > now - window
+            and (symbol is None or e['symbol'] == symbol)]
+    return {
+        'count': len(live),
+        'total_usd': sum(e['usd_value'] for e in live),
+        'long_usd': sum(e['usd_value'] for e in live if e['side'] == 'BUY'),
+        'largest': max((e['usd_value'] for e in live), default=None),
+    }
+
+
+def test_matches_rescan_across_windows():
+    rng = random.Random(7)
+    aggregator = LiquidationWindowAggregator()
+    events, now = [], 1_000_000.0
+    for _ in range(3000):
+        now += rng.expovariate(5.0)
+        event = {
+            'symbol': rng.choice(['BTCUSDT', 'ETHUSDT', 'SOLUSDT']),
+            'usd_value': rng.lognormvariate(9, 1.5),
+            'side': rng.choice(['BUY', 'SELL']),
+            'timestamp': now,
+        }
+        events.append(event)
+        aggregator.add(event['symbol'], event['usd_value'], event['side'].title(), price=100.0, timestamp=now)
+
+        if len(events) % 250 == 0:
+            for window in (60, 300, 900):
+                for symbol in (None, 'ETHUSDT'):
+                    stats = aggregator.window_stats(symbol, window, now)
+                    expected = _reference(events, symbol, window, now)
+                    assert stats['count'] == expected['count']
+                    assert stats['total_usd'] == pytest.approx(expected['total_usd'])
+                    assert stats['long_usd'] == pytest.approx(expected['long_usd'])
+                    assert stats['largest']['usd_value'] == expected['largest']
+                    assert stats['avg_price'] == pytest.approx(100.0)
+
+
+def test_largest_expires_and_breakdown():
+    aggregator = LiquidationWindowAggregator(windows=(60, 300))
+    aggregator.add('BTCUSDT', 900_000, 'Buy', price=50_000, timestamp=0.0)
+    aggregator.add('ETHUSDT', 100_000, 'Sell', price=3_000, timestamp=30.0)
+    aggregator.add('ETHUSDT', 200_000, 'Sell', price=3_100, timestamp=45.0)
+
+    stats = aggregator.window_stats(None, 300, now=50.0)
+    assert stats['largest']['symbol'] == 'BTCUSDT' and stats['first_timestamp'] == 0.0
+    assert list(stats['symbols']) == ['BTCUSDT', 'ETHUSDT']
+    assert stats['symbols']['ETHUSDT'] == pytest.approx(300_000)
+
+    # The BTC event leaves the 1m window first, the next largest takes over
+    one_minute = aggregator.window_stats(None, 60, now=61.0)
+    assert one_minute['count'] == 2 and one_minute['largest']['usd_value'] == 200_000
+    assert list(one_minute['symbols']) == ['ETHUSDT']
+    assert aggregator.window_stats('ETHUSDT', 60, now=61.0)['avg_price'] == pytest.approx(9_200 / 3)
+
+    with pytest.raises(ValueError):
+        aggregator.window_stats(None, 120)
+
+
+def test_late_events_and_pruning():
+    aggregator = LiquidationWindowAggregator(windows=(60,))
+    aggregator.add('BTCUSDT', 10.0, 'Buy', timestamp=100.0)
+    assert aggregator.window_stats('BTCUSDT', 60, now=200.0)['count'] == 0
+
+    # A late timestamp after expiry lands in a fresh bucket, not the expired one
+    aggregator.add('BTCUSDT', 5.0, 'Sell', timestamp=100.5)
+    stats = aggregator.window_stats('BTCUSDT', 60, now=150.0)
+    assert stats['count'] == 1 and stats['short_usd'] == 5.0
+
+    summary = aggregator.summary(60, now=500.0)
+    assert summary['symbols'] == {} and summary['global']['count'] == 0
+    assert aggregator.get_stats()['symbols'] == 0
+
+    register_liquidation_aggregator(aggregator)
+    assert get_liquidation_aggregator() is aggregator
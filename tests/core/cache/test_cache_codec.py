@@ -0,0 +1,74 @@
+"""
+Unit Tests for the L2/L3 cache codec
+
+Covers legacy JSON compatibility, headered serializer/compression round
+trips, NumPy values and handling of unknown format versions.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from src.core.cache.cache_codec import (
+    HEADER_MARKER,
+    CacheCodec,
+    CacheCodecError,
+    _COMPRESSORS,
+    _SERIALIZERS,
+)
+
+PAYLOAD = {
+    'symbol': 'BTCUSDT',
+    'score': 61.25,
+    'count': 3,
+    'components': {'technical': 55.0, 'volume': 70.5},
+    'ohlcv': [[1700000000000, 1.0, 2.0, 0.5, 1.5, 100.0]] * 200,
+}
+
+
+def test_legacy_json_is_byte_compatible():
+    codec = CacheCodec('json')
+    assert codec.legacy
+    encoded = codec.encode(PAYLOAD)
+    assert json.loads(encoded.decode()) == PAYLOAD
+    assert codec.decode(encoded) == PAYLOAD
+
+
+def test_double_encoded_legacy_payload():
+    data = json.dumps(json.dumps({'a': 1})).encode()
+    assert CacheCodec().decode(data) == {'a': 1}
+
+
+@pytest.mark.parametrize('serializer', sorted(_SERIALIZERS))
+@pytest.mark.parametrize('compression', ['none'] + sorted(_COMPRESSORS))
+def test_round_trip(serializer, compression):
+    codec = CacheCodec(serializer, compression, compress_threshold=64)
+    encoded = codec.encode(PAYLOAD)
+    if not codec.legacy:
+        assert encoded[0] == HEADER_MARKER
+    # Any codec decodes any other codec's output
+    assert CacheCodec('json').decode(encoded) == PAYLOAD
+
+
+def test_small_payloads_are_not_compressed():
+    codec = CacheCodec('json', 'zlib', compress_threshold=1 << 20)
+    encoded = codec.encode({'a': 1})
+    assert encoded[1] & 0x0F == 0
+
+
+def test_numpy_values_are_serialized():
+    value = {'i': np.int64(7), 'f': np.float32(0.5), 'arr': np.arange(3)}
+    for serializer in _SERIALIZERS:
+        decoded = CacheCodec('json').decode(CacheCodec(serializer).encode(value))
+        assert decoded == {'i': 7, 'f': 0.5, 'arr': [0, 1, 2]}
+
+
+def test_newer_format_version_is_rejected():
+    with pytest.raises(CacheCodecError):
+        CacheCodec().decode(bytes((HEADER_MARKER + 1, 0x10)) + b'{}')
+
+
+def test_unknown_serializer_is_rejected():
+    with pytest.raises(ValueError):
+        CacheCodec('pickle')
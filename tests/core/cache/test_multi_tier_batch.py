@@ -0,0 +1,114 @@
+"""
+Unit Tests for batched multi-tier cache reads and writes
+
+Covers L1 resolution, single multi-get / MGET round trips for misses, bulk
+promotion and pipelined writes.
+"""
+
+import asyncio
+import json
+
+from src.core.cache.multi_tier_cache import CacheLayer, MultiTierCacheAdapter
+
+
+class FakeMemcached:
+    def __init__(self):
+        self.data = {}
+        self.multi_get_calls = 0
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def multi_get(self, *keys):
+        self.multi_get_calls += 1
+        return tuple(self.data.get(key) for key in keys)
+
+    async def set(self, key, value, exptime=0):
+        self.data[key] = value
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def setex(self, key, ttl, value):
+        self.commands.append((key, ttl, value))
+
+    async def execute(self):
+        self.redis.pipeline_executions += 1
+        for key, ttl, value in self.commands:
+            self.redis.data[key] = value
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.mget_calls = 0
+        self.pipeline_executions = 0
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def mget(self, keys):
+        self.mget_calls += 1
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def _cache():
+    cache = MultiTierCacheAdapter(cross_process_mode=False)
+    cache._memcached_client = FakeMemcached()
+    cache._redis_client = FakeRedis()
+    return cache
+
+
+def test_get_many_batches_each_tier():
+    async def scenario():
+        cache = _cache()
+        await cache._set_l1('local', 1)
+        cache._memcached_client.data[b'warm'] = json.dumps({'v': 2}).encode()
+        cache._redis_client.data['cold'] = json.dumps([3]).encode()
+        results = await cache.get_many(['local', 'warm', 'cold', 'missing'], default='none')
+        return cache, results
+
+    cache, results = asyncio.run(scenario())
+    assert results['local'] == (1, CacheLayer.L1_MEMORY)
+    assert results['warm'] == ({'v': 2}, CacheLayer.L2_MEMCACHED)
+    assert results['cold'] == ([3], CacheLayer.L3_REDIS)
+    assert results['missing'] == ('none', CacheLayer.MISS)
+
+    # One round trip per remote tier, regardless of key count
+    assert cache._memcached_client.multi_get_calls == 1
+    assert cache._redis_client.mget_calls == 1
+    assert cache.stats.l2_hits == 1
+    assert cache.stats.l3_hits == 1
+    assert cache.stats.total_misses == 1
+    assert cache.stats.promotions == 3
+
+
+def test_get_many_promotes_l3_hits():
+    async def scenario():
+        cache = _cache()
+        cache._redis_client.data['cold'] = json.dumps({'v': 1}).encode()
+        await cache.get_many(['cold'])
+        return cache, await cache.get_many(['cold'])
+
+    cache, results = asyncio.run(scenario())
+    assert results['cold'] == ({'v': 1}, CacheLayer.L1_MEMORY)
+    assert json.loads(cache._memcached_client.data[b'cold']) == {'v': 1}
+
+
+def test_set_many_pipelines_redis_writes():
+    async def scenario():
+        cache = _cache()
+        await cache.set_many({'a': 1, 'b': {'x': 2}}, ttl_override=10)
+        return cache, await cache.get_many(['a', 'b'])
+
+    cache, results = asyncio.run(scenario())
+    assert cache._redis_client.pipeline_executions == 1
+    assert json.loads(cache._redis_client.data['b']) == {'x': 2}
+    assert json.loads(cache._memcached_client.data[b'a']) == 1
+    assert results['a'] == (1, CacheLayer.L1_MEMORY)
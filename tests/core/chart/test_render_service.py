@@ -0,0 +1,113 @@
+"""
+Unit Tests for the chart render service
+
+Covers the render cache and its last-candle keys, single-flight rendering of
+concurrent requests, queue rejection, and process-pool rendering with
+per-renderer styles.
+"""
+
+import asyncio
+import os
+import threading
+import time
+
+import pandas as pd
+
+from src.core.chart.render_service import ChartRenderService, RendererSpec, chart_cache_key
+
+
+class FakeRenderer:
+    """Writes a small file per chart and records the calls it served."""
+
+    def __init__(self, out_dir, delay=0.0, font_size=None):
+        import matplotlib
+        self.out_dir = out_dir
+        self.delay = delay
+        self.calls = []
+        if font_size:
+            matplotlib.rcParams['font.size'] = font_size
+
+    def draw(self, name):
+        self.calls.append((name, threading.current_thread().name))
+        time.sleep(self.delay)
+        path = os.path.join(self.out_dir, f"{name}.png")
+        with open(path, 'w') as f:
+            f.write(name)
+        return path
+
+    async def style(self, name):
+        import matplotlib
+        path = os.path.join(self.out_dir, f"{name}.txt")
+        with open(path, 'w') as f:
+            f.write(f"{matplotlib.rcParams['font.size']}:{os.getpid()}")
+        return path
+
+
+def _ohlcv(closes):
+    return pd.DataFrame({'timestamp': range(len(closes)), 'close': closes})
+
+
+def test_cache_key_follows_last_candle():
+    base = chart_cache_key('BTCUSDT', _ohlcv([1.0, 2.0]), '1h', entry_price=2.0, targets=[3.0])
+    assert base == chart_cache_key('BTCUSDT', _ohlcv([9.0, 2.0]), '1h', targets=[3.0], entry_price=2.0)
+    assert base != chart_cache_key('BTCUSDT', _ohlcv([1.0, 2.5]), '1h', entry_price=2.0, targets=[3.0])
+    assert base != chart_cache_key('BTCUSDT', _ohlcv([1.0, 2.0, 2.0]), '1h', entry_price=2.0, targets=[3.0])
+    assert base != chart_cache_key('BTCUSDT', _ohlcv([1.0, 2.0]), '1h', entry_price=2.0, targets=[3.5])
+    assert chart_cache_key('BTCUSDT', [[1, 2, 3, 1, 2, 5]])[2] == (repr([1, 2, 3, 1, 2, 5]), 1)
+
+
+def test_thread_mode_cache_single_flight_and_rejection(tmp_path):
+    renderer = FakeRenderer(str(tmp_path), delay=0.1)
+    spec = RendererSpec(f"{__name__}:FakeRenderer", (str(tmp_path),))
+    service = ChartRenderService(mode='thread', max_pending=2)
+
+    async def run():
+        key = chart_cache_key('BTCUSDT', _ohlcv([1.0, 2.0]), '1h')
+        # Three callers for one chart share a single render
+        paths = await asyncio.gather(*[
+            service.render(spec, 'draw', {'name': 'btc'}, cache_key=key, local=renderer) for _ in range(3)
+        ])
+        cached = await service.render(spec, 'draw', {'name': 'btc'}, cache_key=key, local=renderer)
+
+        # One running and two waiting fill the queue; the fourth request is turned away
+        burst = await asyncio.gather(*[
+            service.render(spec, 'draw', {'name': f"eth{i}"}, local=renderer) for i in range(4)
+        ])
+        return paths, cached, burst
+
+    paths, cached, burst = asyncio.run(run())
+    service.shutdown()
+
+    assert paths == [str(tmp_path / 'btc.png')] * 3 and cached == paths[0]
+    assert burst.count(None) == 1
+    assert [name for name, _ in renderer.calls].count('btc') == 1
+    assert all(thread.startswith('chart_render') for _, thread in renderer.calls)
+
+    stats = service.get_stats()
+    assert stats['coalesced'] == 2 and stats['cache_hits'] == 1 and stats['rejected'] == 1
+    assert stats['renders'] == 4 and stats['cached'] == 1 and stats['waiting'] == 0
+
+
+def test_process_mode_keeps_renderer_styles_apart(tmp_path):
+    small = RendererSpec(f"{__name__}:FakeRenderer", (str(tmp_path), 0.0, 7))
+    large = RendererSpec(f"{__name__}:FakeRenderer", (str(tmp_path), 0.0, 21))
+    service = ChartRenderService(max_workers=1, preload=())
+
+    async def run():
+        await service.warmup()
+        a = await service.render(small, 'style', {'name': 'small'})
+        b = await service.render(large, 'style', {'name': 'large'})
+        c = await service.render(small, 'style', {'name': 'small_again'})
+        failed = await service.render(small, 'missing_method', {})
+        return a, b, c, failed
+
+    try:
+        a, b, c, failed = asyncio.run(run())
+    finally:
+        service.shutdown()
+
+    styles = [open(path).read().split(':') for path in (a, b, c)]
+    assert [size for size, _ in styles] == ['7.0', '21.0', '7.0']
+    # One preloaded worker served every job, never the test process itself
+    assert len({pid for _, pid in styles}) == 1 and styles[0][1] != str(os.getpid())
+    assert failed is None and service.get_stats()['errors'] == 1
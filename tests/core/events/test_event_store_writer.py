@@ -0,0 +1,79 @@
+"""
+Unit Tests for the EventStore group-commit writer
+
+Covers batched commits, ack-on-commit durability, backpressure on a full
+queue and flushing on close.
+"""
+
+import asyncio
+import sqlite3
+
+from src.core.events.event_bus import Event
+from src.core.events.event_sourcing import DurabilityMode, EventStore
+
+
+def _event(i):
+    return Event(event_type='market_data_updated', source='test', data={'seq': i, 'symbol': 'BTCUSDT'})
+
+
+def _row_count(store):
+    with sqlite3.connect(str(store.db_path)) as conn:
+        return conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+
+def test_events_are_committed_in_batches(tmp_path):
+    async def run():
+        store = EventStore(storage_path=str(tmp_path), write_batch_size=500)
+        await store.initialize()
+        for i in range(2000):
+            await store.append_event(_event(i))
+        await store.flush()
+        stats = store.get_statistics()['writer']
+        await store.close()
+        return store, stats
+
+    store, stats = asyncio.run(run())
+    assert _row_count(store) == 2000
+    assert stats['rows_written'] == 2000
+    assert stats['commits'] <= 8
+    assert stats['commit_batch_size']['max'] <= 500
+    assert stats['append_latency_ms']['p99'] >= stats['append_latency_ms']['p50']
+
+
+def test_ack_on_commit_waits_for_the_row(tmp_path):
+    async def run():
+        store = EventStore(storage_path=str(tmp_path), durability='commit', write_batch_interval_ms=5)
+        await store.initialize()
+        await asyncio.gather(*[store.append_event(_event(i)) for i in range(50)])
+        rows = _row_count(store)
+        await store.close()
+        return store, rows
+
+    store, rows = asyncio.run(run())
+    assert store.durability is DurabilityMode.ACK_ON_COMMIT
+    assert rows == 50
+
+
+def test_full_queue_applies_backpressure(tmp_path):
+    async def run():
+        store = EventStore(storage_path=str(tmp_path), write_queue_size=10, write_batch_size=10)
+        await store.initialize()
+        await asyncio.gather(*[store.append_event(_event(i)) for i in range(200)])
+        await store.close()
+        return store
+
+    store = asyncio.run(run())
+    assert store.write_stats['backpressure_waits'] > 0
+    assert _row_count(store) == 200
+
+
+def test_close_writes_queued_events(tmp_path):
+    async def run():
+        store = EventStore(storage_path=str(tmp_path), write_batch_interval_ms=1000)
+        await store.initialize()
+        for i in range(10):
+            await store.append_event(_event(i))
+        await store.close()
+        return store
+
+    assert _row_count(asyncio.run(run())) == 10
@@ -0,0 +1,94 @@
+"""
+Unit Tests for the hot-tier event index
+
+Covers key + time-range queries with limit/offset, capacity eviction kept in
+sync across indexes, late events and archiving from the time-ordered head.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from src.core.events.event_bus import Event
+from src.core.events.event_sourcing import EventRecord, EventStore, QueryType
+from src.core.events.hot_event_index import HotEventIndex
+
+BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _record(i, symbol='BTCUSDT', event_type='trade', seconds=None):
+    event = Event(
+        event_type=event_type,
+        source='bybit_ws' if i % 2 else 'rest',
+        timestamp=BASE + timedelta(seconds=i if seconds is None else seconds),
+        data={'symbol': symbol, 'exchange': 'bybit', 'seq': i}
+    )
+    return EventRecord.from_event(event)
+
+
+def _seqs(records):
+    return [r.data['seq'] for r in records]
+
+
+def test_key_query_with_time_range_limit_and_offset():
+    index = HotEventIndex()
+    for i in range(100):
+        index.append(_record(i, symbol='BTCUSDT' if i % 3 else 'ETHUSDT'))
+
+    eth = index.query('symbol', 'ETHUSDT', limit=None)
+    assert _seqs(eth) == list(range(0, 100, 3))
+
+    window = index.query('symbol', 'BTCUSDT', start_time=BASE + timedelta(seconds=10),
+                         end_time=BASE + timedelta(seconds=20), limit=3, offset=1)
+    # BTC seqs in [10, 20]: 10, 11, 13, 14, 16, 17, 19, 20 -> skip newest one, take 3
+    assert _seqs(window) == [16, 17, 19]
+    assert index.query('symbol', 'SOLUSDT') == []
+    assert len(index.query('source', 'rest', limit=100)) == 50
+
+
+def test_eviction_keeps_indexes_in_sync():
+    index = HotEventIndex(max_events=10)
+    for i in range(25):
+        evicted = index.append(_record(i, symbol=f"S{i % 2}"))
+    assert len(evicted) == 1 and evicted[0].data['seq'] == 14
+    assert len(index) == 10 and len(index.by_id) == 10
+    assert index.count('symbol', 'S0') + index.count('symbol', 'S1') == 10
+    assert _seqs(index.query('event_type', 'trade', limit=None)) == list(range(15, 25))
+
+
+def test_late_events_are_time_ordered():
+    index = HotEventIndex()
+    for i in (0, 1, 3, 4):
+        index.append(_record(i))
+    index.append(_record(2))
+    assert _seqs(index) == [0, 1, 2, 3, 4]
+    assert _seqs(index.query('symbol', 'BTCUSDT', limit=None)) == [0, 1, 2, 3, 4]
+
+
+def test_pop_older_than_pops_from_head():
+    index = HotEventIndex()
+    for i in range(50):
+        index.append(_record(i, event_type='a' if i < 30 else 'b'))
+    popped = index.pop_older_than(BASE + timedelta(seconds=40))
+    assert _seqs(popped) == list(range(40))
+    assert index.count('event_type', 'a') == 0
+    assert _seqs(index.query('event_type', 'b', limit=None)) == list(range(40, 50))
+
+
+def test_event_store_queries_use_indexes(tmp_path):
+    async def run():
+        store = EventStore(storage_path=str(tmp_path), max_memory_events=1000)
+        for i in range(300):
+            record = _record(i, symbol='ETHUSDT' if i % 2 else 'BTCUSDT')
+            await store.append_event(record.to_event())
+        by_symbol = await store.query_events(QueryType.BY_SYMBOL, symbol='ETHUSDT')
+        by_exchange = await store.query_events(QueryType.BY_EXCHANGE, exchange='bybit', limit=10, offset=5)
+        in_range = await store.query_events(
+            QueryType.BY_TYPE, event_type='trade',
+            start_time=BASE, end_time=BASE + timedelta(seconds=9)
+        )
+        return by_symbol, by_exchange, in_range
+
+    by_symbol, by_exchange, in_range = asyncio.run(run())
+    assert len(by_symbol) == 100 and by_symbol[-1].data['seq'] == 299
+    assert _seqs(by_exchange) == list(range(285, 295))
+    assert _seqs(in_range) == list(range(10))
@@ -0,0 +1,106 @@
+"""
+Unit Tests for the columnar warm-tier archive
+
+Covers block statistics pruning for time/type filtered scans, event_id
+lookups, legacy jsonl.gz migration and EventStore archiving/replay.
+"""
+
+import asyncio
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+
+from src.core.events.event_bus import Event
+from src.core.events.event_sourcing import EventRecord, EventStore, QueryType, StorageTier
+from src.core.events.warm_archive import WarmArchive
+
+BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _record(i, event_type='trade', day=0):
+    event = Event(
+        event_type=event_type,
+        source='test',
+        timestamp=BASE + timedelta(days=day, minutes=i),
+        data={'symbol': 'BTCUSDT', 'seq': i}
+    )
+    return EventRecord.from_event(event)
+
+
+def _make(**columns):
+    return EventRecord(**columns, storage_tier=StorageTier.WARM)
+
+
+def test_scan_reads_only_overlapping_blocks(tmp_path):
+    archive = WarmArchive(tmp_path, block_size=100)
+    archive.append('2026-01-01', [_record(i) for i in range(1000)])
+    archive.append('2026-01-01', [_record(i, event_type='signal') for i in range(0, 1000, 10)])
+
+    start, end = BASE + timedelta(minutes=250), BASE + timedelta(minutes=349)
+    records = archive.scan(_make, start, end, event_types=['trade'])
+
+    assert [r.data['seq'] for r in records] == list(range(250, 350))
+    assert all(r.storage_tier is StorageTier.WARM and r.timestamp.tzinfo for r in records)
+    # 10 trade blocks + 1 signal block; only the two trade blocks overlapping the range are read
+    assert archive.stats['blocks_read'] == 2
+    assert archive.stats['blocks_skipped'] == 9
+
+
+def test_get_by_event_id(tmp_path):
+    archive = WarmArchive(tmp_path, block_size=10, index_cache_size=1)
+    day1 = [_record(i) for i in range(50)]
+    day2 = [_record(i, day=1) for i in range(50)]
+    archive.append('2026-01-01', day1)
+    archive.append('2026-01-02', day2)
+
+    found = archive.get(day1[37].event_id, _make)
+    assert found.event_id == day1[37].event_id and found.data == day1[37].data
+    assert archive.stats['blocks_read'] == 1
+    assert archive.get('missing', _make) is None
+
+    archive.drop_date('2026-01-01')
+    assert archive.dates() == ['2026-01-02']
+    assert archive.get(day1[37].event_id, _make) is None
+
+
+def test_legacy_files_are_migrated(tmp_path):
+    records = [_record(i) for i in range(20)]
+    with gzip.open(tmp_path / 'events_2026-01-01.jsonl.gz', 'wt') as f:
+        for record in records:
+            f.write(json.dumps({
+                'event_id': record.event_id, 'event_type': record.event_type,
+                'timestamp': record.timestamp.isoformat(), 'source': record.source,
+                'priority': record.priority, 'data': record.data, 'metadata': record.metadata,
+                'storage_timestamp': record.storage_timestamp, 'checksum': record.checksum
+            }) + '\n')
+
+    async def run():
+        store = EventStore(storage_path=str(tmp_path))
+        await store.initialize()
+        event = await store.get_event(records[5].event_id)
+        await store.close()
+        return store, event
+
+    store, event = asyncio.run(run())
+    assert event.checksum == records[5].checksum
+    assert list(store.warm_files) == ['2026-01-01']
+    assert (tmp_path / 'events_2026-01-01.jsonl.gz.migrated').exists()
+    assert store.warm_archive.migrate_legacy(tmp_path, _make) == 0
+
+
+def test_archived_events_are_replayed_by_type(tmp_path):
+    async def run():
+        store = EventStore(storage_path=str(tmp_path), warm_block_size=50)
+        await store.initialize()
+        archived = [_record(i, event_type='trade' if i % 2 else 'signal') for i in range(200)]
+        await store._archive_events_to_warm('2026-01-01', archived)
+        records = await store.query_events(
+            QueryType.BY_TIME_RANGE,
+            start_time=BASE, end_time=BASE + timedelta(minutes=99),
+            event_types=['signal']
+        )
+        await store.close()
+        return records
+
+    records = asyncio.run(run())
+    assert [r.data['seq'] for r in records] == list(range(0, 100, 2))
@@ -0,0 +1,80 @@
+"""
+Unit Tests for the per-cycle market snapshot
+
+Covers single-flight fetches per (symbol, component, version), reuse of
+bulk-stored tickers, expiry and the duplicate-fetch savings counters.
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.market.market_snapshot import MarketSnapshot
+
+
+class CountingLoader:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self.value
+
+
+def test_concurrent_requests_share_one_fetch():
+    snapshot = MarketSnapshot()
+    loader = CountingLoader({'symbol': 'BTCUSDT'})
+
+    async def run():
+        first = await asyncio.gather(*[snapshot.get('BTCUSDT', 'market_data', loader) for _ in range(3)])
+        again = await snapshot.get('BTCUSDT', 'market_data', loader)
+        return first, again
+
+    first, again = asyncio.run(run())
+    assert loader.calls == 1
+    assert all(value is loader.value for value in first) and again is loader.value
+
+    stats = snapshot.get_stats()
+    assert stats['fetches'] == 1 and stats['coalesced'] == 2 and stats['hits'] == 1
+    assert stats['duplicate_fetches_saved'] == 3
+
+
+def test_versions_and_failures_are_separate():
+    snapshot = MarketSnapshot()
+    short, long = CountingLoader('short'), CountingLoader('long')
+
+    async def failing():
+        raise RuntimeError("exchange down")
+
+    async def run():
+        assert await snapshot.get('ETHUSDT', 'kline', short, version=100) == 'short'
+        assert await snapshot.get('ETHUSDT', 'kline', long, version=500) == 'long'
+        with pytest.raises(RuntimeError):
+            await snapshot.get('SOLUSDT', 'market_data', failing)
+        # A failed or empty fetch is retried by the next caller
+        assert await snapshot.get('SOLUSDT', 'market_data', CountingLoader(None)) is None
+        return await snapshot.get('SOLUSDT', 'market_data', CountingLoader('ok'))
+
+    assert asyncio.run(run()) == 'ok'
+    assert snapshot.peek('ETHUSDT', 'kline') == 'long'
+    assert snapshot.peek('ETHUSDT', 'kline', version=100) == 'short'
+    assert snapshot.stats['errors'] == 1 and snapshot.stats['fetches'] == 5
+
+
+def test_bulk_tickers_are_reused_until_expired():
+    snapshot = MarketSnapshot(max_age=0.05)
+    snapshot.put_many('ticker', {'BTCUSDT': {'last': 1.0}, 'ETHUSDT': None})
+
+    assert snapshot.symbols('ticker') == ['BTCUSDT']
+    assert snapshot.peek('BTCUSDT', 'ticker') == {'last': 1.0}
+    assert snapshot.peek('ETHUSDT', 'ticker') is None
+    assert snapshot.duplicate_fetches_saved == 1
+
+    async def expire():
+        await asyncio.sleep(0.06)
+        return await snapshot.get('BTCUSDT', 'ticker', CountingLoader({'last': 2.0}))
+
+    assert asyncio.run(expire()) == {'last': 2.0}
+    assert snapshot.stats['expired'] == 1 and snapshot.stats['fetches'] == 1
@@ -0,0 +1,151 @@
+"""
+Unit Tests for the columnar OHLCV candle store
+
+Covers in-place live candle upserts, capacity eviction, REST merges and
+zero-copy DataFrame materialization.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core.market import ohlcv_store
+from src.core.market.ohlcv_store import OHLCVRingBuffer, OHLCVStore, frame_to_arrays, get_ohlcv_store
+
+MINUTE_MS = 60_000
+
+
+def _make_frame(start_ms: int, count: int, base_price: float = 100.0) -> pd.DataFrame:
+    timestamps = start_ms + np.arange(count) * MINUTE_MS
+    close = base_price + np.arange(count, dtype=float)
+    df = pd.DataFrame({
+        'timestamp': pd.to_datetime(timestamps, unit='ms'),
+        'open': close - 0.5,
+        'high': close + 1.0,
+        'low': close - 1.0,
+        'close': close,
+        'volume': np.full(count, 10.0)
+    })
+    return df.set_index('timestamp')
+
+
+def test_upsert_overwrites_live_candle_in_place():
+    buffer = OHLCVRingBuffer(capacity=10)
+    buffer.upsert(MINUTE_MS, 1, 2, 0.5, 1.5, 10)
+    buffer.upsert(MINUTE_MS, 1, 3, 0.5, 2.5, 20)
+
+    assert len(buffer) == 1
+    assert buffer.values[-1].tolist() == [1, 3, 0.5, 2.5, 20]
+
+
+def test_live_candle_update_visible_through_materialized_frame():
+    buffer = OHLCVRingBuffer(capacity=10)
+    buffer.upsert(MINUTE_MS, 1, 2, 0.5, 1.5, 10)
+    frame = buffer.to_dataframe()
+
+    buffer.upsert(MINUTE_MS, 1, 2, 0.5, 1.75, 12)
+
+    assert buffer.to_dataframe() is frame
+    assert frame['close'].iloc[-1] == 1.75
+    assert np.shares_memory(frame.to_numpy(), buffer.values)
+
+
+def test_append_evicts_oldest_beyond_capacity():
+    buffer = OHLCVRingBuffer(capacity=5)
+    for i in range(23):
+        buffer.upsert(i * MINUTE_MS, i, i, i, i, i)
+
+    assert len(buffer) == 5
+    assert buffer.timestamps.tolist() == [i * MINUTE_MS for i in range(18, 23)]
+    assert buffer.values[:, 3].tolist() == [18, 19, 20, 21, 22]
+
+
+def test_frames_survive_compaction():
+    buffer = OHLCVRingBuffer(capacity=3)
+    for i in range(3):
+        buffer.upsert(i * MINUTE_MS, i, i, i, i, i)
+    frame = buffer.to_dataframe()
+
+    for i in range(3, 12):
+        buffer.upsert(i * MINUTE_MS, i, i, i, i, i)
+
+    assert frame['close'].tolist() == [0, 1, 2]
+    assert buffer.to_dataframe()['close'].tolist() == [9, 10, 11]
+
+
+def test_merge_prefers_incoming_rows_and_keeps_order():
+    buffer = OHLCVRingBuffer(capacity=100)
+    buffer.upsert(2 * MINUTE_MS, 1, 1, 1, 1, 1)
+    buffer.upsert(3 * MINUTE_MS, 1, 1, 1, 1, 1)
+
+    buffer.merge(
+        [0, MINUTE_MS, 2 * MINUTE_MS],
+        [[5, 5, 5, 5, 5], [6, 6, 6, 6, 6], [7, 7, 7, 7, 7]]
+    )
+
+    assert buffer.timestamps.tolist() == [0, MINUTE_MS, 2 * MINUTE_MS, 3 * MINUTE_MS]
+    assert buffer.values[:, 3].tolist() == [5, 6, 7, 1]
+
+
+def test_out_of_order_upsert_falls_back_to_merge():
+    buffer = OHLCVRingBuffer(capacity=10)
+    buffer.upsert(2 * MINUTE_MS, 2, 2, 2, 2, 2)
+    buffer.upsert(MINUTE_MS, 1, 1, 1, 1, 1)
+
+    assert buffer.timestamps.tolist() == [MINUTE_MS, 2 * MINUTE_MS]
+
+
+def test_invalid_capacity_rejected():
+    with pytest.raises(ValueError):
+        OHLCVRingBuffer(capacity=0)
+
+
+def test_store_merges_rest_frame_then_ws_candles():
+    store = OHLCVStore(capacities={'base': 50})
+    store.merge_frame('BTCUSDT', 'base', _make_frame(0, 10))
+
+    # Live candle update followed by the next candle opening
+    store.upsert_candle('BTCUSDT', 'base', 9 * MINUTE_MS, 108.5, 111, 107, 110.5, 12)
+    store.upsert_candle('BTCUSDT', 'base', 10 * MINUTE_MS, 110.5, 111, 110, 110.8, 1)
+
+    frame = store.get_frame('BTCUSDT', 'base')
+    assert len(frame) == 11
+    assert frame.index.name == 'timestamp'
+    assert frame.index.is_monotonic_increasing
+    assert frame['close'].iloc[-2] == 110.5
+    assert frame['close'].iloc[-1] == 110.8
+    assert list(frame.columns) == ['open', 'high', 'low', 'close', 'volume']
+
+
+def test_store_frames_and_stats():
+    store = OHLCVStore()
+    assert not store.has_data('ETHUSDT')
+    assert store.get_frame('ETHUSDT', 'ltf') is None
+
+    store.merge_frame('ETHUSDT', 'ltf', _make_frame(0, 4))
+    store.merge_frame('ETHUSDT', 'htf', _make_frame(0, 0))
+
+    assert store.has_data('ETHUSDT')
+    assert store.has_data('ETHUSDT', 'ltf')
+    assert not store.has_data('ETHUSDT', 'htf')
+    assert set(store.get_frames('ETHUSDT')) == {'ltf'}
+    assert store.get_stats()['candles'] == 4
+
+
+def test_frame_to_arrays_accepts_timestamp_column():
+    df = _make_frame(0, 3).reset_index()
+    df['timestamp'] = df['timestamp'].astype('int64') // 10**6
+
+    timestamps, values = frame_to_arrays(df)
+
+    assert timestamps.tolist() == [0, MINUTE_MS, 2 * MINUTE_MS]
+    assert values.shape == (3, 5)
+
+
+def test_shared_store_uses_first_config(monkeypatch):
+    monkeypatch.setattr(ohlcv_store, '_shared_store', None)
+    store = get_ohlcv_store({'market_data': {'ohlcv_store': {'capacity': {'base': 50}}}})
+
+    assert get_ohlcv_store() is store
+    assert get_ohlcv_store({'market_data': {'ohlcv_store': {'capacity': {'base': 10}}}}) is store
+    assert store.capacities['base'] == 50 and store.capacities['htf'] == 200
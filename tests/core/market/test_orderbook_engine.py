@@ -0,0 +1,115 @@
+"""
+Unit Tests for the incremental L2 order book engine
+
+Covers snapshot/delta application, update-id gap detection and the
+top-N/depth queries used by the orderbook indicators.
+"""
+
+import pytest
+
+from src.core.market.orderbook_engine import LocalOrderBook, OrderBookSide
+
+
+@pytest.fixture
+def book():
+    """Order book seeded with a small snapshot (u=10)."""
+    book = LocalOrderBook('BTCUSDT')
+    book.apply_snapshot(
+        bids=[['100', '1'], ['99', '2'], ['98', '3']],
+        asks=[['101', '1'], ['102', '2'], ['103', '3']],
+        update_id=10,
+        timestamp=1_700_000_000_000
+    )
+    return book
+
+
+def test_side_keeps_best_price_first():
+    bids = OrderBookSide(is_bid=True)
+    asks = OrderBookSide(is_bid=False)
+    for price in (99.0, 101.0, 100.0):
+        bids.update(price, 1.0)
+        asks.update(price, 1.0)
+
+    assert [level[0] for level in bids.top()] == [101.0, 100.0, 99.0]
+    assert [level[0] for level in asks.top()] == [99.0, 100.0, 101.0]
+
+
+def test_zero_size_deletes_level():
+    side = OrderBookSide(is_bid=False)
+    side.update(10.0, 1.0)
+    side.update(11.0, 1.0)
+    side.update(10.0, 0.0)
+    # Deleting a level that does not exist is a no-op
+    side.update(12.0, 0.0)
+
+    assert side.top() == [[11.0, 1.0]]
+
+
+def test_snapshot_parses_string_levels(book):
+    assert book.synced
+    assert book.best_bid() == (100.0, 1.0)
+    assert book.best_ask() == (101.0, 1.0)
+    assert book.mid_price() == 100.5
+    assert book.spread() == 1.0
+
+
+def test_delta_upserts_and_deletes(book):
+    applied = book.apply_delta(
+        bids=[['100.5', '4'], ['99', '0']],
+        asks=[['101', '0'], ['102', '5']],
+        update_id=11
+    )
+
+    assert applied
+    assert book.update_id == 11
+    assert book.top(2) == {
+        'bids': [[100.5, 4.0], [100.0, 1.0]],
+        'asks': [[102.0, 5.0], [103.0, 3.0]]
+    }
+
+
+def test_gap_invalidates_book(book):
+    assert not book.apply_delta(bids=[['100', '9']], asks=[], update_id=12)
+    assert not book.synced
+    assert book.stats['gaps'] == 1
+    # Levels were not touched and later deltas are refused until a snapshot
+    assert book.best_bid() == (100.0, 1.0)
+    assert not book.apply_delta(bids=[], asks=[], update_id=13)
+
+    book.apply_snapshot(bids=[['100', '9']], asks=[['101', '1']], update_id=20)
+    assert book.apply_delta(bids=[], asks=[['101', '2']], update_id=21)
+
+
+def test_stale_delta_is_dropped(book):
+    assert book.apply_delta(bids=[['100', '50']], asks=[], update_id=10)
+    assert book.best_bid() == (100.0, 1.0)
+    assert book.stats['stale_dropped'] == 1
+
+
+def test_delta_before_snapshot_requires_resync():
+    book = LocalOrderBook('ETHUSDT')
+    assert not book.apply_delta(bids=[['1', '1']], asks=[], update_id=1)
+
+
+def test_depth_queries(book):
+    assert book.depth() == (6.0, 6.0)
+    assert book.depth(2) == (3.0, 3.0)
+
+    # 100 bps around a 100.5 mid covers 99.495..101.505
+    within = book.depth_within_bps(100)
+    assert within['bid_size'] == 1.0
+    assert within['ask_size'] == 1.0
+    assert within['bid_notional'] == 100.0
+    assert book.imbalance(1) == 0.0
+
+
+def test_to_dict_is_cached_until_next_update(book):
+    first = book.to_dict()
+    assert book.to_dict() is first
+    assert first['bids'][0] == [100.0, 1.0]
+    assert first['timestamp'] == 1_700_000_000_000
+
+    book.apply_delta(bids=[['100', '2']], asks=[], update_id=11)
+    second = book.to_dict()
+    assert second is not first
+    assert second['bids'][0] == [100.0, 2.0]
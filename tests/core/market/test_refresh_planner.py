@@ -0,0 +1,136 @@
+"""
+Unit Tests for the cross-symbol REST refresh planner
+
+Covers bulk ticker batching, per-symbol fallback, single-flight loads with
+result reuse and stalest-first ordering.
+"""
+
+import asyncio
+
+from src.core.market.refresh_planner import RefreshPlanner, get_refresh_planner
+
+
+class FakeExchange:
+    def __init__(self):
+        self.bulk_calls = []
+        self.single_calls = []
+
+    async def fetch_tickers_by_symbol(self, symbols):
+        self.bulk_calls.append(list(symbols))
+        return {s: {'symbol': s, 'last': 1.0} for s in symbols if s != 'MISSINGUSDT'}
+
+    async def fetch_ticker(self, symbol):
+        self.single_calls.append(symbol)
+        return {'symbol': symbol, 'last': 2.0}
+
+
+class FakeBulklessExchange:
+    def __init__(self):
+        self.single_calls = []
+
+    async def fetch_ticker(self, symbol):
+        self.single_calls.append(symbol)
+        return {'symbol': symbol, 'last': 2.0}
+
+
+class FakeExchangeManager:
+    def __init__(self, exchange):
+        self.exchange = exchange
+
+    async def get_primary_exchange(self):
+        return self.exchange
+
+
+def test_ticker_refreshes_are_batched():
+    exchange = FakeExchange()
+    planner = RefreshPlanner(FakeExchangeManager(exchange), window=0.01)
+
+    async def run():
+        return await asyncio.gather(
+            planner.fetch_ticker('BTCUSDT', staleness=5),
+            planner.fetch_ticker('ETHUSDT', staleness=90),
+            planner.fetch_ticker('BTCUSDT'),
+            planner.fetch_ticker('MISSINGUSDT'),
+        )
+
+    btc, eth, btc_again, missing = asyncio.run(run())
+    assert btc is btc_again and eth['symbol'] == 'ETHUSDT'
+    # Stalest symbol first, duplicates collapsed
+    assert exchange.bulk_calls == [['ETHUSDT', 'BTCUSDT', 'MISSINGUSDT']]
+    # Symbols absent from the bulk response fall back to a single fetch
+    assert exchange.single_calls == ['MISSINGUSDT'] and missing['last'] == 2.0
+    assert planner.get_stats()['coalesced'] == 1
+
+
+def test_exchange_without_bulk_endpoint():
+    exchange = FakeBulklessExchange()
+    planner = RefreshPlanner(FakeExchangeManager(exchange), window=0.01)
+
+    async def run():
+        return await asyncio.gather(planner.fetch_ticker('BTCUSDT'), planner.fetch_ticker('ETHUSDT'))
+
+    assert [t['symbol'] for t in asyncio.run(run())] == ['BTCUSDT', 'ETHUSDT']
+    assert exchange.single_calls == ['BTCUSDT', 'ETHUSDT']
+
+
+def test_loads_are_single_flight_and_reused():
+    planner = RefreshPlanner(FakeExchangeManager(FakeExchange()), window=0.01, result_ttl=60)
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {'base': 'frame'}
+
+    async def run():
+        first = await asyncio.gather(*[planner.load('kline', 'BTCUSDT', loader) for _ in range(5)])
+        again = await planner.load('kline', 'BTCUSDT', loader)
+        return first, again
+
+    first, again = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(result is again for result in first)
+    assert planner.get_stats()['result_reuses'] == 1
+
+
+def test_stalest_loads_start_first():
+    planner = RefreshPlanner(FakeExchangeManager(FakeExchange()), window=0.01, max_concurrency=1)
+    order = []
+
+    def loader(symbol):
+        async def load():
+            order.append(symbol)
+        return load
+
+    async def run():
+        await asyncio.gather(
+            planner.load('kline', 'A', loader('A'), staleness=10),
+            planner.load('kline', 'B', loader('B'), staleness=300),
+            planner.load('kline', 'C', loader('C'), staleness=60),
+        )
+
+    asyncio.run(run())
+    assert order == ['B', 'C', 'A']
+
+
+def test_load_errors_reach_every_waiter():
+    planner = RefreshPlanner(FakeExchangeManager(FakeExchange()), window=0.01)
+
+    async def loader():
+        raise ValueError("boom")
+
+    async def run():
+        return await asyncio.gather(
+            planner.load('open_interest', 'BTCUSDT', loader),
+            planner.load('open_interest', 'BTCUSDT', loader),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+def test_planner_is_shared_per_exchange_manager():
+    manager = FakeExchangeManager(FakeExchange())
+    assert get_refresh_planner(manager) is get_refresh_planner(manager, {'window': 1})
+    assert get_refresh_planner(FakeExchangeManager(FakeExchange())) is not get_refresh_planner(manager)
@@ -0,0 +1,107 @@
+"""
+Unit Tests for the columnar trade tape
+
+Covers O(1) de-duplication, count/age retention, column views and the legacy
+newest-first record layout.
+"""
+
+import numpy as np
+import pytest
+
+from src.core.market.trade_tape import SIDE_BUY, SIDE_SELL, TradeTape, encode_side
+
+
+def _fill(tape: TradeTape, count: int, start_ts: int = 1_000, step_ms: int = 1_000) -> None:
+    for i in range(count):
+        side = SIDE_BUY if i % 2 == 0 else SIDE_SELL
+        tape.append(f"t{i}", 100.0 + i, 1.0 + i, side, start_ts + i * step_ms)
+
+
+def test_encode_side():
+    assert encode_side('Buy') == SIDE_BUY
+    assert encode_side('sell') == SIDE_SELL
+    assert encode_side(None) == 0
+
+
+def test_duplicates_are_skipped():
+    tape = TradeTape('BTCUSDT', capacity=10)
+    assert tape.append('a', 100.0, 1.0, SIDE_BUY, 1)
+    assert not tape.append('a', 100.0, 1.0, SIDE_BUY, 1)
+
+    assert len(tape) == 1
+    assert tape.stats['duplicates'] == 1
+
+
+def test_count_retention_releases_evicted_ids():
+    tape = TradeTape('BTCUSDT', capacity=5)
+    _fill(tape, 23)
+
+    assert len(tape) == 5
+    assert tape.timestamps.tolist() == [1_000 + i * 1_000 for i in range(18, 23)]
+    assert 't17' not in tape
+    assert 't22' in tape
+    # An evicted id may appear again (e.g. REST replay) without being treated as a duplicate
+    assert tape.stats['evicted'] == 18
+
+
+def test_age_retention():
+    tape = TradeTape('BTCUSDT', capacity=100, max_age_ms=5_000)
+    _fill(tape, 20)
+
+    assert tape.timestamps[0] >= tape.last_timestamp - 5_000
+    assert len(tape) == 6
+
+
+def test_out_of_order_trade_dropped():
+    tape = TradeTape('BTCUSDT', capacity=10)
+    tape.append('a', 100.0, 1.0, SIDE_BUY, 2_000)
+
+    assert not tape.append('b', 100.0, 1.0, SIDE_BUY, 1_000)
+    assert tape.stats['out_of_order'] == 1
+
+
+def test_columns_since_and_aggregates():
+    tape = TradeTape('BTCUSDT', capacity=10)
+    _fill(tape, 4)
+
+    cols = tape.columns(since_ms=3_000)
+    assert cols['price'].tolist() == [102.0, 103.0]
+    assert tape.buy_sell_volume() == {'buy_volume': 4.0, 'sell_volume': 6.0}
+    np.testing.assert_array_equal(tape.cvd(), [1.0, -1.0, 2.0, -2.0])
+
+
+def test_extend_sorts_rest_trades():
+    tape = TradeTape('BTCUSDT', capacity=10)
+    added = tape.extend([
+        {'id': 2, 'price': '101', 'amount': '2', 'side': 'sell', 'timestamp': 2_000},
+        {'id': 1, 'price': '100', 'amount': '1', 'side': 'buy', 'timestamp': 1_000},
+        {'id': 1, 'price': '100', 'amount': '1', 'side': 'buy', 'timestamp': 1_000},
+    ])
+
+    assert added == 2
+    assert tape.timestamps.tolist() == [1_000, 2_000]
+
+
+def test_to_records_newest_first_and_cached():
+    tape = TradeTape('BTCUSDT', capacity=10)
+    _fill(tape, 3)
+
+    records = tape.to_records()
+    assert [r['id'] for r in records] == ['t2', 't1', 't0']
+    assert records[0]['side'] == 'buy'
+    assert records[0]['cost'] == pytest.approx(102.0 * 3.0)
+    assert tape.to_records() is records
+
+    tape.append('t3', 1.0, 1.0, SIDE_SELL, 10_000)
+    assert tape.to_records()[0]['id'] == 't3'
+
+
+def test_views_survive_compaction():
+    tape = TradeTape('BTCUSDT', capacity=3)
+    _fill(tape, 3)
+    prices = tape.prices
+
+    _fill_more = [tape.append(f"n{i}", 1.0, 1.0, SIDE_BUY, 100_000 + i) for i in range(10)]
+
+    assert all(_fill_more)
+    assert prices.tolist() == [100.0, 101.0, 102.0]
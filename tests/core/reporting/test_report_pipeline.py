@@ -0,0 +1,106 @@
+"""
+Unit Tests for the report pipeline
+
+Covers stage timing, the shared template environment, section fingerprints
+across runs and WeasyPrint rendering with cached stylesheets.
+"""
+
+import asyncio
+import importlib
+import os
+import time
+
+import pytest
+
+from src.core.reporting.report_pipeline import (
+    PdfRenderer,
+    ReportPipeline,
+    ReportTimer,
+    SectionCache,
+    template_environment,
+)
+
+
+def _weasyprint_available():
+    # Importing can succeed while pango/cairo fail at render time, so render
+    # a tiny document to be sure
+    try:
+        weasyprint = importlib.import_module("weasyprint")
+        weasyprint.HTML(string="<p>x</p>").write_pdf()
+        return True
+    except Exception:
+        return False
+
+
+def test_timer_accumulates_stages():
+    timer = ReportTimer("r1")
+    timer.stage("charts")
+    time.sleep(0.02)
+    timer.stage("template")
+    timer.stage("charts")
+    time.sleep(0.01)
+    summary = timer.summary()
+
+    assert list(timer.stages) == ["charts", "template"]
+    assert timer.stages["charts"] >= 0.03 and timer.stages["template"] < 0.01
+    assert summary.startswith("charts 0.0") and "total" in summary
+
+    pipeline = ReportPipeline(mode='thread')
+    pipeline.record("market_report", timer)
+    stats = pipeline.get_stats()["stages"]["market_report"]
+    assert stats["charts"]["count"] == 1 and stats["total"]["max"] >= timer.stages["charts"]
+
+
+def test_template_environment_is_shared_and_reloads(tmp_path):
+    template_file = tmp_path / "report.html"
+    template_file.write_text("<p>{{ value }}</p>")
+
+    env = template_environment(str(tmp_path))
+    assert template_environment(str(tmp_path)) is env
+    first = env.get_template("report.html")
+    assert env.get_template("report.html") is first
+    assert first.render(value=1) == "<p>1</p>"
+
+    # An edited template is compiled again
+    template_file.write_text("<div>{{ value }}</div>")
+    stamp = os.path.getmtime(template_file) + 5
+    os.utime(template_file, (stamp, stamp))
+    assert env.get_template("report.html").render(value=2) == "<div>2</div>"
+
+
+def test_section_cache_tracks_changes_per_scope():
+    cache = SectionCache(max_entries=2)
+    overview = {"btc": {"price": 50_000.0, "change": 1.2}}
+
+    assert not cache.contains("tpl:1", "market_overview", overview)
+    cache.add("tpl:1", "market_overview", overview)
+    assert cache.contains("tpl:1", "market_overview", {"btc": {"change": 1.2, "price": 50_000.0}})
+    assert not cache.contains("tpl:1", "market_overview", {"btc": {"price": 50_001.0, "change": 1.2}})
+    # A changed template (new scope) checks every section again
+    assert not cache.contains("tpl:2", "market_overview", overview)
+
+    cache.add("tpl:1", "notable_news", [])
+    cache.add("tpl:1", "trading_signals", [])
+    assert not cache.contains("tpl:1", "market_overview", overview)
+    assert cache.stats == {"hits": 1, "misses": 4}
+
+
+@pytest.mark.skipif(not _weasyprint_available(), reason="WeasyPrint system libraries not installed")
+def test_pdf_renderer_reuses_parsed_styles(tmp_path):
+    html = ("<html><head><style>p { color: #c00; }</style>"
+            "<style media='screen'>p { color: blue; }</style></head>"
+            "<body><p>{}</p></body></html>")
+    pipeline = ReportPipeline(mode='thread')
+    renderer = pipeline._local_renderer
+
+    async def run():
+        first = await pipeline.render_pdf(html.replace("{}", "one"), str(tmp_path / "one.pdf"))
+        second = await pipeline.render_pdf(html.replace("{}", "two"), str(tmp_path / "two.pdf"))
+        return first, second
+
+    assert asyncio.run(run()) == (True, True)
+    pipeline.shutdown()
+    assert (tmp_path / "two.pdf").read_bytes().startswith(b"%PDF")
+    # Only the plain <style> block is cached, once for both reports
+    assert isinstance(renderer, PdfRenderer) and len(renderer._stylesheets) == 1
+    assert pipeline.get_stats()["pdf_renders"] == 2
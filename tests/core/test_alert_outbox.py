@@ -0,0 +1,134 @@
+"""
+Unit Tests for the webhook alert outbox
+
+Covers coalescing of queued embeds, rate limit handling (429 retry_after and
+exhausted buckets), retries with backoff, permanent failures and recovery of
+pending rows after a restart.
+"""
+
+import asyncio
+import json
+import time
+
+from src.core.alert_outbox import AlertOutbox
+
+URL = "https://discord.com/api/webhooks/123/token"
+
+
+class FakeDiscord:
+    """Records posts and answers with scripted (status, headers, body) responses."""
+
+    def __init__(self, responses=()):
+        self.responses = list(responses)
+        self.posts = []
+
+    async def __call__(self, url, payload, files):
+        self.posts.append((time.monotonic(), url, payload, files))
+        if self.responses:
+            return self.responses.pop(0)
+        return 204, {}, ''
+
+
+def _embed(i):
+    return {'embeds': [{'title': f"alert {i}", 'description': 'x'}]}
+
+
+async def _drain(outbox, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while outbox.queue_depth and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+
+
+def _pending_rows(db_path):
+    import sqlite3
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT status, attempts FROM alert_outbox ORDER BY id").fetchall()
+
+
+def test_burst_is_coalesced_and_rate_limits_respected(tmp_path):
+    db_path = str(tmp_path / 'outbox.db')
+    discord = FakeDiscord([
+        (429, {'x-ratelimit-remaining': '0'}, json.dumps({'retry_after': 0.2})),
+        (204, {'x-ratelimit-remaining': '0', 'x-ratelimit-reset-after': '0.1'}, ''),
+    ])
+    outbox = AlertOutbox(db_path, sender=discord, coalesce_window=0.05)
+
+    async def run():
+        start = time.monotonic()
+        for i in range(12):
+            await outbox.enqueue(URL, _embed(i))
+        enqueue_time = time.monotonic() - start
+        await _drain(outbox)
+        stats = outbox.get_stats()
+        await outbox.stop()
+        return enqueue_time, stats
+
+    enqueue_time, stats = asyncio.run(run())
+    # Enqueueing never waits on Discord
+    assert enqueue_time < 0.5
+
+    (t0, _, first, _), (t1, _, second, _), (t2, _, third, _) = discord.posts
+    assert len(first['embeds']) == 10 and second == first
+    assert [e['title'] for e in third['embeds']] == ['alert 10', 'alert 11']
+    assert t1 - t0 >= 0.2 and t2 - t1 >= 0.1
+
+    assert stats['delivered'] == 12 and stats['posts'] == 3 and stats['rate_limited'] == 1
+    assert stats['coalesced'] == 10 and stats['queue_depth'] == 0
+    assert stats['latency_p95'] >= stats['latency_p50'] > 0
+    assert stats['routes']['123']['sent'] == 12
+    assert _pending_rows(db_path) == []
+
+
+def test_retries_failures_and_attachments_are_sent_alone(tmp_path):
+    db_path = str(tmp_path / 'outbox.db')
+    chart = tmp_path / 'chart.png'
+    chart.write_bytes(b'png')
+    discord = FakeDiscord([(502, {}, 'bad gateway'), (204, {}, ''), (400, {}, 'invalid form body')])
+    outbox = AlertOutbox(db_path, sender=discord, initial_retry_delay=0.05, coalesce_window=0)
+
+    async def run():
+        await outbox.enqueue(URL, {'content': 'report', 'embeds': [{'title': 'r'}]}, files=[str(chart)])
+        await outbox.enqueue(URL, {'content': 'broken'}, alert_type='system')
+        await _drain(outbox)
+        stats = outbox.get_stats()
+        await outbox.stop()
+        return stats
+
+    stats = asyncio.run(run())
+    assert [post[2].get('content') for post in discord.posts] == ['report', 'report', 'broken']
+    assert discord.posts[0][3] == [('chart.png', b'png')]
+    assert stats['retries'] == 1 and stats['delivered'] == 1 and stats['failed'] == 1
+    assert _pending_rows(db_path) == [('failed', 0)]
+
+
+def test_pending_messages_survive_restart(tmp_path):
+    db_path = str(tmp_path / 'outbox.db')
+    down = FakeDiscord([(503, {}, '')] * 10)
+    outbox = AlertOutbox(db_path, sender=down, initial_retry_delay=5.0, coalesce_window=0)
+
+    async def first_run():
+        await outbox.enqueue(URL, _embed(1))
+        await outbox.enqueue(URL, _embed(2))
+        await asyncio.sleep(0.05)
+        await outbox.stop(drain_timeout=0)
+
+    asyncio.run(first_run())
+    assert _pending_rows(db_path) == [('pending', 1), ('pending', 0)]
+
+    up = FakeDiscord()
+    restarted = AlertOutbox(db_path, sender=up, initial_retry_delay=5.0, coalesce_window=0)
+
+    async def second_run():
+        # Bring the retry forward instead of waiting out the backoff
+        await restarted.start()
+        for route in restarted._routes.values():
+            for entry in route.queue:
+                entry.next_attempt_at = 0
+            route.wakeup.set()
+        await _drain(restarted)
+        await restarted.stop()
+
+    asyncio.run(second_run())
+    assert restarted.stats['recovered'] == 2 and restarted.stats['delivered'] == 2
+    assert [e['title'] for e in up.posts[0][2]['embeds']] == ['alert 1', 'alert 2']
+    assert _pending_rows(db_path) == []
@@ -0,0 +1,181 @@
+"""
+Tests for in-memory excursion tracking and batched flushing
+
+Covers the vectorized MFE/MAE pass, batched writes from
+SignalPerformanceTracker, parameterized summaries and rollups.
+"""
+
+import sqlite3
+
+import pytest
+
+from src.database.excursion_tracker import ExcursionTracker
+from src.database.signal_performance import SignalPerformanceTracker
+from src.database.sqlite_access import close_all
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / 'signals.db')
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE trading_signals (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, signal_id TEXT UNIQUE NOT NULL,
+            symbol TEXT NOT NULL, signal_type TEXT NOT NULL, entry_price REAL,
+            stop_loss REAL, current_price REAL, created_at TEXT DEFAULT (datetime('now')),
+            status TEXT DEFAULT 'pending', opened_at TEXT, closed_at TEXT, exit_price REAL,
+            exit_reason TEXT, outcome TEXT, pnl_pct REAL, r_multiple REAL, duration_hours REAL,
+            mfe_pct REAL, mae_pct REAL, mfe_price REAL, mae_price REAL, mfe_at TEXT, mae_at TEXT,
+            signal_pattern TEXT, performance_notes TEXT
+        )
+    ''')
+    conn.commit()
+    conn.close()
+    yield path
+    close_all()
+
+
+def _insert(db_path, signal_id, symbol='BTCUSDT', signal_type='LONG', entry=100.0, **columns):
+    columns = {'status': 'active', **columns}
+    names = ', '.join(['signal_id', 'symbol', 'signal_type', 'entry_price'] + list(columns))
+    placeholders = ', '.join('?' for _ in range(4 + len(columns)))
+    conn = sqlite3.connect(db_path)
+    conn.execute(f'INSERT INTO trading_signals ({names}) VALUES ({placeholders})',
+                 [signal_id, symbol, signal_type, entry] + list(columns.values()))
+    conn.commit()
+    conn.close()
+
+
+def _row(db_path, signal_id):
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    row = conn.execute('SELECT * FROM trading_signals WHERE signal_id = ?', (signal_id,)).fetchone()
+    conn.close()
+    return row
+
+
+def test_vectorized_pass_tracks_direction():
+    tracker = ExcursionTracker()
+    tracker.add('long', 'BTCUSDT', 'LONG', 100.0)
+    tracker.add('short', 'BTCUSDT', 'SHORT', 100.0)
+    tracker.add('other', 'ETHUSDT', 'LONG', 10.0)
+
+    assert tracker.update_price('BTCUSDT', 110.0, timestamp=0) == 2
+    assert tracker.update_price('BTCUSDT', 105.0, timestamp=1) == 0
+    assert tracker.get('long')['mfe_pct'] == pytest.approx(10.0)
+    assert tracker.get('short')['mae_pct'] == pytest.approx(-10.0)
+
+    updates = {u['signal_id']: u for u in tracker.drain_dirty()}
+    assert set(updates) == {'long', 'short'} and tracker.dirty_count == 0
+    assert updates['long']['mfe_price'] == 110.0 and updates['long']['mae_pct'] is None
+    assert updates['short']['mae_at'] == '1970-01-01T00:00:00'
+
+    tracker.update_price('BTCUSDT', 120.0)
+    assert tracker.remove('long')['mfe_pct'] == pytest.approx(20.0)
+    assert 'long' not in tracker and len(tracker) == 2
+
+
+def test_batched_flush(db_path):
+    for i in range(3):
+        _insert(db_path, f"s{i}", mfe_pct=1.0 if i == 0 else None)
+    _insert(db_path, 'eth', symbol='ETHUSDT', signal_type='SHORT', entry=10.0)
+
+    tracker = SignalPerformanceTracker(db_path, flush_interval=3600)
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    tracker.sync_active([dict(r) for r in conn.execute("SELECT * FROM trading_signals WHERE status = 'active'")])
+    conn.close()
+
+    # First dirty batch flushes right away, later ones wait for the interval
+    assert tracker.update_price('BTCUSDT', 101.0) == 2  # s0 already stored 1%
+    assert _row(db_path, 's0')['mfe_pct'] == pytest.approx(1.0)
+    assert _row(db_path, 's1')['mfe_pct'] == pytest.approx(1.0)
+    assert tracker.update_price('BTCUSDT', 98.0) == 3
+    assert tracker.update_price('ETHUSDT', 9.0) == 1
+    assert _row(db_path, 's1')['mae_pct'] is None
+
+    assert tracker.flush_excursions() == 4
+    assert _row(db_path, 's2')['mae_pct'] == pytest.approx(-2.0)
+    assert _row(db_path, 's2')['mfe_price'] == 101.0
+    assert _row(db_path, 'eth')['mfe_pct'] == pytest.approx(10.0)
+
+    # Closing writes the pending excursion before the row leaves 'active'
+    tracker.update_price('BTCUSDT', 95.0)
+    assert tracker.close_signal('s1', exit_price=95.0, exit_reason='stop_loss')
+    assert _row(db_path, 's1')['mae_pct'] == pytest.approx(-5.0)
+    assert 's1' not in tracker.excursions
+
+    # Signals no longer active are dropped on sync
+    tracker.sync_active([{'signal_id': 's0'}])
+    assert tracker.excursions.signal_ids() == ['s0']
+    tracker.close()
+    assert _row(db_path, 's0')['mae_pct'] == pytest.approx(-5.0)
+
+
+def test_update_excursion_writes_through(db_path):
+    _insert(db_path, 'sig', signal_type='SHORT')
+    tracker = SignalPerformanceTracker(db_path)
+
+    assert tracker.update_excursion('sig', 97.0)
+    assert _row(db_path, 'sig')['mfe_pct'] == pytest.approx(3.0)
+    assert not tracker.update_excursion('missing', 97.0)
+
+
+def test_summary_parameterized_and_rollups(db_path):
+    rows = [
+        ('a', 'LONG', 'win', 4.0, '-3 days'),
+        ('b', 'LONG', 'loss', -2.0, '-3 days'),
+        ('c', "SHORT' OR '1'='1", 'win', 1.0, '-2 days'),
+        ('d', 'LONG', 'win', 2.0, '-0 days'),
+        ('e', 'LONG', 'win', 8.0, '-30 days'),
+    ]
+    conn = sqlite3.connect(db_path)
+    for signal_id, signal_type, outcome, pnl, age in rows:
+        conn.execute(
+            "INSERT INTO trading_signals (signal_id, symbol, signal_type, status, outcome, pnl_pct, "
+            "signal_pattern, created_at) VALUES (?, 'BTCUSDT', ?, 'closed', ?, ?, 'momentum', datetime('now', ?))",
+            (signal_id, signal_type, outcome, pnl, age)
+        )
+    conn.commit()
+    conn.close()
+
+    tracker = SignalPerformanceTracker(db_path)
+    live = tracker.get_performance_summary(signal_type='LONG', days=7)
+    assert live['total_signals'] == 3 and live['wins'] == 2
+    assert live['avg_pnl_pct'] == pytest.approx(4 / 3, abs=0.01)
+    assert live['profit_factor'] == pytest.approx(3.0)
+    assert tracker.get_performance_summary(signal_type="SHORT' OR '1'='1")['total_signals'] == 1
+
+    rolled = tracker.get_performance_summary(signal_type='LONG', signal_pattern='momentum', days=7, use_rollups=True)
+    assert rolled == live
+    assert tracker.get_performance_summary(days=7, use_rollups=True) == tracker.get_performance_summary(days=7)
+
+
+def test_rollups_pick_up_foreign_closes_and_completed_days(db_path):
+    def add_closed(signal_id, pnl, age, closed_at):
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "INSERT INTO trading_signals (signal_id, symbol, signal_type, status, outcome, pnl_pct, "
+            "created_at, closed_at) VALUES (?, 'BTCUSDT', 'LONG', 'closed', 'win', ?, datetime('now', ?), ?)",
+            (signal_id, pnl, age, closed_at)
+        )
+        conn.commit()
+        conn.close()
+
+    add_closed('a', 1.0, '-3 days', '2026-01-01T00:00:00')
+    tracker = SignalPerformanceTracker(db_path)
+    assert tracker.get_performance_summary(days=7, use_rollups=True)['total_signals'] == 1
+
+    # Closed by another process after the rollups were built
+    add_closed('b', 2.0, '-3 days', '2099-01-01T00:00:00')
+    assert tracker.get_performance_summary(days=7, use_rollups=True) == tracker.get_performance_summary(days=7)
+
+    # A day that completed after the last rebuild, closed before the watermark
+    add_closed('c', 3.0, '-2 days', '2000-01-01T00:00:00')
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE signal_performance_rollup_state SET rolled_through = DATE('now', '-3 days')")
+    conn.commit()
+    conn.close()
+    rolled = SignalPerformanceTracker(db_path).get_performance_summary(days=7, use_rollups=True)
+    assert rolled['total_signals'] == 3
+    assert rolled == tracker.get_performance_summary(days=7)
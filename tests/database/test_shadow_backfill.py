@@ -0,0 +1,124 @@
+"""
+Tests for the set-based shadow forward-return backfill
+
+Covers as-of price joins, per-horizon maturity, completion marking, one
+price load per symbol and the pending-row index.
+"""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from src.database import shadow_storage
+from src.database.shadow_backfill import ShadowReturnBackfill, as_of_prices, exchange_price_loader
+from src.database.sqlite_access import close_all, get_db_access
+
+MINUTE = 60_000
+NOW = 1_767_268_800_000  # 2026-01-01 12:00 UTC
+START = NOW - 48 * 60 * MINUTE
+
+
+def _history(symbol_offset=0.0):
+    # 1-minute candles over the last 48h, price rises 1 per minute
+    timestamps = np.arange(START, NOW, MINUTE, dtype=np.int64)
+    closes = 1000.0 + symbol_offset + (timestamps - START) / MINUTE
+    return timestamps, closes, MINUTE
+
+
+@pytest.fixture
+def shadow_db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert shadow_storage.init_shadow_tables()
+    yield get_db_access()
+    close_all()
+
+
+def test_as_of_prices():
+    history = (np.array([0, 60, 120]), np.array([1.0, 2.0, 3.0]), 60)
+    prices = as_of_prices(history, np.array([-1, 0, 59, 61, 179, 180]))
+    assert np.isnan(prices[0]) and np.isnan(prices[-1])
+    assert list(prices[1:5]) == [1.0, 1.0, 2.0, 3.0]
+
+
+def test_backfill_fills_matured_horizons(shadow_db):
+    loads = []
+
+    async def loader(symbol, start_ms, end_ms):
+        loads.append(symbol)
+        return _history(100.0 if symbol == 'ETHUSDT' else 0.0)
+
+    # 30h old: every horizon matured; 2h old: only 15m and 1h
+    old_ts, recent_ts = NOW - 30 * 60 * MINUTE, NOW - 120 * MINUTE
+    old_id = shadow_storage.store_dual_regime_adjustment({'timestamp': old_ts, 'symbol': 'BTCUSDT'})
+    recent_id = shadow_storage.store_distribution_signal(
+        {'timestamp': recent_ts, 'symbol': 'BTCUSDT', 'entry_price': 2000.0})
+    cas_id = shadow_storage.store_cas_signal(
+        {'timestamp': old_ts, 'symbol': 'ETHUSDT', 'current_price': 1000.0})
+
+    backfill = ShadowReturnBackfill(loader)
+    updated = asyncio.run(backfill.run(now_ms=NOW))
+
+    assert updated == {'shadow_dual_regime': 1, 'shadow_cas_signals': 1, 'shadow_distribution_signals': 1}
+    assert sorted(loads) == ['BTCUSDT', 'ETHUSDT']
+
+    dual = shadow_storage.get_dual_regime_adjustments()[0]
+    entry = 1000.0 + 18 * 60  # entry price filled from history (as-of signal time)
+    assert dual['id'] == old_id and dual['entry_price'] == entry
+    assert dual['return_24h'] == pytest.approx((entry + 24 * 60 - entry) / entry * 100)
+    assert dual['return_calculated_at'] is not None
+
+    dist = shadow_storage.get_distribution_signals()[0]
+    assert dist['id'] == recent_id
+    assert dist['return_1h'] == pytest.approx((1000.0 + 46 * 60 + 60 - 2000.0) / 2000.0 * 100)
+    assert dist['return_4h'] is None and dist['return_calculated_at'] is None
+
+    cas = shadow_storage.get_cas_signals()[0]
+    assert cas['id'] == cas_id and cas['return_24h'] == pytest.approx((1100.0 + 18 * 60 + 24 * 60 - 1000.0) / 10)
+    assert isinstance(cas['return_calculated_at'], int)
+
+    # Completed rows are no longer pending; the partial one is, and keeps its 1h value
+    loads.clear()
+    later = NOW + 3 * 60 * MINUTE
+    async def later_loader(symbol, start_ms, end_ms):
+        loads.append(symbol)
+        timestamps = np.arange(START, later, MINUTE, dtype=np.int64)
+        return timestamps, np.full(len(timestamps), 5000.0), MINUTE
+    backfill.price_loader = later_loader
+    assert asyncio.run(backfill.run(now_ms=later)) == {'shadow_distribution_signals': 1}
+    assert loads == ['BTCUSDT']
+    dist = shadow_storage.get_distribution_signals()[0]
+    assert dist['return_1h'] == pytest.approx((1000.0 + 46 * 60 + 60 - 2000.0) / 2000.0 * 100)
+    assert dist['return_4h'] == pytest.approx(150.0)
+
+
+def test_pending_rows_use_index(shadow_db):
+    async def loader(symbol, start_ms, end_ms):
+        return None
+
+    backfill = ShadowReturnBackfill(loader)
+    asyncio.run(backfill.run(now_ms=NOW))
+    plan = shadow_db.connection().execute(
+        'EXPLAIN QUERY PLAN SELECT id FROM shadow_cas_signals '
+        'WHERE return_calculated_at IS NULL AND timestamp BETWEEN ? AND ?', (0, NOW)
+    ).fetchall()
+    assert 'idx_shadow_cas_signals_pending' in ' '.join(row[-1] for row in plan)
+
+
+def test_exchange_loader_uses_one_fetch():
+    class FakeExchange:
+        def __init__(self):
+            self.calls = []
+
+        async def fetch_ohlcv(self, symbol, timeframe='1m', limit=1000):
+            self.calls.append((symbol, timeframe, limit))
+            return [[START + i * 5 * MINUTE, 1, 1, 1, 100.0 + i, 1] for i in range(3)]
+
+    exchange = FakeExchange()
+    loader = exchange_price_loader(exchange)
+
+    now_ms = int(time.time() * 1000)
+    timestamps, closes, interval = asyncio.run(loader('BTCUSDT', now_ms - 48 * 60 * MINUTE, now_ms))
+    assert exchange.calls == [('BTCUSDT', '5m', 1000)]
+    assert interval == 5 * MINUTE and list(closes) == [100.0, 101.0, 102.0]
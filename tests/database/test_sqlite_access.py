@@ -0,0 +1,129 @@
+"""
+Tests for the shared SQLite access layer
+
+Covers batched commits, per-job rollback, async wrappers and the shadow and
+signal storage modules running on top of it.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from src.database import shadow_storage, signal_storage
+from src.database.sqlite_access import SQLiteAccess, close_all, get_db_access
+
+
+@pytest.fixture
+def access(tmp_path):
+    db = SQLiteAccess(str(tmp_path / 'test.db'))
+    db.execute('CREATE TABLE items (id INTEGER PRIMARY KEY, value TEXT UNIQUE)')
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def virtuoso_db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    yield tmp_path / 'data' / 'virtuoso.db'
+    close_all()
+
+
+def test_concurrent_writes_share_commits(access):
+    def writer(offset):
+        for i in range(50):
+            access.execute('INSERT INTO items (value) VALUES (?)', (f"v{offset + i}",))
+
+    threads = [threading.Thread(target=writer, args=(n * 100,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert access.connection().execute('SELECT COUNT(*) FROM items').fetchone()[0] == 400
+    assert access.stats['commits'] < 400
+    assert access.connection().execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+
+def test_failing_job_only_rolls_back_itself(access):
+    futures = [
+        access.execute('INSERT INTO items (value) VALUES (?)', ('a',), wait=False),
+        access.execute('INSERT INTO items (value) VALUES (?)', ('a',), wait=False),
+        access.execute('INSERT INTO items (value) VALUES (?)', ('b',), wait=False),
+    ]
+    access.flush()
+
+    assert futures[0].result() and futures[2].result()
+    with pytest.raises(sqlite3.IntegrityError):
+        futures[1].result()
+    rows = access.connection().execute('SELECT value FROM items ORDER BY value').fetchall()
+    assert [r['value'] for r in rows] == ['a', 'b']
+
+
+def test_failed_background_write_is_logged(access, caplog):
+    with caplog.at_level('WARNING', logger='src.database.sqlite_access'):
+        access.execute('INSERT INTO missing (value) VALUES (?)', ('a',), wait=False)
+        access.flush()
+
+    assert access.stats['write_errors'] == 1
+    assert 'no such table: missing' in caplog.text
+
+
+def test_async_wrappers(access):
+    async def run():
+        row_ids = await asyncio.gather(*[
+            access.execute_async('INSERT INTO items (value) VALUES (?)', (f"x{i}",)) for i in range(20)
+        ])
+        count = await access.read_async(lambda conn: conn.execute('SELECT COUNT(*) FROM items').fetchone()[0])
+        return row_ids, count
+
+    row_ids, count = asyncio.run(run())
+    assert len(set(row_ids)) == 20 and count == 20
+
+
+def test_shadow_storage_round_trip(virtuoso_db):
+    assert shadow_storage.init_shadow_tables()
+    # A minute old, so the days_to_keep=0 cleanup cutoff is strictly after it
+    timestamp = int(time.time() * 1000) - 60_000
+    row_id = shadow_storage.store_cas_signal(
+        {'symbol': 'BTCUSDT', 'cas_score': 42.0, 'is_valid': True, 'timestamp': timestamp})
+    assert shadow_storage.update_cas_forward_returns(row_id, return_1h=1.5)
+
+    signals = shadow_storage.get_cas_signals(symbol='btcusdt')
+    assert len(signals) == 1 and signals[0]['return_1h'] == 1.5 and signals[0]['is_valid'] is True
+    assert shadow_storage.cleanup_old_shadow_data(days_to_keep=0) == 1
+    assert get_db_access().get_stats()['connections_opened'] <= 3
+
+
+class FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 1, 1, 12, 0, 0, tzinfo=tz)
+
+
+def test_signal_storage_skips_duplicates(virtuoso_db, monkeypatch):
+    # signal_id has one-second resolution; freeze it so both stores collide
+    monkeypatch.setattr(signal_storage, 'datetime', FrozenDatetime)
+    get_db_access().execute('''
+        CREATE TABLE trading_signals (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, signal_id TEXT UNIQUE, symbol TEXT,
+            signal_type TEXT, confluence_score REAL, reliability REAL, entry_price REAL,
+            stop_loss REAL, current_price REAL, timestamp INTEGER, targets TEXT,
+            components TEXT, interpretations TEXT, insights TEXT, influential_components TEXT,
+            sent_to_discord INTEGER, json_path TEXT, pdf_path TEXT, trade_params TEXT
+        )
+    ''')
+    signal = {'symbol': 'ETH/USDT', 'signal_type': 'LONG', 'score': 71.2, 'price': 3000.0,
+              'components': {'volume': 80}}
+
+    async def run():
+        return await get_db_access().run_async(signal_storage.store_trading_signal, signal)
+
+    inserted = asyncio.run(run())
+    assert inserted is not None
+    assert signal_storage.store_trading_signal(signal) is None
+    stored = signal_storage.get_recent_signals(symbol='ETHUSDT')
+    assert len(stored) == 1 and stored[0]['components'] == {'volume': 80}
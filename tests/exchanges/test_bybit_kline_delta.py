@@ -0,0 +1,130 @@
+"""
+Unit Tests for incremental kline refresh in BybitExchange._fetch_all_timeframes
+
+Covers the initial full fetch, delta fetches from the cached high-water mark,
+and the full backfill when a delta response leaves a gap.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.core.exchanges.bybit import BybitExchange
+from src.core.market import ohlcv_store
+
+MINUTE_MS = 60_000
+
+
+class FakeKlineApi:
+    """Serves contiguous 1-unit candles up to ``now`` for any interval."""
+
+    def __init__(self):
+        self.now = (int(time.time() * 1000) // MINUTE_MS) * MINUTE_MS
+        self.requests = []
+        self.drop_bar = False
+
+    async def request(self, method, endpoint, params):
+        interval_ms = int(params['interval']) * MINUTE_MS
+        last = (self.now // interval_ms) * interval_ms
+        first = max(-(-int(params['start']) // interval_ms) * interval_ms, last - 199 * interval_ms)
+        timestamps = list(range(first, last + 1, interval_ms))
+        if self.drop_bar and len(timestamps) > 2:
+            timestamps.pop(1)
+        self.requests.append((params['interval'], len(timestamps)))
+        rows = [[str(ts), '1', '2', '0.5', '1.5', '10'] for ts in reversed(timestamps)]
+        return {'retCode': 0, 'result': {'list': rows}}
+
+
+@pytest.fixture
+def exchange(monkeypatch):
+    monkeypatch.setenv('BYBIT_API_KEY', 'key')
+    monkeypatch.setenv('BYBIT_API_SECRET', 'secret')
+    # Each test starts from an empty process-wide candle store
+    monkeypatch.setattr(ohlcv_store, '_shared_store', None)
+    exchange = BybitExchange({'exchanges': {'bybit': {'websocket': {}}}})
+    api = FakeKlineApi()
+
+    async def no_rate_limit(*args, **kwargs):
+        pass
+
+    exchange._check_rate_limit = no_rate_limit
+    exchange._make_request = api.request
+    return exchange, api
+
+
+def test_second_refresh_only_fetches_new_candles(exchange):
+    exchange, api = exchange
+
+    async def scenario():
+        first = await exchange._fetch_all_timeframes('BTCUSDT')
+        full_requests = list(api.requests)
+        api.requests.clear()
+        second = await exchange._fetch_all_timeframes('BTCUSDT')
+        return first, second, full_requests
+
+    first, second, full_requests = asyncio.run(scenario())
+    assert sorted(full_requests) == [('1', 200), ('240', 200), ('30', 200), ('5', 200)]
+    # Only the still-forming bar is re-downloaded per timeframe
+    assert sorted(api.requests) == [('1', 1), ('240', 1), ('30', 1), ('5', 1)]
+    for tf in ('base', 'ltf', 'mtf', 'htf'):
+        assert len(second[tf]) == 200
+        assert second[tf].equals(first[tf])
+
+    stats = exchange.get_kline_fetch_stats()
+    assert stats['full_fetches'] == 4
+    assert stats['delta_fetches'] == 4
+
+
+def test_new_candles_are_merged(exchange):
+    exchange, api = exchange
+
+    async def scenario():
+        await exchange._fetch_all_timeframes('BTCUSDT')
+        api.now += 3 * MINUTE_MS
+        return await exchange._fetch_all_timeframes('BTCUSDT')
+
+    data = asyncio.run(scenario())
+    base = data['base']
+    # The shared store keeps up to its base capacity, beyond one 200-candle fetch
+    assert len(base) == 203
+    assert int(base.index[-1].value // 1_000_000) == (api.now // MINUTE_MS) * MINUTE_MS
+    assert base.index.is_monotonic_increasing
+
+
+def test_gap_triggers_full_backfill(exchange):
+    exchange, api = exchange
+
+    async def scenario():
+        await exchange._fetch_all_timeframes('BTCUSDT')
+        api.now += 5 * MINUTE_MS
+        api.drop_bar = True
+        api.requests.clear()
+        await exchange._fetch_all_timeframes('BTCUSDT')
+
+    asyncio.run(scenario())
+    base_requests = [count for interval, count in api.requests if interval == '1']
+    assert len(base_requests) == 2
+    assert exchange.get_kline_fetch_stats()['gap_backfills'] == 1
+
+
+def test_delta_fetch_can_be_disabled(monkeypatch):
+    monkeypatch.setenv('BYBIT_API_KEY', 'key')
+    monkeypatch.setenv('BYBIT_API_SECRET', 'secret')
+    # Each test starts from an empty process-wide candle store
+    monkeypatch.setattr(ohlcv_store, '_shared_store', None)
+    exchange = BybitExchange({'exchanges': {'bybit': {'websocket': {}, 'ohlcv_delta_fetch': {'enabled': False}}}})
+    api = FakeKlineApi()
+
+    async def no_rate_limit(*args, **kwargs):
+        pass
+
+    exchange._check_rate_limit = no_rate_limit
+    exchange._make_request = api.request
+
+    async def scenario():
+        await exchange._fetch_all_timeframes('BTCUSDT')
+        await exchange._fetch_all_timeframes('BTCUSDT')
+
+    asyncio.run(scenario())
+    assert all(count == 200 for _, count in api.requests)
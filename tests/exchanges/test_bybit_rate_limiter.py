@@ -0,0 +1,86 @@
+"""
+Tests for the shared Bybit token-bucket rate limiter
+
+Covers immediate grants, endpoint throttling, priority ordering of queued
+requests, header adaptation and reservations made by _check_rate_limit.
+"""
+
+import asyncio
+import time
+
+from src.core.exchanges.rate_limiter import BybitRateLimiter, RequestPriority, TokenBucket
+
+
+def test_token_bucket_refill():
+    bucket = TokenBucket(capacity=2, refill_rate=10)
+    now = time.monotonic()
+    bucket.consume(now)
+    bucket.consume(now)
+    assert bucket.wait_time(now) > 0
+    assert bucket.wait_time(now + 0.2) == 0
+
+
+def test_endpoint_limit_throttles_requests():
+    async def run():
+        limiter = BybitRateLimiter({'endpoints': {'kline': {'requests': 2, 'per_second': 0.1}}})
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire('kline')
+        return time.monotonic() - start, limiter.get_stats()
+
+    elapsed, stats = asyncio.run(run())
+    # Third request waits for one token at 20 tokens/s
+    assert 0.03 <= elapsed < 0.5
+    assert stats['immediate'] == 2
+    assert stats['queued'] == 1
+
+
+def test_queued_requests_are_served_by_priority():
+    async def run():
+        limiter = BybitRateLimiter({'endpoints': {'kline': {'requests': 1, 'per_second': 0.02}}})
+        await limiter.acquire('kline')
+        order = []
+
+        async def request(name, priority):
+            await limiter.acquire('kline', priority=priority)
+            order.append(name)
+
+        await asyncio.gather(
+            request('report', RequestPriority.REPORTS),
+            request('market', RequestPriority.MARKET_DATA),
+            request('trade', RequestPriority.TRADING),
+        )
+        return order, limiter.get_stats()
+
+    order, stats = asyncio.run(run())
+    assert order == ['trade', 'market', 'report']
+    assert stats['wait_histograms']['reports']['count'] == 1
+
+
+def test_exhausted_header_blocks_endpoint():
+    async def run():
+        limiter = BybitRateLimiter()
+        reset_ms = int((time.time() + 0.1) * 1000)
+        limiter.update_from_headers('v5/order/create', {
+            'X-Bapi-Limit': '10',
+            'X-Bapi-Limit-Status': '0',
+            'X-Bapi-Limit-Reset-Timestamp': str(reset_ms)
+        })
+        start = time.monotonic()
+        await limiter.wait_if_needed('v5/order/create')
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.05
+
+
+def test_reservation_is_not_charged_twice():
+    async def run():
+        limiter = BybitRateLimiter()
+        await limiter.reserve('kline')
+        await limiter.wait_if_needed('v5/market/kline')
+        return limiter
+
+    limiter = asyncio.run(run())
+    assert round(limiter.global_used()) == 1
+    assert limiter.get_stats()['reserved_used'] == 1
+    assert limiter.get_api_call_stats() == {'v5/market/kline': 1}
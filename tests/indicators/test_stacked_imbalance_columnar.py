@@ -0,0 +1,156 @@
+"""
+Unit Tests for the columnar stacked imbalance ingestion path
+
+Covers the incremental level histogram (bucketing, window expiry, outlier
+and whale corrections), TradeTape cursor reads and parity with the
+DataFrame path.
+"""
+
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from src.indicators.stacked_imbalance import (
+    SIDE_BUY,
+    SIDE_SELL,
+    StackedImbalanceCalculator,
+    StackedImbalanceConfig,
+    TradeLevelHistogram,
+    encode_sides,
+)
+
+MINUTE_MS = 60_000
+T0 = 1_700_000_000_000
+
+
+def _batch(count: int, start_ms: int, seed: int = 7) -> np.ndarray:
+    """Structured trade batch with a buy-heavy run of prices above 100."""
+    rng = np.random.default_rng(seed)
+    batch = np.zeros(count, dtype=[('price', 'f8'), ('size', 'f8'), ('side', 'i1'), ('timestamp', 'i8')])
+    batch['price'] = 100.0 + rng.integers(0, 10, count)
+    batch['size'] = rng.uniform(0.1, 2.0, count)
+    batch['side'] = np.where(batch['price'] >= 105, SIDE_BUY, np.where(rng.random(count) < 0.5, SIDE_BUY, SIDE_SELL))
+    batch['timestamp'] = start_ms + np.arange(count)
+    return batch
+
+
+def test_encode_sides_accepts_labels_and_codes():
+    assert encode_sides(['Buy', 'sell', 'b', 'S', '']).tolist() == [1, -1, 1, -1, 0]
+    assert encode_sides([1, -1, 0, 2.0]).tolist() == [1, -1, 0, 1]
+
+
+def test_histogram_buckets_by_tick():
+    histogram = TradeLevelHistogram(tick_size=1.0, window_ms=MINUTE_MS)
+    histogram.ingest([100.2, 100.4, 101.0, 101.1], [1, 2, 3, 4], ['buy', 'sell', 'buy', ''], [1, 2, 3, 4])
+
+    levels, _, num_trades = histogram.build_levels()
+
+    assert num_trades == 4
+    assert levels[100.0].buy_volume == 1.0
+    assert levels[100.0].sell_volume == 2.0
+    # Unknown side splits 50/50
+    assert levels[101.0].buy_volume == 5.0
+    assert levels[101.0].sell_volume == 2.0
+    assert levels[101.0].trade_count == 2
+
+
+def test_histogram_expires_rows_outside_window():
+    histogram = TradeLevelHistogram(tick_size=1.0, window_ms=MINUTE_MS)
+    histogram.ingest([100.0, 101.0], [1.0, 1.0], [1, -1], [T0, T0 + 1_000])
+    histogram.ingest([102.0], [1.0], [1], [T0 + MINUTE_MS + 500])
+
+    levels, _, _ = histogram.build_levels()
+
+    assert sorted(levels) == [101.0, 102.0]
+    assert histogram.stats['expired'] == 1
+
+
+def test_histogram_drops_invalid_and_out_of_order_rows():
+    histogram = TradeLevelHistogram(tick_size=1.0, window_ms=MINUTE_MS)
+    histogram.ingest([100.0, -1.0, np.nan], [1.0, 1.0, 1.0], [1, 1, 1], [T0 + 5_000] * 3)
+    added = histogram.ingest([100.0, 100.0], [1.0, 1.0], [1, 1], [T0 + 4_000, T0 + 6_000])
+
+    assert added == 1
+    assert histogram.stats['invalid'] == 2
+    assert histogram.stats['out_of_order'] == 1
+    assert len(histogram) == 2
+
+
+def test_histogram_grows_past_initial_capacity():
+    histogram = TradeLevelHistogram(tick_size=1.0, window_ms=10 * MINUTE_MS, initial_capacity=16)
+    for i in range(10):
+        histogram.ingest(np.full(10, 100.0), np.ones(10), np.ones(10), T0 + np.arange(10) + i * 10)
+
+    assert len(histogram) == 100
+    assert histogram.build_levels()[0][100.0].trade_count == 100
+
+
+class _Tape:
+    """Minimal TradeTape stand-in exposing columns() and the appended counter."""
+
+    def __init__(self):
+        self.rows = []
+        self.stats = {'appended': 0}
+
+    def add(self, price, size, side, ts):
+        self.rows.append((price, size, side, ts))
+        self.stats['appended'] += 1
+
+    def __len__(self):
+        return len(self.rows)
+
+    def columns(self):
+        arr = np.array(self.rows, dtype=float).reshape(-1, 4)
+        return {'price': arr[:, 0], 'size': arr[:, 1], 'side': arr[:, 2], 'timestamp': arr[:, 3]}
+
+
+def test_tape_cursor_reads_only_new_trades():
+    histogram = TradeLevelHistogram(tick_size=1.0, window_ms=MINUTE_MS)
+    tape = _Tape()
+    tape.add(100.0, 1.0, 1, T0 + 1_000)
+    tape.add(100.0, 1.0, 1, T0 + 2_000)
+
+    assert histogram.ingest_tape(tape) == 2
+    assert histogram.ingest_tape(tape) == 0
+
+    tape.add(100.0, 1.0, -1, T0 + 3_000)
+    assert histogram.ingest_tape(tape) == 1
+    assert histogram.build_levels()[0][100.0].sell_volume == 1.0
+
+
+def test_columnar_path_matches_dataframe_path():
+    pytest.importorskip('pandas')
+    now_ms = int(time.time() * 1000)
+    batch = _batch(500, now_ms - 1_000)
+    config = StackedImbalanceConfig(tick_sizes={'default': 1.0}, cache_ttl_seconds=0)
+
+    columnar = asyncio.run(StackedImbalanceCalculator(config).calculate('TESTUSDT', trades=batch))
+    records = [
+        {'price': float(r['price']), 'size': float(r['size']),
+         'side': 'buy' if r['side'] == SIDE_BUY else 'sell', 'timestamp': int(r['timestamp'])}
+        for r in batch
+    ]
+    legacy = asyncio.run(StackedImbalanceCalculator(config).calculate('TESTUSDT', trades=records))
+
+    assert columnar.score == pytest.approx(legacy.score)
+    assert columnar.confidence == pytest.approx(legacy.confidence)
+    assert columnar.total_levels_analyzed == legacy.total_levels_analyzed
+    assert columnar.metadata['whale_threshold'] == pytest.approx(legacy.metadata['whale_threshold'])
+
+
+def test_calculate_scores_accumulated_batches():
+    now_ms = int(time.time() * 1000)
+    config = StackedImbalanceConfig(tick_sizes={'default': 1.0}, cache_ttl_seconds=0)
+    calculator = StackedImbalanceCalculator(config)
+
+    calculator.ingest_trades('TESTUSDT', _batch(60, now_ms - 2_000, seed=1))
+    assert asyncio.run(calculator.calculate('TESTUSDT')).metadata['neutral_reason'] == 'insufficient_trades'
+
+    calculator.ingest_trades('TESTUSDT', _batch(60, now_ms - 1_000, seed=2))
+    result = asyncio.run(calculator.calculate('TESTUSDT'))
+
+    # The single largest trade is dropped as a 99.9th percentile outlier
+    assert result.metadata['total_trades_analyzed'] == 119
+    assert result.total_levels_analyzed == 10
@@ -0,0 +1,214 @@
+"""
+Unit Tests for the event-driven analysis scheduler
+
+Covers change triggers (new candle, imbalance drift, volume surge), deadline
+scheduling, volatility priority, worker limits and backpressure metrics.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from src.monitoring.analysis_scheduler import (
+    TRIGGER_CANDLE,
+    TRIGGER_DEADLINE,
+    TRIGGER_IMBALANCE,
+    TRIGGER_NEW,
+    TRIGGER_VOLUME,
+    AnalysisScheduler,
+)
+
+
+class _Buffer:
+    def __init__(self, last_timestamp):
+        self.last_timestamp = last_timestamp
+
+    def __len__(self):
+        # Too short for the volatility estimate
+        return 1
+
+
+class _Store:
+    def __init__(self):
+        self.buffers = {}
+
+    def get_buffer(self, symbol, timeframe):
+        return self.buffers.get(symbol)
+
+
+class _Book:
+    synced = True
+
+    def __init__(self, value):
+        self.value = value
+
+    def imbalance(self, n=None):
+        return self.value
+
+
+class _Tape:
+    def __init__(self, volume):
+        self.volume = volume
+
+    def __len__(self):
+        return 1
+
+    def buy_sell_volume(self, since_ms=None):
+        return {'buy_volume': self.volume, 'sell_volume': 0.0}
+
+
+def _scheduler(analyze=None, max_concurrent=10, **settings):
+    mdm = SimpleNamespace(ohlcv_store=_Store(), order_books={}, trade_tapes={}, smart_intervals=None)
+    config = {'monitoring': {'scheduler': {'min_interval_seconds': 5, 'max_interval_seconds': 60, **settings}}}
+
+    async def noop(symbol):
+        return {'success': True, 'symbol': symbol}
+
+    return AnalysisScheduler(analyze or noop, config=config, market_data_manager=mdm,
+                             max_concurrent=max_concurrent), mdm
+
+
+def _ran(scheduler, symbol, started):
+    """Mark a symbol as analyzed at ``started`` with baselines captured."""
+    state = scheduler._states[symbol]
+    scheduler._capture_baseline(state, started)
+    state.last_started = started
+    state.runs += 1
+    return state
+
+
+def test_new_symbols_are_due_immediately():
+    scheduler, _ = _scheduler()
+    scheduler.set_symbols([{'symbol': 'BTCUSDT'}, 'ETHUSDT'])
+
+    assert scheduler.symbols == ['BTCUSDT', 'ETHUSDT']
+    assert scheduler._evaluate(scheduler._states['BTCUSDT'], time.time()) == TRIGGER_NEW
+
+
+def test_quiet_symbol_waits_for_deadline():
+    scheduler, _ = _scheduler()
+    scheduler.set_symbols(['BTCUSDT'])
+    state = _ran(scheduler, 'BTCUSDT', 1_000.0)
+
+    assert scheduler._evaluate(state, 1_030.0) is None
+    assert scheduler._evaluate(state, 1_060.0) == TRIGGER_DEADLINE
+
+
+def test_new_candle_triggers_after_min_interval():
+    scheduler, mdm = _scheduler()
+    scheduler.set_symbols(['BTCUSDT'])
+    mdm.ohlcv_store.buffers['BTCUSDT'] = _Buffer(60_000)
+    state = _ran(scheduler, 'BTCUSDT', 1_000.0)
+
+    mdm.ohlcv_store.buffers['BTCUSDT'] = _Buffer(120_000)
+
+    # Debounced inside min_interval
+    assert scheduler._evaluate(state, 1_002.0) is None
+    assert scheduler._evaluate(state, 1_006.0) == TRIGGER_CANDLE
+
+
+def test_imbalance_drift_triggers():
+    scheduler, mdm = _scheduler(imbalance_drift=0.2)
+    scheduler.set_symbols(['BTCUSDT'])
+    mdm.order_books['BTCUSDT'] = _Book(0.1)
+    state = _ran(scheduler, 'BTCUSDT', 1_000.0)
+
+    mdm.order_books['BTCUSDT'].value = 0.25
+    assert scheduler._evaluate(state, 1_010.0) is None
+
+    mdm.order_books['BTCUSDT'].value = -0.15
+    assert scheduler._evaluate(state, 1_010.0) == TRIGGER_IMBALANCE
+
+
+def test_volume_surge_triggers():
+    scheduler, mdm = _scheduler(volume_surge_ratio=2.0)
+    scheduler.set_symbols(['BTCUSDT'])
+    mdm.trade_tapes['BTCUSDT'] = _Tape(100.0)
+    _ran(scheduler, 'BTCUSDT', 1_000.0)
+    # 100 units over 10s sets a 10/s baseline rate
+    state = _ran(scheduler, 'BTCUSDT', 1_010.0)
+    assert state.volume_rate == 10.0
+
+    mdm.trade_tapes['BTCUSDT'].volume = 150.0
+    assert scheduler._evaluate(state, 1_020.0) is None
+
+    mdm.trade_tapes['BTCUSDT'].volume = 250.0
+    assert scheduler._evaluate(state, 1_020.0) == TRIGGER_VOLUME
+
+
+def test_volatile_symbols_get_shorter_deadlines():
+    scheduler, _ = _scheduler(volatility_reference=0.002)
+
+    assert scheduler._symbol_interval(0.0) == 60.0
+    assert scheduler._symbol_interval(0.002) == 30.0
+    # Never below the debounce interval
+    assert scheduler._symbol_interval(1.0) == 5.0
+
+
+def test_smart_intervals_set_base_interval():
+    scheduler, mdm = _scheduler()
+    mdm.smart_intervals = SimpleNamespace(enabled=True, get_current_interval=lambda component: 90)
+
+    assert scheduler._symbol_interval(0.0) == 90.0
+
+
+def test_removed_symbols_are_dropped():
+    scheduler, _ = _scheduler()
+    scheduler.set_symbols(['BTCUSDT', 'ETHUSDT'])
+    scheduler.set_symbols(['ETHUSDT'])
+
+    assert scheduler.symbols == ['ETHUSDT']
+
+
+def test_dispatch_respects_worker_limit_and_reports_backpressure():
+    started = []
+    release = None
+
+    async def slow(symbol):
+        started.append(symbol)
+        await release.wait()
+
+    async def scenario():
+        nonlocal release
+        release = asyncio.Event()
+        scheduler, _ = _scheduler(analyze=slow, max_concurrent=2)
+        scheduler.set_symbols(['A', 'B', 'C'])
+
+        assert scheduler.dispatch_due() == 2
+        await asyncio.sleep(0)
+        stats = scheduler.get_stats()
+        assert stats['in_flight'] == 2
+        assert stats['queue_depth'] == 1
+        assert stats['saturated_ticks'] == 1
+
+        release.set()
+        await asyncio.gather(*list(scheduler._tasks))
+        assert scheduler.dispatch_due() == 1
+        await asyncio.gather(*list(scheduler._tasks))
+        return scheduler
+
+    scheduler = asyncio.run(scenario())
+    stats = scheduler.get_stats()
+
+    assert sorted(started) == ['A', 'B', 'C']
+    assert stats['completed'] == 3
+    assert stats['triggers'][TRIGGER_NEW] == 3
+    assert scheduler.all_analyzed()
+
+
+def test_slow_symbol_times_out_without_blocking_others():
+    async def analyze(symbol):
+        if symbol == 'SLOW':
+            await asyncio.sleep(10)
+
+    async def scenario():
+        scheduler, _ = _scheduler(analyze=analyze, analysis_timeout_seconds=0.05)
+        scheduler.set_symbols(['SLOW', 'FAST'])
+        scheduler.dispatch_due()
+        await asyncio.gather(*list(scheduler._tasks))
+        return scheduler
+
+    scheduler = asyncio.run(scenario())
+
+    assert scheduler.stats['timeouts'] == 1
+    assert scheduler.get_stats()['per_symbol']['FAST']['runs'] == 1
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Cache codec benchmark
+
+Compares payload size and encode/decode time of the L2/L3 cache codecs
+(legacy json, orjson, msgpack, each with optional zlib/zstd/lz4) for the
+keys the dashboard and mobile endpoints read most.
+
+By default it uses synthetic payloads shaped like our cache entries. With
+--redis it reads the live values of the same keys from Redis instead:
+
+    python tests/performance/cache_codec_benchmark.py
+    python tests/performance/cache_codec_benchmark.py --redis --host localhost
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.core.cache.cache_codec import CacheCodec, CacheCodecError, _COMPRESSORS, _SERIALIZERS
+
+SYMBOLS = [f"{base}USDT" for base in (
+    'BTC', 'ETH', 'SOL', 'XRP', 'DOGE', 'ADA', 'AVAX', 'LINK', 'DOT', 'SUI',
+    'TON', 'TRX', 'LTC', 'BCH', 'NEAR', 'APT', 'ARB', 'OP', 'INJ', 'SEI'
+)]
+COMPONENTS = ('orderflow', 'orderbook', 'volume', 'price_structure', 'technical', 'sentiment')
+
+
+def _breakdown(symbol):
+    return {
+        'symbol': symbol,
+        'overall_score': round(random.uniform(30, 80), 2),
+        'sentiment': random.choice(['BULLISH', 'BEARISH', 'NEUTRAL']),
+        'reliability': round(random.uniform(50, 100), 1),
+        'components': {name: round(random.uniform(0, 100), 2) for name in COMPONENTS},
+        'sub_components': {
+            name: {f'{name}_{i}': round(random.uniform(0, 100), 4) for i in range(8)}
+            for name in COMPONENTS
+        },
+        'interpretations': {
+            name: f"{name.replace('_', ' ').title()} shows moderate strength with mixed signals " * 3
+            for name in COMPONENTS
+        },
+        'score_history': [[int(time.time() * 1000) - i * 60_000, round(random.uniform(30, 80), 2)] for i in range(60)],
+        'timestamp': int(time.time() * 1000)
+    }
+
+
+def _ticker(symbol):
+    price = random.uniform(0.01, 90_000)
+    return {
+        'symbol': symbol, 'price': price, 'high': price * 1.03, 'low': price * 0.97,
+        'change_24h': random.uniform(-10, 10), 'volume': random.uniform(1e5, 1e9),
+        'turnover_24h': random.uniform(1e6, 1e10), 'funding_rate': random.uniform(-1e-3, 1e-3),
+        'open_interest': random.uniform(1e5, 1e9)
+    }
+
+
+def synthetic_payloads():
+    """Payloads shaped like the cache entries behind /mobile-data and the dashboard."""
+    random.seed(7)
+    signals = [dict(_ticker(s), confluence_score=random.uniform(30, 80), components={
+        name: random.uniform(0, 100) for name in COMPONENTS}) for s in SYMBOLS]
+    candles = []
+    ts = int(time.time() * 1000)
+    price = 60_000.0
+    for i in range(1000):
+        price *= 1 + random.gauss(0, 0.001)
+        candles.append([ts - (1000 - i) * 60_000, price, price * 1.001, price * 0.999, price, random.uniform(1, 500)])
+    return {
+        'market:overview': {
+            'total_symbols': 450, 'total_volume_24h': 8.5e10, 'trend_strength': 42.1,
+            'current_volatility': 2.3, 'btc_dominance': 57.2, 'average_change_24h': 0.8,
+            'fear_greed_value': 61, 'fear_greed_label': 'Greed', 'total_market_cap': 3.1e12,
+            'gainers': 210, 'losers': 240, 'timestamp': ts
+        },
+        'market:movers': {
+            'gainers': [_ticker(s) for s in SYMBOLS[:10]],
+            'losers': [_ticker(s) for s in SYMBOLS[10:]]
+        },
+        'market:tickers': {s: _ticker(s) for s in SYMBOLS * 5},
+        'analysis:signals': {'signals': signals, 'count': len(signals), 'timestamp': ts},
+        'confluence:breakdown:BTCUSDT': _breakdown('BTCUSDT'),
+        'ohlcv:BTCUSDT:1m': candles
+    }
+
+
+def redis_payloads(host, port):
+    import redis
+
+    client = redis.Redis(host=host, port=port)
+    codec = CacheCodec()
+    payloads = {}
+    for key in synthetic_payloads():
+        data = client.get(key)
+        if data:
+            try:
+                payloads[key] = codec.decode(data)
+            except CacheCodecError as e:
+                print(f"  skipping {key}: {e}")
+    return payloads
+
+
+def _time(fn, arg, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(arg)
+    return (time.perf_counter() - start) / repeat * 1e6, result
+
+
+def benchmark(payloads, repeat):
+    codecs = [CacheCodec(serializer) for serializer in sorted(_SERIALIZERS)]
+    codecs += [
+        CacheCodec(serializer, compression, compress_threshold=1024)
+        for serializer in sorted(_SERIALIZERS) for compression in sorted(_COMPRESSORS)
+    ]
+
+    print(f"{'key':32} {'codec':18} {'bytes':>9} {'ratio':>6} {'encode µs':>10} {'decode µs':>10}")
+    print("-" * 90)
+    for key, value in payloads.items():
+        baseline = None
+        for codec in codecs:
+            encode_us, encoded = _time(codec.encode, value, repeat)
+            decode_us, _ = _time(codec.decode, encoded, repeat)
+            baseline = baseline or len(encoded)
+            label = codec.serializer if codec.compression == 'none' else f"{codec.serializer}+{codec.compression}"
+            print(f"{key:32} {label:18} {len(encoded):>9} {len(encoded) / baseline:>6.2f} "
+                  f"{encode_us:>10.1f} {decode_us:>10.1f}")
+        print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--redis', action='store_true', help='benchmark live values from Redis')
+    parser.add_argument('--host', default=os.getenv('REDIS_HOST', 'localhost'))
+    parser.add_argument('--port', type=int, default=int(os.getenv('REDIS_PORT', 6379)))
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    payloads = redis_payloads(args.host, args.port) if args.redis else synthetic_payloads()
+    print("=" * 90)
+    print(f"CACHE CODEC BENCHMARK ({'redis' if args.redis else 'synthetic'} payloads, {args.repeat} runs each)")
+    print(f"serializers: {', '.join(sorted(_SERIALIZERS))}; compressors: {', '.join(sorted(_COMPRESSORS))}")
+    print("=" * 90)
+    benchmark(payloads, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Correlation matrix benchmark
+
+Compares the previous per-pair path (``calculate_correlation`` for every
+pair, each fetching both symbols) with the shared-panel engine for a
+30 symbol heatmap and a 7-window beta series. The exchange is simulated with
+a fixed fetch latency:
+
+    python tests/performance/correlation_matrix_benchmark.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.core.analysis.correlation_calculator import CorrelationCalculator
+
+SYMBOLS = ['BTCUSDT'] + [f"ALT{i}USDT" for i in range(29)]
+DAYS = 90
+FETCH_LATENCY = 0.005
+
+
+class SimulatedExchange:
+    def __init__(self):
+        rng = np.random.default_rng(0)
+        index = pd.date_range(end=pd.Timestamp.now(tz='UTC').floor('D'), periods=DAYS, freq='D')
+        market = rng.normal(0, 0.02, DAYS)
+        self.candles = {}
+        for i, symbol in enumerate(SYMBOLS):
+            closes = 100 * np.cumprod(1 + (0.5 + i / 30) * market + rng.normal(0, 0.01, DAYS))
+            self.candles[symbol] = [[int(ts.timestamp() * 1000), c, c, c, c, 1.0] for ts, c in zip(index, closes)]
+        self.calls = 0
+
+    async def fetch_ohlcv(self, symbol, timeframe, limit, since):
+        self.calls += 1
+        await asyncio.sleep(FETCH_LATENCY)
+        return [c for c in self.candles[symbol] if c[0] >= since][-limit:]
+
+
+async def per_pair_matrix(calculator, symbols):
+    """Previous path: one calculate_correlation (two fetches) per pair."""
+    pairs = [(a, b) for i, a in enumerate(symbols) for b in symbols[i + 1:]]
+    results = await asyncio.gather(*[calculator.calculate_correlation(a, b, 30) for a, b in pairs])
+    matrix = np.eye(len(symbols))
+    for (a, b), result in zip(pairs, results):
+        i, j = symbols.index(a), symbols.index(b)
+        matrix[i, j] = matrix[j, i] = result.correlation
+    return matrix
+
+
+async def run(label, fn):
+    exchange = SimulatedExchange()
+    calculator = CorrelationCalculator(exchange)
+    start = time.perf_counter()
+    result = await fn(calculator)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{label:34} {exchange.calls:>8} {elapsed:>10.1f}")
+    return result
+
+
+async def main():
+    print("=" * 60)
+    print(f"CORRELATION MATRIX BENCHMARK ({len(SYMBOLS)} symbols, {FETCH_LATENCY * 1000:.0f}ms per fetch)")
+    print("=" * 60)
+    print(f"{'path':34} {'fetches':>8} {'total ms':>10}")
+
+    await run('per-pair matrix', lambda c: per_pair_matrix(c, SYMBOLS))
+    new = await run('panel matrix', lambda c: c.calculate_correlation_matrix(SYMBOLS, 30))
+
+    # Panel result equals pandas over the same 30-day window
+    closes = pd.DataFrame({s: [c[4] for c in SimulatedExchange().candles[s]] for s in SYMBOLS})
+    reference = closes.pct_change().iloc[-31:].corr().to_numpy()
+    assert np.allclose(reference, np.array(new['correlation_matrix'], dtype=float))
+
+    async def old_betas(calculator):
+        # Previous beta series: calculate_beta per symbol and window
+        for symbol in SYMBOLS[1:]:
+            for _ in range(7):
+                calculator._beta_cache.clear()
+                await calculator.calculate_beta(symbol, days=30)
+
+    await run('per-window beta series (uncached)', old_betas)
+    await run('panel beta series', lambda c: c.calculate_beta_time_series(SYMBOLS[1:], 30, 7))
+
+    async def dashboard(calculator):
+        await calculator.calculate_correlation_matrix(SYMBOLS, 30)
+        await calculator.calculate_beta_time_series(SYMBOLS[1:], 30, 7)
+        await calculator.engine.betas(SYMBOLS, 30)
+
+    await run('panel matrix + series + betas', dashboard)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
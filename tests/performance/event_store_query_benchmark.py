@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+EventStore hot-tier query benchmark
+
+Compares the previous full deque scan with the indexed hot tier for
+symbol and symbol + time-range queries at 10k, 100k and 1M events:
+
+    python tests/performance/event_store_query_benchmark.py
+"""
+
+import os
+import sys
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.core.events.event_bus import Event
+from src.core.events.event_sourcing import EventRecord
+from src.core.events.hot_event_index import HotEventIndex
+
+SIZES = (10_000, 100_000, 1_000_000)
+SYMBOLS = [f"SYM{i}USDT" for i in range(50)]
+QUERIES = 20
+BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _records(count):
+    return [
+        EventRecord.from_event(Event(
+            event_type='market_data_updated' if i % 4 else 'trade_executed',
+            source='benchmark',
+            timestamp=BASE + timedelta(milliseconds=i),
+            data={'symbol': SYMBOLS[i % len(SYMBOLS)], 'exchange': 'bybit'}
+        ))
+        for i in range(count)
+    ]
+
+
+def scan(events, symbol, start, end, limit):
+    """Previous path: scan every hot event, then sort and truncate."""
+    results = []
+    for record in events:
+        if record.data.get('symbol') == symbol:
+            if start and record.timestamp < start:
+                continue
+            if end and record.timestamp > end:
+                continue
+            results.append(record)
+    return sorted(results, key=lambda x: x.timestamp)[-limit:]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    for i in range(QUERIES):
+        fn(i)
+    return (time.perf_counter() - start) / QUERIES * 1000
+
+
+def main():
+    print("=" * 78)
+    print(f"EVENT STORE HOT-TIER QUERY BENCHMARK (avg of {QUERIES} queries, limit=100)")
+    print("=" * 78)
+    print(f"{'events':>10} {'query':18} {'scan ms':>10} {'indexed ms':>11} {'speedup':>9}")
+    for size in SIZES:
+        records = _records(size)
+        events = deque(records, maxlen=size)
+        index = HotEventIndex(max_events=size)
+        for record in records:
+            index.append(record)
+        span = timedelta(milliseconds=size)
+        start, end = BASE + span * 0.4, BASE + span * 0.6
+
+        cases = [
+            ('symbol', lambda i: scan(events, SYMBOLS[i], None, None, 100),
+             lambda i: index.query('symbol', SYMBOLS[i], limit=100)),
+            ('symbol + range', lambda i: scan(events, SYMBOLS[i], start, end, 100),
+             lambda i: index.query('symbol', SYMBOLS[i], start_time=start, end_time=end, limit=100)),
+        ]
+        for label, old, new in cases:
+            assert [r.event_id for r in old(0)] == [r.event_id for r in new(0)]
+            scan_ms, index_ms = timed(old), timed(new)
+            print(f"{size:>10,} {label:18} {scan_ms:>10.3f} {index_ms:>11.4f} {scan_ms / index_ms:>8.0f}x")
+
+
+if __name__ == '__main__':
+    main()
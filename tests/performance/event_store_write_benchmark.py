@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+EventStore write path benchmark
+
+Appends 10k events and compares the previous one-INSERT-and-commit-per-event
+path with the group-commit writer in both durability modes:
+
+    python tests/performance/event_store_write_benchmark.py
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.core.events.event_bus import Event
+from src.core.events.event_sourcing import EventRecord, EventStore
+
+EVENTS = 10_000
+
+
+def _events():
+    return [Event(event_type='market_data_updated', source='benchmark',
+                  data={'seq': i, 'symbol': 'BTCUSDT', 'price': 60_000 + i}) for i in range(EVENTS)]
+
+
+async def legacy(path, events):
+    """Previous path: one INSERT and one commit per event."""
+    store = EventStore(storage_path=path)
+    await store.initialize()
+    # Stop the group-commit writer and reproduce the per-event transaction
+    store._writer_task.cancel()
+    store._writer_task = store._write_queue = None
+
+    start = time.perf_counter()
+    for event in events:
+        record = EventRecord.from_event(event)
+        await store._db_connection.execute("""
+            INSERT OR REPLACE INTO events
+            (event_id, event_type, timestamp, source, priority, data, metadata, storage_timestamp, checksum)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, store._record_to_row(record))
+        await store._db_connection.commit()
+    elapsed = time.perf_counter() - start
+    await store.close()
+    return elapsed, None
+
+
+async def group_commit(path, events, durability):
+    store = EventStore(storage_path=path, durability=durability)
+    await store.initialize()
+    start = time.perf_counter()
+    if durability == 'commit':
+        # Concurrent producers, each waiting for its commit
+        await asyncio.gather(*[store.append_event(event) for event in events])
+    else:
+        for event in events:
+            await store.append_event(event)
+        await store.flush()
+    elapsed = time.perf_counter() - start
+    stats = store.get_statistics()['writer']
+    await store.close()
+    return elapsed, stats
+
+
+async def main():
+    events = _events()
+    print("=" * 86)
+    print(f"EVENT STORE WRITE BENCHMARK ({EVENTS:,} events, WAL + synchronous=NORMAL)")
+    print("=" * 86)
+    print(f"{'path':26} {'events/s':>10} {'commits':>8} {'avg batch':>10} {'p50 append ms':>14} {'p99 append ms':>14}")
+    runs = [
+        ('per-event commit (legacy)', lambda p: legacy(p, events)),
+        ('group commit, ack enqueue', lambda p: group_commit(p, events, 'enqueue')),
+        ('group commit, ack commit', lambda p: group_commit(p, events, 'commit')),
+    ]
+    for label, run in runs:
+        with tempfile.TemporaryDirectory() as path:
+            elapsed, stats = await run(path)
+        if stats is None:
+            print(f"{label:26} {EVENTS / elapsed:>10,.0f} {EVENTS:>8} {1:>10} {'-':>14} {'-':>14}")
+        else:
+            print(f"{label:26} {EVENTS / elapsed:>10,.0f} {stats['commits']:>8} "
+                  f"{stats['commit_batch_size']['avg']:>10.0f} {stats['append_latency_ms']['p50']:>14.3f} "
+                  f"{stats['append_latency_ms']['p99']:>14.3f}")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+WebSocket broadcast fan-out benchmark
+
+Measures SmartWebSocketBroadcaster throughput at 100/500/1000 simulated
+clients (20% mobile, one stalled socket) against the previous per-client
+json.dumps + gather delivery:
+
+    python tests/performance/websocket_broadcast_benchmark.py
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.websocket.smart_broadcaster import MessageType, Priority, QueuedMessage, SmartWebSocketBroadcaster
+
+CLIENT_COUNTS = (100, 500, 1000)
+MESSAGES = 50
+
+
+class SimulatedWebSocket:
+    def __init__(self, mobile=False):
+        self.headers = {'user-agent': 'iPhone' if mobile else 'Mozilla/5.0'}
+        self.stalled = False
+        self.bytes_sent = 0
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        if self.stalled:
+            await asyncio.sleep(3600)
+        await asyncio.sleep(0)
+        self.bytes_sent += len(text)
+
+
+def _market_update(seq):
+    return {
+        'type': MessageType.MARKET_UPDATE.value,
+        'topic': 'market',
+        'data': {
+            'seq': seq,
+            'tickers': {f'SYM{i}USDT': {'price': 100.123456 + i, 'change_24h': 1.23456} for i in range(50)},
+            'confluence_score': 61.23456
+        },
+        'timestamp': time.time()
+    }
+
+
+async def _connect_clients(broadcaster, count):
+    client_ids = []
+    for i in range(count):
+        websocket = SimulatedWebSocket(mobile=i % 5 == 0)
+        client_ids.append(await broadcaster.connect_client(websocket, f'client_{i}'))
+    for client in broadcaster.clients.values():
+        # Keep the mobile bandwidth limit out of the measurement
+        client.bandwidth_limit = None
+    broadcaster.clients[client_ids[0]].websocket.stalled = True
+    return client_ids
+
+
+async def _legacy_deliver(broadcaster, client_ids, content):
+    """Previous delivery path: encode per client and gather every send."""
+    async def send(client):
+        message = broadcaster._optimize_message_for_mobile(content) if client.is_mobile else content
+        await asyncio.wait_for(client.websocket.send_text(json.dumps(message)), timeout=0.05)
+
+    await asyncio.gather(*[send(broadcaster.clients[c]) for c in client_ids], return_exceptions=True)
+
+
+async def run(count):
+    broadcaster = SmartWebSocketBroadcaster()
+    client_ids = await _connect_clients(broadcaster, count)
+
+    # Legacy: a stalled socket holds every message until its send times out
+    start = time.perf_counter()
+    for seq in range(MESSAGES):
+        await _legacy_deliver(broadcaster, client_ids, _market_update(seq))
+    legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for seq in range(MESSAGES):
+        await broadcaster._deliver_message(QueuedMessage(
+            MessageType.MARKET_UPDATE, Priority.MEDIUM, _market_update(seq), client_ids
+        ))
+        await asyncio.sleep(0)
+    # Wait for every healthy client to drain its queue
+    while any(c.send_queue for c in list(broadcaster.clients.values())[1:]):
+        await asyncio.sleep(0)
+    fanout = time.perf_counter() - start
+
+    stats = broadcaster.get_statistics()
+    await broadcaster.stop()
+    sends = MESSAGES * count
+    print(f"{count:>8} {sends / legacy:>16,.0f} {sends / fanout:>16,.0f} {legacy / fanout:>8.1f}x "
+          f"{stats['payloads_encoded'] - count:>9} {stats['messages_dropped']:>8}")
+
+
+async def main():
+    print("=" * 72)
+    print(f"WEBSOCKET FAN-OUT BENCHMARK ({MESSAGES} market updates, 20% mobile, 1 stalled client)")
+    print("=" * 72)
+    print(f"{'clients':>8} {'legacy sends/s':>16} {'fan-out sends/s':>16} {'speedup':>9} {'encodes':>9} {'dropped':>8}")
+    for count in CLIENT_COUNTS:
+        await run(count)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,107 @@
+"""
+Unit Tests for SmartWebSocketBroadcaster fan-out
+
+Covers serialize-once delivery per client variant, mobile rounding without
+mutating the desktop payload, and drop-oldest send queues for slow clients.
+"""
+
+import asyncio
+import json
+
+from src.websocket.smart_broadcaster import QueuedMessage, MessageType, Priority, SmartWebSocketBroadcaster
+
+
+class FakeWebSocket:
+    def __init__(self, user_agent='', delay=0.0):
+        self.headers = {'user-agent': user_agent}
+        self.delay = delay
+        self.sent = []
+        self.blocked = asyncio.Event()
+        self.blocked.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        await self.blocked.wait()
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(text)
+
+
+def _message(client_ids, data):
+    return QueuedMessage(
+        message_type=MessageType.MARKET_UPDATE,
+        priority=Priority.MEDIUM,
+        content={'type': 'market_update', 'topic': 'market', 'data': data},
+        target_clients=client_ids
+    )
+
+
+def test_message_is_encoded_once_per_variant():
+    async def scenario():
+        broadcaster = SmartWebSocketBroadcaster()
+        desktop = [await broadcaster.connect_client(FakeWebSocket(), f'd{i}') for i in range(5)]
+        mobile = [await broadcaster.connect_client(FakeWebSocket('iPhone'), f'm{i}') for i in range(3)]
+        encoded_before = broadcaster._stats['payloads_encoded']
+
+        await broadcaster._deliver_message(_message(desktop + mobile, {'price': 1.23456, 'nested': {'v': 2.34567}}))
+        await asyncio.sleep(0.01)
+        return broadcaster, encoded_before
+
+    broadcaster, encoded_before = asyncio.run(scenario())
+    assert broadcaster._stats['payloads_encoded'] - encoded_before == 2
+
+    desktop_payload = json.loads(broadcaster.clients['d0'].websocket.sent[-1])
+    mobile_payload = json.loads(broadcaster.clients['m0'].websocket.sent[-1])
+    assert desktop_payload['data'] == {'price': 1.23456, 'nested': {'v': 2.34567}}
+    assert mobile_payload['data'] == {'price': 1.23, 'nested': {'v': 2.35}}
+    assert all(c.websocket.sent[-1] == broadcaster.clients['d1'].websocket.sent[-1]
+               for c in broadcaster.clients.values() if not c.is_mobile)
+
+
+def test_slow_client_drops_oldest_without_stalling_others():
+    async def scenario():
+        broadcaster = SmartWebSocketBroadcaster(send_queue_size=3)
+        fast = await broadcaster.connect_client(FakeWebSocket(), 'fast')
+        slow_ws = FakeWebSocket()
+        slow = await broadcaster.connect_client(slow_ws, 'slow')
+        slow_ws.blocked.clear()
+
+        for i in range(10):
+            await broadcaster._deliver_message(_message([fast, slow], {'seq': i}))
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+        fast_seqs = [json.loads(m)['data']['seq'] for m in broadcaster.clients['fast'].websocket.sent[1:]]
+
+        slow_ws.blocked.set()
+        await asyncio.sleep(0.01)
+        return broadcaster, fast_seqs, slow_ws
+
+    broadcaster, fast_seqs, slow_ws = asyncio.run(scenario())
+    assert fast_seqs == list(range(10))
+    slow_seqs = [json.loads(m)['data']['seq'] for m in slow_ws.sent[1:]]
+    # One message was already being sent when the socket blocked; the rest keep the newest 3
+    assert slow_seqs[-3:] == [7, 8, 9]
+    assert broadcaster.clients['slow'].dropped_messages == 6
+    assert broadcaster._stats['messages_dropped'] == 6
+
+
+def test_failed_send_disconnects_client():
+    class BrokenWebSocket(FakeWebSocket):
+        async def send_text(self, text):
+            # Welcome message goes through, the first broadcast fails
+            if self.sent:
+                raise ConnectionError('closed')
+            self.sent.append(text)
+
+    async def scenario():
+        broadcaster = SmartWebSocketBroadcaster()
+        client_id = await broadcaster.connect_client(BrokenWebSocket(), 'broken')
+        assert client_id in broadcaster.clients
+        await broadcaster._deliver_message(_message([client_id], {'seq': 1}))
+        await asyncio.sleep(0.01)
+        return broadcaster
+
+    broadcaster = asyncio.run(scenario())
+    assert 'broken' not in broadcaster.clients